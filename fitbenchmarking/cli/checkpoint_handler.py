@@ -21,7 +21,7 @@ from fitbenchmarking.core.results_output import (
 )
 from fitbenchmarking.utils.checkpoint import Checkpoint
 from fitbenchmarking.utils.log import get_logger
-from fitbenchmarking.utils.options import find_options_file
+from fitbenchmarking.utils.options import find_options_file, parse_shard
 
 LOGGER = get_logger()
 
@@ -263,6 +263,13 @@ def merge_data_sets(
     6) Unselected minimizers and failed problems will be discarded when
        combining.
 
+    7) Coverage
+
+        If the files are shards of one benchmark (run with
+        ``--shard i/N``), a warning lists any shards which are missing.
+        If no shards are missing, the shard is removed from the config
+        of the merged datasets.
+
     :param files: The files to combine.
     :type files: list[str]
     :param output: The name for the new checkpoint file.
@@ -280,12 +287,24 @@ def merge_data_sets(
     LOGGER.info("Loading %s...", files[0])
     with open(files[0], encoding="utf-8") as f:
         A = json.load(f)
+    shards = get_shards(A)
     for to_merge in files[1:]:
         LOGGER.info("Merging %s...", to_merge)
         with open(to_merge, encoding="utf-8") as f:
             B = json.load(f)
+        shards |= get_shards(B)
         A = merge(A, B, strategy=strategy)
 
+    missing_shards = find_missing_shards(shards)
+    if missing_shards:
+        LOGGER.warning(
+            "No checkpoint was given for the shards: %s",
+            ", ".join(missing_shards),
+        )
+    elif shards:
+        for group in A.values():
+            group.get("config", {}).pop("shard", None)
+
     LOGGER.info("Writing to %s...", output)
     with open(output, "w", encoding="utf-8") as f:
         json.dump(A, f, indent=2)
@@ -384,6 +403,70 @@ def merge_problems(A: dict[str, dict], B: dict[str, dict]):
     return A, update_keys
 
 
+def result_key(result: dict) -> tuple[str, ...]:
+    """
+    Get a uid for a result entry in cp file.
+
+    :param result: The result entry
+    :type result: dict[str, any]
+
+    :return: The problem name, and the software, minimizer, jacobian,
+             hessian and cost function tags
+    :rtype: tuple[str]
+    """
+    return (
+        result["name"],
+        result["software_tag"],
+        result["minimizer_tag"],
+        result["jacobian_tag"],
+        result["hessian_tag"],
+        result["costfun_tag"],
+    )
+
+
+def get_shards(data: dict[str, dict]) -> set[str]:
+    """
+    Get the shards that the datasets in a checkpoint file were run for.
+
+    :param data: The checkpoint data
+    :type data: dict[str, dict[str, any]]
+
+    :return: The shards, as i/N strings
+    :rtype: set[str]
+    """
+    return {
+        group["config"]["shard"]
+        for group in data.values()
+        if group.get("config", {}).get("shard")
+    }
+
+
+def find_missing_shards(shards: set[str]) -> list[str]:
+    """
+    Find the shards of a benchmark that are not in a set of shards.
+
+    :param shards: The shards which are present, as i/N strings
+    :type shards: set[str]
+
+    :return: The missing shards, as i/N strings
+    :rtype: list[str]
+    """
+    present = [parse_shard(s) for s in shards]
+    num_shards = {n for _, n in present}
+    if len(num_shards) > 1:
+        LOGGER.warning(
+            "The checkpoints were split into different numbers of shards: %s",
+            ", ".join(sorted(shards)),
+        )
+
+    return [
+        f"{i}/{n}"
+        for n in sorted(num_shards)
+        for i in range(1, n + 1)
+        if (i, n) not in present
+    ]
+
+
 def merge_results(A: list[dict], B: list[dict], strategy: str):
     """
     Merge the results sections of 2 checkpoint files.
@@ -400,23 +483,10 @@ def merge_results(A: list[dict], B: list[dict], strategy: str):
     :rtype: list[dict[str, any]]
     """
 
-    def key_gen(k: dict):
-        """
-        Get a uid for a result entry in cp file.
-        """
-        return (
-            k["name"],
-            k["software_tag"],
-            k["minimizer_tag"],
-            k["jacobian_tag"],
-            k["hessian_tag"],
-            k["costfun_tag"],
-        )
-
-    A_key = {key_gen(r): i for i, r in enumerate(A)}
+    A_key = {result_key(r): i for i, r in enumerate(A)}
 
     for res in B:
-        key = key_gen(res)
+        key = result_key(res)
         if key in A_key:
             if (
                 strategy in ["accuracy", "energy", "runtime"]
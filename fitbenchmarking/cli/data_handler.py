@@ -0,0 +1,143 @@
+"""
+This is a command line tool for handling the data files of problems for
+the FitBenchmarking software package.
+For more information on usage type fitbenchmarking-data --help
+or for more general information, see the online docs at
+docs.fitbenchmarking.com.
+"""
+
+import sys
+import textwrap
+from argparse import ArgumentParser, RawDescriptionHelpFormatter
+from pathlib import Path
+
+from fitbenchmarking.cli.exception_handler import exception_handler
+from fitbenchmarking.parsing.fitbenchmark_parser import (
+    load_data_file,
+    save_binary_data,
+)
+from fitbenchmarking.utils.log import get_logger
+
+LOGGER = get_logger()
+
+
+def get_parser() -> ArgumentParser:
+    """
+    Creates and returns a parser for the args.
+
+    :return: Configured argument parser
+    :rtype: ArgumentParser
+    """
+    description = (
+        "This is a tool for working with the data files of FitBenchmarking "
+        "problems."
+    )
+
+    parser = ArgumentParser(
+        prog="fitbenchmarking-data",
+        add_help=True,
+        description=description,
+        formatter_class=RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "-d",
+        "--debug-mode",
+        default=False,
+        action="store_true",
+        help="Enable debug mode (prints traceback).",
+    )
+
+    subparsers = parser.add_subparsers(
+        metavar="ACTION",
+        dest="subprog",
+        help=(
+            "Which action should be performed? "
+            "For more information on options use "
+            "`fitbenchmarking-data ACTION -h`"
+        ),
+    )
+
+    convert_epilog = textwrap.dedent("""
+    Usage Examples:
+
+        $ fitbenchmarking-data convert data_files/data.txt
+        $ fitbenchmarking-data convert data_files/*.txt -f npy
+    """)
+    convert = subparsers.add_parser(
+        "convert",
+        description=(
+            "Convert text data files to binary data files, which are "
+            "written next to them"
+        ),
+        help="Convert text data files to binary data files",
+        epilog=convert_epilog,
+    )
+    convert.add_argument(
+        "files",
+        metavar="FILES",
+        nargs="+",
+        help="The text data files to convert",
+    )
+    convert.add_argument(
+        "-f",
+        "--format",
+        metavar="FORMAT",
+        default="npz",
+        choices=["npz", "npy"],
+        help=(
+            "The binary format to write. npy files are memory mapped when "
+            "they are read, but can only hold a single x and y column."
+        ),
+    )
+
+    return parser
+
+
+@exception_handler
+def convert_data_files(
+    files: list[str], data_format: str = "npz", debug: bool = False
+) -> list[Path]:
+    """
+    Convert text data files to binary data files, which are written next
+    to them with the same name and the extension of the format.
+    The input_file of the problems must then be changed to use them.
+
+    :param files: The text data files to convert.
+    :type files: list[str]
+    :param data_format: The binary format to write, "npz" or "npy".
+    :type data_format: str
+    :param debug: Enable debugging output.
+    :type debug: bool
+
+    :return: The paths of the binary data files.
+    :rtype: list[Path]
+    """
+    outputs = []
+    for filename in files:
+        output = Path(filename).with_suffix(f".{data_format}")
+        LOGGER.info("Converting %s to %s...", filename, output)
+        save_binary_data(load_data_file(filename), output)
+        outputs.append(output)
+    return outputs
+
+
+def main():
+    """
+    Entry point exposed as the `fitbenchmarking-data` command.
+    """
+    parser = get_parser()
+
+    args = parser.parse_args(sys.argv[1:])
+
+    if args.subprog == "convert":
+        convert_data_files(
+            files=args.files,
+            data_format=args.format,
+            debug=args.debug_mode,
+        )
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
@@ -114,6 +114,144 @@ of the Fitbenchmarking docs. """
         default=0,
         help="Set the number of runs to average each fit over.",
     )
+    adaptive_runs_group = parser.add_mutually_exclusive_group()
+    adaptive_runs_group.add_argument(
+        "--adaptive_runs",
+        action="store_true",
+        help=(
+            "Use this option if you would like each fit to be repeated "
+            "until its runtime is stable, instead of num_runs times."
+        ),
+    )
+    adaptive_runs_group.add_argument(
+        "--dont_adaptive_runs",
+        action="store_true",
+        help=(
+            "Use this option if you would like each fit to be repeated "
+            "num_runs times."
+        ),
+    )
+    parser.add_argument(
+        "--max_runs",
+        metavar="MAX_RUNS",
+        type=int,
+        default=0,
+        help="Set the maximum number of runs of each fit for adaptive runs.",
+    )
+    parser.add_argument(
+        "--runtime_rtol",
+        metavar="RUNTIME_RTOL",
+        type=float,
+        default=0,
+        help=(
+            "Set the relative width of the confidence interval of the "
+            "runtime at which adaptive runs stop."
+        ),
+    )
+    parser.add_argument(
+        "--max_timing_time",
+        metavar="MAX_TIMING_TIME",
+        type=float,
+        default=0,
+        help=(
+            "Set the total runtime in seconds after which adaptive runs stop."
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        metavar="NUM_WORKERS",
+        type=int,
+        default=0,
+        help=(
+            "Set the number of worker processes to run the fits on. "
+            "Each problem and starting value pair is sent to a worker."
+        ),
+    )
+
+    parser.add_argument(
+        "--shard",
+        metavar="I/N",
+        default="",
+        help=(
+            "Split the benchmark into N shards and only run the fits in "
+            "shard I. The shards can be run on different machines and "
+            "the checkpoints merged with fitbenchmarking-cp merge."
+        ),
+    )
+    parser.add_argument(
+        "--runtime_history",
+        metavar="CHECKPOINT_FILE",
+        default="",
+        help=(
+            "A checkpoint file from a previous run. The runtimes in it "
+            "are used to start the longest fits first when running on "
+            "more than one worker process."
+        ),
+    )
+    convergence_trace_group = parser.add_mutually_exclusive_group()
+    convergence_trace_group.add_argument(
+        "--convergence_trace",
+        action="store_true",
+        help=(
+            "Use this option if you would like to record the best cost "
+            "against time and evaluations during each fit, for the "
+            "time-to-target performance profile."
+        ),
+    )
+    convergence_trace_group.add_argument(
+        "--dont_convergence_trace",
+        action="store_true",
+        help=(
+            "Use this option if you would not like to record the "
+            "convergence of each fit."
+        ),
+    )
+    model_cache_group = parser.add_mutually_exclusive_group()
+    model_cache_group.add_argument(
+        "--model_cache",
+        action="store_true",
+        help=(
+            "Use this option if you would like to reuse the model "
+            "evaluation when the model is evaluated again at the same "
+            "parameters."
+        ),
+    )
+    model_cache_group.add_argument(
+        "--dont_model_cache",
+        action="store_true",
+        help=(
+            "Use this option if you would like every evaluation of the "
+            "model to call the model function."
+        ),
+    )
+    isolate_fits_group = parser.add_mutually_exclusive_group()
+    isolate_fits_group.add_argument(
+        "--isolate_fits",
+        action="store_true",
+        help=(
+            "Use this option if you would like each fit to run in its "
+            "own process, which is killed if it exceeds the maximum "
+            "runtime or memory."
+        ),
+    )
+    isolate_fits_group.add_argument(
+        "--dont_isolate_fits",
+        action="store_true",
+        help=(
+            "Use this option if you would like the fits to run in the "
+            "main process."
+        ),
+    )
+    parser.add_argument(
+        "--max_memory",
+        metavar="MAX_MEMORY",
+        type=float,
+        default=0,
+        help=(
+            "Set the maximum memory in MiB that an isolated fit can use "
+            "before it is killed."
+        ),
+    )
     parser.add_argument(
         "-a",
         "--algorithm_type",
@@ -164,11 +302,23 @@ of the Fitbenchmarking docs. """
             "median",
             "harmonic",
             "trim",
+            "cpu",
         ],
         type=str,
         default="",
         help="Set the metric for the runtime.",
     )
+    parser.add_argument(
+        "--cpu_clock",
+        metavar="CPU_CLOCK",
+        choices=["process", "thread"],
+        type=str,
+        default="",
+        help=(
+            "Set the clock used to measure the CPU time of each run, "
+            "either the whole process or the calling thread."
+        ),
+    )
 
     parser.add_argument(
         "--port",
@@ -329,6 +479,16 @@ of the Fitbenchmarking docs. """
         ),
     )
 
+    parser.add_argument(
+        "--resume",
+        default=False,
+        action="store_true",
+        help=(
+            "Resume an interrupted run from the checkpoint. Fits which "
+            "have results in the checkpoint will not be run again."
+        ),
+    )
+
     run_dash_group = parser.add_mutually_exclusive_group()
     run_dash_group.add_argument(
         "--run_dash",
@@ -382,6 +542,13 @@ def parse_options_from_cli(args: argparse.Namespace) -> dict:
     options_dictionary = {
         "results_dir": args.results_dir,
         "num_runs": args.num_runs,
+        "max_runs": args.max_runs,
+        "runtime_rtol": args.runtime_rtol,
+        "max_timing_time": args.max_timing_time,
+        "num_workers": args.jobs,
+        "max_memory": args.max_memory,
+        "shard": args.shard,
+        "runtime_history": args.runtime_history,
         "algorithm_type": args.algorithm_type,
         "software": args.software,
         "jac_method": args.jac_method,
@@ -393,6 +560,7 @@ def parse_options_from_cli(args: argparse.Namespace) -> dict:
         "external_output": args.external_output,
         "run_name": args.run_name,
         "runtime_metric": args.runtime_metric,
+        "cpu_clock": args.cpu_clock,
         "port": args.port,
         "ip_address": args.ip_address,
     }
@@ -424,6 +592,34 @@ def parse_options_from_cli(args: argparse.Namespace) -> dict:
     elif args.dont_check_jacobian:
         options_dictionary["check_jacobian"] = False
 
+    # Check if adaptive_runs in options.py should be overridden, and if so,
+    # add to options_dictionary
+    if args.adaptive_runs:
+        options_dictionary["adaptive_runs"] = True
+    elif args.dont_adaptive_runs:
+        options_dictionary["adaptive_runs"] = False
+
+    # Check if convergence_trace in options.py should be overridden, and if
+    # so, add to options_dictionary
+    if args.convergence_trace:
+        options_dictionary["convergence_trace"] = True
+    elif args.dont_convergence_trace:
+        options_dictionary["convergence_trace"] = False
+
+    # Check if model_cache in options.py should be overridden, and if so,
+    # add to options_dictionary
+    if args.model_cache:
+        options_dictionary["model_cache"] = True
+    elif args.dont_model_cache:
+        options_dictionary["model_cache"] = False
+
+    # Check if isolate_fits in options.py should be overridden, and if so,
+    # add to options_dictionary
+    if args.isolate_fits:
+        options_dictionary["isolate_fits"] = True
+    elif args.dont_isolate_fits:
+        options_dictionary["isolate_fits"] = False
+
     # Check if benchmark in options.py should be overridden, and if so,
     # add to options_dictionary
     if args.pbar:
@@ -441,7 +637,13 @@ def parse_options_from_cli(args: argparse.Namespace) -> dict:
 
 
 @exception_handler
-def run(problem_sets, additional_options=None, options_file="", debug=False):
+def run(
+    problem_sets,
+    additional_options=None,
+    options_file="",
+    debug=False,
+    resume=False,
+):
     """
     Run benchmarking for the problems sets and options file given.
     Opens a webbrowser to the results_index after fitting.
@@ -455,6 +657,9 @@ def run(problem_sets, additional_options=None, options_file="", debug=False):
     :type options_file: str, optional
     :param debug: Enable debugging output.
     :type debug: bool
+    :param resume: Reuse the results in the checkpoint from an
+                   interrupted run, instead of running those fits again.
+    :type resume: bool
     """
     # additional_options is initialied to an empty dict if no value is given
     if additional_options is None:
@@ -485,6 +690,13 @@ def run(problem_sets, additional_options=None, options_file="", debug=False):
     pp_dfs_all_prob_sets = {}
     cp = Checkpoint(options=options)
     results = {}
+
+    # Results from the run being resumed, this must be loaded before the
+    # checkpoint is written to
+    completed_groups, partial_results = {}, []
+    if resume:
+        completed_groups, partial_results = cp.load_partial()
+
     try:
         for sub_dir in problem_sets:
             # Create full path for the directory that holds a group of
@@ -509,11 +721,19 @@ def run(problem_sets, additional_options=None, options_file="", debug=False):
             LOGGER.info(
                 "Running the benchmarking on the %s problem set", label
             )
+            # The first group which was not finalised is the one the
+            # interrupted run stopped in
+            if label in completed_groups:
+                completed_results = completed_groups[label]
+            else:
+                completed_results, partial_results = partial_results, []
+
             fit = Fit(
                 options=options,
                 data_dir=data_dir,
                 label=label,
                 checkpointer=cp,
+                completed_results=completed_results,
             )
             results, failed_problems, unselected_minimizers = fit.benchmark()
 
@@ -622,6 +842,7 @@ def main():
             options_file=args.options_file,
             debug=args.debug_mode,
             additional_options=options_dictionary,
+            resume=args.resume,
         )
 
 
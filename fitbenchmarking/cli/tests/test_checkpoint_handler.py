@@ -11,12 +11,16 @@ from unittest import TestCase
 
 from fitbenchmarking import test_files
 from fitbenchmarking.cli.checkpoint_handler import (
+    find_missing_shards,
     generate_report,
     merge,
     merge_data_sets,
     merge_problems,
     merge_results,
 )
+from fitbenchmarking.utils.log import get_logger
+
+LOGGER = get_logger()
 
 
 class TestGenerateReport(TestCase):
@@ -399,3 +403,81 @@ class TestMergeResults(TestCase):
         assert json.dumps(expected_r) == json.dumps(actual_r), (
             "Conflicting results merged incorrectly"
         )
+
+
+class TestShardCoverage(TestCase):
+    """
+    Tests for the coverage checks when merging shards.
+    """
+
+    def setUp(self):
+        """
+        Write copies of A and B which are shards of one benchmark
+        """
+        ch_test_files = Path(__file__).parent / "test_files"
+        self.A = json.load((ch_test_files / "A.json").open())
+        self.B = json.load((ch_test_files / "B.json").open())
+        self._dir = TemporaryDirectory()
+        self.dir = Path(self._dir.name)
+
+    def tearDown(self):
+        """
+        Clean up the temporary directory
+        """
+        self._dir.cleanup()
+
+    def write_shards(self, *shards):
+        """
+        Write A and B to files, marked as the given shards.
+
+        :return: The paths to the files
+        :rtype: list[str]
+        """
+        files = []
+        for name, data, shard in zip(["A", "B"], [self.A, self.B], shards):
+            for group in data.values():
+                group["config"] = {"shard": shard}
+            path = self.dir / f"{name}.json"
+            path.write_text(json.dumps(data), encoding="utf-8")
+            files.append(str(path))
+        return files
+
+    def test_find_missing_shards(self):
+        """
+        Test that the missing shards are found.
+        """
+        assert find_missing_shards({"1/3", "3/3"}) == ["2/3"]
+        assert find_missing_shards({"1/2", "2/2"}) == []
+        assert find_missing_shards(set()) == []
+
+    def test_merge_all_shards(self):
+        """
+        Test that the shard is removed from the config when all of the
+        shards are merged.
+        """
+        output = self.dir / "out.json"
+        merge_data_sets(self.write_shards("1/2", "2/2"), str(output))
+        merged = json.loads(output.read_text(encoding="utf-8"))
+        assert "shard" not in merged["DataSet1"]["config"]
+
+    def test_merge_missing_shard(self):
+        """
+        Test that a warning is logged for a missing shard.
+        """
+        output = self.dir / "out.json"
+        with self.assertLogs(LOGGER, level="WARNING") as log:
+            merge_data_sets(self.write_shards("1/3", "2/3"), str(output))
+        assert any("3/3" in line for line in log.output)
+        merged = json.loads(output.read_text(encoding="utf-8"))
+        assert merged["DataSet1"]["config"]["shard"] == "1/3"
+
+    def test_merge_absent_combination(self):
+        """
+        Test that no warning is logged for a combination of problem and
+        tags which has no result because it was not run, e.g. a minimizer
+        which doesn't support the problem.
+        """
+        output = self.dir / "out.json"
+        self.A["DataSet1"]["results"].pop(1)
+        with self.assertNoLogs(LOGGER, level="WARNING"):
+            merge_data_sets(self.write_shards("1/2", "2/2"), str(output))
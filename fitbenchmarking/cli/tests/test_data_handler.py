@@ -0,0 +1,83 @@
+"""
+Tests for data_handler.py
+"""
+
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+
+from fitbenchmarking.cli import data_handler
+from fitbenchmarking.cli.data_handler import convert_data_files
+from fitbenchmarking.parsing.fitbenchmark_parser import load_data_file
+
+
+class TestConvertDataFiles(TestCase):
+    """
+    Tests for converting text data files to binary data files.
+    """
+
+    def setUp(self):
+        self.dir = TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+        self.text_file = Path(self.dir.name) / "data.txt"
+        self.text_file.write_text(
+            "# X Y E\n1 2 0.5\n3 4 0.5\n5 6 0.5\n", encoding="utf-8"
+        )
+
+    def assert_same_data(self, binary_file):
+        expected = load_data_file(self.text_file)
+        result = load_data_file(binary_file)
+        self.assertEqual(set(result), set(expected))
+        for key, values in expected.items():
+            np.testing.assert_array_equal(result[key], values)
+
+    def test_convert_npz(self):
+        """
+        Test that a .npz file is written next to the text file.
+        """
+        outputs = convert_data_files([str(self.text_file)])
+
+        self.assertEqual(outputs, [self.text_file.with_suffix(".npz")])
+        self.assert_same_data(outputs[0])
+
+    def test_convert_npy(self):
+        """
+        Test that a .npy file is written when requested.
+        """
+        outputs = convert_data_files([str(self.text_file)], data_format="npy")
+
+        self.assertEqual(outputs, [self.text_file.with_suffix(".npy")])
+        self.assert_same_data(outputs[0])
+
+    def test_missing_file(self):
+        """
+        Test that the tool exits if a file can't be read.
+        """
+        with self.assertRaises(SystemExit):
+            convert_data_files([str(self.text_file.with_name("missing.txt"))])
+
+    def test_main(self):
+        """
+        Test the command line arguments are passed on.
+        """
+        argv = [
+            "fitbenchmarking-data",
+            "convert",
+            "a.txt",
+            "b.txt",
+            "-f",
+            "npy",
+        ]
+        with (
+            patch.object(sys, "argv", argv),
+            patch.object(data_handler, "convert_data_files") as convert,
+        ):
+            data_handler.main()
+
+        convert.assert_called_once_with(
+            files=["a.txt", "b.txt"], data_format="npy", debug=False
+        )
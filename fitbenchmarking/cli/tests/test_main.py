@@ -68,11 +68,27 @@ def get_default_cli_args():
         "results_dir": "",
         "debug_mode": False,
         "num_runs": 0,
+        "adaptive_runs": False,
+        "dont_adaptive_runs": False,
+        "max_runs": 0,
+        "runtime_rtol": 0,
+        "max_timing_time": 0,
+        "jobs": 0,
+        "isolate_fits": False,
+        "dont_isolate_fits": False,
+        "max_memory": 0,
+        "shard": "",
+        "runtime_history": "",
+        "convergence_trace": False,
+        "dont_convergence_trace": False,
+        "model_cache": False,
+        "dont_model_cache": False,
         "algorithm_type": [],
         "software": [],
         "jac_method": [],
         "cost_func_type": [],
         "runtime_metric": "",
+        "cpu_clock": "",
         "port": 0,
         "ip_address": "",
         "make_plots": False,
@@ -90,6 +106,7 @@ def get_default_cli_args():
         "level": "",
         "external_output": "",
         "load_checkpoint": False,
+        "resume": False,
         "run_dash": False,
         "dont_run_dash": False,
         "check_jacobian": False,
@@ -169,6 +186,57 @@ class TestMain(TestCase):
         # Check that it's not empty
         self.assertTrue(contents)
 
+    @patch("fitbenchmarking.cli.main.save_results")
+    @patch("fitbenchmarking.utils.misc.get_problem_files")
+    def test_resume_reuses_checkpoint(self, get_problems, save_results):
+        """
+        Checks that resuming a run does not run the fits which are
+        already in the checkpoint file.
+        """
+        get_problems.side_effect = lambda path: [get_problem_files(path)[0]]
+        save_results.side_effect = RuntimeError(
+            "Exception raised during save..."
+        )
+        additional_options = {
+            "scipy_ls": ["lm-scipy"],
+            "software": ["scipy_ls"],
+            "num_runs": 1,
+        }
+
+        with TemporaryDirectory() as results_dir:
+            additional_options["results_dir"] = results_dir
+            with self.assertRaises(RuntimeError):
+                main.run(
+                    ["examples/benchmark_problems/NIST/low_difficulty"],
+                    additional_options=dict(additional_options),
+                    debug=True,
+                )
+            with open(f"{results_dir}/checkpoint.json", encoding="utf8") as f:
+                expected = load(f)
+
+            with (
+                patch(
+                    "fitbenchmarking.cli.main.Fit._perform_fit"
+                ) as perform_fit,
+                self.assertRaises(RuntimeError),
+            ):
+                main.run(
+                    ["examples/benchmark_problems/NIST/low_difficulty"],
+                    additional_options=dict(additional_options),
+                    debug=True,
+                    resume=True,
+                )
+            with open(f"{results_dir}/checkpoint.json", encoding="utf8") as f:
+                actual = load(f)
+
+        perform_fit.assert_not_called()
+        self.assertEqual(actual.keys(), expected.keys())
+        for label, group in expected.items():
+            self.assertEqual(
+                [r["name"] for r in actual[label]["results"]],
+                [r["name"] for r in group["results"]],
+            )
+
     @dataclass
     class OptionMapping:
         """
@@ -187,6 +255,13 @@ class TestMain(TestCase):
     valid_options = [
         OptionMapping("results_dir", "test_value", "results_dir"),
         OptionMapping("num_runs", "test_value", "num_runs"),
+        OptionMapping("jobs", "test_value", "num_workers"),
+        OptionMapping("max_memory", "test_value", "max_memory"),
+        OptionMapping("max_runs", "test_value", "max_runs"),
+        OptionMapping("runtime_rtol", "test_value", "runtime_rtol"),
+        OptionMapping("max_timing_time", "test_value", "max_timing_time"),
+        OptionMapping("shard", "test_value", "shard"),
+        OptionMapping("runtime_history", "test_value", "runtime_history"),
         OptionMapping("algorithm_type", "test_value", "algorithm_type"),
         OptionMapping("software", "test_value", "software"),
         OptionMapping("jac_method", "test_value", "jac_method"),
@@ -197,6 +272,7 @@ class TestMain(TestCase):
         OptionMapping("external_output", "test_value", "external_output"),
         OptionMapping("run_name", "test_value", "run_name"),
         OptionMapping("runtime_metric", "test_value", "runtime_metric"),
+        OptionMapping("cpu_clock", "test_value", "cpu_clock"),
         OptionMapping("port", "test_value", "port"),
         OptionMapping("ip_address", "test_value", "ip_address"),
         OptionMapping("logging_file_name", "test_value", "file_name"),
@@ -204,6 +280,16 @@ class TestMain(TestCase):
         OptionMapping("dont_make_plots", True, "make_plots", False),
         OptionMapping("run_dash", True, "run_dash", True),
         OptionMapping("dont_run_dash", True, "run_dash", False),
+        OptionMapping("adaptive_runs", True, "adaptive_runs", True),
+        OptionMapping("dont_adaptive_runs", True, "adaptive_runs", False),
+        OptionMapping("convergence_trace", True, "convergence_trace", True),
+        OptionMapping(
+            "dont_convergence_trace", True, "convergence_trace", False
+        ),
+        OptionMapping("model_cache", True, "model_cache", True),
+        OptionMapping("dont_model_cache", True, "model_cache", False),
+        OptionMapping("isolate_fits", True, "isolate_fits", True),
+        OptionMapping("dont_isolate_fits", True, "isolate_fits", False),
         OptionMapping("pbar", True, "pbar", True),
         OptionMapping("no_pbar", True, "pbar", False),
         OptionMapping("append_log", True, "append", True),
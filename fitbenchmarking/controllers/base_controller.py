@@ -202,6 +202,15 @@ class Controller:
         # save number of function evaluations
         self.func_evals = None
 
+        # save the evaluations counted per run of the fit, and the time
+        # spent in them (only counted for the overhead table)
+        self.eval_counts = {}
+        self.eval_times = {}
+
+        # save the best cost against time and evaluations during the last
+        # run of the fit (only recorded if convergence_trace is set)
+        self.convergence_trace = None
+
         # set default chain length for Bayesian minimizers
         self.chain_length = 100000
 
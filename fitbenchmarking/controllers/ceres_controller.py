@@ -32,7 +32,10 @@ class CeresCostFunction(pyceres.CostFunction):
 
         x = parameters[0]
 
-        res = self.fb_cf.eval_r(x)
+        if jacobians is None:
+            res = self.fb_cf.eval_r(x)
+        else:
+            res, jac = self.fb_cf.eval_r_and_jac(x)
 
         if np.any(np.isinf(res)):
             return False
@@ -40,7 +43,7 @@ class CeresCostFunction(pyceres.CostFunction):
         np.copyto(residuals, res)
 
         if jacobians is not None:
-            np.copyto(jacobians[0], np.ravel(self.fb_cf.jac_res(x)))
+            np.copyto(jacobians[0], np.ravel(jac))
 
         return True
 
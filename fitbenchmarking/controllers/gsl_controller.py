@@ -116,10 +116,10 @@ class GSLController(Controller):
         :type p: list
         :param data: x data, this is discarded as the defaults can be used.
         :type data: N/A
-        :return: result from cost_func.eval_r and eval_j
+        :return: result from cost_func.eval_r_and_jac
         :rtype: (numpy array, numpy array)
         """
-        return self.cost_func.eval_r(p), self.cost_func.jac_res(p)
+        return self.cost_func.eval_r_and_jac(p)
 
     def _chi_squared(self, p, data=None):
         """
@@ -156,10 +156,10 @@ class GSLController(Controller):
         :type p: list
         :param data: x data, this is discarded as the defaults can be used.
         :type data: N/A
-        :return: result from cost_func.eval_cost and _jac_chi_squared
+        :return: result from cost_func.eval_cost_grad
         :rtype: (numpy array, numpy array)
         """
-        return self.cost_func.eval_cost(p), self._jac_chi_squared(p)
+        return self.cost_func.eval_cost_grad(p)
 
     def setup(self):
         """
@@ -134,12 +134,11 @@ class NLoptController(Controller):
         NLOPT objective function
         """
 
-        jacs = self.cost_func.jac_cost(x)
+        if grad.size == 0:
+            return self.cost_func.eval_cost(x)
 
-        if grad.size > 0:
-            np.copyto(grad, jacs)
-
-        fx = self.cost_func.eval_cost(x)
+        fx, jacs = self.cost_func.eval_cost_grad(x)
+        np.copyto(grad, jacs)
         return fx
 
     def setup(self):
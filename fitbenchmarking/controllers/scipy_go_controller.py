@@ -19,10 +19,23 @@ class ScipyGOController(Controller):
     controller_name = "scipy_go"
 
     algorithm_check = {
-        "all": ["differential_evolution", "shgo", "dual_annealing"],
+        "all": [
+            "differential_evolution",
+            "differential_evolution_batch",
+            "shgo",
+            "dual_annealing",
+        ],
         "ls": [None],
-        "deriv_free": ["differential_evolution"],
-        "general": ["differential_evolution", "shgo", "dual_annealing"],
+        "deriv_free": [
+            "differential_evolution",
+            "differential_evolution_batch",
+        ],
+        "general": [
+            "differential_evolution",
+            "differential_evolution_batch",
+            "shgo",
+            "dual_annealing",
+        ],
         "simplex": [],
         "trust_region": [],
         "levenberg-marquardt": [],
@@ -32,6 +45,7 @@ class ScipyGOController(Controller):
         "steepest_descent": [],
         "global_optimization": [
             "differential_evolution",
+            "differential_evolution_batch",
             "shgo",
             "dual_annealing",
         ],
@@ -54,6 +68,7 @@ class ScipyGOController(Controller):
         super().__init__(cost_func)
 
         self._maxiter = None
+        self._batch_evals = 0
 
     def setup(self):
         """
@@ -87,9 +102,18 @@ class ScipyGOController(Controller):
         else:  # differential_evolution
             kwargs = {"maxiter": self._maxiter}
         fun = self.cost_func.eval_cost
+        algorithm = self.minimizer
+        if self.minimizer == "differential_evolution_batch":
+            # The population is evaluated in one call to the cost function,
+            # which requires the trial vectors to be updated once per
+            # generation rather than SciPy's default of immediately
+            kwargs["vectorized"] = True
+            kwargs["updating"] = "deferred"
+            self._batch_evals = 0
+            fun = self._eval_cost_vectorized
+            algorithm = "differential_evolution"
         bounds = self.value_ranges
-        algorithm = getattr(optimize, self.minimizer)
-        self._result = algorithm(fun, bounds, **kwargs)
+        self._result = getattr(optimize, algorithm)(fun, bounds, **kwargs)
 
     def cleanup(self):
         """
@@ -105,4 +129,27 @@ class ScipyGOController(Controller):
 
         self.final_params = self._result.x
         self.iteration_count = self._result.nit
-        self.func_evals = self._result.nfev
+        if self.minimizer == "differential_evolution_batch":
+            # SciPy adds one to nfev for each vectorized call, however many
+            # members of the population it evaluates
+            self.func_evals = self._batch_evals
+        else:
+            self.func_evals = self._result.nfev
+
+    def _eval_cost_vectorized(self, params):
+        """
+        Evaluate the cost function at a population of parameters.
+
+        :param params: The parameters, with one column per member of the
+                       population
+        :type params: numpy.ndarray
+
+        :return: The cost function at each member of the population
+        :rtype: numpy.ndarray
+        """
+        params = np.asarray(params)
+        if params.ndim == 1:
+            self._batch_evals += 1
+            return self.cost_func.eval_cost(params)
+        self._batch_evals += params.shape[1]
+        return self.cost_func.eval_cost_batch(params.T)
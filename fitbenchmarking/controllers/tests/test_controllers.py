@@ -893,6 +893,28 @@ class DefaultControllerTests(TestCase):
         controller._status = -1
         self.shared_tests.check_diverged(controller)
 
+    def test_nlopt_objective(self):
+        """
+        NLoptController: Test the objective only evaluates the gradient
+        when it is asked for
+        """
+        controller = create_controller("nlopt", self.cost_func)
+        params = np.array(list(self.problem.starting_values[0].values()))
+        expected_cost, expected_grad = self.cost_func.eval_cost_grad(params)
+
+        jacobian = self.cost_func.jacobian
+        with patch.object(jacobian, "eval", wraps=jacobian.eval) as mock_jac:
+            cost = controller.objective_master_nlopt(params, np.array([]))
+            mock_jac.assert_not_called()
+
+            grad = np.zeros(len(params))
+            cost_with_grad = controller.objective_master_nlopt(params, grad)
+            mock_jac.assert_called_once()
+
+        self.assertAlmostEqual(cost, expected_cost)
+        self.assertAlmostEqual(cost_with_grad, expected_cost)
+        np.testing.assert_allclose(grad, expected_grad)
+
     def test_lmfit(self):
         """
         LmfitController: Test for output shape
@@ -938,6 +960,31 @@ class DefaultControllerTests(TestCase):
         ):
             self.shared_tests.check_diverged(controller)
 
+    @parameterized.expand(
+        [
+            ("bumps", "amoeba"),
+            ("dfo", "dfols"),
+            ("minuit", "migrad"),
+            ("scipy", "CG"),
+            ("scipy_ls", "lm"),
+            ("scipy_leastsq", "trf"),
+            ("nlopt", "LD_VAR2"),
+            ("lmfit", "leastsq"),
+        ]
+    )
+    def test_read_only_model(self, controller_name, minimizer):
+        """
+        Test that the controllers don't write to the evaluations of the
+        model, which are read-only when the model cache is enabled
+        """
+        self.problem.model_cache.enabled = True
+        controller = create_controller(controller_name, self.cost_func)
+        controller.minimizer = minimizer
+
+        self.shared_tests.controller_run_test(controller)
+
+        self.assertGreater(self.problem.model_cache.misses, 0)
+
     @parameterized.expand(["lmfit", "bumps"])
     def test_variable_names_corrected_in_controllers(self, controller_name):
         """
@@ -1490,6 +1537,61 @@ class GlobalOptimizationControllerTests(TestCase):
         ]
         self.shared_tests.check_diverged(controller)
 
+    def test_scipy_go_differential_evolution(self):
+        """
+        ScipyGOController: Test that differential evolution evaluates the
+        members of the population one at a time by default
+        """
+        controller = create_controller("scipy_go", self.cost_func)
+        controller.minimizer = "differential_evolution"
+        controller.parameter_set = 0
+        controller.prepare()
+
+        with patch.object(
+            self.cost_func,
+            "eval_cost_batch",
+            wraps=self.cost_func.eval_cost_batch,
+        ) as eval_cost_batch:
+            controller.fit()
+        controller.cleanup()
+
+        eval_cost_batch.assert_not_called()
+        self.assertEqual(controller.func_evals, controller._result.nfev)
+
+    def test_scipy_go_differential_evolution_batch(self):
+        """
+        ScipyGOController: Test that differential_evolution_batch evaluates
+        the population in batches and counts each member of it
+        """
+        controller = create_controller("scipy_go", self.cost_func)
+        controller.minimizer = "differential_evolution_batch"
+        controller.parameter_set = 0
+        controller.prepare()
+
+        with (
+            patch.object(
+                self.cost_func,
+                "eval_cost_batch",
+                wraps=self.cost_func.eval_cost_batch,
+            ) as eval_cost_batch,
+            patch.object(
+                self.cost_func,
+                "eval_cost",
+                wraps=self.cost_func.eval_cost,
+            ) as eval_cost,
+        ):
+            controller.fit()
+        controller.cleanup()
+
+        eval_cost_batch.assert_called()
+        num_points = eval_cost.call_count + sum(
+            len(call.args[0]) for call in eval_cost_batch.call_args_list
+        )
+        self.assertEqual(controller.func_evals, num_points)
+        self.assertEqual(
+            len(controller.final_params), len(self.problem.starting_values[0])
+        )
+
     def test_gradient_free(self):
         """
         GradientFreeController: Tests for output shape
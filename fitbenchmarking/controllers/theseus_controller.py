@@ -66,11 +66,11 @@ class TheseusCostFunction(th.CostFunction):
         Jacobians in pytorch tensor form for Theseus ai
         """
 
-        err = self.error()
         optim_vars_list = [
             float(optim_vars1[0]) for optim_vars1 in self.optim_vars
         ]
-        jacs = self.fb_cf.jac_res(optim_vars_list)
+        res, jacs = self.fb_cf.eval_r_and_jac(optim_vars_list)
+        err = torch.Tensor(np.array([res]))
         th_jac = [
             torch.Tensor([[[item] for item in jacs[:, index]]])
             for index in range(len(optim_vars_list))
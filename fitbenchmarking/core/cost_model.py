@@ -0,0 +1,111 @@
+"""
+Implements a cost model used to predict how long the fits for a problem
+will take, so that the longest fits can be started first when the
+benchmark is run in parallel.
+"""
+
+import re
+from collections import defaultdict
+
+import numpy as np
+
+# The suffix added to the names of the results for multifit problems
+_DATASET_SUFFIX = re.compile(r", Dataset \d+$")
+
+
+class CostModel:
+    """
+    Predicts the cost of running all of the fits for a problem.
+
+    The cost is the number of data points multiplied by the number of
+    parameters. When the runtimes from a previous run are available, the
+    cost of a problem which was in that run is its total runtime, and the
+    cost of any other problem is converted to seconds using the median
+    runtime per data point and parameter of the previous run. Fits which
+    failed in the previous run have no runtimes, and are counted as taking
+    the max_runtime, as the longest of them were stopped by it.
+    """
+
+    def __init__(self, history=None, max_runtime=0.0):
+        """
+        Set up the cost model.
+
+        :param history: Results from a previous run of the benchmark
+        :type history: list[FittingResult], optional
+        :param max_runtime: The max_runtime of the fits, which the fits
+                            without a runtime are counted as taking
+        :type max_runtime: float, optional
+        """
+        # The total runtime of the previous run for each problem
+        self._runtimes = defaultdict(float)
+        # The size of each problem, multifit problems have a result per
+        # dataset for each fit
+        dataset_sizes = {}
+
+        for result in history or []:
+            name = _DATASET_SUFFIX.sub("", result.name)
+            # The datasets of a multifit problem share one fit, so the
+            # runtimes are only counted for the first dataset
+            dataset = _DATASET_SUFFIX.search(result.name)
+            if dataset is None or dataset.group() == ", Dataset 1":
+                runtimes = np.asarray(result.runtimes, dtype=float)
+                # The max_runtime limits all the runs of a fit together
+                self._runtimes[name] += (
+                    float(np.sum(runtimes))
+                    if np.isfinite(runtimes).all()
+                    else max_runtime
+                )
+            dataset_sizes[result.name] = (
+                name,
+                result.get_n_data_points() * result.get_n_parameters(),
+            )
+
+        sizes = defaultdict(int)
+        for name, size in dataset_sizes.values():
+            sizes[name] += size
+
+        rates = [
+            self._runtimes[name] / size
+            for name, size in sizes.items()
+            if size > 0 and self._runtimes[name] > 0
+        ]
+        # The runtime per data point and parameter
+        self._rate = float(np.median(rates)) if rates else 1.0
+
+    def predict(self, problem, name=None):
+        """
+        Predict the cost of running all of the fits for a problem.
+
+        :param problem: The problem to predict the cost for
+        :type problem: FittingProblem
+        :param name: The name of the problem in the results, if different
+                     from problem.name (e.g. for multistart problems)
+        :type name: str, optional
+
+        :return: The predicted cost
+        :rtype: float
+        """
+        if name is None:
+            name = problem.name
+        if self._runtimes.get(name, 0) > 0:
+            return self._runtimes[name]
+        return self._rate * get_problem_size(problem)
+
+
+def get_problem_size(problem):
+    """
+    Get the number of data points multiplied by the number of parameters
+    for a problem.
+
+    :param problem: The problem
+    :type problem: FittingProblem
+
+    :return: The size of the problem
+    :rtype: int
+    """
+    if problem.multifit:
+        n_data_points = sum(len(x) for x in problem.data_x)
+    else:
+        n_data_points = len(problem.data_x)
+    n_params = len(problem.starting_values[0])
+    return n_data_points * n_params
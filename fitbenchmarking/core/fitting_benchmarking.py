@@ -4,9 +4,11 @@ methods to fit and benchmark a set of problems for a certain
 fitting software.
 """
 
+import hashlib
 import os
+import pickle
 import platform
-import timeit
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 from codecarbon import EmissionsTracker
@@ -15,16 +17,24 @@ from tqdm import tqdm, trange
 from tqdm.contrib.logging import logging_redirect_tqdm
 
 from fitbenchmarking.controllers.controller_factory import ControllerFactory
+from fitbenchmarking.core.cost_model import CostModel
 from fitbenchmarking.cost_func.cost_func_factory import create_cost_func
 from fitbenchmarking.hessian.hessian_factory import create_hessian
 from fitbenchmarking.jacobian.jacobian_factory import create_jacobian
 from fitbenchmarking.parsing.parser_factory import parse_problem_file
 from fitbenchmarking.utils import fitbm_result, misc, output_grabber
+from fitbenchmarking.utils.checkpoint import Checkpoint
+from fitbenchmarking.utils.eval_counter import (
+    counting_evals,
+    tracing_convergence,
+)
 from fitbenchmarking.utils.exceptions import (
+    CheckpointError,
     ControllerAttributeError,
     FitBenchmarkException,
     IncompatibleCostFunctionError,
     IncompatibleMinimizerError,
+    MaxMemoryError,
     MaxRuntimeError,
     NoHessianError,
     NoJacobianError,
@@ -32,7 +42,14 @@ from fitbenchmarking.utils.exceptions import (
     UnsupportedMinimizerError,
     ValidationException,
 )
+from fitbenchmarking.utils.isolation import run_isolated
 from fitbenchmarking.utils.log import get_logger
+from fitbenchmarking.utils.options import parse_shard
+from fitbenchmarking.utils.timer import (
+    repeat,
+    repeat_until_stable,
+    time_phase,
+)
 
 LOGGER = get_logger()
 
@@ -43,7 +60,14 @@ class Fit:
     and collates the results.
     """
 
-    def __init__(self, options, data_dir, checkpointer, label="benchmark"):
+    def __init__(
+        self,
+        options,
+        data_dir,
+        checkpointer,
+        label="benchmark",
+        completed_results=None,
+    ):
         """
         Initializes the Fit(ting) class.
 
@@ -59,6 +83,10 @@ class Fit:
         :type checkpointer: Checkpoint
         :param label: The name for the dataset in the checkpoint
         :type label: str
+        :param completed_results: Results from a previous run of this
+                                  dataset. These are reused instead of
+                                  running the same fits again.
+        :type completed_results: list[FittingResult], optional
         """
         self._options = options
         self._data_dir = data_dir
@@ -68,22 +96,39 @@ class Fit:
         self._failed_problems = []
         self._unselected_minimizers = {}
         self._start_values_index = 0
+        self._parsed_problems = {}
+        self._completed_results = {
+            _result_key(r): r for r in completed_results or []
+        }
         self._grabbed_output = output_grabber.OutputGrabber(self._options)
-        self._emissions_tracker = None
         self._logger_prefix = "    "
-        if "energy_usage" in options.table_type:
-            if platform.system() == "Darwin":
-                LOGGER.info(
-                    "Please be aware that you may be prompted by "
-                    "CodeCarbon to provide a password to give sudo rights "
-                    "so that the powermetrics tool can be used."
-                )
-            self._emissions_tracker = EmissionsTracker(
-                measure_power_secs=1,
-                tracking_mode="process",
-                save_to_file=False,
-                log_level="error",
+        if (
+            "energy_usage" in options.table_type
+            and platform.system() == "Darwin"
+        ):
+            LOGGER.info(
+                "Please be aware that you may be prompted by "
+                "CodeCarbon to provide a password to give sudo rights "
+                "so that the powermetrics tool can be used."
             )
+        self._emissions_tracker = self._create_emissions_tracker()
+
+    def _create_emissions_tracker(self):
+        """
+        Create the tracker used to measure the energy usage of the fits,
+        if the energy_usage table is selected.
+
+        :return: The emissions tracker, or None if energy is not measured
+        :rtype: codecarbon.EmissionsTracker or None
+        """
+        if "energy_usage" not in self._options.table_type:
+            return None
+        return EmissionsTracker(
+            measure_power_secs=1,
+            tracking_mode="process",
+            save_to_file=False,
+            log_level="error",
+        )
 
     def benchmark(
         self,
@@ -130,37 +175,39 @@ class Fit:
 
         LOGGER.info("Running problems")
 
-        benchmark_pbar = (
-            tqdm(
-                problems,
-                colour="green",
-                desc="Benchmark problems",
-                unit="Benchmark problem",
-                leave=True,
-            )
-            if self._options.pbar
-            else problems
-        )
-
+        # Make the names unique
         name_index = dict.fromkeys(name_count, 0)
+        for _, problem in problems:
+            if name_count[problem.name] > 1:
+                name_index[problem.name] += 1
+                problem.name += f" {name_index[problem.name]}"
 
         with logging_redirect_tqdm(loggers=[LOGGER]):
-            for i, (fname, problem) in enumerate(benchmark_pbar):
-                # Make the name unique
-                if name_count[problem.name] > 1:
-                    name_index[problem.name] += 1
-                    problem.name += f" {name_index[problem.name]}"
-
-                info_str = (
-                    f" Running data from: {os.path.basename(fname)}"
-                    f" {i + 1}/{len(problems)} "
+            if self._options.num_workers > 1:
+                self._benchmark_in_pool(problems)
+            else:
+                benchmark_pbar = (
+                    tqdm(
+                        problems,
+                        colour="green",
+                        desc="Benchmark problems",
+                        unit="Benchmark problem",
+                        leave=True,
+                    )
+                    if self._options.pbar
+                    else problems
                 )
-                LOGGER.info("\n%s", "#" * len(info_str))
-                LOGGER.info(info_str)
-                LOGGER.info("#" * len(info_str))
+                for i, (fname, problem) in enumerate(benchmark_pbar):
+                    info_str = (
+                        f" Running data from: {os.path.basename(fname)}"
+                        f" {i + 1}/{len(problems)} "
+                    )
+                    LOGGER.info("\n%s", "#" * len(info_str))
+                    LOGGER.info(info_str)
+                    LOGGER.info("#" * len(info_str))
 
-                results = self._loop_over_starting_values(problem)
-                self._results.extend(results)
+                    results = self._loop_over_starting_values(problem)
+                    self._results.extend(results)
 
         if self._emissions_tracker:
             _ = self._emissions_tracker.stop()
@@ -202,37 +249,225 @@ class Fit:
         )
 
         for index in num_start_vals_pbar:
-            LOGGER.info(
-                "%sStarting value: %i/%i",
-                self._logger_prefix,
-                index + 1,
-                num_start_vals,
+            result = self._run_starting_value(problem, index)
+            results.extend(result)
+
+            # Checks to see if all of the minimizers from every software raised
+            # an exception and record the problem name if that is the case
+            self._check_failed_problem(
+                _start_value_name(name, index, num_start_vals), results
             )
 
-            # Set the values of the start index
-            self._start_values_index = index
+        return results
 
-            if num_start_vals > 1:
-                prefix = (len(str(num_start_vals)) - len(str(index + 1))) * "0"
-                problem.name = f"{name}, Start {prefix}{index + 1}"
+    def _run_starting_value(self, problem, index):
+        """
+        Runs the benchmark for a single starting value of the problem.
 
-            #############################
-            # Loops over cost functions #
-            #############################
-            result = self._loop_over_cost_function(problem)
-            results.extend(result)
+        :param problem: The problem to benchmark on
+        :type problem: fitbenchmarking.parsing.fitting_problem.FittingProblem
+        :param index: The index of the starting values to use
+        :type index: int
 
-            # Checks to see if all of the minimizers from every software raised
-            # an exception and record the problem name if that is the case
-            software_check = [np.isinf(v.accuracy) for v in results]
-            if all(software_check):
-                self._failed_problems.append(problem.name)
+        :return: all results for this starting value
+        :rtype: list[fibenchmarking.utils.fitbm_result.FittingResult]
+        """
+        name = problem.name
+        num_start_vals = len(problem.starting_values)
 
+        LOGGER.info(
+            "%sStarting value: %i/%i",
+            self._logger_prefix,
+            index + 1,
+            num_start_vals,
+        )
+
+        # Set the values of the start index
+        self._start_values_index = index
+        problem.name = _start_value_name(name, index, num_start_vals)
+
+        #############################
+        # Loops over cost functions #
+        #############################
+        try:
+            results = self._loop_over_cost_function(problem)
+        finally:
             # Reset name for next loop
             problem.name = name
 
         return results
 
+    def _check_failed_problem(self, name, results):
+        """
+        Record the problem name as failed if every result so far has an
+        infinite accuracy, i.e. all of the minimizers raised an exception.
+
+        :param name: The name of the problem as reported in the results
+        :type name: str
+        :param results: The results for the problem so far
+        :type results: list[fibenchmarking.utils.fitbm_result.FittingResult]
+        """
+        # When sharding, the fits for a problem can all be in other shards
+        if self._options.shard and not results:
+            return
+        if all(np.isinf(v.accuracy) for v in results):
+            self._failed_problems.append(name)
+
+    def _benchmark_in_pool(self, problems):
+        """
+        Run each (problem, starting value) pair on a pool of worker
+        processes.
+
+        The problems are re-parsed by the workers as parsed problems can
+        hold functions which cannot be pickled. The pairs with the largest
+        predicted cost are submitted first, and idle workers take the next
+        pair from the pool's queue, so the cheap pairs fill in around the
+        expensive ones. The results are collected in the order of the
+        problems, so the results list and the checkpoint are the same as
+        for a serial run.
+
+        :param problems: The problem files and the parsed problems
+        :type problems: list[tuple[str, FittingProblem]]
+        """
+        cost_model = CostModel(
+            self._load_runtime_history(), self._options.max_runtime
+        )
+        units = []
+        costs = []
+        parse_index = {}
+        for fname, problem in problems:
+            index = parse_index.get(fname, 0)
+            parse_index[fname] = index + 1
+            num_start_vals = len(problem.starting_values)
+            for start_index in range(num_start_vals):
+                units.append(
+                    (fname, index, problem.name, start_index, num_start_vals)
+                )
+                costs.append(
+                    cost_model.predict(
+                        problem,
+                        _start_value_name(
+                            problem.name, start_index, num_start_vals
+                        ),
+                    )
+                )
+
+        LOGGER.info(
+            "Running %i fits on %i worker processes",
+            len(units),
+            self._options.num_workers,
+        )
+
+        with ProcessPoolExecutor(
+            max_workers=self._options.num_workers,
+            initializer=_init_worker,
+            initargs=(
+                self._options,
+                self._data_dir,
+                self._label,
+                list(self._completed_results.values()),
+            ),
+        ) as pool:
+            futures = [None] * len(units)
+            for i in sorted(
+                range(len(units)), key=costs.__getitem__, reverse=True
+            ):
+                futures[i] = pool.submit(_run_unit, *units[i][:4])
+
+            futures_pbar = (
+                tqdm(
+                    futures,
+                    colour="green",
+                    desc="Benchmark fits",
+                    unit="Benchmark fit",
+                    leave=True,
+                )
+                if self._options.pbar
+                else futures
+            )
+
+            problem_results = []
+            for unit, future in zip(units, futures_pbar):
+                _, _, name, start_index, num_start_vals = unit
+                results, unselected_minimizers = future.result()
+
+                for result in results:
+                    self._checkpointer.add_result(result)
+                self._results.extend(results)
+                self._unselected_minimizers.update(unselected_minimizers)
+
+                if start_index == 0:
+                    problem_results = []
+                problem_results.extend(results)
+                self._check_failed_problem(
+                    _start_value_name(name, start_index, num_start_vals),
+                    problem_results,
+                )
+
+    def _load_runtime_history(self):
+        """
+        Load the results for this dataset from the checkpoint file given
+        by the runtime_history option.
+
+        :return: The results from the previous run
+        :rtype: list[fibenchmarking.utils.fitbm_result.FittingResult]
+        """
+        filename = self._options.runtime_history
+        if not filename:
+            return []
+        try:
+            results, _, _, _ = Checkpoint(self._options).load(filename)
+        except CheckpointError:
+            LOGGER.warning(
+                "Could not load the runtime history from %s", filename
+            )
+            return []
+        return results.get(self._label, [])
+
+    def _run_unit(self, fname, parse_index, name, start_index):
+        """
+        Run a single (problem, starting value) pair. This is the task run
+        by the worker processes when ``num_workers`` is greater than 1.
+
+        :param fname: The problem definition file
+        :type fname: str
+        :param parse_index: The index of the problem in the list returned
+                            when parsing the file
+        :type parse_index: int
+        :param name: The (unique) name to give the problem
+        :type name: str
+        :param start_index: The index of the starting values to use
+        :type start_index: int
+
+        :return: The results and the minimizers that were unselected due
+                 to algorithm_type
+        :rtype: tuple[list[fibenchmarking.utils.fitbm_result.FittingResult],
+                      dict[str, list[str]]]
+        """
+        if fname not in self._parsed_problems:
+            with self._grabbed_output:
+                parsed = parse_problem_file(fname, self._options)
+            for fp in parsed:
+                fp.correct_data()
+            self._parsed_problems[fname] = parsed
+
+        problem = self._parsed_problems[fname][parse_index]
+        problem.name = name
+
+        self._unselected_minimizers = {}
+        if self._emissions_tracker is None:
+            self._emissions_tracker = self._create_emissions_tracker()
+        try:
+            results = self._run_starting_value(problem, start_index)
+        finally:
+            # The pool does not tell the workers when it shuts down, so
+            # the tracker is stopped once each pair has been run, rather
+            # than left running for the life of the worker
+            if self._emissions_tracker is not None:
+                _ = self._emissions_tracker.stop()
+                self._emissions_tracker = None
+        return results, self._unselected_minimizers
+
     def _loop_over_cost_function(self, problem):
         """
         Run benchmarking for each cost function given in options.
@@ -510,32 +745,53 @@ class Fit:
                         "%sHessian: %s", self._logger_prefix * 6, hess_name
                     )
 
-                # Perform the fit a number of times specified by num_runs
-                accuracy, runtimes, energy = self._perform_fit(controller)
-                result_args = {
-                    "controller": controller,
-                    "accuracy": accuracy,
-                    "runtimes": runtimes,
-                    "energy": energy,
-                    "runtime_metric": self._options.runtime_metric,
-                }
-                if problem.multifit:
-                    # for multifit problems, multiple accuracy values
-                    # are stored in a list i.e. we have multiple results
-                    for i in range(len(accuracy)):
-                        result_args["dataset"] = i
-                        result = fitbm_result.FittingResult(**result_args)
-                        result.fin_function_params = (
-                            problem.get_function_params(
-                                params=controller.final_params[i]
-                            )
-                        )
+                if not self._in_shard(controller):
+                    LOGGER.info(
+                        "%sSkipping fit, it is in another shard",
+                        self._logger_prefix * 6,
+                    )
+                elif (
+                    completed := self._get_completed_results(controller)
+                ) is not None:
+                    LOGGER.info(
+                        "%sUsing the result from the previous run",
+                        self._logger_prefix * 6,
+                    )
+                    for result in completed:
                         results.append(result)
                         self._checkpointer.add_result(result)
                 else:
-                    result = fitbm_result.FittingResult(**result_args)
-                    results.append(result)
-                    self._checkpointer.add_result(result)
+                    # Perform the fit a number of times specified by num_runs,
+                    # or until the runtime is stable for adaptive runs
+                    accuracy, runtimes, cpu_runtimes, energy, phase_times = (
+                        self._perform_fit(controller)
+                    )
+                    result_args = {
+                        "controller": controller,
+                        "accuracy": accuracy,
+                        "runtimes": runtimes,
+                        "cpu_runtimes": cpu_runtimes,
+                        "energy": energy,
+                        "runtime_metric": self._options.runtime_metric,
+                        "phase_times": phase_times,
+                    }
+                    if problem.multifit:
+                        # for multifit problems, multiple accuracy values
+                        # are stored in a list i.e. we have multiple results
+                        for i in range(len(accuracy)):
+                            result_args["dataset"] = i
+                            result = fitbm_result.FittingResult(**result_args)
+                            result.fin_function_params = (
+                                problem.get_function_params(
+                                    params=controller.final_params[i]
+                                )
+                            )
+                            results.append(result)
+                            self._checkpointer.add_result(result)
+                    else:
+                        result = fitbm_result.FittingResult(**result_args)
+                        results.append(result)
+                        self._checkpointer.add_result(result)
 
                 # For minimizers that do not accept hessians we raise an
                 # StopIteration exception to exit the loop through the
@@ -545,22 +801,67 @@ class Fit:
 
         return results
 
+    def _in_shard(self, controller):
+        """
+        Check whether the fit the controller is set up for is in the shard
+        of the benchmark being run.
+
+        :param controller: The software controller for the fitting
+        :type controller: Object derived from BaseSoftwareController
+
+        :return: Whether to run the fit
+        :rtype: bool
+        """
+        if not self._options.shard:
+            return True
+        index, num_shards = parse_shard(self._options.shard)
+        return _get_shard(_fit_key(controller), num_shards) == index
+
+    def _get_completed_results(self, controller):
+        """
+        Get the results of a previous run for the fit the controller is
+        set up for.
+
+        :param controller: The software controller for the fitting
+        :type controller: Object derived from BaseSoftwareController
+
+        :return: The results for the fit, or None if it has not been run.
+                 Multifit problems have one result per dataset.
+        :rtype: list[fibenchmarking.utils.fitbm_result.FittingResult]
+                or None
+        """
+        if not self._completed_results:
+            return None
+
+        problem = controller.problem
+        name, *tags = _fit_key(controller)
+        if problem.multifit:
+            names = [
+                f"{name}, Dataset {i + 1}" for i in range(len(problem.data_x))
+            ]
+        else:
+            names = [name]
+
+        keys = [(name, *tags) for name in names]
+        if not all(key in self._completed_results for key in keys):
+            return None
+        return [self._completed_results[key] for key in keys]
+
     def _perform_fit(self, controller):
         """
         Performs a fit using the provided controller and its data. It
-        will be run a number of times specified by num_runs.
+        will be run a number of times specified by num_runs, or until the
+        runtime is stable if adaptive_runs is set.
 
         :param controller: The software controller for the fitting
         :type controller: Object derived from BaseSoftwareController
 
-        :return: The chi squared, runtimes and energy usage of the fit.
-        :rtype: tuple(float, list[float], float)
+        :return: The chi squared, runtimes, CPU times, energy usage and
+                 time spent in each phase of the fit.
+        :rtype: tuple(float, list[float], list[float], float,
+                      dict[str, float])
         """
         num_runs = self._options.num_runs
-        energy = np.nan
-        tracker = self._emissions_tracker
-        tracker_started = False
-        tracker_stopped = False
 
         # For multifit problems, Mantid combines the datasets itself,
         # everything else needs the controller to do it
@@ -569,69 +870,11 @@ class Fit:
         )
 
         try:
-            with self._grabbed_output:
-                if combine_datasets:
-                    controller.multifit_init()
-                controller.validate()
-                controller.prepare()
-                if tracker:
-                    tracker.start_task()
-                    tracker_started = True
-                    runtimes = timeit.Timer(stmt=controller.execute).repeat(
-                        num_runs, 1
-                    )
-                    energy = tracker.stop_task().energy_consumed / num_runs
-                    tracker_stopped = True
-                else:
-                    runtimes = timeit.Timer(stmt=controller.execute).repeat(
-                        num_runs, 1
-                    )
-                controller.cleanup()
-                if combine_datasets:
-                    controller.multifit_cleanup()
-                controller.check_attributes()
-
-            min_time = np.min(runtimes)
-            ratio = np.max(runtimes) / min_time
-            tol = 4
-            if ratio > tol:
-                LOGGER.warning(
-                    "The ratio of the max time to the min is %.8f,"
-                    " which is larger than the tolerance of %d."
-                    " The min time is %.8f. This can indicate that"
-                    " the fitting engine is caching results. If the"
-                    " min time is small this may just indicate that"
-                    " other non-FitBenchmarking CPU activities are"
-                    " taking place that affects the timing"
-                    " results",
-                    ratio,
-                    tol,
-                    min_time,
-                )
-
-            # Avoid deleting results (max runtime exception) if gotten this far
-            controller.timer.reset()
-            if controller.params_pdfs is None:
-                accuracy = controller.eval_chisq(
-                    params=controller.final_params,
-                    x=controller.data_x,
-                    y=controller.data_y,
-                    e=controller.data_e,
-                )
+            if self._options.isolate_fits:
+                output = self._execute_isolated(controller, combine_datasets)
             else:
-                conf = controller.eval_confidence()
-                accuracy = 1 / conf if conf != 0 else np.inf
-
-            accuracy_check = (
-                any(np.isnan(n) for n in accuracy)
-                if controller.problem.multifit
-                else np.isnan(accuracy)
-            )
-            if np.isnan(runtimes).any() or accuracy_check:
-                raise ControllerAttributeError(
-                    "Either the computed runtime "
-                    "or accuracy values were a NaN."
-                )
+                output = self._execute_fit(controller, combine_datasets)
+            accuracy, runtimes, cpu_runtimes, energy, phase_times = output
         except ValidationException as ex:
             LOGGER.warning(str(ex))
             controller.flag = 7
@@ -640,7 +883,7 @@ class Fit:
 
             # Note: Handle all exceptions as general exception to cover case
             #       where software re-raises our exception as a new type.
-            error_flags = {MaxRuntimeError: 6}
+            error_flags = {MaxRuntimeError: 6, MaxMemoryError: 9}
 
             controller.flag = 3
             for error, flag in error_flags.items():
@@ -655,13 +898,7 @@ class Fit:
         # Reset the controller timer once exceptions have been handled
         controller.timer.reset()
 
-        # Ensure emissions tracker has been stopped if energy not set. The
-        # task is only stopped if it was started, as the fit may have raised
-        # an exception before the task was started.
-        if self._emissions_tracker and tracker_started and not tracker_stopped:
-            _ = self._emissions_tracker.stop_task()
-
-        if controller.flag in [3, 6, 7]:
+        if controller.flag in [3, 6, 7, 9]:
             multi_fit = controller.problem.multifit
 
             # The fit failed, so multifit_cleanup may not have run yet.
@@ -681,6 +918,11 @@ class Fit:
             # cost function value to be infinite
             energy = np.inf
             runtimes = [np.inf] * num_runs
+            cpu_runtimes = [np.inf] * num_runs
+            phase_times = {}
+            controller.eval_counts = {}
+            controller.eval_times = {}
+            controller.convergence_trace = None
             controller.final_params = (
                 None if not multi_fit else [None] * len(controller.data_x)
             )
@@ -694,7 +936,198 @@ class Fit:
             # flag if not
             controller.check_bounds_respected()
 
-        return accuracy, runtimes, energy
+        return accuracy, runtimes, cpu_runtimes, energy, phase_times
+
+    def _execute_fit(self, controller, combine_datasets):
+        """
+        Runs the fit and evaluates the accuracy of the result. Exceptions
+        raised by the fit are left for _perform_fit to handle.
+
+        :param controller: The software controller for the fitting
+        :type controller: Object derived from BaseSoftwareController
+        :param combine_datasets: Whether the controller needs to combine
+                                 the datasets of a multifit problem
+        :type combine_datasets: bool
+
+        :return: The chi squared, runtimes, CPU times, energy usage and
+                 time spent in each phase of the fit.
+        :rtype: tuple(float, list[float], list[float], float,
+                      dict[str, float])
+        """
+        energy = np.nan
+        tracker = self._emissions_tracker
+        tracker_running = False
+        phase_times = {}
+        # Counting the evaluations adds a small cost to each of them, so
+        # they are only counted when the overhead table is produced
+        count_evals = "overhead" in self._options.table_type
+        # The datasets of a multifit problem share one fit, so their
+        # convergence is not traced separately
+        trace_fit = (
+            self._options.convergence_trace and not controller.problem.multifit
+        )
+
+        try:
+            with (
+                self._grabbed_output,
+                counting_evals(controller, count_evals) as counter,
+                tracing_convergence(controller, trace_fit) as trace,
+            ):
+                with time_phase(phase_times, "setup"):
+                    if combine_datasets:
+                        controller.multifit_init()
+                    controller.validate()
+                    controller.prepare()
+                    if controller.cost_func.jacobian is not None:
+                        controller.cost_func.jacobian.prepare(
+                            controller.initial_params
+                        )
+                counter.reset()
+                with time_phase(phase_times, "fit"):
+                    if tracker:
+                        tracker.start_task()
+                        tracker_running = True
+                        runtimes, cpu_runtimes = self._time_fit(controller)
+                        tracker_running = False
+                        energy = tracker.stop_task().energy_consumed / len(
+                            runtimes
+                        )
+                    else:
+                        runtimes, cpu_runtimes = self._time_fit(controller)
+                if count_evals:
+                    controller.eval_counts, controller.eval_times = (
+                        counter.per_run(len(runtimes))
+                    )
+                if trace_fit:
+                    controller.convergence_trace = trace.as_array()
+                with time_phase(phase_times, "cleanup"):
+                    controller.cleanup()
+                    if combine_datasets:
+                        controller.multifit_cleanup()
+                    controller.check_attributes()
+        except Exception:
+            # Ensure emissions tracker has been stopped if energy not set.
+            # The task is only stopped if it was started, as the fit may
+            # have raised an exception before the task was started.
+            if tracker_running:
+                _ = tracker.stop_task()
+            raise
+        finally:
+            # Release the resources of the Jacobian, e.g. the worker
+            # processes of the parallel Jacobian, which hold a copy of
+            # the problem from this fit
+            if controller.cost_func.jacobian is not None:
+                controller.cost_func.jacobian.close()
+
+        min_time = np.min(runtimes)
+        ratio = np.max(runtimes) / min_time
+        tol = 4
+        if ratio > tol:
+            LOGGER.warning(
+                "The ratio of the max time to the min is %.8f,"
+                " which is larger than the tolerance of %d."
+                " The min time is %.8f. This can indicate that"
+                " the fitting engine is caching results. If the"
+                " min time is small this may just indicate that"
+                " other non-FitBenchmarking CPU activities are"
+                " taking place that affects the timing"
+                " results",
+                ratio,
+                tol,
+                min_time,
+            )
+
+        # Avoid deleting results (max runtime exception) if gotten this far
+        controller.timer.reset()
+        with time_phase(phase_times, "accuracy"):
+            if controller.params_pdfs is None:
+                accuracy = controller.eval_chisq(
+                    params=controller.final_params,
+                    x=controller.data_x,
+                    y=controller.data_y,
+                    e=controller.data_e,
+                )
+            else:
+                conf = controller.eval_confidence()
+                accuracy = 1 / conf if conf != 0 else np.inf
+
+        accuracy_check = (
+            any(np.isnan(n) for n in accuracy)
+            if controller.problem.multifit
+            else np.isnan(accuracy)
+        )
+        if np.isnan(runtimes).any() or accuracy_check:
+            raise ControllerAttributeError(
+                "Either the computed runtime or accuracy values were a NaN."
+            )
+
+        return accuracy, runtimes, cpu_runtimes, energy, phase_times
+
+    def _time_fit(self, controller):
+        """
+        Times the fit num_runs times, or if adaptive_runs is set, until the
+        confidence interval of the runtime metric is within runtime_rtol.
+        The CPU time of each run is measured with the cpu_clock option.
+        The model cache of the problem is cleared before each run.
+
+        :param controller: The software controller for the fitting
+        :type controller: Object derived from BaseSoftwareController
+
+        :return: The runtime and CPU time of each run of the fit
+        :rtype: tuple(list[float], list[float])
+        """
+        num_runs = self._options.num_runs
+        cpu_clock = self._options.cpu_clock
+        execute = controller.execute
+
+        def run():
+            # Start each run with an empty cache, so that later runs do
+            # not reuse the model evaluations of the first
+            controller.problem.model_cache.clear()
+            return execute()
+
+        if not self._options.adaptive_runs:
+            return repeat(run, num_runs, cpu_clock)
+
+        return repeat_until_stable(
+            run,
+            runtime_metric=self._options.runtime_metric,
+            min_runs=num_runs,
+            max_runs=max(num_runs, self._options.max_runs),
+            rtol=self._options.runtime_rtol,
+            max_time=self._options.max_timing_time,
+            cpu_clock=cpu_clock,
+        )
+
+    def _execute_isolated(self, controller, combine_datasets):
+        """
+        Runs _execute_fit in a child process, which is killed if it
+        exceeds the max_runtime or max_memory options. The state of the
+        controller after the fit is copied back from the child.
+
+        :param controller: The software controller for the fitting
+        :type controller: Object derived from BaseSoftwareController
+        :param combine_datasets: Whether the controller needs to combine
+                                 the datasets of a multifit problem
+        :type combine_datasets: bool
+
+        :return: The chi squared, runtimes, CPU times, energy usage and
+                 time spent in each phase of the fit.
+        :rtype: tuple(float, list[float], list[float], float,
+                      dict[str, float])
+        """
+
+        def fit_in_child():
+            output = self._execute_fit(controller, combine_datasets)
+            return output, _controller_state(controller)
+
+        output, state = run_isolated(
+            fit_in_child,
+            max_runtime=self._options.max_runtime,
+            max_memory=self._options.max_memory,
+        )
+        vars(controller).update(state)
+        return output
 
     def _check_jacobian(self, func, jac, params):
         """
@@ -729,3 +1162,195 @@ class Fit:
                 "been provided by the user.",
                 normalized_error,
             )
+
+
+def _result_key(result):
+    """
+    Get the key identifying the fit a result came from. This matches the
+    key used when merging checkpoint files.
+
+    :param result: The result
+    :type result: fibenchmarking.utils.fitbm_result.FittingResult
+
+    :return: The problem name, and the software, minimizer, jacobian,
+             hessian and cost function tags
+    :rtype: tuple[str]
+    """
+    return (
+        result.name,
+        result.software_tag,
+        result.minimizer_tag,
+        result.jacobian_tag,
+        result.hessian_tag,
+        result.costfun_tag,
+    )
+
+
+def _fit_key(controller):
+    """
+    Get the key identifying the fit the controller is set up for. This
+    matches the key of the result from the fit (for multifit problems
+    the name does not include the dataset).
+
+    :param controller: The software controller for the fitting
+    :type controller: Object derived from BaseSoftwareController
+
+    :return: The problem name, and the software, minimizer, jacobian,
+             hessian and cost function tags
+    :rtype: tuple[str]
+    """
+    cost_func = controller.cost_func
+    minimizer = controller.minimizer
+
+    jacobian_tag = ""
+    if (
+        cost_func.jacobian is not None
+        and minimizer in controller.jacobian_enabled_solvers
+    ):
+        jacobian_tag = cost_func.jacobian.name()
+    hessian_tag = ""
+    if (
+        cost_func.hessian is not None
+        and minimizer in controller.hessian_enabled_solvers
+    ):
+        hessian_tag = cost_func.hessian.name()
+
+    return (
+        controller.problem.name,
+        controller.software or "",
+        minimizer or "",
+        jacobian_tag,
+        hessian_tag,
+        cost_func.__class__.__name__,
+    )
+
+
+def _get_shard(key, num_shards):
+    """
+    Get the shard a fit belongs to. This uses a hash of the key which is
+    stable between processes and machines, so every node running a shard
+    of the benchmark agrees on the partition.
+
+    :param key: The key identifying the fit, as given by _fit_key
+    :type key: tuple[str]
+    :param num_shards: The number of shards
+    :type num_shards: int
+
+    :return: The shard the fit belongs to, from 1 to num_shards
+    :rtype: int
+    """
+    digest = hashlib.sha1("\x1f".join(key).encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % num_shards + 1
+
+
+def _start_value_name(name, index, num_start_vals):
+    """
+    Get the name of a problem for a given starting value.
+
+    :param name: The name of the problem
+    :type name: str
+    :param index: The index of the starting values
+    :type index: int
+    :param num_start_vals: The number of starting values for the problem
+    :type num_start_vals: int
+
+    :return: The name to use in the results
+    :rtype: str
+    """
+    if num_start_vals > 1:
+        prefix = (len(str(num_start_vals)) - len(str(index + 1))) * "0"
+        return f"{name}, Start {prefix}{index + 1}"
+    return name
+
+
+# Controller attributes which are shared with the problem, so are not
+# copied back from an isolated fit
+_SHARED_CONTROLLER_ATTRS = {
+    "cost_func",
+    "problem",
+    "timer",
+    "data_x",
+    "data_y",
+    "data_e",
+}
+
+
+def _controller_state(controller):
+    """
+    Get the attributes of a controller that can be sent back from the
+    process running an isolated fit.
+
+    :param controller: The software controller for the fitting
+    :type controller: Object derived from BaseSoftwareController
+
+    :return: The picklable attributes of the controller
+    :rtype: dict
+    """
+    state = {}
+    for key, value in vars(controller).items():
+        if key in _SHARED_CONTROLLER_ATTRS:
+            continue
+        try:
+            pickle.dumps(value)
+        except Exception:
+            continue
+        state[key] = value
+    return state
+
+
+class _NullCheckpoint:
+    """
+    Stands in for the Checkpoint in worker processes. The results are
+    returned to the main process, which adds them to the real checkpoint.
+    """
+
+    def add_result(self, result):
+        """
+        Ignore the result.
+        """
+
+    def finalise_group(self, *args, **kwargs):
+        """
+        Nothing to finalise.
+        """
+
+
+# The Fit object used by the current worker process
+_WORKER_FIT = None
+
+
+def _init_worker(options, data_dir, label, completed_results):
+    """
+    Set up a worker process for running the benchmark in parallel.
+
+    :param options: The options for the benchmark
+    :type options: fitbenchmarking.utils.options.Options
+    :param data_dir: The directory holding the problem set
+    :type data_dir: str
+    :param label: The name for the dataset in the checkpoint
+    :type label: str
+    :param completed_results: Results from a previous run to reuse
+    :type completed_results: list[FittingResult]
+    """
+    global _WORKER_FIT
+
+    # Progress bars are drawn by the main process
+    options.pbar = False
+    _WORKER_FIT = Fit(
+        options=options,
+        data_dir=data_dir,
+        checkpointer=_NullCheckpoint(),
+        label=label,
+        completed_results=completed_results,
+    )
+
+
+def _run_unit(fname, parse_index, name, start_index):
+    """
+    Run a single (problem, starting value) pair in a worker process.
+    See :meth:`Fit._run_unit`.
+    """
+    # The pool's entry point is part of the Fit implementation
+    return _WORKER_FIT._run_unit(  # noqa: SLF001
+        fname, parse_index, name, start_index
+    )
@@ -11,6 +11,7 @@ import webbrowser
 from shutil import copytree
 
 import dash_bootstrap_components as dbc
+import numpy as np
 import pandas as pd
 from dash import Dash, dcc, html
 from dash.dependencies import Input, Output
@@ -283,8 +284,9 @@ def _process_best_results(results: list[FittingResult]) -> FittingResult:
     This includes:
      - Setting the `is_best_fit` flag,
      - Setting the `min_accuracy` value,
-     - Setting the `min_runtime` value, and
-     - Setting the `min_energy` value
+     - Setting the `min_runtime` value,
+     - Setting the `min_energy` value, and
+     - Setting the `min_time_to_target` value
 
     :param results: The results to compare and update
     :type results: list[FittingResult]
@@ -301,6 +303,7 @@ def _process_best_results(results: list[FittingResult]) -> FittingResult:
         "median_runtime": results[0],
         "harmonic_runtime": results[0],
         "trim_runtime": results[0],
+        "cpu_runtime": results[0],
     }
     lowest = results[0]
     for result in results[1:]:
@@ -325,8 +328,16 @@ def _process_best_results(results: list[FittingResult]) -> FittingResult:
             "harmonic_runtime"
         ].harmonic_runtime
         result.min_trim_runtime = fastest["trim_runtime"].trim_runtime
+        result.min_cpu_runtime = fastest["cpu_runtime"].cpu_runtime
         result.min_energy = lowest.energy
 
+    # The time to target depends on min_accuracy, so is found once it is set
+    times_to_target = np.array([r.time_to_target for r in results])
+    if not np.isnan(times_to_target).all():
+        min_time_to_target = np.nanmin(times_to_target)
+        for result in results:
+            result.min_time_to_target = min_time_to_target
+
     return best
 
 
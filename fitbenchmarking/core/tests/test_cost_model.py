@@ -0,0 +1,137 @@
+"""
+Tests for fitbenchmarking.core.cost_model
+"""
+
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from fitbenchmarking.core.cost_model import CostModel, get_problem_size
+
+
+def make_problem(name, n_data_points, n_params, multifit=False):
+    """
+    Create a mock problem with the given size.
+    """
+    problem = MagicMock()
+    problem.name = name
+    problem.multifit = multifit
+    if multifit:
+        problem.data_x = [np.zeros(n) for n in n_data_points]
+    else:
+        problem.data_x = np.zeros(n_data_points)
+    problem.starting_values = [{f"p{i}": 1.0 for i in range(n_params)}]
+    return problem
+
+
+def make_result(name, runtimes, n_data_points, n_params):
+    """
+    Create a mock result with the given runtimes and size.
+    """
+    result = MagicMock()
+    result.name = name
+    result.runtimes = runtimes
+    result.get_n_data_points.return_value = n_data_points
+    result.get_n_parameters.return_value = n_params
+    return result
+
+
+class GetProblemSizeTests(unittest.TestCase):
+    """
+    Tests for get_problem_size
+    """
+
+    def test_problem_size(self):
+        """
+        Checks the size is the data points multiplied by the parameters.
+        """
+        problem = make_problem("prob", 10, 3)
+        self.assertEqual(get_problem_size(problem), 30)
+
+    def test_problem_size_multifit(self):
+        """
+        Checks the data points of every dataset are counted for multifit
+        problems.
+        """
+        problem = make_problem("prob", [10, 5], 3, multifit=True)
+        self.assertEqual(get_problem_size(problem), 45)
+
+
+class CostModelTests(unittest.TestCase):
+    """
+    Tests for CostModel
+    """
+
+    def test_predict_no_history(self):
+        """
+        Checks the problem size is used without a history.
+        """
+        model = CostModel()
+        self.assertEqual(model.predict(make_problem("prob", 10, 3)), 30)
+
+    def test_predict_from_history(self):
+        """
+        Checks the runtimes of all the fits are summed for a problem in
+        the history.
+        """
+        history = [
+            make_result("prob", [1.0, 3.0], 10, 3),
+            make_result("prob", [2.0, 2.5], 10, 3),
+        ]
+        model = CostModel(history)
+        self.assertEqual(model.predict(make_problem("prob", 10, 3)), 8.5)
+
+    def test_predict_failed_fits(self):
+        """
+        Checks fits without a runtime are counted as taking the
+        max_runtime, so a problem whose fit was stopped by it is predicted
+        to be the longest.
+        """
+        history = [
+            make_result("quick", [1.0, 3.0], 10, 3),
+            make_result("stopped", [np.inf, np.inf], 10, 3),
+            make_result("stopped", [2.0, 2.0], 10, 3),
+        ]
+        model = CostModel(history, max_runtime=600.0)
+        self.assertEqual(model.predict(make_problem("quick", 10, 3)), 4.0)
+        self.assertEqual(model.predict(make_problem("stopped", 10, 3)), 604.0)
+
+    def test_predict_new_problem(self):
+        """
+        Checks the size of a problem which is not in the history is
+        converted to seconds with the median rate of the history.
+        """
+        history = [
+            make_result("a", [1.0], 10, 1),
+            make_result("b", [2.0], 10, 1),
+            make_result("c", [30.0], 10, 1),
+        ]
+        model = CostModel(history)
+        self.assertAlmostEqual(model.predict(make_problem("d", 5, 2)), 2.0)
+
+    def test_predict_name(self):
+        """
+        Checks the name argument is used to look up the history.
+        """
+        history = [make_result("prob, Start 2", [4.0], 10, 3)]
+        model = CostModel(history)
+        problem = make_problem("prob", 10, 3)
+        self.assertEqual(model.predict(problem, "prob, Start 2"), 4.0)
+
+    def test_predict_multifit_history(self):
+        """
+        Checks the shared runtime of a multifit problem is only counted
+        once.
+        """
+        history = [
+            make_result("prob, Dataset 1", [5.0], 10, 3),
+            make_result("prob, Dataset 2", [5.0], 10, 3),
+        ]
+        model = CostModel(history)
+        problem = make_problem("prob", [10, 10], 3, multifit=True)
+        self.assertEqual(model.predict(problem), 5.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,19 +2,26 @@
 Tests for fitbenchmarking.core.fitting_benchmarking.Fit
 """
 
+import contextlib
 import inspect
 import json
 import os
+import time
 import unittest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import numpy as np
+import psutil
 from parameterized import parameterized
 
 from fitbenchmarking import test_files
 from fitbenchmarking.controllers.scipy_controller import ScipyController
-from fitbenchmarking.core.fitting_benchmarking import Fit
+from fitbenchmarking.core.fitting_benchmarking import (
+    Fit,
+    _get_shard,
+    _result_key,
+)
 from fitbenchmarking.cost_func.nlls_cost_func import NLLSCostFunc
 from fitbenchmarking.cost_func.weighted_nlls_cost_func import (
     WeightedNLLSCostFunc,
@@ -25,6 +32,7 @@ from fitbenchmarking.utils import exceptions
 from fitbenchmarking.utils.checkpoint import Checkpoint
 from fitbenchmarking.utils.fitbm_result import FittingResult
 from fitbenchmarking.utils.log import get_logger
+from fitbenchmarking.utils.misc import get_problem_files
 from fitbenchmarking.utils.options import Options
 
 LOGGER = get_logger()
@@ -233,7 +241,7 @@ class PerformFitTests(unittest.TestCase):
 
         for minimizer, acc in zip(["Nelder-Mead", "Powell"], expected):
             controller.minimizer = minimizer
-            accuracy, runtimes, energy = fit._perform_fit(controller)
+            accuracy, runtimes, _, energy, _ = fit._perform_fit(controller)
 
             self.assertAlmostEqual(accuracy, acc, 6)
             assert len(runtimes) == self.options.num_runs
@@ -254,12 +262,12 @@ class PerformFitTests(unittest.TestCase):
 
         fit = Fit(options=self.options, data_dir="test", checkpointer=self.cp)
         mock.return_value = 2
-        accuracy, _, _ = fit._perform_fit(controller)
+        accuracy, _, _, _, _ = fit._perform_fit(controller)
         assert accuracy == 0.5
         assert mock.call_count == 1
 
         mock.return_value = 0
-        accuracy, _, _ = fit._perform_fit(controller)
+        accuracy, _, _, _, _ = fit._perform_fit(controller)
         assert accuracy == np.inf
 
     @parameterized.expand(
@@ -277,7 +285,7 @@ class PerformFitTests(unittest.TestCase):
         fit = Fit(options=self.options, data_dir="test", checkpointer=self.cp)
 
         mock.side_effect = exp
-        accuracy, runtimes, energy = fit._perform_fit(controller)
+        accuracy, runtimes, _, energy, _ = fit._perform_fit(controller)
         assert accuracy == np.inf
         assert energy == np.inf
         assert runtimes == [np.inf] * 5
@@ -301,7 +309,7 @@ class PerformFitTests(unittest.TestCase):
 
         mock_stop_task.assert_not_called()
 
-    @patch("timeit.Timer.repeat")
+    @patch(f"{FITTING_DIR}.repeat")
     @patch(
         "fitbenchmarking.controllers.scipy_controller.ScipyController.cleanup"
     )
@@ -317,7 +325,7 @@ class PerformFitTests(unittest.TestCase):
         """
         mock1.return_value = None
         mock2.return_value = None
-        mock3.return_value = [1, 1, 1, 1, 5]
+        mock3.return_value = ([1, 1, 1, 1, 5], [1, 1, 1, 1, 5])
 
         with self.assertLogs(LOGGER, level="WARNING") as log:
             controller = set_up_controller("ENSO.dat", self.options)
@@ -349,7 +357,7 @@ class PerformFitTests(unittest.TestCase):
         fit = Fit(options=self.options, data_dir="test5", checkpointer=self.cp)
 
         mock.side_effect = exceptions.MaxRuntimeError
-        accuracy, runtimes, energy = fit._perform_fit(controller)
+        accuracy, runtimes, _, energy, _ = fit._perform_fit(controller)
         assert controller.flag == 6
         assert accuracy == np.inf
         assert energy == np.inf
@@ -431,6 +439,230 @@ class PerformFitTests(unittest.TestCase):
             assert start_task_check.call_count == 1
             assert stop_task_check.call_count == 1
 
+    @parameterized.expand(
+        [
+            ("stable", 1e6, 2, 4, 2),
+            ("max_runs", 1e-12, 2, 4, 4),
+            ("num_runs", 1e-12, 5, 3, 5),
+        ]
+    )
+    def test_perform_fit_adaptive_runs(
+        self, _, rtol, num_runs, max_runs, expected
+    ):
+        """
+        The test checks adaptive runs stop when the runtime is stable,
+        and take at least num_runs and at most max_runs runs.
+        """
+        self.options.adaptive_runs = True
+        self.options.num_runs = num_runs
+        self.options.max_runs = max_runs
+        self.options.runtime_rtol = rtol
+        controller = set_up_controller("ENSO.dat", self.options)
+        controller.minimizer = "Powell"
+        fit = Fit(options=self.options, data_dir="test", checkpointer=self.cp)
+
+        _, runtimes, _, _, _ = fit._perform_fit(controller)
+
+        assert len(runtimes) == expected
+
+    def test_perform_fit_phase_times(self):
+        """
+        The test checks _perform_fit records the time spent in each phase
+        of the fit.
+        """
+        controller = set_up_controller("ENSO.dat", self.options)
+        controller.minimizer = "Powell"
+        fit = Fit(options=self.options, data_dir="test", checkpointer=self.cp)
+
+        _, runtimes, _, _, phase_times = fit._perform_fit(controller)
+
+        assert list(phase_times) == ["setup", "fit", "cleanup", "accuracy"]
+        assert all(t >= 0 for t in phase_times.values())
+        assert phase_times["fit"] >= sum(runtimes)
+
+    @patch(
+        "fitbenchmarking.controllers.scipy_controller.ScipyController.fit",
+        side_effect=exceptions.MaxRuntimeError,
+    )
+    def test_perform_fit_phase_times_failed(self, _):
+        """
+        The test checks _perform_fit records no phase times for a fit
+        which failed.
+        """
+        controller = set_up_controller("ENSO.dat", self.options)
+        controller.minimizer = "Powell"
+        fit = Fit(options=self.options, data_dir="test", checkpointer=self.cp)
+
+        _, _, _, _, phase_times = fit._perform_fit(controller)
+
+        assert phase_times == {}
+
+    @parameterized.expand([(None,), (exceptions.MaxRuntimeError,)])
+    def test_perform_fit_jacobian_closed(self, side_effect):
+        """
+        The test checks _perform_fit closes the Jacobian at the end of the
+        fit, whether or not it succeeds.
+        """
+        controller = set_up_controller("ENSO.dat", self.options)
+        controller.minimizer = "Powell"
+        fit = Fit(options=self.options, data_dir="test", checkpointer=self.cp)
+
+        with (
+            patch.object(controller.cost_func.jacobian, "close") as close,
+            patch.object(
+                controller, "fit", side_effect=side_effect, autospec=True
+            ),
+        ):
+            fit._perform_fit(controller)
+
+        close.assert_called_once()
+
+    def test_perform_fit_jacobian_prepared(self):
+        """
+        The test checks _perform_fit prepares the Jacobian at the initial
+        parameters before the fit is timed.
+        """
+        controller = set_up_controller("ENSO.dat", self.options)
+        controller.minimizer = "Powell"
+        fit = Fit(options=self.options, data_dir="test", checkpointer=self.cp)
+        calls = []
+        time_fit = fit._time_fit
+
+        def timed_fit(ctrl):
+            calls.append("time_fit")
+            return time_fit(ctrl)
+
+        with (
+            patch.object(
+                controller.cost_func.jacobian,
+                "prepare",
+                side_effect=lambda _: calls.append("prepare"),
+            ) as prepare,
+            patch.object(fit, "_time_fit", side_effect=timed_fit),
+        ):
+            fit._perform_fit(controller)
+
+        assert calls == ["prepare", "time_fit"]
+        prepare.assert_called_once_with(controller.initial_params)
+
+    def test_perform_fit_eval_counts(self):
+        """
+        The test checks _perform_fit counts the evaluations of the fit
+        when the overhead table is selected.
+        """
+        self.options.table_type = ["overhead"]
+        controller = set_up_controller("ENSO.dat", self.options)
+        controller.minimizer = "Powell"
+        fit = Fit(options=self.options, data_dir="test", checkpointer=self.cp)
+
+        fit._perform_fit(controller)
+
+        assert controller.eval_counts["model"] > 0
+        assert controller.eval_counts["eval_cost"] > 0
+        assert set(controller.eval_times) == {*controller.eval_counts, "total"}
+        assert "eval_model" not in vars(controller.problem)
+        assert "eval_cost" not in vars(controller.cost_func)
+
+    def test_perform_fit_eval_counts_not_selected(self):
+        """
+        The test checks _perform_fit does not count the evaluations of the
+        fit when the overhead table is not selected.
+        """
+        controller = set_up_controller("ENSO.dat", self.options)
+        controller.minimizer = "Powell"
+        fit = Fit(options=self.options, data_dir="test", checkpointer=self.cp)
+
+        fit._perform_fit(controller)
+
+        assert controller.eval_counts == {}
+        assert controller.eval_times == {}
+
+    def test_perform_fit_convergence_trace(self):
+        """
+        The test checks _perform_fit traces the convergence of the fit
+        when convergence_trace is set.
+        """
+        self.options.convergence_trace = True
+        controller = set_up_controller("ENSO.dat", self.options)
+        controller.minimizer = "Powell"
+        fit = Fit(options=self.options, data_dir="test", checkpointer=self.cp)
+
+        accuracy, _, _, _, _ = fit._perform_fit(controller)
+
+        trace = controller.convergence_trace
+        assert trace.shape[1] == 3
+        assert np.all(np.diff(trace[:, 2]) < 0)
+        self.assertAlmostEqual(trace[-1, 2], accuracy, 6)
+        assert "execute" not in vars(controller)
+
+    def test_perform_fit_isolated(self):
+        """
+        The test checks _perform_fit gives the same result when the fit
+        is run in a child process.
+        """
+        controller = set_up_controller("ENSO.dat", self.options)
+        controller.minimizer = "Nelder-Mead"
+        fit = Fit(options=self.options, data_dir="test", checkpointer=self.cp)
+        expected, _, _, _, _ = fit._perform_fit(controller)
+        expected_params = controller.final_params
+        expected_flag = controller.flag
+
+        self.options.isolate_fits = True
+        controller = set_up_controller("ENSO.dat", self.options)
+        controller.minimizer = "Nelder-Mead"
+        fit = Fit(options=self.options, data_dir="test", checkpointer=self.cp)
+        accuracy, runtimes, _, _, _ = fit._perform_fit(controller)
+
+        self.assertAlmostEqual(accuracy, expected, 6)
+        assert len(runtimes) == self.options.num_runs
+        assert controller.flag == expected_flag
+        np.testing.assert_allclose(controller.final_params, expected_params)
+
+    @patch("fitbenchmarking.controllers.base_controller.Controller.execute")
+    def test_perform_fit_isolated_max_runtime(self, mock):
+        """
+        The test checks an isolated fit which does not check the timer is
+        killed and given flag 6.
+        """
+        self.options.isolate_fits = True
+        self.options.max_runtime = 0.5
+        controller = set_up_controller("Gauss3.dat", self.options)
+        controller.minimizer = "Nelder-Mead"
+        fit = Fit(options=self.options, data_dir="test", checkpointer=self.cp)
+
+        mock.side_effect = lambda: time.sleep(30)
+        accuracy, runtimes, _, energy, _ = fit._perform_fit(controller)
+        assert controller.flag == 6
+        assert accuracy == np.inf
+        assert energy == np.inf
+        assert runtimes == [np.inf] * 5
+
+    @patch("fitbenchmarking.controllers.base_controller.Controller.execute")
+    def test_perform_fit_isolated_max_memory(self, mock):
+        """
+        The test checks an isolated fit which uses too much memory is
+        killed and given flag 9.
+        """
+        self.options.isolate_fits = True
+        self.options.max_memory = (
+            psutil.Process().memory_info().rss / 1024**2 + 50
+        )
+        controller = set_up_controller("Gauss3.dat", self.options)
+        controller.minimizer = "Nelder-Mead"
+        fit = Fit(options=self.options, data_dir="test", checkpointer=self.cp)
+
+        def use_memory():
+            data = np.ones(int(500 * 1024**2 / 8))
+            time.sleep(30)
+            return data
+
+        mock.side_effect = use_memory
+        accuracy, runtimes, _, energy, _ = fit._perform_fit(controller)
+        assert controller.flag == 9
+        assert accuracy == np.inf
+        assert energy == np.inf
+        assert runtimes == [np.inf] * 5
+
 
 class HessianTests(unittest.TestCase):
     """
@@ -467,7 +699,7 @@ class HessianTests(unittest.TestCase):
 
         self.fit = Fit(options=options, data_dir=data_file, checkpointer=cp)
 
-    @patch(f"{FITTING_DIR}.Fit._perform_fit", return_value=(1, 2, 3))
+    @patch(f"{FITTING_DIR}.Fit._perform_fit", return_value=(1, 2, 2, 3, {}))
     def test_loop_over_hessians_method(self, mock):
         """
         The test checks _loop_over_hessians method.
@@ -479,7 +711,7 @@ class HessianTests(unittest.TestCase):
         assert all(isinstance(r, FittingResult) for r in results)
         assert mock.call_count == 2
 
-    @patch(f"{FITTING_DIR}.Fit._perform_fit", return_value=(1, 2, 3))
+    @patch(f"{FITTING_DIR}.Fit._perform_fit", return_value=(1, 2, 2, 3, {}))
     @patch("fitbenchmarking.hessian.scipy_hessian.Scipy.__init__")
     @patch("fitbenchmarking.hessian.analytic_hessian.Analytic.__init__")
     def test_loop_over_hessians_fallback(self, analytic, scipy, perform_fit):
@@ -502,7 +734,7 @@ class HessianTests(unittest.TestCase):
     @patch("fitbenchmarking.utils.fitbm_result.FittingResult")
     @patch(
         f"{FITTING_DIR}.Fit._perform_fit",
-        return_value=([1, 1], [2, 2], [3, 3]),
+        return_value=([1, 1], [2, 2], [2, 2], [3, 3], {}),
     )
     def test_loop_over_hessians_multifit(self, perform_fit, mock):
         """
@@ -528,7 +760,7 @@ class HessianTests(unittest.TestCase):
         assert self.controller.problem.get_function_params.call_count == 4
         assert self.fit._checkpointer.add_result.call_count == 4
 
-    @patch(f"{FITTING_DIR}.Fit._perform_fit", return_value=(1, 2, 3))
+    @patch(f"{FITTING_DIR}.Fit._perform_fit", return_value=(1, 2, 2, 3, {}))
     def test_loop_over_hessians_minimizer_check(self, perform_fit):
         """
         The test checks _loop_over_hessians method
@@ -1068,6 +1300,173 @@ class BenchmarkTests(unittest.TestCase):
             assert r.hess == expected["results"][ix]["hessian"]
             assert r.jac == expected["results"][ix]["jacobian"]
 
+    @patch(
+        f"{FITTING_DIR}.misc.get_problem_files",
+        side_effect=lambda path: get_problem_files(path)[:3],
+    )
+    def test_benchmark_method_num_workers(self, _):
+        """
+        Checks that running the problems on a pool of worker processes
+        gives the same results, in the same order, as a serial run.
+        """
+        options = Options(
+            additional_options={
+                "software": ["scipy_ls"],
+                "table_type": ["acc", "runtime", "compare", "local_min"],
+                "num_runs": 1,
+                "pbar": False,
+            }
+        )
+        serial, serial_failed, serial_unselected = Fit(
+            options=options, data_dir=DATA_DIR, checkpointer=MagicMock()
+        ).benchmark()
+
+        options.num_workers = 2
+        checkpointer = MagicMock()
+        parallel, parallel_failed, parallel_unselected = Fit(
+            options=options, data_dir=DATA_DIR, checkpointer=checkpointer
+        ).benchmark()
+
+        assert serial_failed == parallel_failed
+        assert serial_unselected == parallel_unselected
+        assert len(serial) == len(parallel)
+        for s, p in zip(serial, parallel):
+            assert s.name == p.name
+            assert s.modified_minimizer_name() == p.modified_minimizer_name()
+            self.assertAlmostEqual(s.accuracy, p.accuracy, 6)
+
+        added = [c.args[0] for c in checkpointer.add_result.call_args_list]
+        assert [r.name for r in added] == [r.name for r in parallel]
+
+    @patch(f"{FITTING_DIR}.ProcessPoolExecutor")
+    def test_benchmark_in_pool_longest_first(self, executor):
+        """
+        Checks the fits predicted to take longest are submitted to the
+        pool first, and the results are still collected in order.
+        """
+        pool = executor.return_value.__enter__.return_value
+        submitted = []
+
+        def submit(_func, fname, parse_index, name, start_index):
+            submitted.append(name)
+            future = MagicMock()
+            future.result.return_value = ([], {})
+            return future
+
+        pool.submit.side_effect = submit
+
+        problems = []
+        for fname in get_problem_files(DATA_DIR)[:3]:
+            for problem in parse_problem_file(fname, self.fit._options):
+                problem.starting_values = problem.starting_values[:1]
+                problems.append((fname, problem))
+
+        self.fit._options.num_workers = 2
+        self.fit._options.pbar = False
+        self.fit._benchmark_in_pool(problems)
+
+        sizes = {
+            p.name: len(p.data_x) * len(p.starting_values[0])
+            for _, p in problems
+        }
+        expected = sorted(sizes, key=sizes.get, reverse=True)
+        assert submitted == expected
+        assert self.fit._failed_problems == [p.name for _, p in problems]
+
+    @patch(
+        f"{FITTING_DIR}.Checkpoint.load",
+        side_effect=exceptions.CheckpointError("Cannot load"),
+    )
+    def test_load_runtime_history_error(self, _):
+        """
+        Checks a runtime history which cannot be loaded is ignored.
+        """
+        self.fit._options.runtime_history = "missing.json"
+        assert self.fit._load_runtime_history() == []
+
+    @patch(
+        f"{FITTING_DIR}.misc.get_problem_files",
+        side_effect=lambda path: get_problem_files(path)[:2],
+    )
+    def test_benchmark_method_completed_results(self, _):
+        """
+        Checks that fits with results from a previous run are not run
+        again, and that the previous results are returned and checkpointed.
+        """
+        options = Options(
+            additional_options={
+                "software": ["scipy_ls"],
+                "num_runs": 1,
+                "pbar": False,
+            }
+        )
+        previous, _, _ = Fit(
+            options=options, data_dir=DATA_DIR, checkpointer=MagicMock()
+        ).benchmark()
+
+        # The last fit was interrupted
+        completed_results = previous[:-1]
+        checkpointer = MagicMock()
+        fit = Fit(
+            options=options,
+            data_dir=DATA_DIR,
+            checkpointer=checkpointer,
+            completed_results=completed_results,
+        )
+        with patch.object(
+            fit, "_perform_fit", wraps=fit._perform_fit
+        ) as perform_fit:
+            results, _, _ = fit.benchmark()
+
+        assert perform_fit.call_count == 1
+        assert len(results) == len(previous)
+        assert results[:-1] == completed_results
+        assert results[-1].name == previous[-1].name
+        assert results[-1].minimizer == previous[-1].minimizer
+        added = [c.args[0] for c in checkpointer.add_result.call_args_list]
+        assert added == results
+
+    @patch(
+        f"{FITTING_DIR}.misc.get_problem_files",
+        side_effect=lambda path: get_problem_files(path)[:2],
+    )
+    def test_benchmark_method_shard(self, _):
+        """
+        Checks that the shards of a benchmark split the fits between them
+        with no fit run in more than one shard.
+        """
+        options = Options(
+            additional_options={
+                "software": ["scipy", "scipy_ls"],
+                "num_runs": 1,
+                "pbar": False,
+            }
+        )
+        results, _, _ = Fit(
+            options=options, data_dir=DATA_DIR, checkpointer=MagicMock()
+        ).benchmark()
+        expected = [_result_key(r) for r in results]
+
+        sharded = []
+        for i in range(1, 4):
+            options.shard = f"{i}/3"
+            results, failed, _ = Fit(
+                options=options, data_dir=DATA_DIR, checkpointer=MagicMock()
+            ).benchmark()
+            assert failed == []
+            assert results
+            sharded.extend(_result_key(r) for r in results)
+
+        assert sorted(sharded) == sorted(expected)
+
+    def test_get_shard_is_stable(self):
+        """
+        Checks the shard of a fit does not change between runs.
+        """
+        key = ("Misra1a", "scipy", "Powell", "", "", "WeightedNLLSCostFunc")
+        assert _get_shard(key, 7) == 1
+        assert all(1 <= _get_shard(key, n) <= n for n in range(1, 10))
+
     @patch(f"{FITTING_DIR}.parse_problem_file")
     @patch(
         f"{FITTING_DIR}.misc.get_problem_files",
@@ -1133,3 +1532,30 @@ class BenchmarkTests(unittest.TestCase):
         with patch.object(tracker, "stop", wraps=tracker.stop) as stop_check:
             self.fit.benchmark()
             stop_check.assert_called_once()
+
+    @parameterized.expand([(None,), (exceptions.FitBenchmarkException,)])
+    @patch(f"{FITTING_DIR}.EmissionsTracker")
+    def test_emissions_tracker_stopped_after_unit(self, side_effect, tracker):
+        """
+        Verify that a worker stops its emissions tracker after running each
+        problem and starting value pair, and uses a new one for the next
+        """
+        fname = os.path.join(DATA_DIR, "ENSO.dat")
+        trackers = [MagicMock(), MagicMock()]
+        tracker.side_effect = trackers
+        fit = Fit(
+            options=self.fit._options, data_dir=DATA_DIR, checkpointer=None
+        )
+
+        with patch.object(
+            fit, "_run_starting_value", side_effect=side_effect
+        ) as run:
+            for _ in range(2):
+                with contextlib.suppress(exceptions.FitBenchmarkException):
+                    fit._run_unit(fname, 0, "ENSO", 0)
+
+        assert run.call_count == 2
+        assert tracker.call_count == 2
+        for t in trackers:
+            t.stop.assert_called_once()
+        assert fit._emissions_tracker is None
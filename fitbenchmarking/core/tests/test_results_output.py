@@ -10,6 +10,7 @@ from tempfile import TemporaryDirectory
 from unittest import mock
 from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
 from dash import dcc, html
 from parameterized import parameterized
@@ -542,6 +543,23 @@ class ProcessBestResultsTests(unittest.TestCase):
         for r in self.results:
             self.assertEqual(r.min_mean_runtime, fastest.mean_runtime)
 
+    def test_minimum_time_to_target_set(self):
+        """
+        Test that min_time_to_target is set from the traced results.
+        """
+        for r, time in zip(self.results, [0.5, 0.3, 0.2, 0.4, 0.1]):
+            # Each trace reaches its own final accuracy at the given time
+            r.convergence_trace = np.array(
+                [[0.01, 1, 100.0], [time, 10, r.accuracy]]
+            )
+        self.results[0].convergence_trace = None
+
+        _process_best_results(self.results)
+
+        # Only the best result (accuracy 1) reaches 1.01 * min_accuracy
+        for r in self.results:
+            self.assertEqual(r.min_time_to_target, 0.3)
+
 
 class UpdateWarningTests(unittest.TestCase):
     """
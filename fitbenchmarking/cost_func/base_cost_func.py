@@ -5,12 +5,40 @@ Implements the base class for the cost function class.
 from abc import ABCMeta, abstractmethod
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from fitbenchmarking.utils.exceptions import IncompatibleMinimizerError
 
 if TYPE_CHECKING:
     from fitbenchmarking.jacobian.base_jacobian import Jacobian
     from fitbenchmarking.parsing.fitting_problem import FittingProblem
 
+# The number of data points to form the outer products for at once in
+# add_outer_products
+OUTER_PRODUCT_CHUNK_SIZE = 256
+
+
+def add_outer_products(hes, jac, weighted_jac):
+    """
+    Add the outer products J_i^T W_i of the rows of the Jacobian and the
+    weighted Jacobian to the (m, m, n) Hessian in place.
+
+    The products are formed for a chunk of data points at a time, so the
+    temporary arrays are bounded by the chunk size rather than n.
+
+    :param hes: The Hessian to add to, indexed (param, param, data point)
+    :type hes: 3D numpy array
+    :param jac: The Jacobian, indexed (data point, param)
+    :type jac: 2D numpy array
+    :param weighted_jac: The Jacobian with each row weighted
+    :type weighted_jac: 2D numpy array
+    """
+    for start in range(0, jac.shape[0], OUTER_PRODUCT_CHUNK_SIZE):
+        chunk = slice(start, start + OUTER_PRODUCT_CHUNK_SIZE)
+        hes[..., chunk] += np.einsum(
+            "ij,ik->jki", jac[chunk], weighted_jac[chunk]
+        )
+
 
 class CostFunc:
     """
@@ -84,6 +112,37 @@ class CostFunc:
         """
         raise NotImplementedError
 
+    def eval_cost_grad(self, params, **kwargs):
+        """
+        Evaluate the cost function and its Jacobian together, for
+        minimizers which take both from one callback. This calls
+        ``eval_cost`` and ``jac_cost`` in turn, so model evaluations are
+        only shared if the model cache of the problem is enabled.
+
+        :param params: The parameters at which to evaluate the cost function
+        :type params: list
+
+        :return: evaluated cost function and Jacobian of the cost function
+        :rtype: tuple (float, 1D numpy array)
+        """
+        return self.eval_cost(params, **kwargs), self.jac_cost(
+            params, **kwargs
+        )
+
+    def eval_cost_batch(self, params, **kwargs):
+        """
+        Evaluate the cost function for a batch of parameters, for
+        minimizers which evaluate a population of parameters at once.
+
+        :param params: The sets of parameters to evaluate the cost
+                       function at, with shape (k, m)
+        :type params: 2D numpy array
+
+        :return: evaluated cost function for each set of parameters
+        :rtype: 1D numpy array
+        """
+        return np.array([self.eval_cost(p, **kwargs) for p in params])
+
     @abstractmethod
     def hes_res(self, params, **kwargs):
         """
@@ -2,8 +2,9 @@
 Implements the root non-linear least squares cost function
 """
 
-from numpy import array, ravel, sqrt
+from numpy import asarray, ravel, sqrt
 
+from fitbenchmarking.cost_func.base_cost_func import add_outer_products
 from fitbenchmarking.cost_func.nlls_base_cost_func import BaseNLLSCostFunc
 from fitbenchmarking.utils.exceptions import (
     CostFuncError,
@@ -47,11 +48,27 @@ class HellingerNLLSCostFunc(BaseNLLSCostFunc):
                 "The length of the x and y are not the same, "
                 f"len(x)={len(x)} and len(y)= {len(y)}."
             )
-        result = sqrt(y) - sqrt(self.problem.eval_model(params=params, x=x))
+        result = self.eval_r_from_model(
+            self.problem.eval_model(params=params, x=x), **kwargs
+        )
 
         # Flatten in case of a vector function
         return ravel(result)
 
+    def eval_r_from_model(self, model, **kwargs):
+        """
+        Calculate the residuals, :math:`\\sqrt{y_i} - \\sqrt{f(x_i, p)}`,
+        from the model
+
+        :param model: The model evaluated at the data points
+        :type model: numpy array
+
+        :return: The residuals for the data points
+        :rtype: numpy array
+        """
+        y = kwargs.get("y", self.problem.data_y)
+        return sqrt(y) - sqrt(model)
+
     def jac_res(self, params, **kwargs):
         """
         Uses the Jacobian of the model to evaluate the Jacobian of the
@@ -86,14 +103,17 @@ class HellingerNLLSCostFunc(BaseNLLSCostFunc):
 
         f = self.problem.eval_model(params, x=x)
         jac = self.jacobian.eval(params, **kwargs)
-        hes = self.hessian.eval(params, **kwargs)
-
-        for i in range(len(x)):
-            jac_i = array([jac[i]])
-            hes[:, :, i] = jac_i.T.dot(jac_i) / (4 * f[i] ** (3 / 2)) - hes[
-                :, :, i
-            ] / (2 * f[i] ** (1 / 2))
-        return hes, self.jac_res(params, **kwargs)
+        hes = asarray(self.hessian.eval(params, **kwargs), dtype=float)
+
+        # For each data point i,
+        # J_i^T J_i / (4 f_i^(3/2)) - H_i / (2 f_i^(1/2)),
+        # applied to the (m, m, n) Hessian in place. The J_i^T J_i terms
+        # are added in chunks of data points, so no other (m, m, n) array
+        # is made.
+        sqrt_f = sqrt(f)
+        hes /= -2 * sqrt_f
+        add_outer_products(hes, jac, jac / (4 * f * sqrt_f)[:, None])
+        return hes, -jac / (2 * sqrt_f[:, None])
 
     def validate_problem(self):
         """
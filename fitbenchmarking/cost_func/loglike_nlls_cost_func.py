@@ -4,7 +4,7 @@ to be used for Bayesian Fitting when evaluation of the
 log-likelihood is required.
 """
 
-from numpy import ravel
+from numpy import asarray, ravel
 
 from fitbenchmarking.cost_func.nlls_base_cost_func import BaseNLLSCostFunc
 from fitbenchmarking.utils.exceptions import CostFuncError
@@ -65,11 +65,28 @@ class LoglikeNLLSCostFunc(BaseNLLSCostFunc):
                 f"the same, len(x)={len(x)}, len(y)={len(y)}"
                 f" and len(e)={len(e)}"
             )
-        result = (y - self.problem.eval_model(params=params, x=x)) / e
+        result = self.eval_r_from_model(
+            self.problem.eval_model(params=params, x=x), **kwargs
+        )
 
         # Flatten in case of a vector function
         return ravel(result)
 
+    def eval_r_from_model(self, model, **kwargs):
+        """
+        Calculate the residuals, :math:`\\frac{y_i - f(x_i, p)}{e_i}`, from
+        the model
+
+        :param model: The model evaluated at the data points
+        :type model: numpy array
+
+        :return: The residuals for the data points
+        :rtype: numpy array
+        """
+        y = kwargs.get("y", self.problem.data_y)
+        e = kwargs.get("e", self.problem.data_e)
+        return (y - model) / e
+
     def jac_res(self, params, **kwargs):
         """
         Uses the Jacobian of the model to evaluate the Jacobian of the
@@ -102,9 +119,9 @@ class LoglikeNLLSCostFunc(BaseNLLSCostFunc):
         """
         e = kwargs.get("e", self.problem.data_e)
 
-        hes = self.hessian.eval(params, **kwargs)
-        for i, e_i in enumerate(e):
-            hes[:, :, i] = -hes[:, :, i] / e_i
+        # Scale the Hessian of each data point by -1/e_i in place
+        hes = asarray(self.hessian.eval(params, **kwargs), dtype=float)
+        hes /= -asarray(e)
 
         return hes, self.jac_res(params, **kwargs)
 
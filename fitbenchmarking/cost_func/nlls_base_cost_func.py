@@ -58,6 +58,22 @@ class BaseNLLSCostFunc(CostFunc):
         """
         raise NotImplementedError
 
+    def eval_r_from_model(self, model, **kwargs):
+        """
+        Calculate the residuals from the model evaluated at the data
+        points. This is used to evaluate the cost function for a batch of
+        parameters, so should broadcast over the leading dimension of the
+        model.
+
+        :param model: The model evaluated at the data points, with shape
+                      (n,) or (k, n) for a batch of parameters
+        :type model: numpy array
+
+        :return: The residuals, with the same shape as the model
+        :rtype: numpy array
+        """
+        raise NotImplementedError
+
     def _evaluating_combined_multifit(self, x) -> bool:
         """
         Check whether eval_r has been asked for the combined multifit
@@ -121,6 +137,54 @@ class BaseNLLSCostFunc(CostFunc):
 
         return np.concatenate(r)
 
+    def eval_r_and_jac(self, params, **kwargs):
+        """
+        Calculate the residuals and their Jacobian together, for
+        minimizers which take both from one callback. This calls
+        ``eval_r`` and ``jac_res`` in turn and shares no work itself; the
+        model evaluation is only reused for the Jacobian if the model
+        cache of the problem is enabled (see the ``model_cache`` option).
+        Subclasses may override this to share more work.
+
+        :param params: The parameters at which to calculate the residuals
+                       and Jacobian
+        :type params: list
+
+        :return: The residuals and the Jacobian of the residuals
+        :rtype: tuple (1D numpy array, 2D numpy array)
+        """
+        r = self.eval_r(params, **kwargs)
+        J = self.jac_res(params, **kwargs)
+        return r, J
+
+    def eval_cost_batch(self, params, **kwargs):
+        """
+        Evaluate the cost function for a batch of parameters, evaluating
+        the model for the whole batch at once.
+
+        :param params: The sets of parameters to evaluate the cost
+                       function at, with shape (k, m)
+        :type params: 2D numpy array
+
+        :return: evaluated cost function for each set of parameters
+        :rtype: 1D numpy array
+        """
+        # Multifit problems, vector functions and cost functions which
+        # can't find the residuals from the model are evaluated one set of
+        # parameters at a time
+        if (
+            self._evaluating_combined_multifit(kwargs.get("x"))
+            or np.ndim(kwargs.get("y", self.problem.data_y)) != 1
+            or type(self).eval_r_from_model
+            is BaseNLLSCostFunc.eval_r_from_model
+        ):
+            return super().eval_cost_batch(params, **kwargs)
+
+        x = kwargs.get("x", self.problem.data_x)
+        model = self.problem.eval_model_batch(params, x=x)
+        r = self.eval_r_from_model(model, **kwargs)
+        return np.einsum("ij,ij->i", r, r)
+
     def eval_cost(self, params, **kwargs):
         """
         Evaluate the square of the L2 norm of the residuals,
@@ -149,11 +213,25 @@ class BaseNLLSCostFunc(CostFunc):
         :return: evaluated Jacobian of the cost function
         :rtype: 1D numpy array
         """
-        r = self.eval_r(params, **kwargs)
-        J = self.jac_res(params, **kwargs)
+        r, J = self.eval_r_and_jac(params, **kwargs)
 
         return 2.0 * J.T.dot(r)
 
+    def eval_cost_grad(self, params, **kwargs):
+        """
+        Evaluate the cost function and its Jacobian together, sharing the
+        residuals between them.
+
+        :param params: The parameters at which to evaluate the cost function
+        :type params: list
+
+        :return: evaluated cost function and Jacobian of the cost function
+        :rtype: tuple (float, 1D numpy array)
+        """
+        r, J = self.eval_r_and_jac(params, **kwargs)
+
+        return dot(r, r), 2.0 * J.T.dot(r)
+
     def hes_cost(self, params, **kwargs):
         """
         Uses the Hessian of the model to evaluate the Hessian of the
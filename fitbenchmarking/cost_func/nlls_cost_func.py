@@ -41,11 +41,26 @@ class NLLSCostFunc(BaseNLLSCostFunc):
                 "The length of the x and y are not the same, "
                 f"len(x)={len(x)} and len(y)={len(y)}."
             )
-        result = y - self.problem.eval_model(params=params, x=x)
+        result = self.eval_r_from_model(
+            self.problem.eval_model(params=params, x=x), **kwargs
+        )
 
         # Flatten in case of a vector function
         return ravel(result)
 
+    def eval_r_from_model(self, model, **kwargs):
+        """
+        Calculate the residuals, :math:`y_i - f(x_i, p)`, from the model
+
+        :param model: The model evaluated at the data points
+        :type model: numpy array
+
+        :return: The residuals for the data points
+        :rtype: numpy array
+        """
+        y = kwargs.get("y", self.problem.data_y)
+        return y - model
+
     def jac_res(self, params, **kwargs):
         """
         Uses the Jacobian of the model to evaluate the Jacobian of the
@@ -5,7 +5,10 @@ https://docs.mantidproject.org/nightly/fitting/fitcostfunctions/Poisson.html
 
 import numpy as np
 
-from fitbenchmarking.cost_func.base_cost_func import CostFunc
+from fitbenchmarking.cost_func.base_cost_func import (
+    CostFunc,
+    add_outer_products,
+)
 from fitbenchmarking.utils.exceptions import (
     CostFuncError,
     IncompatibleCostFunctionError,
@@ -50,6 +53,42 @@ class PoissonCostFunc(CostFunc):
         """
         x = kwargs.get("x", self.problem.data_x)
         y = kwargs.get("y", self.problem.data_y)
+        self._check_data(x, y)
+        f_xp = self.problem.eval_model(x=x, params=params)
+
+        return sum(np.ravel(self._deviance(y, f_xp)))
+
+    def eval_cost_batch(self, params, **kwargs):
+        """
+        Evaluate the Poisson deviance cost function for a batch of
+        parameters, evaluating the model for the whole batch at once.
+
+        :param params: The sets of parameters to evaluate the cost
+                       function at, with shape (k, m)
+        :type params: 2D numpy array
+
+        :return: evaluated cost function for each set of parameters
+        :rtype: 1D numpy array
+        """
+        x = kwargs.get("x", self.problem.data_x)
+        y = kwargs.get("y", self.problem.data_y)
+        if np.ndim(y) != 1:
+            return super().eval_cost_batch(params, **kwargs)
+        self._check_data(x, y)
+
+        f_xp = self.problem.eval_model_batch(params, x=x)
+        return np.sum(self._deviance(y, f_xp), axis=1)
+
+    @staticmethod
+    def _check_data(x, y):
+        """
+        Check that the data can be used with the Poisson cost function.
+
+        :param x: The x values to evaluate at
+        :type x: np.array
+        :param y: The y values to evaluate at
+        :type y: np.array
+        """
         if len(x) != len(y):
             raise CostFuncError(
                 "The length of the x and y are not the same, "
@@ -61,15 +100,30 @@ class PoissonCostFunc(CostFunc):
                 "positive experimental values, try again with "
                 "a different cost function."
             )
-        f_xp = self.problem.eval_model(x=x, params=params)
 
-        # Penalise nagative f(x, p)
-        f_xp[f_xp <= 0.0] = np.finfo(float).max
+    @staticmethod
+    def _deviance(y, f_xp):
+        """
+        Calculate the Poisson deviance of each data point, penalising
+        non-positive values of the model.
 
-        residuals = _safe_a_log_b(y, y) - _safe_a_log_b(y, f_xp) - (y - f_xp)
+        :param y: The data
+        :type y: numpy array
+        :param f_xp: The model evaluated at the data points, with shape
+                     (n,) or (k, n) for a batch of parameters
+        :type f_xp: numpy array
+
+        :return: The deviance of each data point, with the shape of f_xp
+        :rtype: numpy array
+        """
+        # Penalise nagative f(x, p)
+        f_xp = np.where(f_xp <= 0.0, np.finfo(float).max, f_xp)
 
-        # Flatten in case of a vector function
-        return sum(np.ravel(residuals))
+        return (
+            _safe_a_log_b(y, y)
+            - _safe_a_log_b(np.broadcast_to(y, f_xp.shape), f_xp)
+            - (y - f_xp)
+        )
 
     def jac_res(self, params, **kwargs):
         """
@@ -120,14 +174,16 @@ class PoissonCostFunc(CostFunc):
 
         f = self.problem.eval_model(params, x=x)
         jac = self.jacobian.eval(params, **kwargs)
-        hes = self.hessian.eval(params, **kwargs)
+        hes = np.asarray(self.hessian.eval(params, **kwargs), dtype=float)
 
-        for i in range(len(x)):
-            jac_i = np.array([jac[i]])
-            hes[:, :, i] = hes[:, :, i] - y[i] / f[i] * (
-                hes[:, :, i] - jac_i.T.dot(jac_i) / f[i]
-            )
-        return hes, self.jac_res(params, **kwargs)
+        # For each data point i, H_i - y_i / f_i * (H_i - J_i^T J_i / f_i),
+        # applied to the (m, m, n) Hessian in place. The J_i^T J_i terms
+        # are added in chunks of data points, so no other (m, m, n) array
+        # is made.
+        scale = 1 - y / f
+        hes *= scale
+        add_outer_products(hes, jac, jac * (y / f**2)[:, None])
+        return hes, jac * scale[:, None]
 
     def hes_cost(self, params, **kwargs):
         """
@@ -141,8 +197,18 @@ class PoissonCostFunc(CostFunc):
         :return: evaluated Hessian of the cost function
         :rtype: 2D numpy array
         """
-        H, _ = self.hes_res(params, **kwargs)
-        return np.sum(H, 2)
+        x = kwargs.get("x", self.problem.data_x)
+        y = kwargs.get("y", self.problem.data_y)
+
+        f = self.problem.eval_model(params, x=x)
+        jac = self.jacobian.eval(params, **kwargs)
+        hes = np.asarray(self.hessian.eval(params, **kwargs))
+
+        # The sum of the Hessians of the residuals, contracted over the
+        # data points so they are not formed separately
+        return np.tensordot(hes, 1 - y / f, axes=1) + jac.T.dot(
+            jac * (y / f**2)[:, None]
+        )
 
     def validate_problem(self):
         """
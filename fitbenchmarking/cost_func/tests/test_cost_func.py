@@ -3,9 +3,10 @@ Tests available cost function classes in FitBenchmarking.
 """
 
 from unittest import TestCase
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import numpy as np
+from parameterized import parameterized
 
 from fitbenchmarking.cost_func.cost_func_factory import create_cost_func
 from fitbenchmarking.cost_func.hellinger_nlls_cost_func import (
@@ -23,6 +24,7 @@ from fitbenchmarking.cost_func.weighted_nlls_cost_func import (
     WeightedNLLSCostFunc,
 )
 from fitbenchmarking.hessian.analytic_hessian import Analytic
+from fitbenchmarking.hessian.scipy_hessian import Scipy as ScipyHessian
 from fitbenchmarking.jacobian.scipy_jacobian import Scipy
 from fitbenchmarking.parsing.fitting_problem import FittingProblem
 from fitbenchmarking.utils import exceptions
@@ -165,6 +167,41 @@ class TestNLLSCostFunc(TestCase):
         expected = np.array([-2.0])
         self.assertTrue(np.allclose(jac_cost, expected))
 
+    def test_eval_r_and_jac(self):
+        """
+        Test that eval_r_and_jac matches eval_r and jac_res, evaluating the
+        model at the parameters once
+        """
+        jacobian = Scipy(self.cost_function.problem)
+        jacobian.method = "2-point"
+        self.cost_function.jacobian = jacobian
+        problem = self.cost_function.problem
+        problem.function = MagicMock(side_effect=problem.function)
+
+        r, J = self.cost_function.eval_r_and_jac(params=[5.0])
+
+        self.assertTrue(np.allclose(r, [0.0, -3.0, 4.0]))
+        self.assertTrue(np.allclose(J, [[-1.0], [-1.0], [-1.0]]))
+        # One evaluation at the parameters and one for the difference
+        self.assertEqual(problem.function.call_count, 2)
+
+    def test_eval_cost_grad(self):
+        """
+        Test that eval_cost_grad matches eval_cost and jac_cost
+        """
+        jacobian = Scipy(self.cost_function.problem)
+        jacobian.method = "2-point"
+        self.cost_function.jacobian = jacobian
+
+        cost, grad = self.cost_function.eval_cost_grad(params=[5.0])
+
+        self.assertAlmostEqual(
+            cost, self.cost_function.eval_cost(params=[5.0])
+        )
+        self.assertTrue(
+            np.allclose(grad, self.cost_function.jac_cost(params=[5.0]))
+        )
+
     def test_hes_res(self):
         """
         Test that hes_res works for the NLLs cost function
@@ -563,6 +600,35 @@ class TestHellingerNLLSCostFunc(TestCase):
         )
         self.assertTrue(np.allclose(H, expected))
 
+    def test_hes_res_matches_per_point(self):
+        """
+        Test that hes_res for the Hellinger NLLs cost function matches the
+        Hessian of each data point found separately, when the data points
+        are split into chunks
+        """
+        rng = np.random.default_rng(0)
+        jac_eval = rng.random((3, 2))
+        hes_eval = rng.random((2, 2, 3))
+        self.cost_function.jacobian = MagicMock()
+        self.cost_function.jacobian.eval.return_value = jac_eval
+        self.cost_function.hessian = MagicMock()
+        self.cost_function.hessian.eval.return_value = hes_eval.copy()
+
+        with patch(
+            "fitbenchmarking.cost_func.base_cost_func.OUTER_PRODUCT_CHUNK_SIZE",
+            2,
+        ):
+            H, J = self.cost_function.hes_res(params=[5.0])
+
+        f = self.x_val + 5.0
+        for i, f_i in enumerate(f):
+            jac_i = jac_eval[[i]]
+            expected = jac_i.T.dot(jac_i) / (4 * f_i ** (3 / 2)) - hes_eval[
+                :, :, i
+            ] / (2 * f_i ** (1 / 2))
+            self.assertTrue(np.allclose(H[:, :, i], expected))
+        self.assertTrue(np.allclose(J, -jac_eval / (2 * np.sqrt(f))[:, None]))
+
     def test_validate_problem_correct(self):
         """
         Test that validate_problem does not raise an error
@@ -647,6 +713,22 @@ class TestPoissonCostFunc(TestCase):
         expected = np.array([[0.0], [0.23076923], [-0.25]])
         self.assertTrue(np.allclose(J, expected))
 
+    def test_eval_cost_grad(self):
+        """
+        Test that eval_cost_grad matches eval_cost and jac_cost for the
+        Poisson cost function
+        """
+        jacobian = Scipy(self.cost_function.problem)
+        jacobian.method = "2-point"
+        self.cost_function.jacobian = jacobian
+
+        cost, grad = self.cost_function.eval_cost_grad(params=[5.0])
+
+        self.assertAlmostEqual(cost, 0.8392283816092849, places=12)
+        self.assertTrue(
+            np.allclose(grad, self.cost_function.jac_cost(params=[5.0]))
+        )
+
     def test_hes_res(self):
         """
         Test that hes_res works for the Poisson NLLs cost function
@@ -674,6 +756,52 @@ class TestPoissonCostFunc(TestCase):
         )
         self.assertTrue(np.allclose(H, expected))
 
+    def test_hes_res_matches_per_point(self):
+        """
+        Test that hes_res for the Poisson cost function matches the
+        Hessian of each data point found separately
+        """
+        rng = np.random.default_rng(0)
+        jac_eval = rng.random((3, 2))
+        hes_eval = rng.random((2, 2, 3))
+        self.cost_function.jacobian = MagicMock()
+        self.cost_function.jacobian.eval.return_value = jac_eval
+        self.cost_function.hessian = MagicMock()
+        self.cost_function.hessian.eval.return_value = hes_eval.copy()
+
+        H, J = self.cost_function.hes_res(params=[5.0])
+
+        f = self.x_val + 5.0
+        for i, (f_i, y_i) in enumerate(zip(f, self.y_val)):
+            jac_i = jac_eval[[i]]
+            expected = hes_eval[:, :, i] - y_i / f_i * (
+                hes_eval[:, :, i] - jac_i.T.dot(jac_i) / f_i
+            )
+            self.assertTrue(np.allclose(H[:, :, i], expected))
+        self.assertTrue(
+            np.allclose(J, jac_eval * (1 - self.y_val / f)[:, None])
+        )
+
+    def test_hes_cost_matches_hes_res(self):
+        """
+        Test that hes_cost for the Poisson cost function is the sum of the
+        Hessians of the residuals
+        """
+        rng = np.random.default_rng(0)
+        jac_eval = rng.random((3, 2))
+        hes_eval = rng.random((2, 2, 3))
+        self.cost_function.jacobian = MagicMock()
+        self.cost_function.jacobian.eval.return_value = jac_eval
+        self.cost_function.hessian = MagicMock()
+        self.cost_function.hessian.eval.side_effect = lambda *a, **k: (
+            hes_eval.copy()
+        )
+
+        H, _ = self.cost_function.hes_res(params=[5.0])
+        H_cost = self.cost_function.hes_cost(params=[5.0])
+
+        self.assertTrue(np.allclose(H_cost, np.sum(H, 2)))
+
     def test_validate_problem_correct(self):
         """
         Test that validate_problem does not raise an error
@@ -689,6 +817,115 @@ class TestPoissonCostFunc(TestCase):
             self.cost_function.validate_problem()
 
 
+class TestEvalCostBatch(TestCase):
+    """
+    Class to test eval_cost_batch for each cost function
+    """
+
+    def setUp(self):
+        """
+        Setting up a problem to evaluate each cost function on
+        """
+        self.options = Options()
+        self.problem = FittingProblem(self.options)
+        self.problem.function = lambda x, p1, p2: p1 * x + p2
+        self.problem.data_x = np.array([1.0, 8.0, 11.0])
+        self.problem.data_y = np.array([6.0, 10.0, 20.0])
+        self.problem.data_e = np.array([1.0, 2.0, 4.0])
+        self.params = np.array([[1.0, 5.0], [2.0, 1.0], [0.5, 3.0]])
+
+    @parameterized.expand(
+        [
+            (NLLSCostFunc,),
+            (WeightedNLLSCostFunc,),
+            (LoglikeNLLSCostFunc,),
+            (HellingerNLLSCostFunc,),
+            (PoissonCostFunc,),
+        ]
+    )
+    def test_eval_cost_batch(self, cost_func_class):
+        """
+        Test that eval_cost_batch matches eval_cost for each set of
+        parameters
+        """
+        cost_function = cost_func_class(self.problem)
+
+        result = cost_function.eval_cost_batch(self.params)
+
+        expected = [cost_function.eval_cost(p) for p in self.params]
+        self.assertTrue(np.allclose(result, expected))
+
+    def test_eval_cost_batch_uses_model_batch(self):
+        """
+        Test that the NLLS cost functions evaluate the model for the batch
+        in one call
+        """
+        cost_function = NLLSCostFunc(self.problem)
+        self.problem.batch_function = MagicMock(
+            side_effect=lambda x, p: p[:, :1] * x + p[:, 1:]
+        )
+
+        cost_function.eval_cost_batch(self.params)
+
+        self.problem.batch_function.assert_called_once()
+
+
+class TestReadOnlyModel(TestCase):
+    """
+    Class to test that the cost functions don't write to the evaluations
+    of the model, which are read-only when the model cache is enabled
+    """
+
+    def setUp(self):
+        """
+        Setting up a problem with the model cache enabled
+        """
+        self.options = Options()
+        self.options.model_cache = True
+        self.problem = FittingProblem(self.options)
+        self.problem.function = lambda x, p1, p2: p1 * x + p2
+        self.problem.data_x = np.array([1.0, 8.0, 11.0])
+        self.problem.data_y = np.array([6.0, 10.0, 20.0])
+        self.problem.data_e = np.array([1.0, 2.0, 4.0])
+        self.params = np.array([1.0, 5.0])
+
+    @parameterized.expand(
+        [
+            (NLLSCostFunc,),
+            (WeightedNLLSCostFunc,),
+            (LoglikeNLLSCostFunc,),
+            (HellingerNLLSCostFunc,),
+            (PoissonCostFunc,),
+        ]
+    )
+    def test_read_only_model(self, cost_func_class):
+        """
+        Test that each method of the cost functions can be used when the
+        model evaluations are read-only
+        """
+        cost_function = cost_func_class(self.problem)
+        jacobian = Scipy(self.problem)
+        jacobian.method = "2-point"
+        cost_function.jacobian = jacobian
+        hessian = ScipyHessian(self.problem, jacobian)
+        hessian.method = "2-point"
+        cost_function.hessian = hessian
+
+        self.assertFalse(self.problem.eval_model(self.params).flags.writeable)
+        # Each method is called twice, so the second call is given the
+        # cached evaluations
+        for _ in range(2):
+            cost_function.eval_cost(self.params)
+            cost_function.jac_res(self.params)
+            cost_function.jac_cost(self.params)
+            cost_function.eval_cost_grad(self.params)
+            cost_function.hes_res(self.params)
+            cost_function.hes_cost(self.params)
+            if hasattr(cost_function, "eval_r_and_jac"):
+                cost_function.eval_r(self.params)
+                cost_function.eval_r_and_jac(self.params)
+
+
 class FactoryTests(TestCase):
     """
     Tests for the cost function factory
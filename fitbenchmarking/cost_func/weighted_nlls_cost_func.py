@@ -45,10 +45,27 @@ class WeightedNLLSCostFunc(BaseNLLSCostFunc):
                 f"the same, len(x)={len(x)}, len(y)={len(y)}"
                 f" and len(e)={len(e)}"
             )
-        result = (y - self.problem.eval_model(params=params, x=x)) / e
+        result = self.eval_r_from_model(
+            self.problem.eval_model(params=params, x=x), **kwargs
+        )
 
         return ravel(result)
 
+    def eval_r_from_model(self, model, **kwargs):
+        """
+        Calculate the residuals, :math:`\\frac{y_i - f(x_i, p)}{e_i}`, from
+        the model
+
+        :param model: The model evaluated at the data points
+        :type model: numpy array
+
+        :return: The residuals for the data points
+        :rtype: numpy array
+        """
+        y = kwargs.get("y", self.problem.data_y)
+        e = kwargs.get("e", self.problem.data_e)
+        return (y - model) / e
+
     def jac_res(self, params, **kwargs):
         """
         Uses the Jacobian of the model to evaluate the Jacobian of the
@@ -90,8 +107,13 @@ class WeightedNLLSCostFunc(BaseNLLSCostFunc):
         """
         e = kwargs.get("e", self.problem.data_e)
 
-        hes = self.hessian.eval(params, **kwargs)
-        for i, e_i in enumerate(e):
-            hes[:, :, i] = -hes[:, :, i] / e_i
+        # for multifit problems, e is a list of arrays, one for each
+        # dataset, so we need to concatenate them into a single array
+        if isinstance(e, list):
+            e = np.concatenate(e)
+
+        # Scale the Hessian of each data point by -1/e_i in place
+        hes = np.asarray(self.hessian.eval(params, **kwargs), dtype=float)
+        hes /= -np.asarray(e)
 
         return hes, self.jac_res(params, **kwargs)
@@ -13,6 +13,11 @@ class Numdifftools(Hessian):
     finite difference approximations to the derivative
     """
 
+    def __init__(self, problem, jacobian):
+        super().__init__(problem, jacobian)
+        # The numdifftools Jacobian of the Jacobian for each method
+        self._hes_funcs = {}
+
     def eval(self, params, **kwargs):
         """
         Evaluates Hessian of problem.eval_model, returning the value
@@ -26,11 +31,37 @@ class Numdifftools(Hessian):
         """
         x = kwargs.get("x", self.problem.data_x)
 
-        def jac_func(params):
-            return self.jacobian.eval(params, x=x).T
-
-        hes_func = nd.Jacobian(jac_func, method=self.method)
-        hes = hes_func(params)
+        # The numdifftools Jacobian is kept for each method and reused, as
+        # for the numdifftools Jacobian
+        if self.method not in self._hes_funcs:
+            self._hes_funcs[self.method] = nd.Jacobian(
+                self._jac_func, method=self.method
+            )
+        # numdifftools uses the keyword x itself, so x is passed by position
+        hes = self._hes_funcs[self.method](params, x)
 
         # ensure Hessian is symmetric
         return 0.5 * (hes + hes.transpose(1, 0, 2))
+
+    def _jac_func(self, params, x):
+        """
+        Evaluate the transposed Jacobian, to be differentiated.
+
+        :param params: The parameter values to find the Jacobian at
+        :type params: list
+        :param x: The x values to find the Jacobian at
+        :type x: numpy array
+
+        :return: The transposed Jacobian
+        :rtype: numpy array
+        """
+        return self.jacobian.eval(params, x=x).T
+
+    def __getstate__(self):
+        """
+        Remove the numdifftools Jacobians when pickling, as they are
+        recreated when they are needed.
+        """
+        state = self.__dict__.copy()
+        state["_hes_funcs"] = {}
+        return state
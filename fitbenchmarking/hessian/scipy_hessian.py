@@ -2,10 +2,9 @@
 Module which calculates SciPy finite difference approximations
 """
 
-from functools import lru_cache
-
 import numpy as np
 from scipy.optimize._numdiff import approx_derivative
+from scipy.sparse import issparse
 
 from fitbenchmarking.hessian.base_hessian import Hessian
 
@@ -23,6 +22,11 @@ class Scipy(Hessian):
         Evaluates Hessian of problem.eval_model, returning the value
         \nabla^2_p f(x, p)
 
+        The Jacobian of every data point is differentiated at once, so the
+        Jacobian is evaluated once for each step of the finite difference.
+        If the chunk_size Hessian option is set, the data points are
+        differentiated in chunks of that size to bound the memory used.
+
         :param params: The parameter values to find the Hessian at
         :type params: list
 
@@ -30,25 +34,46 @@ class Scipy(Hessian):
         :rtype: 3D numpy array
         """
         x = kwargs.get("x", self.problem.data_x)
-        hes = np.zeros((len(params), len(params), len(x)))
-
-        @lru_cache
-        def grad(params):
-            return self.jacobian.eval(params)
-
-        for i, _ in enumerate(x):
-
-            def grad_i(params):
-                return grad(tuple(params))[i, :]
+        num_params = len(params)
+        num_points = len(x)
+        chunk_size = self.problem.options.hes_chunk_size or num_points
+        hes = np.zeros((num_params, num_params, num_points))
 
-            hes[:, :, i] = approx_derivative(
-                grad_i,
+        for start in range(0, num_points, chunk_size):
+            rows = slice(start, min(start + chunk_size, num_points))
+            # The derivative of the flattened Jacobian, J[i, j], with
+            # respect to p_k is indexed by [i * num_params + j, k]
+            jac_derivative = approx_derivative(
+                self._flat_jacobian,
                 params,
                 method=self.method,
                 rel_step=None,
                 bounds=(-np.inf, np.inf),
-                kwargs=kwargs,
+                args=(rows, kwargs),
             )
+            hes[:, :, rows] = jac_derivative.reshape(
+                -1, num_params, num_params
+            ).transpose(1, 2, 0)
 
         # ensure Hessian is symmetric
         return 0.5 * (hes + hes.transpose(1, 0, 2))
+
+    def _flat_jacobian(self, params, rows, kwargs):
+        """
+        Evaluates the Jacobian for some of the data points, flattened to
+        one dimension for approx_derivative.
+
+        :param params: The parameter values to find the Jacobian at
+        :type params: numpy array
+        :param rows: The data points to keep
+        :type rows: slice
+        :param kwargs: The keyword arguments for the Jacobian
+        :type kwargs: dict
+
+        :return: The flattened Jacobian of the data points
+        :rtype: 1D numpy array
+        """
+        jac = self.jacobian.eval(params, **kwargs)
+        if issparse(jac):
+            jac = jac.toarray()
+        return np.asarray(jac)[rows].ravel()
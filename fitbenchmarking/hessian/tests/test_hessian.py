@@ -3,8 +3,10 @@ Unit testing for the hessian directory.
 """
 
 from unittest import TestCase
+from unittest.mock import patch
 
 import numpy as np
+from parameterized import parameterized
 
 from fitbenchmarking.cost_func.hellinger_nlls_cost_func import (
     HellingerNLLSCostFunc,
@@ -289,6 +291,53 @@ class TestHessianClass(TestCase):
             eval_result = hes.eval(params=self.params)
             self.assertTrue(np.isclose(self.actual_hessian, eval_result).all())
 
+    def test_numdifftools_reuses_jacobian(self):
+        """
+        Test that the numdifftools Jacobian is built once, and that the
+        Hessian is found at the given x values.
+        """
+        hes = Numdifftools(self.cost_func.problem, self.jacobian)
+        hes.method = "central"
+        hes.eval(params=self.params)
+        x = np.array([2.0, 3.0])
+
+        with patch("numdifftools.Jacobian.__init__") as init:
+            eval_result = hes.eval(params=self.params, x=x)
+
+        init.assert_not_called()
+        self.assertTrue(
+            np.isclose(H_ls(x=x, p=self.params), eval_result).all()
+        )
+
+    def test_scipy_eval_jacobian_count(self):
+        """
+        Test that the Scipy Hessian evaluates the Jacobian once per step,
+        rather than once per step for every data point
+        """
+        hes = Scipy(self.cost_func.problem, self.jacobian)
+        hes.method = "2-point"
+        with patch.object(
+            self.jacobian, "eval", wraps=self.jacobian.eval
+        ) as mock_eval:
+            hes.eval(params=self.params)
+
+        self.assertEqual(mock_eval.call_count, len(self.params) + 1)
+
+    @parameterized.expand([[1], [2], [5], [10]])
+    def test_scipy_eval_chunked(self, chunk_size):
+        """
+        Test that the Scipy Hessian is the same when found in chunks
+        """
+        for method in ["2-point", "3-point", "cs"]:
+            hes = Scipy(self.cost_func.problem, self.jacobian)
+            hes.method = method
+            self.fitting_problem.options.hes_chunk_size = 0
+            expected = hes.eval(params=self.params)
+            self.fitting_problem.options.hes_chunk_size = chunk_size
+            eval_result = hes.eval(params=self.params)
+            np.testing.assert_allclose(eval_result, expected)
+            self.assertTrue(np.isclose(self.actual_hessian, eval_result).all())
+
     def test_analytic_raise_error(self):
         """
         Test analytic Hessian raises an exception when problem.hessian is
@@ -2,8 +2,14 @@
 Implements the base class for the Jacobian.
 """
 
+import warnings
 from abc import ABCMeta, abstractmethod
 
+import numpy as np
+
+# Raised when a complex number is cast to a real one
+ComplexWarning = getattr(np, "exceptions", np).ComplexWarning
+
 
 class Jacobian:
     """
@@ -62,6 +68,101 @@ class Jacobian:
         """
         self._method = value
 
+    def matches_finite_differences(self, rtol=1e-4):
+        """
+        Check that the Jacobian agrees with central differences at the first
+        starting values of the problem. This is used by the Jacobians which
+        need the model to support other types of numbers, to check that it
+        does. The result is cached on the problem.
+
+        :param rtol: The relative tolerance of the check
+        :type rtol: float
+
+        :return: Whether the Jacobian can be evaluated and agrees
+        :rtype: bool
+        """
+        checks = self.problem.jacobian_checks
+        name = self.__class__.__name__
+        if name not in checks:
+            checks[name] = self._check_finite_differences(rtol)
+        return checks[name]
+
+    def _check_finite_differences(self, rtol):
+        """
+        Check that the Jacobian agrees with central differences at the first
+        starting values of the problem. The derivatives are compared in one
+        random direction, so the check evaluates the model a fixed number
+        of times, whatever the number of parameters.
+
+        :param rtol: The relative tolerance of the check
+        :type rtol: float
+
+        :return: Whether the Jacobian can be evaluated and agrees
+        :rtype: bool
+        """
+        if not self.problem.starting_values:
+            return False
+        params = np.array(
+            list(self.problem.starting_values[0].values()), dtype=float
+        )
+        # The direction is relative to each parameter, and each component
+        # is non zero so no parameter is left out of the check
+        rng = np.random.default_rng(0)
+        direction = rng.uniform(0.5, 1.5, len(params)) * np.where(
+            params == 0, 1.0, np.abs(params)
+        )
+        step = 1e-6
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("error", ComplexWarning)
+                deriv = np.ravel(
+                    self.directional_derivative(params, direction)
+                )
+                forward = self.problem.eval_model(params + step * direction)
+                backward = self.problem.eval_model(params - step * direction)
+                expected = np.ravel(
+                    (np.asarray(forward) - np.asarray(backward)) / (2 * step)
+                )
+        except Exception:
+            return False
+        if deriv.shape != expected.shape or not np.isrealobj(deriv):
+            return False
+        scale = max(1.0, float(np.max(np.abs(expected), initial=0.0)))
+        return bool(np.allclose(deriv, expected, rtol=rtol, atol=rtol * scale))
+
+    def directional_derivative(self, params, direction, **kwargs):
+        """
+        Evaluates the derivative of the model in a direction,
+        :math:`\\nabla_p f(x,p) d`. Jacobians which can find this more
+        cheaply than the whole Jacobian override this.
+
+        :param params: The parameter values at which to evaluate the
+                       derivative
+        :type params: list
+        :param direction: The direction, with a value for each parameter
+        :type direction: numpy array
+
+        :return: The derivative of the model in the direction
+        :rtype: numpy array
+        """
+        return np.asarray(self.eval(params, **kwargs)) @ direction
+
+    def prepare(self, params):
+        """
+        Do any work which is needed before the fit and should not be
+        timed, e.g. detecting the sparsity of the Jacobian. This is called
+        before each fit.
+
+        :param params: The parameter values the fit starts from
+        :type params: list
+        """
+
+    def close(self):
+        """
+        Release any resources held by the Jacobian, e.g. pools of worker
+        processes. This is called at the end of each fit.
+        """
+
     def name(self) -> str:
         """
         Get a name for the current status of the jacobian.
@@ -1,13 +1,16 @@
 """
 Module which acts as a analytic Jacobian calculator when available, otherwise
-uses a trusted software to approximate.
+uses automatic differentiation or a trusted software to approximate.
 """
 
 from typing import Any
 
 from fitbenchmarking.jacobian.analytic_jacobian import Analytic
 from fitbenchmarking.jacobian.base_jacobian import Jacobian
+from fitbenchmarking.jacobian.complex_step_jacobian import ComplexStep
+from fitbenchmarking.jacobian.forward_ad_jacobian import ForwardAD
 from fitbenchmarking.jacobian.scipy_jacobian import Scipy
+from fitbenchmarking.utils.exceptions import NoJacobianError
 from fitbenchmarking.utils.log import get_logger
 
 LOGGER = get_logger()
@@ -15,17 +18,26 @@ LOGGER = get_logger()
 
 class BestAvailable(Jacobian):
     """
-    Class to apply an analytical Jacobian if available -- otherwise choose a
-    scipy one.
+    Class to apply an analytical Jacobian if available -- otherwise choose
+    a forward mode or complex step one if the model supports it, and
+    otherwise a scipy one.
     """
 
     def __init__(self, problem):
         if callable(problem.jacobian):
             self.sub_jac = Analytic(problem)
             self.sub_jac.method = "default"
-        else:
-            self.sub_jac = Scipy(problem)
-            self.sub_jac.method = "2-point"
+            return
+
+        for jacobian_cls in (ForwardAD, ComplexStep):
+            try:
+                self.sub_jac = jacobian_cls(problem)
+            except NoJacobianError:
+                continue
+            return
+
+        self.sub_jac = Scipy(problem)
+        self.sub_jac.method = "2-point"
 
     def eval(self, params, **kwargs):
         """
@@ -0,0 +1,72 @@
+"""
+Module which calculates complex step approximations to the Jacobian
+"""
+
+import numpy as np
+
+from fitbenchmarking.jacobian.base_jacobian import Jacobian
+from fitbenchmarking.utils.exceptions import NoJacobianError
+
+# The size of the imaginary step, relative to the parameters
+STEP = 1e-20
+
+
+class ComplexStep(Jacobian):
+    """
+    Implements complex step approximations to the derivative, which are
+    accurate to machine precision with one evaluation of the model for each
+    parameter. This needs the model to accept complex parameters.
+    """
+
+    # Problem formats that are incompatible with certain Jacobians
+    INCOMPATIBLE_PROBLEMS = {"default": ["mantid"]}
+
+    def __init__(self, problem):
+        super().__init__(problem)
+        self._method = "default"
+        if (
+            problem.format in self.INCOMPATIBLE_PROBLEMS["default"]
+            or not self.matches_finite_differences()
+        ):
+            raise NoJacobianError(
+                "The model of the problem does not support complex "
+                "parameters, so complex step Jacobians are not available"
+            )
+
+    def eval(self, params, **kwargs):
+        """
+        Evaluates Jacobian of problem.eval_model
+
+        :param params: The parameter values to find the Jacobian at
+        :type params: list
+
+        :return: Approximation of the Jacobian
+        :rtype: numpy array
+        """
+        params = np.asarray(params, dtype=float)
+        steps = STEP * np.maximum(1.0, np.abs(params))
+        # The model is evaluated at each complex step in one batch
+        evals = self.problem.eval_model_batch(
+            params + 1j * np.diag(steps), **kwargs
+        )
+        return (np.imag(evals) / steps[:, np.newaxis]).T
+
+    def directional_derivative(self, params, direction, **kwargs):
+        """
+        Evaluates the derivative of the model in a direction, with one
+        complex step along it.
+
+        :param params: The parameter values at which to evaluate the
+                       derivative
+        :type params: list
+        :param direction: The direction, with a value for each parameter
+        :type direction: numpy array
+
+        :return: The derivative of the model in the direction
+        :rtype: numpy array
+        """
+        params = np.asarray(params, dtype=float)
+        evals = self.problem.eval_model(
+            params + 1j * STEP * np.asarray(direction), **kwargs
+        )
+        return np.imag(evals) / STEP
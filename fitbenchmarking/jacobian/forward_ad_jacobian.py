@@ -0,0 +1,227 @@
+"""
+Module which calculates the Jacobian by forward mode automatic
+differentiation, using dual numbers
+"""
+
+import numpy as np
+
+from fitbenchmarking.jacobian.base_jacobian import Jacobian
+from fitbenchmarking.utils.exceptions import NoJacobianError
+
+
+class Dual:
+    """
+    A dual number holding a value and its derivatives with respect to each
+    parameter. Numpy ufuncs and arithmetic operators on dual numbers apply
+    the chain rule, so models written as numpy expressions can be evaluated
+    with dual number parameters to find their Jacobian.
+    """
+
+    # Make numpy defer to the dual numbers in binary operators
+    __array_priority__ = 100
+
+    def __init__(self, value, deriv):
+        """
+        :param value: The value
+        :type value: float or numpy array
+        :param deriv: The derivatives of the value, with the derivative
+                      with respect to each parameter along the last axis
+        :type deriv: numpy array
+        """
+        self.value = np.asarray(value)
+        self.deriv = np.asarray(deriv)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        rule = _RULES.get(ufunc)
+        if method != "__call__" or kwargs or rule is None:
+            return NotImplemented
+        values = [i.value if isinstance(i, Dual) else i for i in inputs]
+        derivs = [i.deriv if isinstance(i, Dual) else None for i in inputs]
+        return rule(*values, *derivs)
+
+    def __add__(self, other):
+        return np.add(self, other)
+
+    def __radd__(self, other):
+        return np.add(other, self)
+
+    def __sub__(self, other):
+        return np.subtract(self, other)
+
+    def __rsub__(self, other):
+        return np.subtract(other, self)
+
+    def __mul__(self, other):
+        return np.multiply(self, other)
+
+    def __rmul__(self, other):
+        return np.multiply(other, self)
+
+    def __truediv__(self, other):
+        return np.true_divide(self, other)
+
+    def __rtruediv__(self, other):
+        return np.true_divide(other, self)
+
+    def __pow__(self, other):
+        return np.power(self, other)
+
+    def __rpow__(self, other):
+        return np.power(other, self)
+
+    def __neg__(self):
+        return np.negative(self)
+
+    def __pos__(self):
+        return self
+
+
+def _scale(factor, deriv):
+    """
+    Multiply derivatives by a factor with the shape of the value.
+
+    :param factor: The factor
+    :type factor: numpy array
+    :param deriv: The derivatives, or None for a constant
+    :type deriv: numpy array or None
+
+    :return: The scaled derivatives, or 0 for a constant
+    :rtype: numpy array or int
+    """
+    if deriv is None:
+        return 0
+    return np.expand_dims(factor, -1) * deriv
+
+
+def _unary(func, grad):
+    """
+    Create the rule for a function of one argument.
+
+    :param func: The function
+    :type func: Callable
+    :param grad: The derivative of the function, given the argument and
+                 the value of the function
+    :type grad: Callable
+
+    :return: The rule applying the function to a dual number
+    :rtype: Callable
+    """
+
+    def rule(a, da):
+        value = func(a)
+        return Dual(value, _scale(grad(a, value), da))
+
+    return rule
+
+
+def _power(a, b, da, db):
+    """
+    The rule for raising a to the power b.
+    """
+    value = np.power(a, b)
+    deriv = _scale(b * np.power(a, b - 1), da)
+    if db is not None:
+        deriv = deriv + _scale(value * np.log(a), db)
+    return Dual(value, deriv)
+
+
+_RULES = {
+    np.add: lambda a, b, da, db: Dual(
+        a + b, (0 if da is None else da) + (0 if db is None else db)
+    ),
+    np.subtract: lambda a, b, da, db: Dual(
+        a - b, (0 if da is None else da) - (0 if db is None else db)
+    ),
+    np.multiply: lambda a, b, da, db: Dual(
+        a * b, _scale(b, da) + _scale(a, db)
+    ),
+    np.true_divide: lambda a, b, da, db: Dual(
+        a / b, _scale(1 / b, da) - _scale(a / b**2, db)
+    ),
+    np.power: _power,
+    np.negative: _unary(np.negative, lambda a, v: -np.ones_like(v)),
+    np.positive: _unary(np.positive, lambda a, v: np.ones_like(v)),
+    np.exp: _unary(np.exp, lambda a, v: v),
+    np.log: _unary(np.log, lambda a, v: 1 / a),
+    np.log10: _unary(np.log10, lambda a, v: 1 / (a * np.log(10))),
+    np.sqrt: _unary(np.sqrt, lambda a, v: 0.5 / v),
+    np.square: _unary(np.square, lambda a, v: 2 * a),
+    np.sin: _unary(np.sin, lambda a, v: np.cos(a)),
+    np.cos: _unary(np.cos, lambda a, v: -np.sin(a)),
+    np.tan: _unary(np.tan, lambda a, v: 1 + v**2),
+    np.arctan: _unary(np.arctan, lambda a, v: 1 / (1 + a**2)),
+    np.sinh: _unary(np.sinh, lambda a, v: np.cosh(a)),
+    np.cosh: _unary(np.cosh, lambda a, v: np.sinh(a)),
+    np.tanh: _unary(np.tanh, lambda a, v: 1 - v**2),
+}
+
+
+class ForwardAD(Jacobian):
+    """
+    Implements forward mode automatic differentiation with dual numbers,
+    which finds the Jacobian to machine precision with one evaluation of
+    the model. This needs the model to be written with numpy expressions.
+    """
+
+    def __init__(self, problem):
+        super().__init__(problem)
+        self._method = "default"
+        if not self.matches_finite_differences():
+            raise NoJacobianError(
+                "The model of the problem can't be evaluated with dual "
+                "numbers, so forward mode Jacobians are not available"
+            )
+
+    def eval(self, params, **kwargs):
+        """
+        Evaluates Jacobian of problem.eval_model
+
+        :param params: The parameter values to find the Jacobian at
+        :type params: list
+
+        :return: The Jacobian
+        :rtype: numpy array
+        """
+        return self._eval_seeds(params, np.eye(len(params)), **kwargs)
+
+    def directional_derivative(self, params, direction, **kwargs):
+        """
+        Evaluates the derivative of the model in a direction, with a single
+        derivative in each dual number.
+
+        :param params: The parameter values at which to evaluate the
+                       derivative
+        :type params: list
+        :param direction: The direction, with a value for each parameter
+        :type direction: numpy array
+
+        :return: The derivative of the model in the direction
+        :rtype: numpy array
+        """
+        seeds = np.reshape(direction, (-1, 1))
+        return self._eval_seeds(params, seeds, **kwargs)[:, 0]
+
+    def _eval_seeds(self, params, seeds, **kwargs):
+        """
+        Evaluate the model with dual numbers, to find its derivatives in
+        the directions given by the seeds.
+
+        :param params: The parameter values at which to evaluate the
+                       derivatives
+        :type params: list
+        :param seeds: The derivatives of each parameter, with shape (m, k)
+                      for k directions
+        :type seeds: numpy array
+
+        :return: The derivatives of the model, with shape (n, k)
+        :rtype: numpy array
+        """
+        params = np.asarray(params, dtype=float)
+        num_dirs = seeds.shape[1]
+        duals = [Dual(p, seed) for p, seed in zip(params, seeds)]
+        out = self.problem.eval_model(duals, **kwargs)
+        if not isinstance(out, Dual):
+            # The model does not depend on the parameters
+            return np.zeros((np.size(out), num_dirs))
+        deriv = np.broadcast_to(out.deriv, (*out.value.shape, num_dirs))
+        return deriv.reshape(-1, num_dirs)
@@ -0,0 +1,180 @@
+"""
+Module which calculates finite difference approximations, evaluating the
+model at the perturbed parameters in parallel
+"""
+
+import multiprocessing
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+from fitbenchmarking.jacobian.base_jacobian import Jacobian
+from fitbenchmarking.utils.isolation import fork_available
+from fitbenchmarking.utils.log import get_logger
+from fitbenchmarking.utils.timer import TimerWithMaxTime
+
+LOGGER = get_logger()
+
+# The relative step sizes for each method, as used by SciPy
+REL_STEPS = {
+    "2-point": np.finfo(float).eps ** 0.5,
+    "3-point": np.finfo(float).eps ** (1 / 3),
+}
+
+# The problem evaluated by the worker processes
+_WORKER_PROBLEM = None
+
+
+class Parallel(Jacobian):
+    """
+    Implements finite difference approximations to the derivative which
+    evaluate the model at each perturbed set of parameters concurrently, on
+    a pool of threads or processes
+    """
+
+    def __init__(self, problem):
+        super().__init__(problem)
+        self._pool = None
+
+    def eval(self, params, **kwargs):
+        """
+        Evaluates Jacobian of problem.eval_model
+
+        :param params: The parameter values to find the Jacobian at
+        :type params: list
+
+        :return: Approximation of the Jacobian
+        :rtype: numpy array
+        """
+        params = np.asarray(params, dtype=float)
+        sign = np.where(params >= 0, 1.0, -1.0)
+        steps = REL_STEPS[self.method] * sign * np.maximum(1.0, abs(params))
+        # Use the steps which can be represented exactly
+        steps = (params + steps) - params
+        forward = params + np.diag(steps)
+
+        if self.method == "3-point":
+            backward = params - np.diag(steps)
+            evals = self._eval_points(np.vstack((forward, backward)), **kwargs)
+            diffs = evals[: len(params)] - evals[len(params) :]
+            return (diffs / (2 * steps[:, np.newaxis])).T
+
+        # The model at the parameters is usually in the model cache, as it
+        # has just been evaluated for the residuals
+        base = np.ravel(self.problem.eval_model(params, **kwargs))
+        evals = self._eval_points(forward, **kwargs)
+        return ((evals - base) / steps[:, np.newaxis]).T
+
+    def _eval_points(self, points, **kwargs):
+        """
+        Evaluate the model at each set of parameters in parallel.
+
+        :param points: The sets of parameters, with shape (k, m)
+        :type points: numpy array
+
+        :return: The model at each set of parameters, with shape (k, n)
+        :rtype: numpy array
+        """
+        if self.problem.options.jac_parallel_backend == "process":
+            if fork_available():
+                # The workers evaluate the function without checking the
+                # timer of their copy of the problem, so it is checked here
+                self.problem.timer.check_elapsed_time()
+                pool = self._get_pool(ProcessPoolExecutor)
+                x = kwargs.get("x")
+                evals = pool.map(_eval_model, points, [x] * len(points))
+                return np.stack([np.ravel(e) for e in evals])
+            LOGGER.warning(
+                "Processes can't be forked on this platform, so the "
+                "parallel Jacobian will use threads instead."
+            )
+
+        return self.problem.eval_model_batch(
+            points, executor=self._get_pool(ThreadPoolExecutor), **kwargs
+        )
+
+    def _get_pool(self, executor_cls):
+        """
+        Get the pool of threads or processes, creating it on the first
+        call, so the cost of starting it is paid once per fit. Processes are
+        forked with a copy of the problem, as parsed problems can't always
+        be pickled, so the pool is closed at the end of each fit to avoid
+        evaluating a stale copy in later fits.
+
+        :param executor_cls: The type of pool
+        :type executor_cls: type[concurrent.futures.Executor]
+
+        :return: The pool
+        :rtype: concurrent.futures.Executor
+        """
+        if self._pool is not None and not isinstance(self._pool, executor_cls):
+            self.close()
+        if self._pool is None:
+            num_workers = self.problem.options.jac_parallel_workers
+            if not num_workers:
+                # Share the cpus between the worker processes running fits
+                fit_workers = self.problem.options.num_workers or 1
+                num_workers = max(1, (os.cpu_count() or 1) // fit_workers)
+            if executor_cls is ProcessPoolExecutor:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=num_workers,
+                    mp_context=multiprocessing.get_context("fork"),
+                    initializer=_init_worker,
+                    initargs=(self.problem,),
+                )
+            else:
+                self._pool = ThreadPoolExecutor(max_workers=num_workers)
+            weakref.finalize(self, self._pool.shutdown, wait=False)
+        return self._pool
+
+    def close(self):
+        """
+        Shut down the pool of threads or processes, if it has been created.
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def __getstate__(self):
+        """
+        Remove the pool when pickling, as it is recreated when it is
+        needed.
+        """
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        return state
+
+
+def _init_worker(problem):
+    """
+    Set the problem evaluated by a worker process. The max_runtime is
+    checked by the timer of the problem in the main process, so the timer
+    of the copy is disabled. The cache of the copy is also disabled, as
+    each worker evaluates different parameters.
+
+    :param problem: The problem to evaluate
+    :type problem: FittingProblem
+    """
+    global _WORKER_PROBLEM
+    problem.timer = TimerWithMaxTime(np.inf)
+    problem.model_cache.enabled = False
+    _WORKER_PROBLEM = problem
+
+
+def _eval_model(params, x):
+    """
+    Evaluate the model of the problem in a worker process.
+
+    :param params: The parameters to evaluate the model at
+    :type params: numpy array
+    :param x: The x values to evaluate the model at, or None to use the
+              data of the problem
+    :type x: numpy array or None
+
+    :return: The model evaluated at the parameters
+    :rtype: numpy array
+    """
+    kwargs = {} if x is None else {"x": x}
+    return _WORKER_PROBLEM.eval_model(params, **kwargs)
@@ -3,8 +3,8 @@ Module which calculates SciPy finite difference approximations
 """
 
 import numpy as np
-from scipy.optimize._numdiff import approx_derivative
-from scipy.sparse import issparse
+from scipy.optimize._numdiff import approx_derivative, group_columns
+from scipy.sparse import csr_matrix, issparse
 
 from fitbenchmarking.jacobian.base_jacobian import Jacobian
 from fitbenchmarking.utils.exceptions import (
@@ -22,6 +22,10 @@ class Scipy(Jacobian):
     # Problem formats that are incompatible with certain Scipy Jacobians
     INCOMPATIBLE_PROBLEMS = {"cs": ["mantid"]}
 
+    # The number of random points the model is probed at to detect the
+    # sparsity of the Jacobian
+    NUM_SPARSITY_PROBES = 2
+
     def __init__(self, problem):
         super().__init__(problem)
         self.jac_pattern = None
@@ -60,6 +64,11 @@ class Scipy(Jacobian):
             # Remove the "_sparse" at the end
             self.equiv_np_method = self.method[:-7]
 
+        elif self.method.endswith("_autosparse"):
+            # Remove the "_autosparse" at the end
+            self.equiv_np_method = self.method[:-11]
+            self.jac_pattern = self._detect_sparsity(params, **kwargs)
+
         else:
             if self.problem.sparse_jacobian is not None:
                 LOGGER.info(
@@ -82,4 +91,70 @@ class Scipy(Jacobian):
             sparsity=self.jac_pattern,
         )
 
+        if self.method.endswith("_autosparse") and issparse(jac):
+            # The minimizers don't expect a sparse Jacobian for this method
+            jac = jac.toarray()
+
         return jac
+
+    def prepare(self, params):
+        """
+        Detect the sparsity of the Jacobian for the autosparse methods, so
+        that it is not done in the first evaluation of the timed fit.
+
+        :param params: The parameter values the fit starts from
+        :type params: list
+        """
+        if (
+            self.method is not None
+            and self.method.endswith("_autosparse")
+            and not self.problem.multifit
+        ):
+            self._detect_sparsity(params)
+
+    def _detect_sparsity(self, params, **kwargs):
+        """
+        Get the sparsity structure of the Jacobian and its column groups
+        for grouped finite differences. These are detected once per problem
+        by finding the non-zero entries of dense Jacobians at random points
+        near the parameters, and are cached on the problem. This is done by
+        prepare before the fit is timed.
+
+        :param params: The parameter values to find the Jacobian at
+        :type params: list
+
+        :return: The structure and groups to pass to approx_derivative, or
+                 None if the columns can't be grouped
+        :rtype: tuple(scipy.sparse.csr_matrix, numpy.ndarray) or None
+        """
+        # The structure is only known for the data of the problem
+        if kwargs.get("x", self.problem.data_x) is not self.problem.data_x:
+            return None
+
+        if self.problem.jacobian_sparsity is None:
+            params = np.asarray(params, dtype=float)
+            rng = np.random.default_rng(0)
+            structure = False
+            for _ in range(self.NUM_SPARSITY_PROBES):
+                # Probing away from the parameters avoids entries which
+                # are only zero at special values, e.g. zero parameters
+                probe = params + 0.1 * (np.abs(params) + 1) * rng.uniform(
+                    -1, 1, params.shape
+                )
+                jac = approx_derivative(
+                    lambda p: self.problem.eval_model(p).ravel(),
+                    probe,
+                    method="2-point",
+                    bounds=(-np.inf, np.inf),
+                )
+                # Non-finite entries are kept as non-zero
+                structure = structure | (np.atleast_2d(jac) != 0)
+            structure = csr_matrix(structure)
+            groups = group_columns(structure)
+            self.problem.jacobian_sparsity = (structure, groups)
+
+        structure, groups = self.problem.jacobian_sparsity
+        # Grouping only saves evaluations if some columns share a group
+        if np.max(groups, initial=-1) + 1 >= structure.shape[1]:
+            return None
+        return structure, groups
@@ -2,9 +2,14 @@
 Unit testing for the jacobian directory.
 """
 
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase
+from unittest.mock import MagicMock, patch
 
+import numdifftools as nd
 import numpy as np
+from parameterized import parameterized
 from scipy import sparse
 from scipy.sparse import issparse
 
@@ -18,9 +23,12 @@ from fitbenchmarking.cost_func.weighted_nlls_cost_func import (
 )
 from fitbenchmarking.jacobian.analytic_jacobian import Analytic
 from fitbenchmarking.jacobian.best_available_jacobian import BestAvailable
+from fitbenchmarking.jacobian.complex_step_jacobian import ComplexStep
 from fitbenchmarking.jacobian.default_jacobian import Default
+from fitbenchmarking.jacobian.forward_ad_jacobian import Dual, ForwardAD
 from fitbenchmarking.jacobian.jacobian_factory import create_jacobian
 from fitbenchmarking.jacobian.numdifftools_jacobian import Numdifftools
+from fitbenchmarking.jacobian.parallel_jacobian import Parallel
 from fitbenchmarking.jacobian.scipy_jacobian import Scipy
 from fitbenchmarking.parsing.fitting_problem import FittingProblem
 from fitbenchmarking.utils import exceptions
@@ -51,6 +59,23 @@ def f(x, p1, p2):
     return p1 * np.exp(p2 * x)
 
 
+def f_abs(x, p1, p2):
+    """
+    Test function which does not support complex or dual numbers
+
+    :param x: x data points, defaults to self.data_x
+    :type x: numpy array, optional
+    :param p1: parameter 1
+    :type p1: float
+    :param p2: parameter 1
+    :type p2: float
+
+    :return: function evaluation
+    :rtype: numpy array
+    """
+    return p1 * np.exp(np.abs(p2) * x)
+
+
 def j(x, p):
     """
     Analytic Jacobian evaluation
@@ -238,6 +263,72 @@ class TestJacobianClass(TestCase):
         with self.assertRaises(NoSparseJacobianError):
             jac.eval(params=self.params)
 
+    def test_scipy_eval_autosparse(self):
+        """
+        Test that Scipy evaluation with a detected sparsity pattern is
+        correct, dense, and groups the columns of a block diagonal Jacobian
+        """
+        self.fitting_problem.function = lambda x, a, b, c, d: np.concatenate(
+            (a * np.exp(b * x[:3]), c * np.exp(d * x[3:]))
+        )
+        params = [6.0, 0.1, 0.0, 0.2]
+        x = self.fitting_problem.data_x
+        expected = np.zeros((5, 4))
+        expected[:3, :2] = j(x[:3], params[:2])
+        expected[3:, 2:] = j(x[3:], params[2:])
+
+        jac = Scipy(self.cost_func.problem)
+        jac.method = "2-point_autosparse"
+        eval_result = jac.eval(params=params)
+
+        self.assertFalse(issparse(eval_result))
+        self.assertTrue(np.allclose(expected, eval_result, atol=1e-6))
+        # The column of d is zero at the parameters, as c is zero, but is
+        # kept in the structure
+        structure, groups = self.fitting_problem.jacobian_sparsity
+        np.testing.assert_array_equal(
+            structure.toarray(),
+            [[1, 1, 0, 0]] * 3 + [[0, 0, 1, 1]] * 2,
+        )
+        self.assertEqual(np.max(groups) + 1, 2)
+
+    def test_scipy_prepare_autosparse(self):
+        """
+        Test that prepare detects the sparsity, so the first evaluation
+        only makes the evaluations of one grouped finite difference
+        """
+        self.fitting_problem.function = lambda x, a, b, c, d: np.concatenate(
+            (a * np.exp(b * x[:3]), c * np.exp(d * x[3:]))
+        )
+        params = [6.0, 0.1, 0.0, 0.2]
+        jac = Scipy(self.cost_func.problem)
+        jac.method = "2-point_autosparse"
+        jac.prepare(params)
+        self.assertIsNotNone(self.fitting_problem.jacobian_sparsity)
+
+        with patch.object(
+            self.fitting_problem,
+            "eval_model",
+            wraps=self.fitting_problem.eval_model,
+        ) as eval_model:
+            jac.eval(params=params)
+
+        # The base point and one step for each of the 2 column groups
+        self.assertEqual(eval_model.call_count, 3)
+
+    def test_scipy_eval_autosparse_dense(self):
+        """
+        Test that Scipy evaluation with a detected sparsity pattern is
+        correct when the Jacobian is dense
+        """
+        jac = Scipy(self.cost_func.problem)
+        jac.method = "2-point_autosparse"
+        eval_result = jac.eval(params=self.params)
+
+        self.assertTrue(np.isclose(self.actual, eval_result).all())
+        structure, _ = self.fitting_problem.jacobian_sparsity
+        self.assertTrue(structure.toarray().all())
+
     def test_numdifftools_eval(self):
         """
         Test whether numdifftools evaluation is correct
@@ -254,6 +345,296 @@ class TestJacobianClass(TestCase):
             eval_result = jac.eval(params=self.params)
             self.assertTrue(np.isclose(self.actual, eval_result).all())
 
+    def test_numdifftools_reuses_jacobian(self):
+        """
+        Test that the numdifftools Jacobian is built once per method, and
+        gives the same result as a new one.
+        """
+        jac = Numdifftools(self.cost_func.problem)
+        jac.method = "central"
+        first = jac.eval(params=self.params)
+
+        with patch("numdifftools.Jacobian.__init__") as init:
+            second = jac.eval(params=self.params)
+
+        init.assert_not_called()
+        np.testing.assert_array_equal(first, second)
+        np.testing.assert_array_equal(
+            first,
+            nd.Jacobian(self.fitting_problem.eval_model, method="central")(
+                self.params
+            ),
+        )
+
+        jac.method = "forward"
+        np.testing.assert_array_equal(
+            jac.eval(params=self.params),
+            nd.Jacobian(self.fitting_problem.eval_model, method="forward")(
+                self.params
+            ),
+        )
+
+    def test_numdifftools_x(self):
+        """
+        Test that the numdifftools Jacobian is found at the given x values.
+        """
+        jac = Numdifftools(self.cost_func.problem)
+        jac.method = "central"
+        x = np.array([2.0, 3.0])
+
+        eval_result = jac.eval(params=self.params, x=x)
+
+        self.assertTrue(np.isclose(j(x=x, p=self.params), eval_result).all())
+
+    @parameterized.expand(
+        [
+            ("2-point", "thread", 0),
+            ("3-point", "thread", 2),
+            ("2-point", "process", 2),
+            ("3-point", "process", 0),
+        ]
+    )
+    def test_parallel_eval(self, method, backend, workers):
+        """
+        Test whether the parallel evaluation is correct
+        """
+        self.fitting_problem.options.jac_parallel_backend = backend
+        self.fitting_problem.options.jac_parallel_workers = workers
+        jac = Parallel(self.cost_func.problem)
+        jac.method = method
+        eval_result = jac.eval(params=self.params)
+        self.assertTrue(np.isclose(self.actual, eval_result).all())
+
+    def test_parallel_eval_threads(self):
+        """
+        Test that the parallel Jacobian evaluates the perturbed parameters
+        in one batch on a pool of the set number of threads, which is kept
+        until the Jacobian is closed
+        """
+        self.fitting_problem.options.jac_parallel_workers = 3
+        jac = Parallel(self.cost_func.problem)
+        jac.method = "2-point"
+        with patch.object(
+            self.fitting_problem,
+            "eval_model_batch",
+            wraps=self.fitting_problem.eval_model_batch,
+        ) as eval_model_batch:
+            jac.eval(params=self.params)
+            jac.eval(params=self.params)
+
+        self.assertEqual(eval_model_batch.call_count, 2)
+        self.assertEqual(eval_model_batch.call_args[0][0].shape, (2, 2))
+        executors = {
+            call.kwargs["executor"] for call in eval_model_batch.call_args_list
+        }
+        self.assertEqual(len(executors), 1)
+        executor = executors.pop()
+        self.assertIsInstance(executor, ThreadPoolExecutor)
+        self.assertEqual(executor._max_workers, 3)
+
+        jac.close()
+        self.assertIsNone(jac._pool)
+        with self.assertRaises(RuntimeError):
+            executor.submit(abs, 1)
+
+    def test_parallel_reuses_base_point(self):
+        """
+        Test that the 2-point parallel Jacobian takes the model at the
+        parameters from the model cache, and only evaluates the model at
+        the perturbed parameters
+        """
+        function = self.fitting_problem.function
+        self.fitting_problem.function = MagicMock(side_effect=function)
+        jac = Parallel(self.cost_func.problem)
+        jac.method = "2-point"
+
+        self.fitting_problem.eval_model(self.params)
+        self.fitting_problem.function.reset_mock()
+        eval_result = jac.eval(params=self.params)
+
+        self.assertEqual(
+            self.fitting_problem.function.call_count, len(self.params)
+        )
+        self.assertTrue(np.isclose(self.actual, eval_result).all())
+
+    def test_parallel_eval_x(self):
+        """
+        Test that the parallel Jacobian uses the given x values in each
+        backend
+        """
+        x = np.array([1.0, 2.0])
+        expected = j(x=x, p=self.params)
+        for backend in ["thread", "process"]:
+            self.fitting_problem.options.jac_parallel_backend = backend
+            jac = Parallel(self.cost_func.problem)
+            jac.method = "3-point"
+            eval_result = jac.eval(params=self.params, x=x)
+            self.assertTrue(np.isclose(expected, eval_result).all())
+
+    def test_parallel_fits_after_max_runtime(self):
+        """
+        Test that the worker processes of the parallel Jacobian don't raise
+        a MaxRuntimeError in fits run more than max_runtime apart
+        """
+        timer = self.fitting_problem.timer
+        timer.max_runtime = 0.2
+        self.fitting_problem.options.jac_parallel_backend = "process"
+        jac = Parallel(self.cost_func.problem)
+        jac.method = "2-point"
+        for _ in range(2):
+            timer.start()
+            eval_result = jac.eval(params=self.params)
+            timer.stop()
+            timer.reset()
+            jac.close()
+            self.assertTrue(np.isclose(self.actual, eval_result).all())
+            time.sleep(0.3)
+
+    def test_parallel_max_runtime(self):
+        """
+        Test that the parallel Jacobian raises a MaxRuntimeError once the
+        max_runtime of the fit has passed
+        """
+        timer = self.fitting_problem.timer
+        timer.max_runtime = 0.0
+        self.fitting_problem.options.jac_parallel_backend = "process"
+        jac = Parallel(self.cost_func.problem)
+        jac.method = "2-point"
+        timer.start()
+        with self.assertRaises(exceptions.MaxRuntimeError):
+            jac.eval(params=self.params)
+
+    def test_parallel_close(self):
+        """
+        Test that closing the parallel Jacobian shuts down its processes,
+        and that new ones are started for the next fit
+        """
+        self.fitting_problem.options.jac_parallel_backend = "process"
+        jac = Parallel(self.cost_func.problem)
+        jac.method = "2-point"
+        jac.eval(params=self.params)
+        pool = jac._pool
+        jac.close()
+        self.assertIsNone(jac._pool)
+
+        eval_result = jac.eval(params=self.params)
+        self.assertIsNot(jac._pool, pool)
+        self.assertTrue(np.isclose(self.actual, eval_result).all())
+        jac.close()
+
+    @parameterized.expand([(ComplexStep,), (ForwardAD,)])
+    def test_exact_eval(self, jacobian_cls):
+        """
+        Test whether the complex step and forward mode evaluations are
+        correct
+        """
+        self.fitting_problem.starting_values = [{"p1": 6.0, "p2": 0.1}]
+        jac = jacobian_cls(self.cost_func.problem)
+        eval_result = jac.eval(params=[2.0, -0.3])
+        expected = j(x=self.fitting_problem.data_x, p=[2.0, -0.3])
+        self.assertTrue(np.allclose(expected, eval_result, rtol=1e-14))
+        self.assertEqual(jac.method, "default")
+
+    @parameterized.expand([(ComplexStep,), (ForwardAD,)])
+    def test_exact_eval_x(self, jacobian_cls):
+        """
+        Test that the complex step and forward mode evaluations use the
+        given x values
+        """
+        self.fitting_problem.starting_values = [{"p1": 6.0, "p2": 0.1}]
+        jac = jacobian_cls(self.cost_func.problem)
+        x = np.array([0.5, 1.5])
+        eval_result = jac.eval(params=self.params, x=x)
+        self.assertTrue(np.allclose(j(x=x, p=self.params), eval_result))
+
+    @parameterized.expand([(ComplexStep,), (ForwardAD,)])
+    def test_exact_unsupported_model(self, jacobian_cls):
+        """
+        Test that the complex step and forward mode Jacobians are not
+        available if the model does not support them
+        """
+        self.fitting_problem.function = f_abs
+        self.fitting_problem.starting_values = [{"p1": 6.0, "p2": -0.1}]
+        with self.assertRaises(exceptions.NoJacobianError):
+            jacobian_cls(self.cost_func.problem)
+        self.assertEqual(
+            self.fitting_problem.jacobian_checks,
+            {jacobian_cls.__name__: False},
+        )
+
+    @parameterized.expand([(ComplexStep,), (ForwardAD,)])
+    def test_exact_check_evaluations(self, jacobian_cls):
+        """
+        Test that checking the complex step and forward mode Jacobians
+        evaluates the model the same number of times for any number of
+        parameters
+        """
+        num_evals = []
+        for num_params in [2, 20]:
+            self.fitting_problem.function = lambda x, *p: np.exp(sum(p) * x)
+            self.fitting_problem.starting_values = [
+                {f"p{i}": 0.01 * (i + 1) for i in range(num_params)}
+            ]
+            self.fitting_problem.jacobian_checks = {}
+            with patch.object(
+                self.fitting_problem,
+                "_eval_function",
+                wraps=self.fitting_problem._eval_function,
+            ) as eval_function:
+                jacobian_cls(self.cost_func.problem)
+            num_evals.append(eval_function.call_count)
+
+        self.assertEqual(num_evals, [3, 3])
+
+    @parameterized.expand([(ComplexStep,), (ForwardAD,)])
+    def test_directional_derivative(self, jacobian_cls):
+        """
+        Test the derivative of the complex step and forward mode Jacobians
+        in a direction
+        """
+        self.fitting_problem.starting_values = [{"p1": 6.0, "p2": 0.1}]
+        jac = jacobian_cls(self.cost_func.problem)
+        direction = np.array([0.5, -2.0])
+        result = jac.directional_derivative(self.params, direction)
+        self.assertTrue(np.allclose(self.actual @ direction, result))
+
+    def test_complex_step_incompatible_format(self):
+        """
+        Test that the complex step Jacobian is not available for mantid
+        """
+        self.fitting_problem.starting_values = [{"p1": 6.0, "p2": 0.1}]
+        self.fitting_problem.format = "mantid"
+        with self.assertRaises(exceptions.NoJacobianError):
+            ComplexStep(self.cost_func.problem)
+
+    def test_forward_ad_dual_rules(self):
+        """
+        Test the derivatives of the operations on dual numbers
+        """
+
+        def model(x, a, b):
+            return (
+                (a * x + b) / (1 + x**a)
+                - np.sqrt(a) * np.log(b * x) ** 2
+                + np.sin(a * x) * np.cos(b)
+                + np.tan(b / 4) * np.arctan(a - x)
+                + np.tanh(a * b) * np.sinh(x / 5) / np.cosh(b)
+                + 2**a * np.log10(x) * np.square(b)
+                - (-a) ** 2
+                + x ** (a * b)
+            )
+
+        x = np.array([0.5, 1.0, 2.0])
+        params = np.array([1.3, 0.7])
+        out = model(x, *[Dual(p, s) for p, s in zip(params, np.eye(2))])
+
+        self.assertTrue(np.allclose(out.value, model(x, *params)))
+        steps = 1e-20 * np.eye(2)
+        expected = np.column_stack(
+            [np.imag(model(x, *(params + 1j * s))) / 1e-20 for s in steps]
+        )
+        self.assertTrue(np.allclose(out.deriv, expected, rtol=1e-12))
+
     def test_analytic_cutest_no_errors(self):
         """
         Test analytic Jacobian
@@ -474,6 +855,38 @@ class TestBestAvailable(TestCase):
         jac = BestAvailable(self.fitting_problem)
         self.assertEqual(type(jac.sub_jac), Scipy)
 
+    def test_eval_not_callable_jac_forward_ad(self):
+        """
+        Test that a forward mode jacobian is used when jac is not callable
+        and the model supports dual numbers.
+        """
+        self.fitting_problem.jacobian = None
+        self.fitting_problem.starting_values = [{"p1": 6.0, "p2": 0.1}]
+        jac = BestAvailable(self.fitting_problem)
+        self.assertEqual(type(jac.sub_jac), ForwardAD)
+
+    def test_eval_not_callable_jac_complex_step(self):
+        """
+        Test that a complex step jacobian is used when jac is not callable
+        and the model supports complex but not dual numbers.
+        """
+        self.fitting_problem.jacobian = None
+        self.fitting_problem.function = lambda x, p1, p2: p1 * np.expm1(p2 * x)
+        self.fitting_problem.starting_values = [{"p1": 6.0, "p2": 0.1}]
+        jac = BestAvailable(self.fitting_problem)
+        self.assertEqual(type(jac.sub_jac), ComplexStep)
+
+    def test_eval_not_callable_jac_unsupported_model(self):
+        """
+        Test that a scipy jacobian is used when jac is not callable and the
+        model doesn't support complex or dual numbers.
+        """
+        self.fitting_problem.jacobian = None
+        self.fitting_problem.function = f_abs
+        self.fitting_problem.starting_values = [{"p1": 6.0, "p2": 0.1}]
+        jac = BestAvailable(self.fitting_problem)
+        self.assertEqual(type(jac.sub_jac), Scipy)
+
 
 class TestFactory(TestCase):
     """
@@ -491,6 +904,9 @@ class TestFactory(TestCase):
             ("scipy", Scipy),
             ("analytic", Analytic),
             ("best_available", BestAvailable),
+            ("parallel", Parallel),
+            ("complex_step", ComplexStep),
+            ("forward_ad", ForwardAD),
         ]
 
         invalid = ["numpy", "random_jac"]
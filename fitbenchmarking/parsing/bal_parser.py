@@ -5,11 +5,21 @@ Adjustment problem in the Large (BAL) dataset.
 
 import bz2
 import typing
+import warnings
 
 import numpy as np
 from scipy.sparse import lil_matrix
 
 from fitbenchmarking.parsing.fitbenchmark_parser import FitbenchmarkParser
+from fitbenchmarking.parsing.parse_cache import (
+    entry_path,
+    read_entry,
+    write_entry,
+)
+from fitbenchmarking.utils.exceptions import ParsingError
+
+# The number of bytes of the decompressed file which are read at a time
+_BLOCK_SIZE = 1 << 24
 
 
 class BALParser(FitbenchmarkParser):
@@ -17,34 +27,41 @@ class BALParser(FitbenchmarkParser):
     Parser for a Bundle Adjustment problem definition file.
     """
 
+    # The data file is cached by read_bal_file, along with the state used
+    # by the function
+    _CACHE_DATA_POINTS = False
+
+    def __init__(self, filename, options):
+        super().__init__(filename, options)
+
+        # The arrays read from the data file, which is only read once
+        self._bal_data = None
+
     def read_bal_data(self, file_name):
         """
         Read in datafile
         """
-        with bz2.open(file_name, "rt") as file:
-            self.n_cameras, self.n_points, n_observations = map(
-                int, file.readline().split()
-            )
-
-            self.camera_indices = np.empty(n_observations, dtype=int)
-            self.point_indices = np.empty(n_observations, dtype=int)
+        data = self._read_bal_file(file_name)
+        self.n_cameras = len(data["camera_params"])
+        self.n_points = len(data["points_3d"])
+        self.camera_indices = data["camera_indices"]
+        self.point_indices = data["point_indices"]
 
-            for i in range(n_observations):
-                camera_index, point_index, _, _ = file.readline().split()
-                self.camera_indices[i] = int(camera_index)
-                self.point_indices[i] = int(point_index)
+        return data["camera_params"], data["points_3d"]
 
-            camera_params = np.empty(self.n_cameras * 9)
-            for i in range(self.n_cameras * 9):
-                camera_params[i] = float(file.readline())
-            camera_params = camera_params.reshape((self.n_cameras, -1))
+    def _read_bal_file(self, file_name):
+        """
+        Read the data file, or return the arrays if it has been read.
 
-            points_3d = np.empty(self.n_points * 3)
-            for i in range(self.n_points * 3):
-                points_3d[i] = float(file.readline())
-            points_3d = points_3d.reshape((self.n_points, -1))
+        :param file_name: The path to the data file
+        :type file_name: str
 
-        return camera_params, points_3d
+        :return: The arrays read from the data file
+        :rtype: dict[str, np.ndarray]
+        """
+        if self._bal_data is None:
+            self._bal_data = read_bal_file(file_name, self.options.cache_dir)
+        return self._bal_data
 
     @staticmethod
     def rotate(points, rot_vecs):
@@ -136,15 +153,9 @@ class BALParser(FitbenchmarkParser):
         :return: data
         :rtype: dict<str, np.ndarray>
         """
-        with bz2.open(data_file_path, "rt") as file:
-            _, _, n_observations = map(int, file.readline().split())
-            points_2d = np.empty((n_observations, 2))
-
-            for i in range(n_observations):
-                _, _, x, y = file.readline().split()
-                points_2d[i] = [float(x), float(y)]
+        points_2d = self._read_bal_file(data_file_path)["points_2d"]
 
-        return {"x": np.zeros(n_observations * 2), "y": points_2d.ravel()}
+        return {"x": np.zeros(points_2d.size), "y": points_2d.ravel()}
 
     def _get_equation(self) -> str:
         """
@@ -200,3 +211,102 @@ class BALParser(FitbenchmarkParser):
             return A
 
         return sparse_jac
+
+
+def read_bal_file(file_name, cache_dir=""):
+    """
+    Read a BAL data file in a single pass.
+
+    The file holds the numbers of cameras, points and observations, then
+    the camera index, point index and 2D position of each observation,
+    the 9 parameters of each camera and the 3D position of each point.
+
+    :param file_name: The path to the bz2 data file
+    :type file_name: str
+    :param cache_dir: The directory to cache the arrays in. If empty, they
+                      are not cached.
+    :type cache_dir: str
+
+    :return: The arrays camera_indices, point_indices, points_2d,
+             camera_params and points_3d
+    :rtype: dict[str, np.ndarray]
+    """
+    path = entry_path(file_name, "BALParser", cache_dir)
+    if (entry := read_entry(path)) is not None:
+        return entry[1]
+
+    values = _read_values(file_name)
+    if values.size < 3:
+        raise ParsingError(f"Could not read the BAL file {file_name}")
+    n_cameras, n_points, n_observations = values[:3].astype(int)
+    sizes = [4 * n_observations, 9 * n_cameras, 3 * n_points]
+    if values.size != 3 + sum(sizes):
+        raise ParsingError(
+            f"Expected {3 + sum(sizes)} values in the BAL file {file_name}, "
+            f"found {values.size}"
+        )
+    observations, camera_params, points_3d = np.split(
+        values[3:], np.cumsum(sizes[:-1])
+    )
+    observations = observations.reshape((n_observations, 4))
+
+    data = {
+        "camera_indices": observations[:, 0].astype(int),
+        "point_indices": observations[:, 1].astype(int),
+        "points_2d": observations[:, 2:],
+        "camera_params": camera_params.reshape((n_cameras, 9)),
+        "points_3d": points_3d.reshape((n_points, 3)),
+    }
+    write_entry(path, {}, data)
+    return data
+
+
+def _read_values(file_name):
+    """
+    Read all the numbers in a bz2 file, decompressing and converting it a
+    block at a time.
+
+    :param file_name: The path to the bz2 file
+    :type file_name: str
+
+    :return: The numbers in the file
+    :rtype: np.ndarray
+    """
+    blocks = []
+    rest = b""
+    with (
+        bz2.open(file_name, "rb") as file,
+        warnings.catch_warnings(),
+    ):
+        # np.fromstring warns, rather than raising, when it finds text which
+        # isn't a number
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            while block := file.read(_BLOCK_SIZE):
+                block = rest + block
+                # Split after the last whole line
+                end = block.rfind(b"\n") + 1
+                blocks.append(_to_array(block[:end]))
+                rest = block[end:]
+            blocks.append(_to_array(rest))
+        except (DeprecationWarning, ValueError) as e:
+            raise ParsingError(
+                f"Could not read the BAL file {file_name}: {e}"
+            ) from e
+    return np.concatenate(blocks)
+
+
+def _to_array(text):
+    """
+    Convert whitespace separated numbers to an array.
+
+    :param text: The numbers
+    :type text: bytes
+
+    :return: The numbers
+    :rtype: np.ndarray
+    """
+    # np.fromstring returns [-1.] for text which is only whitespace
+    if not text.strip():
+        return np.empty(0)
+    return np.fromstring(text, sep=" ")
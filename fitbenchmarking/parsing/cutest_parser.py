@@ -4,26 +4,39 @@ This file calls the pycutest interface for SIF data
 
 import os
 import time
+from contextlib import contextmanager, suppress
 from tempfile import TemporaryDirectory
 
 import numpy as np
 import pycutest
 
+try:
+    import fcntl
+except ImportError:
+    # fcntl is not available on Windows, where compiling is not locked
+    fcntl = None
+
 from fitbenchmarking.parsing.base_parser import Parser
 from fitbenchmarking.parsing.fitting_problem import FittingProblem
+from fitbenchmarking.utils.disk_cache import hash_key
 from fitbenchmarking.utils.exceptions import ParsingError
 
-if os.path.isdir(os.environ["PYCUTEST_CACHE"] + "/pycutest_cache_holder"):
-    # clear problems from cache that are older than 1 hour, do not clear
-    # all problems as when running with matlab the cache is cleared again
-    # when dill.load is called in controller
+# The compiled problems are named by a hash of their SIF file, so they can be
+# reused by later runs. Clear the ones which have not been used for this
+# many seconds, rather than all of them, as when running with matlab the
+# cache is cleared again when dill.load is called in controller
+_MAX_CACHE_AGE = 30 * 24 * 3600
+
+_CACHE_HOLDER = os.path.join(
+    os.environ["PYCUTEST_CACHE"], "pycutest_cache_holder"
+)
+
+if os.path.isdir(_CACHE_HOLDER):
     for cached_problem in pycutest.all_cached_problems():
         file_age = time.time() - os.path.getmtime(
-            os.environ["PYCUTEST_CACHE"]
-            + "/pycutest_cache_holder/"
-            + cached_problem[0]
+            os.path.join(_CACHE_HOLDER, cached_problem[0])
         )
-        if file_age > 7200:
+        if file_age > _MAX_CACHE_AGE:
             pycutest.clear_cache(cached_problem[0], cached_problem[1])
 
 
@@ -47,8 +60,11 @@ class CutestParser(Parser):
     As such the function is defined by: `f(x, p) := r(f_x,p,0,1)`
 
     If a new x is passed, we write a new file and parse it to generate a
-    function. We define x to be new if ``not np.isclose(x, cached_x)`` for each
-    ``cached_x`` that has already been stored.
+    function. The functions are stored in a dictionary keyed by a hash of
+    the values of x, so x is new if no x with the same values has been
+    passed before. pycutest keeps the compiled problems between runs, and
+    these are named by a hash of the file, so the same file is only
+    compiled once.
     """
 
     def parse(self):
@@ -92,14 +108,33 @@ class CutestParser(Parser):
         if vr:
             fp.set_value_ranges(vr)
 
-        # Create a list of x and f (function evaluation) and x and g (Jacobian
-        # evaluation).
+        # Map each x to the problem evaluating at it.
         # If a new x is given we will create and parse a new file
-        self._cache_f = [(fp.data_x, self._p.objcons)]
-        self._cache_g = [(fp.data_x, self._p.lagjac, self._p.slagjac)]
+        self._base_x = fp.data_x
+        self._problems = {_x_key(fp.data_x): self._p}
 
         return fp
 
+    def _get_problem(self, x):
+        """
+        Get the problem which evaluates at the given x values, creating it
+        if these x values have not been passed in before.
+
+        :param x: The data to evaluate at
+        :type x: np.array
+        :return: The problem for these x values
+        :rtype: pycutest.CUTEstProblem
+        """
+        if x is self._base_x:
+            return self._p
+
+        key = _x_key(x)
+        if (p := self._problems.get(key)) is None:
+            os.environ["MASTSIF"] = self.mastsif_dir.name
+            fname, _, _, _ = self._setup_data(x)
+            p = self._problems[key] = _import_problem(fname)
+        return p
+
     def _function(self, x, *params):
         """
         If these x values have been passed in before, then run the function
@@ -110,18 +145,7 @@ class CutestParser(Parser):
         :return: The result of evaluating at the given x
         :rtype: np.array
         """
-        os.environ["MASTSIF"] = self.mastsif_dir.name
-
-        for cx, cf in self._cache_f:
-            if x.size == cx.size and np.isclose(cx, x).all():
-                f = cf
-                break
-        else:
-            fname, _, _, _ = self._setup_data(x)
-            p = _import_problem(fname)
-            f = p.objcons
-            self._cache_f.append((x, f))
-        _, fx = f(np.asarray(params))
+        _, fx = self._get_problem(x).objcons(np.asarray(params))
 
         return fx
 
@@ -136,19 +160,7 @@ class CutestParser(Parser):
         :return: The result of evaluating at the given x
         :rtype: np.array
         """
-        os.environ["MASTSIF"] = self.mastsif_dir.name
-
-        for cx, cg, _ in self._cache_g:
-            if np.isclose(cx, x).all():
-                g = cg
-                break
-        else:
-            fname, _, _, _ = self._setup_data(x)
-            p = _import_problem(fname)
-            g = p.lagjac
-            sg = p.slagjac
-            self._cache_g.append((x, g, sg))
-        _, gx = g(np.asarray(params)[0])
+        _, gx = self._get_problem(x).lagjac(np.asarray(params)[0])
 
         return gx
 
@@ -161,20 +173,7 @@ class CutestParser(Parser):
         :return: The result of evaluating at the given x
         :rtype: scipy.sparse.coo_matrix
         """
-
-        os.environ["MASTSIF"] = self.mastsif_dir.name
-
-        for cx, _, csg in self._cache_g:
-            if np.isclose(cx, x).all():
-                sg = csg
-                break
-        else:
-            fname, _, _, _ = self._setup_data(x)
-            p = _import_problem(fname)
-            g = p.lagjac
-            sg = p.slagjac
-            self._cache_g.append((x, g, sg))
-        _, gx = sg(np.asarray(params)[0])
+        _, gx = self._get_problem(x).slagjac(np.asarray(params)[0])
 
         return gx
 
@@ -234,9 +233,10 @@ class CutestParser(Parser):
                 x = np.array([x])
             x, y, e, to_write = _write_x(lines, x)
 
-        file_path = os.path.join(
-            self.mastsif_dir.name, f"{str(id(x))[-10:]}.SIF"
-        )
+        # Name the file by its contents, so pycutest only compiles it once.
+        # Problem names are at most 10 characters.
+        name = hash_key("".join(to_write))[:10].upper()
+        file_path = os.path.join(self.mastsif_dir.name, f"{name}.SIF")
 
         with open(file_path, "w", encoding="utf-8") as f:
             f.writelines(to_write)
@@ -375,6 +375,54 @@ def _check_data(count, x, y, e):
         )
 
 
+def _x_key(x):
+    """
+    Get a key for the values of x.
+
+    :param x: The data to evaluate at
+    :type x: np.array
+    :return: A hash of the shape and values of x
+    :rtype: str
+    """
+    x = np.ascontiguousarray(x, dtype=float)
+    return hash_key(str(x.shape), x.tobytes())
+
+
+@contextmanager
+def _compile_lock(problem):
+    """
+    Lock compiling the problem, as other processes may be compiling the
+    same problem into the cache. Compiling is not locked where fcntl is
+    not available.
+
+    The lock file is removed when the lock is released, so it is not left
+    in the cache. A process which has locked a file that was removed while
+    it waited tries again with a new one.
+
+    :param problem: The name of the problem
+    :type problem: str
+    """
+    if fcntl is None:
+        yield
+        return
+
+    lock_path = os.path.join(
+        os.environ["PYCUTEST_CACHE"], f".fitbenchmarking_{problem}.lock"
+    )
+    while True:
+        lock = open(lock_path, "w", encoding="utf-8")  # noqa: SIM115
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        with suppress(FileNotFoundError):
+            if os.stat(lock_path).st_ino == os.fstat(lock.fileno()).st_ino:
+                break
+        lock.close()
+    try:
+        yield
+    finally:
+        os.remove(lock_path)
+        lock.close()
+
+
 def _import_problem(file_name):
     """
     Import the problem using cutest
@@ -388,4 +436,11 @@ def _import_problem(file_name):
     problem_ext = os.path.basename(file_name)
     problem, _ = os.path.splitext(problem_ext)
 
-    return pycutest.import_problem(problem)
+    with _compile_lock(problem):
+        p = pycutest.import_problem(problem)
+
+    # Mark the compiled problem as used, so it isn't cleared from the cache
+    with suppress(OSError):
+        os.utime(os.path.join(_CACHE_HOLDER, problem))
+
+    return p
@@ -0,0 +1,466 @@
+"""
+Generates numpy code for a model given as an expression string, and for its
+exact Jacobian and Hessian, by differentiating the expression symbolically.
+Subexpressions which are used more than once are evaluated once.
+"""
+
+import ast
+
+import numpy as np
+
+from fitbenchmarking.utils.disk_cache import cache_path, hash_key, write_atomic
+from fitbenchmarking.utils.exceptions import ParsingError
+from fitbenchmarking.utils.log import get_logger
+
+LOGGER = get_logger()
+
+# Changing the generated code should change this, so old cache entries are
+# not used
+CODEGEN_VERSION = "1"
+
+# The numpy functions which can be differentiated
+FUNCTIONS = ["exp", "log", "sin", "cos", "tan"]
+
+# Expressions are nested tuples, with the type of the node first. Equal
+# subexpressions are equal tuples, which makes finding them cheap.
+ZERO = ("num", 0)
+ONE = ("num", 1)
+
+
+def _num(value):
+    return ("num", value)
+
+
+def _is_num(node):
+    return node[0] == "num"
+
+
+def _add(a, b):
+    if a == ZERO:
+        return b
+    if b == ZERO:
+        return a
+    if _is_num(a) and _is_num(b):
+        return _num(a[1] + b[1])
+    return ("add", a, b)
+
+
+def _sub(a, b):
+    if b == ZERO:
+        return a
+    if a == ZERO:
+        return _neg(b)
+    if a == b:
+        return ZERO
+    if _is_num(a) and _is_num(b):
+        return _num(a[1] - b[1])
+    return ("sub", a, b)
+
+
+def _mul(a, b):
+    if ZERO in (a, b):
+        return ZERO
+    if a == ONE:
+        return b
+    if b == ONE:
+        return a
+    if _is_num(a) and _is_num(b):
+        return _num(a[1] * b[1])
+    if a[0] == "neg":
+        return _neg(_mul(a[1], b))
+    if b[0] == "neg":
+        return _neg(_mul(a, b[1]))
+    return ("mul", a, b)
+
+
+def _div(a, b):
+    if a == ZERO:
+        return ZERO
+    if b == ONE:
+        return a
+    if a == b:
+        return ONE
+    if _is_num(a) and _is_num(b) and b[1] != 0:
+        return _num(a[1] / b[1])
+    if a[0] == "neg":
+        return _neg(_div(a[1], b))
+    return ("div", a, b)
+
+
+def _pow(a, b):
+    if b == ZERO:
+        return ONE
+    if b == ONE:
+        return a
+    if _is_num(a) and _is_num(b):
+        return _num(a[1] ** b[1])
+    return ("pow", a, b)
+
+
+def _neg(a):
+    if _is_num(a):
+        return _num(-a[1])
+    if a[0] == "neg":
+        return a[1]
+    return ("neg", a)
+
+
+def _call(func, a):
+    return ("call", func, a)
+
+
+def parse_expression(expression, names):
+    """
+    Parse a numpy expression string into a tree.
+
+    :param expression: The expression, e.g. ``b1*np.exp(-b2*x)``
+    :type expression: str
+    :param names: The names of the variables which can be used
+    :type names: list of str
+
+    :return: The tree of the expression
+    :rtype: tuple
+    """
+    try:
+        tree = ast.parse(expression.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ParsingError(
+            f"Could not parse the expression {expression}"
+        ) from e
+    return _convert(tree.body, set(names))
+
+
+def _convert(node, names):
+    """
+    Convert a node of a python syntax tree into an expression.
+
+    :param node: The node
+    :type node: ast.AST
+    :param names: The names of the variables which can be used
+    :type names: set of str
+
+    :return: The tree of the expression
+    :rtype: tuple
+    """
+    binary = {
+        ast.Add: _add,
+        ast.Sub: _sub,
+        ast.Mult: _mul,
+        ast.Div: _div,
+        ast.Pow: _pow,
+    }
+    if isinstance(node, ast.BinOp) and type(node.op) in binary:
+        return binary[type(node.op)](
+            _convert(node.left, names), _convert(node.right, names)
+        )
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        return _neg(_convert(node.operand, names))
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.UAdd):
+        return _convert(node.operand, names)
+    if (
+        isinstance(node, ast.Constant)
+        and isinstance(node.value, int | float)
+        and not isinstance(node.value, bool)
+    ):
+        return _num(node.value)
+    if isinstance(node, ast.Name) and node.id in names:
+        return ("sym", node.id)
+    if _is_np_attribute(node) and node.attr == "pi":
+        return _num(np.pi)
+    if (
+        isinstance(node, ast.Call)
+        and _is_np_attribute(node.func)
+        and node.func.attr in FUNCTIONS
+        and len(node.args) == 1
+        and not node.keywords
+    ):
+        return _call(node.func.attr, _convert(node.args[0], names))
+    raise ParsingError(
+        f"Can't generate code for the expression {ast.unparse(node)}"
+    )
+
+
+def _is_np_attribute(node):
+    return (
+        isinstance(node, ast.Attribute)
+        and isinstance(node.value, ast.Name)
+        and node.value.id == "np"
+    )
+
+
+def differentiate(node, name, memo=None):
+    """
+    Differentiate an expression with respect to a variable.
+
+    :param node: The tree of the expression
+    :type node: tuple
+    :param name: The name of the variable
+    :type name: str
+    :param memo: The derivatives already found, by node and variable
+    :type memo: dict, optional
+
+    :return: The tree of the derivative
+    :rtype: tuple
+    """
+    memo = {} if memo is None else memo
+    key = (node, name)
+    if key not in memo:
+        memo[key] = _differentiate(node, name, memo)
+    return memo[key]
+
+
+def _differentiate(node, name, memo):
+    kind = node[0]
+    if kind == "num":
+        return ZERO
+    if kind == "sym":
+        return ONE if node[1] == name else ZERO
+    if kind == "call":
+        func, a = node[1], node[2]
+        da = differentiate(a, name, memo)
+        if da == ZERO:
+            return ZERO
+        grad = {
+            "exp": lambda: node,
+            "log": lambda: _div(ONE, a),
+            "sin": lambda: _call("cos", a),
+            "cos": lambda: _neg(_call("sin", a)),
+            "tan": lambda: _add(ONE, _pow(node, _num(2))),
+        }[func]()
+        return _mul(grad, da)
+    if kind == "neg":
+        return _neg(differentiate(node[1], name, memo))
+
+    a, b = node[1], node[2]
+    da = differentiate(a, name, memo)
+    db = differentiate(b, name, memo)
+    if kind == "add":
+        return _add(da, db)
+    if kind == "sub":
+        return _sub(da, db)
+    if kind == "mul":
+        return _add(_mul(da, b), _mul(a, db))
+    if kind == "div":
+        return _sub(_div(da, b), _div(_mul(a, db), _pow(b, _num(2))))
+    # kind == "pow"
+    if db == ZERO:
+        return _mul(_mul(b, _pow(a, _sub(b, ONE))), da)
+    return _mul(node, _add(_mul(db, _call("log", a)), _div(_mul(b, da), a)))
+
+
+class _CodeWriter:
+    """
+    Writes the statements evaluating a set of expressions, assigning the
+    subexpressions which are used more than once to temporary variables.
+    """
+
+    def __init__(self, outputs):
+        """
+        :param outputs: The trees of the expressions to evaluate
+        :type outputs: list of tuple
+        """
+        self.uses = {}
+        for node in outputs:
+            self._count(node)
+        self.names = {}
+        self.lines = []
+
+    def _count(self, node):
+        self.uses[node] = self.uses.get(node, 0) + 1
+        # The children of a repeated node are only counted once
+        if self.uses[node] == 1:
+            for child in _children(node):
+                self._count(child)
+
+    def expression(self, node):
+        """
+        Get the code for an expression, writing the statements for its
+        repeated subexpressions first.
+
+        :param node: The tree of the expression
+        :type node: tuple
+
+        :return: The code of the expression
+        :rtype: str
+        """
+        if node in self.names:
+            return self.names[node]
+        kind = node[0]
+        if kind == "num":
+            return f"({node[1]!r})"
+        if kind == "sym":
+            return node[1]
+        if kind == "call":
+            code = f"np.{node[1]}({self.expression(node[2])})"
+        elif kind == "neg":
+            code = f"(-{self.expression(node[1])})"
+        else:
+            op = {"add": "+", "sub": "-", "mul": "*", "div": "/", "pow": "**"}
+            a, b = self.expression(node[1]), self.expression(node[2])
+            code = f"({a} {op[kind]} {b})"
+        if self.uses[node] > 1:
+            name = f"_t{len(self.names)}"
+            self.names[node] = name
+            self.lines.append(f"    {name} = {code}")
+            return name
+        return code
+
+
+def _children(node):
+    if node[0] in ("num", "sym"):
+        return ()
+    if node[0] == "call":
+        return (node[2],)
+    return node[1:]
+
+
+def generate_code(expression, param_names):
+    """
+    Generate the code for the function, Jacobian and Hessian of a model.
+
+    The code defines ``fitting_function(x, *params)``, which returns the
+    model, ``jacobian_function(x, params)``, which returns the Jacobian with
+    shape (n, m), and ``hessian_function(x, params)``, which returns the
+    Hessian with shape (m, m, n), for n x values and m parameters.
+
+    :param expression: The model as a numpy expression of x and the
+                       parameters, e.g. ``b1*np.exp(-b2*x)``
+    :type expression: str
+    :param param_names: The names of the parameters
+    :type param_names: list of str
+
+    :return: The code
+    :rtype: str
+    """
+    param_names = list(param_names)
+    if "x" in param_names:
+        raise ParsingError("The parameters can't be called x")
+    model = parse_expression(expression, ["x", *param_names])
+
+    memo = {}
+    jac = [differentiate(model, p, memo) for p in param_names]
+    hes = [
+        [differentiate(jac[i], q, memo) for q in param_names[: i + 1]]
+        for i in range(len(param_names))
+    ]
+    unpack = f"    {', '.join(param_names)}, = params"
+
+    writer = _CodeWriter([model])
+    ret = writer.expression(model)
+    code = [
+        f"def fitting_function(x, {', '.join(param_names)}):",
+        *writer.lines,
+        f"    return {ret}",
+        "",
+    ]
+
+    writer = _CodeWriter(jac)
+    cols = [writer.expression(j) for j in jac]
+    code += [
+        "def jacobian_function(x, params):",
+        unpack,
+        *writer.lines,
+        f"    return _columns(x, [{', '.join(cols)}])",
+        "",
+    ]
+
+    writer = _CodeWriter([h for row in hes for h in row])
+    rows = [[writer.expression(h) for h in row] for row in hes]
+    # The Hessian is symmetric, so only the lower triangle is found
+    full = [
+        [rows[max(i, j)][min(i, j)] for j in range(len(rows))]
+        for i in range(len(rows))
+    ]
+    code += [
+        "def hessian_function(x, params):",
+        unpack,
+        *writer.lines,
+        "    return _matrix(x, ["
+        + ", ".join(f"[{', '.join(row)}]" for row in full)
+        + "])",
+        "",
+    ]
+    return "\n".join(code)
+
+
+def _columns(x, cols):
+    """
+    Stack the columns of a Jacobian, some of which may be constant.
+    """
+    return np.column_stack([np.broadcast_to(c, np.shape(x)) for c in cols])
+
+
+def _matrix(x, rows):
+    """
+    Stack the entries of a Hessian, some of which may be constant.
+    """
+    return np.array(
+        [[np.broadcast_to(h, np.shape(x)) for h in row] for row in rows]
+    )
+
+
+def load_code(code):
+    """
+    Define the functions in generated code.
+
+    :param code: The code from generate_code
+    :type code: str
+
+    :return: The function, Jacobian and Hessian
+    :rtype: tuple(callable, callable, callable)
+    """
+    global_dict = {
+        "__builtins__": {},
+        "np": np,
+        "_columns": _columns,
+        "_matrix": _matrix,
+    }
+    local_dict = {}
+    exec(code, global_dict, local_dict)
+    return (
+        local_dict["fitting_function"],
+        local_dict["jacobian_function"],
+        local_dict["hessian_function"],
+    )
+
+
+def generate_derivatives(expression, param_names, cache_dir=""):
+    """
+    Get the function, Jacobian and Hessian of a model given as a numpy
+    expression. The generated code is cached on disk, keyed by a hash of
+    the expression and the parameter names. Cached code is only run if its
+    first line records the same key and version of the code generator.
+
+    :param expression: The model as a numpy expression of x and the
+                       parameters, e.g. ``b1*np.exp(-b2*x)``
+    :type expression: str
+    :param param_names: The names of the parameters
+    :type param_names: list of str
+    :param cache_dir: The cache directory from the options. If empty, the
+                      code is not cached.
+    :type cache_dir: str
+
+    :return: The function, Jacobian and Hessian
+    :rtype: tuple(callable, callable, callable)
+    """
+    param_names = list(param_names)
+    key = hash_key(CODEGEN_VERSION, expression, *param_names)
+    path = cache_path(cache_dir, "codegen", key, ".py")
+    header = f"# fitbenchmarking codegen {CODEGEN_VERSION} {key}\n"
+
+    if path is not None:
+        try:
+            with open(path, encoding="utf-8") as f:
+                code = f.read()
+            if code.startswith(header):
+                return load_code(code)
+            LOGGER.debug("Ignoring the cached code in %s: bad header", path)
+        except FileNotFoundError:
+            pass
+        except (OSError, SyntaxError, KeyError) as e:
+            LOGGER.debug("Ignoring the cached code in %s: %s", path, e)
+
+    code = generate_code(expression, param_names)
+    if path is not None:
+        write_atomic(path, header + code)
+    return load_code(code)
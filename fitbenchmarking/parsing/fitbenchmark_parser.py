@@ -15,11 +15,20 @@ import numpy as np
 
 from fitbenchmarking.parsing.base_parser import Parser
 from fitbenchmarking.parsing.fitting_problem import FittingProblem
+from fitbenchmarking.parsing.parse_cache import (
+    entry_path,
+    read_entry,
+    write_entry,
+)
 from fitbenchmarking.utils.exceptions import ParsingError
 from fitbenchmarking.utils.log import get_logger
 
 LOGGER = get_logger()
 
+# The extensions of the data files which are read with numpy rather than
+# as text
+BINARY_DATA_SUFFIXES = (".npy", ".npz")
+
 
 class FitbenchmarkParser(Parser):
     """
@@ -29,6 +38,11 @@ class FitbenchmarkParser(Parser):
 
     _PARAM_IGNORE_LIST = []
 
+    # Whether the data points can be kept in the parse cache. Parsers which
+    # load their data with side effects, or which don't read it from the
+    # data files, should not cache it.
+    _CACHE_DATA_POINTS = True
+
     def __init__(self, filename, options):
         super().__init__(filename, options)
 
@@ -54,7 +68,7 @@ class FitbenchmarkParser(Parser):
         self.fitting_problem.name = self._entries["name"]
         self.fitting_problem.description = self._entries["description"]
 
-        data_points = [self._get_data_points(p) for p in self._get_data_file()]
+        data_points = self._get_cached_data_points()
 
         self.fitting_problem.function = self._create_function()
         self.fitting_problem.format = self._entries["software"].lower()
@@ -238,6 +252,51 @@ class FitbenchmarkParser(Parser):
             )
             self.fitting_problem.additional_info["ties"] = ties
 
+    def _get_cached_data_points(self) -> list:
+        """
+        Get the data points from each data file, using the parse cache if
+        neither the problem definition file nor the data files have
+        changed since they were cached.
+
+        :return: The data points from each data file
+        :rtype: list[dict[str, np.ndarray]]
+        """
+        path = None
+        if self._CACHE_DATA_POINTS and self.options.cache_dir:
+            path = entry_path(
+                self._filename, type(self).__name__, self.options.cache_dir
+            )
+        if (entry := read_entry(path)) is not None:
+            meta, arrays = entry
+            LOGGER.debug("Using the cached data for %s", self._filename)
+            return [
+                {key: arrays[f"{i}.{key}"] for key in keys}
+                for i, keys in enumerate(meta["keys"])
+            ]
+
+        data_files = self._get_data_file()
+        data_points = [self._get_data_points(p) for p in data_files]
+        # Binary data files are read faster than the cache, and are memory
+        # mapped rather than copied
+        if (
+            path is not None
+            and None not in data_files
+            and not any(
+                Path(f).suffix in BINARY_DATA_SUFFIXES for f in data_files
+            )
+        ):
+            write_entry(
+                path,
+                meta={"keys": [list(points) for points in data_points]},
+                arrays={
+                    f"{i}.{key}": value
+                    for i, points in enumerate(data_points)
+                    for key, value in points.items()
+                },
+                data_files=[Path(f).resolve() for f in data_files],
+            )
+        return data_points
+
     def _get_data_file(self) -> list:
         """
         Find/create the (full) path to a data_file(s) specified in a
@@ -463,38 +522,138 @@ class FitbenchmarkParser(Parser):
         :return: data
         :rtype: dict[str, np.ndarray]
         """
+        return load_data_file(data_file_path)
+
+
+def load_data_file(data_file_path: str) -> dict:
+    """
+    Get the data points from a data file, which is either a text table or
+    a binary file (see load_binary_data).
+
+    :param data_file_path: The path to the file to load the points from
+    :type data_file_path: str
+
+    :return: data
+    :rtype: dict[str, np.ndarray]
+    """
+    if Path(data_file_path).suffix in BINARY_DATA_SUFFIXES:
+        return load_binary_data(data_file_path)
+
+    with open(data_file_path, encoding="utf-8") as f:
+        data_text = f.readlines()
+
+    first_row = _find_first_line(data_text)
+    data_lines = data_text[first_row:]
+    dim = len(data_lines[0].split())
+    cols = _get_column_data(data_text, first_row, dim)
+
+    data_points = _load_rows(data_lines, dim)
+
+    # Strip all np.nan entries
+    data_points = data_points[~np.isnan(data_points).any(axis=1)]
+
+    # Split into x, y, and e
+    data = {
+        key: data_points[:, indices]
+        for key, indices in cols.items()
+        if indices
+    }
+
+    # Flatten if the columns are 1D
+    for key in data:
+        if data[key].shape[1] == 1:
+            data[key] = data[key].ravel()
 
-        with open(data_file_path, encoding="utf-8") as f:
-            data_text = f.readlines()
+    return data
 
-        first_row = _find_first_line(data_text)
-        data_lines = data_text[first_row:]
-        dim = len(data_lines[0].split())
-        cols = _get_column_data(data_text, first_row, dim)
 
-        data_points = np.full((len(data_lines), dim), np.nan)
+def load_binary_data(data_file_path: str) -> dict:
+    """
+    Get the data points from a binary data file.
 
-        for idx, line in enumerate(data_lines):
-            # Skip any values that can't be represented
-            with suppress(ValueError):
-                data_points[idx] = [float(val) for val in line.split()]
+    A .npy file holds a 2D array with the columns x, y and optionally e. It
+    is memory mapped, so the data is read as it is used and the pages are
+    shared by all the processes that read the file.
 
-        # Strip all np.nan entries
-        data_points = data_points[~np.isnan(data_points).any(axis=1)]
+    A .npz file holds an array for each column, named as in the header of
+    a text data file, e.g. "x", "y" and "e" or "x0", "x1", "y" and "e".
 
-        # Split into x, y, and e
-        data = {
-            key: data_points[:, indices]
-            for key, indices in cols.items()
-            if indices
-        }
+    :param data_file_path: The path to the file to load the points from
+    :type data_file_path: str
 
+    :return: data
+    :rtype: dict[str, np.ndarray]
+    """
+    if Path(data_file_path).suffix == ".npy":
+        # Copy on write, as the errors may be corrected in place
+        columns = np.load(data_file_path, mmap_mode="c", allow_pickle=False)
+        if columns.ndim != 2:
+            raise ParsingError(
+                f"Expected a 2D array of columns in {data_file_path}"
+            )
+        cols = _get_column_data([], 0, columns.shape[1])
+        arrays = [columns[:, i] for i in range(columns.shape[1])]
+    else:
+        with np.load(data_file_path, allow_pickle=False) as f:
+            names = f.files
+            arrays = [f[name] for name in names]
+        cols = _get_column_data([" ".join(names)], 1, len(names))
+
+    data = {}
+    for key, indices in cols.items():
+        if len(indices) == 1:
+            data[key] = np.asarray(arrays[indices[0]], dtype=float)
+        elif indices:
+            data[key] = np.column_stack([arrays[i] for i in indices]).astype(
+                float, copy=False
+            )
         # Flatten if the columns are 1D
-        for key in data:
-            if data[key].shape[1] == 1:
-                data[key] = data[key].ravel()
+        if key in data and data[key].ndim == 2 and data[key].shape[1] == 1:
+            data[key] = data[key].ravel()
 
-        return data
+    if len({len(values) for values in data.values()}) != 1:
+        raise ParsingError(
+            f"The arrays in {data_file_path} must all have the same length"
+        )
+
+    # Strip all np.nan entries, only copying the data if there are any
+    nan_rows = np.zeros(len(next(iter(data.values()))), dtype=bool)
+    for values in data.values():
+        nan_rows |= np.isnan(values.reshape(len(values), -1)).any(axis=1)
+    if nan_rows.any():
+        data = {key: values[~nan_rows] for key, values in data.items()}
+
+    return data
+
+
+def save_binary_data(data: dict, data_file_path: str) -> None:
+    """
+    Write data points to a binary data file, which can be read by
+    load_binary_data.
+
+    :param data: The data points, as returned by load_data_file
+    :type data: dict[str, np.ndarray]
+    :param data_file_path: The path to write the data to, ending in .npy
+                           or .npz
+    :type data_file_path: str
+    """
+    data = {key: values for key, values in data.items() if values is not None}
+    suffix = Path(data_file_path).suffix
+    if suffix == ".npz":
+        np.savez(data_file_path, **data)
+    elif suffix == ".npy":
+        if any(values.ndim != 1 for values in data.values()):
+            raise ParsingError(
+                "Only data with a single x and y column can be saved as "
+                ".npy, use .npz instead"
+            )
+        columns = [data[key] for key in ["x", "y", "e"] if key in data]
+        np.save(data_file_path, np.column_stack(columns))
+    else:
+        raise ParsingError(
+            "Binary data files must end in "
+            f"{' or '.join(BINARY_DATA_SUFFIXES)}"
+        )
 
 
 def _parse_range(range_str: str) -> dict:
@@ -573,6 +732,32 @@ def _find_first_line(file_lines: list[str]) -> int:
     return data_start_index
 
 
+def _load_rows(data_lines: list[str], dim: int) -> np.ndarray:
+    """
+    Reads the rows of numbers from the data lines of a file. Rows which
+    can't be read as dim numbers are filled with np.nan.
+
+    :param data_lines: The lines of the file, from the first data line.
+    :type data_lines: A list of strings.
+    :param dim: The number of columns in the data.
+    :type dim: int
+
+    :return: The data, with a row for each line that could be read.
+    :rtype: np.ndarray
+    """
+    # This is much faster than converting the values one by one, but fails
+    # if any line can't be read
+    with suppress(ValueError):
+        return np.loadtxt(data_lines, comments=None, ndmin=2)
+
+    data_points = np.full((len(data_lines), dim), np.nan)
+    for idx, line in enumerate(data_lines):
+        # Skip any values that can't be represented
+        with suppress(ValueError):
+            data_points[idx] = [float(val) for val in line.split()]
+    return data_points
+
+
 def _get_column_data(file_lines: list[str], first_row: int, dim: int) -> dict:
     """
     Gets the data columns in the file as a dictionary of x, y and e.
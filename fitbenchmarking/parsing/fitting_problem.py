@@ -17,6 +17,7 @@ from fitbenchmarking.utils.exceptions import (
     FittingProblemError,
     IncorrectBoundsError,
 )
+from fitbenchmarking.utils.model_cache import ModelCache
 from fitbenchmarking.utils.timer import TimerWithMaxTime
 
 
@@ -120,9 +121,28 @@ class FittingProblem:
         #: Callable function for the Hessian
         self.hessian = None
 
+        #: Callable function evaluating the model for a batch of parameters
+        #: at once, called as :code:`batch_function(x, params)` where params
+        #: has shape (k, m). This is set by parsers which can vectorise the
+        #: model over the parameters.
+        self.batch_function = None
+
+        #: The sparsity structure of the Jacobian and its column groups,
+        #: as detected by the ``2-point_autosparse`` SciPy Jacobian
+        self.jacobian_sparsity = None
+
+        #: Whether the Jacobians which need the model to support other types
+        #: of numbers agree with finite differences, by Jacobian class name
+        self.jacobian_checks = {}
+
         # The timer used to check if the 'max_runtime' is exceeded.
         self.timer = TimerWithMaxTime(self.options.max_runtime)
 
+        #: Cache of the recent model evaluations, used to avoid evaluating
+        #: the model more than once at the same parameters
+        self.model_cache = ModelCache()
+        self.model_cache.enabled = self.options.model_cache
+
         #: Cache for calulating the initial value of the problem for plots
         self._ini_y = {}
 
@@ -141,7 +161,10 @@ class FittingProblem:
 
     def eval_model(self, params, **kwargs):
         """
-        Function evaluation method
+        Function evaluation method. Recent evaluations are cached, so
+        evaluating the model again at the same parameters and x values
+        does not call the function. Cached evaluations are read-only, so
+        must be copied before they are modified.
 
         :param params: parameter value(s)
         :type params: list
@@ -156,7 +179,25 @@ class FittingProblem:
 
         self.timer.check_elapsed_time()
         x = kwargs.get("x", self.data_x)
+        return self.model_cache.get(
+            params,
+            x,
+            self.function,
+            lambda: self._eval_function(params, x),
+        )
+
+    def _eval_function(self, params, x):
+        """
+        Evaluate the function of the problem, without the cache.
 
+        :param params: parameter value(s)
+        :type params: list
+        :param x: the x values to evaluate the function at
+        :type x: numpy array or list of numpy array
+
+        :return: data values evaluated from the function of the problem
+        :rtype: numpy array
+        """
         # Multifit case: x holds the x values of every dataset and params
         # holds the combined (shared./d<i>.) parameters, so split the
         # params up and evaluate the function once per dataset.
@@ -177,6 +218,46 @@ class FittingProblem:
 
         return self.function(x, *params)
 
+    def eval_model_batch(self, params, executor=None, **kwargs):
+        """
+        Evaluate the model for a batch of parameters. This uses the
+        batch_function of the problem if it has one, and otherwise
+        evaluates the function for each set of parameters in turn, or on
+        the executor if one is given.
+
+        :param params: sets of parameter values, with shape (k, m)
+        :type params: 2D numpy array
+        :param executor: A pool of threads to evaluate the function on
+        :type executor: concurrent.futures.Executor, optional
+
+        :return: data values evaluated from the function of the problem for
+                 each set of parameters, with shape (k, n)
+        :rtype: 2D numpy array
+        """
+        if self.function is None:
+            raise FittingProblemError(
+                "Cannot call function before setting function."
+            )
+
+        self.timer.check_elapsed_time()
+        x = kwargs.get("x", self.data_x)
+        params = np.atleast_2d(params)
+
+        if self.batch_function is not None and not isinstance(x, list):
+            # Copy, as the batch function may return a read-only view
+            out = np.array(self.batch_function(x, params))
+            return out.reshape(len(params), -1)
+
+        # The sets of parameters are all different, so the model cache is
+        # not used
+        if executor is None:
+            out = [self._eval_function(p, x) for p in params]
+        else:
+            out = list(
+                executor.map(lambda p: self._eval_function(p, x), params)
+            )
+        return np.stack([np.ravel(o) for o in out])
+
     @property
     def param_names(self):
         """
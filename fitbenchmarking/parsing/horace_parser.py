@@ -57,6 +57,9 @@ class HoraceParser(FitbenchmarkParser):
     Parser for a Horace problem definition file.
     """
 
+    # The data is loaded into the Matlab engine while it is read
+    _CACHE_DATA_POINTS = False
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -45,6 +45,30 @@ def nist_func_definition(function, param_names):
     return local_dict["fitting_function"]
 
 
+def nist_batch_definition(function):
+    """
+    Create a callable evaluating a NIST function for a batch of parameters.
+    NIST functions only use element-wise numpy operations, so passing each
+    parameter as a column evaluates the function for every set of
+    parameters at once.
+
+    :param function: the callable returned by nist_func_definition
+    :type function: callable
+
+    :return: callable taking x and the parameters with shape (k, m), and
+             returning the function values with shape (k, n)
+    :rtype: callable
+    """
+
+    def batch_function(x, params):
+        params = np.asarray(params)
+        out = function(x, *params.T[:, :, np.newaxis])
+        # Functions which do not depend on x are constant along each row
+        return np.broadcast_to(out, (len(params), np.size(x)))
+
+    return batch_function
+
+
 def nist_jacobian_definition(jacobian, param_names):
     """
     Processing a Jacobian plus different set of starting values as specified in
@@ -8,12 +8,21 @@ import re
 import numpy as np
 
 from fitbenchmarking.parsing.base_parser import Parser
+from fitbenchmarking.parsing.expression_codegen import generate_derivatives
 from fitbenchmarking.parsing.fitting_problem import FittingProblem
 from fitbenchmarking.parsing.nist_data_functions import (
+    format_function_scipy,
+    is_safe,
+    nist_batch_definition,
     nist_func_definition,
     nist_hessian_definition,
     nist_jacobian_definition,
 )
+from fitbenchmarking.parsing.parse_cache import (
+    entry_path,
+    read_entry,
+    write_entry,
+)
 from fitbenchmarking.utils.exceptions import (
     NoHessianError,
     NoJacobianError,
@@ -39,52 +48,154 @@ class NISTParser(Parser):
 
         fitting_problem = FittingProblem(self.options)
 
-        equation, data, starting_values, name, description = (
-            self._parse_line_by_line()
+        path = entry_path(
+            self._filename, type(self).__name__, self.options.cache_dir
         )
-        data = self._parse_data(data)
+        if (entry := read_entry(path)) is not None:
+            LOGGER.debug("Using the cached data for %s", self._filename)
+            meta, data = entry
+        else:
+            meta, data = self._read_problem()
+            write_entry(path, meta, data)
 
-        fitting_problem.data_x = data[:, 1]
-        fitting_problem.data_y = data[:, 0]
-        if len(data[0, :]) > 2:
-            fitting_problem.data_e = data[:, 2]
+        fitting_problem.data_x = data["x"]
+        fitting_problem.data_y = data["y"]
+        fitting_problem.data_e = data.get("e")
 
+        name = meta["name"]
         fitting_problem.name = name
-        fitting_problem.description = description
+        fitting_problem.description = meta["description"]
 
         # String containing a mathematical expression
-        fitting_problem.equation = self._parse_equation(equation)
+        fitting_problem.equation = meta["equation"]
 
+        starting_values = meta["starting_values"]
         fitting_problem.starting_values = starting_values
 
-        fitting_problem.function = nist_func_definition(
-            function=fitting_problem.equation,
-            param_names=starting_values[0].keys(),
-        )
-        fitting_problem.format = "nist"
+        param_names = list(starting_values[0].keys())
         try:
-            jacobian = self._parse_jacobian(name)
-            fitting_problem.jacobian = nist_jacobian_definition(
-                jacobian=jacobian, param_names=starting_values[0].keys()
+            function, gen_jacobian, gen_hessian = self._generate_derivatives(
+                fitting_problem.equation, param_names
             )
-        except NoJacobianError:
+        except ParsingError as e:
+            LOGGER.debug(
+                "Could not generate the derivatives of %s: %s", name, e
+            )
+            function = nist_func_definition(
+                function=fitting_problem.equation, param_names=param_names
+            )
+            gen_jacobian, gen_hessian = None, None
+
+        # The derivatives shipped with the problem take precedence, so the
+        # generated ones are only used for problems without them
+        jacobian = self._read_jacobian(name, param_names) or gen_jacobian
+        hessian = self._read_hessian(name, param_names) or gen_hessian
+        if jacobian is None:
             LOGGER.warning(
                 "Could not find analytic Jacobian information for %s problem",
                 name,
             )
-
-        try:
-            hessian = self._parse_hessian(name)
-            fitting_problem.hessian = nist_hessian_definition(
-                hessian=hessian, param_names=starting_values[0].keys()
-            )
-        except NoHessianError:
+        if hessian is None:
             LOGGER.warning(
                 "Could not find Hessian information for %s problem", name
             )
 
+        fitting_problem.function = function
+        fitting_problem.batch_function = nist_batch_definition(function)
+        fitting_problem.format = "nist"
+        if jacobian is not None:
+            fitting_problem.jacobian = jacobian
+        if hessian is not None:
+            fitting_problem.hessian = hessian
+
         return fitting_problem
 
+    def _read_problem(self):
+        """
+        Read the data of the problem from the file. The functions of the
+        problem are built from this, so it is all that is kept in the parse
+        cache.
+
+        :return: The metadata of the problem, with the name, description,
+                 equation and starting values, and the data arrays
+        :rtype: tuple(dict, dict[str, numpy.ndarray])
+        """
+        equation, data, starting_values, name, description = (
+            self._parse_line_by_line()
+        )
+        data = self._parse_data(data)
+
+        arrays = {"x": data[:, 1], "y": data[:, 0]}
+        if len(data[0, :]) > 2:
+            arrays["e"] = data[:, 2]
+
+        meta = {
+            "name": name,
+            "description": description,
+            "equation": self._parse_equation(equation),
+            "starting_values": starting_values,
+        }
+        return meta, arrays
+
+    def _generate_derivatives(self, equation, param_names):
+        """
+        Generate the function, Jacobian and Hessian from the equation.
+
+        :param equation: The equation, as returned by _parse_equation
+        :type equation: str
+        :param param_names: The names of the parameters
+        :type param_names: list of str
+
+        :return: The function, Jacobian and Hessian
+        :rtype: tuple(callable, callable, callable)
+        """
+        expression = format_function_scipy(equation)
+        if not is_safe(expression):
+            raise ParsingError("Error while sanitizing input")
+        return generate_derivatives(
+            expression, param_names, self.options.cache_dir
+        )
+
+    def _read_jacobian(self, name, param_names):
+        """
+        Read the Jacobian from the file shipped with the problem.
+
+        :param name: name of the NIST file
+        :type name: str
+        :param param_names: The names of the parameters
+        :type param_names: list of str
+
+        :return: The Jacobian, or None if there is no file
+        :rtype: callable or None
+        """
+        try:
+            jacobian = self._parse_jacobian(name)
+        except NoJacobianError:
+            return None
+        return nist_jacobian_definition(
+            jacobian=jacobian, param_names=param_names
+        )
+
+    def _read_hessian(self, name, param_names):
+        """
+        Read the Hessian from the file shipped with the problem.
+
+        :param name: name of the NIST file
+        :type name: str
+        :param param_names: The names of the parameters
+        :type param_names: list of str
+
+        :return: The Hessian, or None if there is no file
+        :rtype: callable or None
+        """
+        try:
+            hessian = self._parse_hessian(name)
+        except NoHessianError:
+            return None
+        return nist_hessian_definition(
+            hessian=hessian, param_names=param_names
+        )
+
     def _parse_jacobian(self, name):
         """
         Parses the Jacobian for the NIST file format
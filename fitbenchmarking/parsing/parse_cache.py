@@ -0,0 +1,132 @@
+"""
+A cache on disk of the data read by the parsers, so that problems which
+have not changed since the last run are not parsed again. Only data is
+cached (arrays and JSON metadata), and the parsers rebuild the functions of
+the problems from it.
+"""
+
+import hashlib
+import io
+import json
+
+import numpy as np
+
+from fitbenchmarking.utils.disk_cache import cache_path, hash_key, write_atomic
+from fitbenchmarking.utils.log import get_logger
+
+LOGGER = get_logger()
+
+# Changing what the parsers cache should change this, so old cache entries
+# are not used
+PARSE_CACHE_VERSION = "1"
+
+# Problems with less data than this (in bytes) are parsed faster than an
+# entry can be read, so are not cached
+MIN_CACHED_BYTES = 1 << 13
+
+# The name of the array holding the metadata of an entry
+_META = "__meta__"
+
+
+def file_digest(path):
+    """
+    Get a hash of the contents of a file.
+
+    :param path: The path to the file
+    :type path: str or pathlib.Path
+
+    :return: The hex digest of the contents
+    :rtype: str
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def entry_path(filename, parser_name, cache_dir):
+    """
+    Get the path of the cache entry for a problem definition file, keyed by
+    the parser, the version of the cache and the contents of the file.
+
+    :param filename: The path to the problem definition file
+    :type filename: str or pathlib.Path
+    :param parser_name: The name of the parser class
+    :type parser_name: str
+    :param cache_dir: The cache directory from the options. If empty,
+                      nothing is cached.
+    :type cache_dir: str
+
+    :return: The path of the entry, or None if nothing is cached
+    :rtype: str or None
+    """
+    if not cache_dir:
+        return None
+    key = hash_key(PARSE_CACHE_VERSION, parser_name, file_digest(filename))
+    return cache_path(cache_dir, "parse", key, ".npz")
+
+
+def read_entry(path):
+    """
+    Read a cache entry.
+
+    :param path: The path of the entry, from entry_path
+    :type path: str or None
+
+    :return: The metadata and the arrays of the entry, or None if there is
+             no valid entry
+    :rtype: tuple(dict, dict[str, numpy.ndarray]) or None
+    """
+    if path is None:
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as entry:
+            arrays = {k: entry[k] for k in entry.files}
+        meta = json.loads(str(arrays.pop(_META)))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError) as e:
+        LOGGER.debug("Ignoring the cached problem in %s: %s", path, e)
+        return None
+    # Check the data files have not changed since the entry was written
+    for data_file, digest in meta.get("data_files", []):
+        try:
+            if file_digest(data_file) != digest:
+                return None
+        except OSError:
+            return None
+    return meta, arrays
+
+
+def write_entry(path, meta, arrays, data_files=()):
+    """
+    Write a cache entry, unless the arrays are too small to be worth
+    caching.
+
+    :param path: The path of the entry, from entry_path
+    :type path: str or None
+    :param meta: The metadata of the entry, which must be JSON serialisable
+    :type meta: dict
+    :param arrays: The arrays of the entry
+    :type arrays: dict[str, numpy.ndarray]
+    :param data_files: The other files the entry was read from, which are
+                       checked for changes when the entry is read
+    :type data_files: list of str or pathlib.Path
+    """
+    if path is None:
+        return
+    if sum(np.asarray(a).nbytes for a in arrays.values()) < MIN_CACHED_BYTES:
+        return
+    if any(np.asarray(a).dtype.hasobject for a in arrays.values()):
+        # These could only be stored by pickling them
+        return
+    meta = dict(meta)
+    meta["data_files"] = [[str(f), file_digest(f)] for f in data_files]
+    buffer = io.BytesIO()
+    try:
+        np.savez(buffer, **arrays, **{_META: np.array(json.dumps(meta))})
+    except (TypeError, ValueError) as e:
+        LOGGER.debug("Could not cache the problem in %s: %s", path, e)
+        return
+    write_atomic(path, buffer.getvalue())
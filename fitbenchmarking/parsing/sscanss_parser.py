@@ -22,6 +22,8 @@ class SScanSSParser(FitbenchmarkParser):
     """
 
     _PARAM_IGNORE_LIST = ["robot", "module", "targets"]
+    # The data points are not read from a file
+    _CACHE_DATA_POINTS = False
 
     def parse(self) -> list[FittingProblem]:
         template = super().parse()
@@ -0,0 +1,110 @@
+"""
+Tests for reading BAL data files.
+"""
+
+import bz2
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+from parameterized import parameterized
+
+from fitbenchmarking.parsing import bal_parser, parse_cache
+from fitbenchmarking.parsing.bal_parser import read_bal_file
+from fitbenchmarking.utils.exceptions import ParsingError
+
+# 2 cameras, 3 points and 4 observations
+BAL_FILE = "\n".join(
+    [
+        "2 3 4",
+        "0 0     -1.5e+01 2.5e-01",
+        "0 2     1.0 -2.0",
+        "1 1     3.25 4.5",
+        "1 2     -5.0 6.0",
+        *[str(0.5 * i) for i in range(18)],
+        *[str(-0.25 * i) for i in range(9)],
+        "",
+    ]
+)
+
+
+class ReadBALFileTests(TestCase):
+    """
+    Tests for read_bal_file.
+    """
+
+    def setUp(self):
+        self.dir = TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+        self.file_name = Path(self.dir.name) / "problem.txt.bz2"
+        self.write(BAL_FILE)
+
+    def write(self, text):
+        with bz2.open(self.file_name, "wt") as f:
+            f.write(text)
+
+    def check(self, data):
+        np.testing.assert_array_equal(data["camera_indices"], [0, 0, 1, 1])
+        np.testing.assert_array_equal(data["point_indices"], [0, 2, 1, 2])
+        np.testing.assert_array_equal(
+            data["points_2d"], [[-15, 0.25], [1, -2], [3.25, 4.5], [-5, 6]]
+        )
+        np.testing.assert_array_equal(
+            data["camera_params"], 0.5 * np.arange(18).reshape((2, 9))
+        )
+        np.testing.assert_array_equal(
+            data["points_3d"], -0.25 * np.arange(9).reshape((3, 3))
+        )
+
+    def test_read(self):
+        """
+        Test that the arrays are read from the file.
+        """
+        self.check(read_bal_file(self.file_name))
+
+    def test_read_in_blocks(self):
+        """
+        Test that numbers split between blocks are read.
+        """
+        with patch.object(bal_parser, "_BLOCK_SIZE", 7):
+            self.check(read_bal_file(self.file_name))
+
+    def test_trailing_whitespace(self):
+        """
+        Test that whitespace at the end of the file is ignored.
+        """
+        self.write(BAL_FILE + "  \n ")
+
+        self.check(read_bal_file(self.file_name))
+
+    @parameterized.expand(
+        [
+            ("missing values", BAL_FILE.rsplit("\n", 3)[0]),
+            ("extra values", BAL_FILE + "1.0\n"),
+            ("not a number", BAL_FILE.replace("3.25", "three")),
+            ("empty", ""),
+        ]
+    )
+    def test_invalid_file(self, _, text):
+        """
+        Test that a ParsingError is raised for files which can't be read.
+        """
+        self.write(text)
+
+        with self.assertRaises(ParsingError):
+            read_bal_file(self.file_name)
+
+    def test_cached(self):
+        """
+        Test that the arrays are read from the cache, once written.
+        """
+        cache_dir = Path(self.dir.name) / "cache"
+        with patch.object(parse_cache, "MIN_CACHED_BYTES", 0):
+            read_bal_file(self.file_name, cache_dir)
+            with patch.object(bal_parser, "_read_values") as read:
+                data = read_bal_file(self.file_name, cache_dir)
+
+        read.assert_not_called()
+        self.check(data)
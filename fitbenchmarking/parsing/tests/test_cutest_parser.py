@@ -0,0 +1,206 @@
+"""
+Tests for the caches of compiled problems in the cutest parser.
+"""
+
+import os
+import sys
+from importlib import import_module
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+from pytest import test_type as TEST_TYPE
+
+from conftest import run_for_test_types
+from fitbenchmarking import parsing
+from fitbenchmarking.parsing.parser_factory import parse_problem_file
+from fitbenchmarking.utils.options import Options
+
+
+@run_for_test_types(TEST_TYPE, "all")
+class CutestParserCacheTests(TestCase):
+    """
+    Tests that problems are only compiled for new x values.
+    """
+
+    def setUp(self):
+        # pycutest is only available for the "all" tests
+        self.cutest_parser = import_module(
+            "fitbenchmarking.parsing.cutest_parser"
+        )
+        file_name = Path(__file__).parent / "cutest" / "basic.SIF"
+        self.problem = parse_problem_file(str(file_name), Options())[0]
+        self.parser = self.problem.function.__self__
+        self.params = list(self.problem.starting_values[0].values())
+
+    def evaluate(self, x):
+        self.problem.function(x, *self.params)
+        self.problem.jacobian(x, self.params)
+        self.problem.sparse_jacobian(x, self.params)
+
+    def test_base_x_not_compiled(self):
+        """
+        Test that the problem is not compiled again for the data x values.
+        """
+        with patch.object(
+            self.cutest_parser,
+            "_import_problem",
+            wraps=self.cutest_parser._import_problem,
+        ) as import_problem:
+            self.evaluate(self.problem.data_x)
+            self.evaluate(self.problem.data_x.copy())
+
+        import_problem.assert_not_called()
+
+    def test_new_x_compiled_once(self):
+        """
+        Test that the problem is compiled once for new x values, and used for
+        the function and the Jacobians.
+        """
+        x = self.problem.data_x + 0.5
+
+        with patch.object(
+            self.cutest_parser,
+            "_import_problem",
+            wraps=self.cutest_parser._import_problem,
+        ) as import_problem:
+            self.evaluate(x)
+            self.evaluate(x.copy())
+
+        import_problem.assert_called_once()
+
+    def test_file_named_by_contents(self):
+        """
+        Test that the SIF files for the same x values have the same name,
+        so pycutest can reuse the compiled problem.
+        """
+        x = self.problem.data_x + 0.5
+
+        first, _, _, _ = self.parser._setup_data(x)
+        second, _, _, _ = self.parser._setup_data(x.copy())
+        other, _, _, _ = self.parser._setup_data(np.flip(x))
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other)
+
+
+class CutestParserHelperTests(TestCase):
+    """
+    Tests for the parts of the cutest parser which don't need pycutest, so
+    they are run for all the test types.
+    """
+
+    def setUp(self):
+        self.cache_dir = TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        self.pycutest = MagicMock()
+        # Import the module with pycutest replaced, and remove it from
+        # sys.modules and the package afterwards so the real one is used by
+        # other tests
+        with (
+            patch.dict(sys.modules, {"pycutest": self.pycutest}),
+            patch.dict(os.environ, {"PYCUTEST_CACHE": self.cache_dir.name}),
+            patch.object(parsing, "cutest_parser", create=True),
+        ):
+            sys.modules.pop("fitbenchmarking.parsing.cutest_parser", None)
+            self.cutest_parser = import_module(
+                "fitbenchmarking.parsing.cutest_parser"
+            )
+
+        self.parser = self.cutest_parser.CutestParser("basic.SIF", Options())
+        self.parser.mastsif_dir = self.cache_dir
+        self.parser._setup_data = MagicMock(
+            return_value=("new.SIF", None, None, None)
+        )
+        self.parser._base_x = np.array([1.0, 2.0, 3.0])
+        self.parser._p = MagicMock()
+        self.parser._problems = {
+            self.cutest_parser._x_key(self.parser._base_x): self.parser._p
+        }
+
+    def test_x_key(self):
+        """
+        Test that the key depends on the shape and values of x only.
+        """
+        x = np.array([1.0, 2.0, 3.0, 4.0])
+        x_key = self.cutest_parser._x_key
+
+        self.assertEqual(x_key(x), x_key(x.copy()))
+        self.assertEqual(x_key(x), x_key([1, 2, 3, 4]))
+        self.assertNotEqual(x_key(x), x_key(np.flip(x)))
+        self.assertNotEqual(x_key(x), x_key(x.reshape(2, 2)))
+
+    def test_get_problem_known_x(self):
+        """
+        Test that no problem is imported for x values which have been
+        passed in before.
+        """
+        with patch.object(self.cutest_parser, "_import_problem") as import_p:
+            self.assertIs(
+                self.parser._get_problem(self.parser._base_x), self.parser._p
+            )
+            self.assertIs(
+                self.parser._get_problem(self.parser._base_x.copy()),
+                self.parser._p,
+            )
+
+        import_p.assert_not_called()
+
+    def test_get_problem_new_x(self):
+        """
+        Test that a problem is imported once for new x values.
+        """
+        x = self.parser._base_x + 0.5
+        with patch.object(self.cutest_parser, "_import_problem") as import_p:
+            first = self.parser._get_problem(x)
+            second = self.parser._get_problem(x.copy())
+
+        import_p.assert_called_once_with("new.SIF")
+        self.assertIs(first, import_p.return_value)
+        self.assertIs(second, first)
+
+    def test_import_problem_removes_lock(self):
+        """
+        Test that problems are imported while holding the lock, and that
+        the lock file is removed afterwards.
+        """
+        lock_path = os.path.join(
+            self.cache_dir.name, ".fitbenchmarking_basic.lock"
+        )
+        self.pycutest.import_problem.side_effect = lambda _: self.assertTrue(
+            os.path.exists(lock_path)
+        )
+        with patch.dict(os.environ, {"PYCUTEST_CACHE": self.cache_dir.name}):
+            self.cutest_parser._import_problem("/path/to/basic.SIF")
+
+        self.pycutest.import_problem.assert_called_once_with("basic")
+        self.assertEqual(os.listdir(self.cache_dir.name), [])
+
+    def test_import_problem_removes_lock_on_error(self):
+        """
+        Test that the lock file is removed if the problem fails to import.
+        """
+        self.pycutest.import_problem.side_effect = RuntimeError
+        with (
+            patch.dict(os.environ, {"PYCUTEST_CACHE": self.cache_dir.name}),
+            self.assertRaises(RuntimeError),
+        ):
+            self.cutest_parser._import_problem("/path/to/basic.SIF")
+
+        self.assertEqual(os.listdir(self.cache_dir.name), [])
+
+    def test_import_problem_without_fcntl(self):
+        """
+        Test that problems are imported without locking when fcntl is not
+        available, as on Windows.
+        """
+        with (
+            patch.object(self.cutest_parser, "fcntl", None),
+            patch.dict(os.environ, {"PYCUTEST_CACHE": self.cache_dir.name}),
+        ):
+            p = self.cutest_parser._import_problem("/path/to/basic.SIF")
+
+        self.pycutest.import_problem.assert_called_once_with("basic")
+        self.assertIs(p, self.pycutest.import_problem.return_value)
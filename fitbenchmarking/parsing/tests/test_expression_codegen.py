@@ -0,0 +1,321 @@
+"""
+Tests for fitbenchmarking.parsing.expression_codegen
+"""
+
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+from parameterized import parameterized
+from scipy.optimize._numdiff import approx_derivative
+
+from fitbenchmarking.parsing import expression_codegen
+from fitbenchmarking.parsing.expression_codegen import (
+    differentiate,
+    generate_code,
+    generate_derivatives,
+    parse_expression,
+)
+from fitbenchmarking.parsing.nist_parser import NISTParser
+from fitbenchmarking.utils.exceptions import (
+    NoHessianError,
+    NoJacobianError,
+    ParsingError,
+)
+from fitbenchmarking.utils.options import Options
+
+EXPRESSIONS = [
+    ("b1*np.exp(-b2*x)", [2.0, 0.5]),
+    ("b1*(1-np.exp(-b2*x))", [1.5, 0.3]),
+    ("b1 / (1+np.exp(b2-b3*x))", [3.0, 1.0, 0.7]),
+    ("(b1+b2*x+b3*x**2)/(1+b4*x)", [1.0, 0.5, 0.2, 0.1]),
+    ("b1*np.cos(b2*x) + b3*np.sin(b2*x)", [1.0, 0.4, 2.0]),
+    ("b1*np.tan(b2*x) - np.log(b3+x)", [0.5, 0.2, 2.0]),
+    ("b1*x**b2 + b3**x", [0.5, 1.3, 1.1]),
+    ("b1*(x**2+x*b2) / (x**2+x*b3+b4)", [0.2, 0.2, 0.1, 0.2]),
+    ("-b1*np.exp(-0.5*((x-b2)/b3)**2)/np.pi", [1.0, 2.0, 1.5]),
+    ("b1 + 0*b2", [1.0, 2.0]),
+]
+
+
+def param_names(params):
+    return [f"b{i + 1}" for i in range(len(params))]
+
+
+class ExpressionCodegenTests(TestCase):
+    """
+    Tests for the generated code.
+    """
+
+    def setUp(self):
+        self.x = np.linspace(0.5, 3.0, 7)
+
+    @parameterized.expand(EXPRESSIONS)
+    def test_function(self, expression, params):
+        """
+        Test that the generated function matches the expression.
+        """
+        names = param_names(params)
+        func, _, _ = generate_derivatives(expression, names)
+        expected = eval(
+            expression, {"np": np, "x": self.x, **dict(zip(names, params))}
+        )
+
+        np.testing.assert_allclose(
+            np.broadcast_to(func(self.x, *params), self.x.shape),
+            expected,
+            rtol=1e-15,
+        )
+
+    @parameterized.expand(EXPRESSIONS)
+    def test_jacobian(self, expression, params):
+        """
+        Test that the generated Jacobian matches finite differences.
+        """
+        func, jac, _ = generate_derivatives(expression, param_names(params))
+        expected = approx_derivative(
+            lambda p: np.broadcast_to(func(self.x, *p), self.x.shape),
+            params,
+            method="3-point",
+        )
+
+        actual = jac(self.x, params)
+
+        self.assertEqual(actual.shape, (len(self.x), len(params)))
+        np.testing.assert_allclose(actual, expected, rtol=1e-6, atol=1e-8)
+
+    @parameterized.expand(EXPRESSIONS)
+    def test_hessian(self, expression, params):
+        """
+        Test that the generated Hessian matches finite differences of the
+        generated Jacobian.
+        """
+        _, jac, hes = generate_derivatives(expression, param_names(params))
+        expected = approx_derivative(
+            lambda p: jac(self.x, p).T.ravel(), params, method="3-point"
+        ).reshape(len(params), len(self.x), len(params))
+
+        actual = hes(self.x, params)
+
+        self.assertEqual(actual.shape, (len(params), len(params), len(self.x)))
+        np.testing.assert_allclose(
+            actual, expected.transpose(0, 2, 1), rtol=1e-6, atol=1e-8
+        )
+
+    def test_repeated_subexpressions(self):
+        """
+        Test that repeated subexpressions are evaluated once.
+        """
+        code = generate_code(
+            "b1*np.exp(-b2*x) + b3*np.exp(-b2*x)", ["b1", "b2", "b3"]
+        )
+
+        function_code = code.split("def jacobian_function")[0]
+        self.assertEqual(function_code.count("np.exp"), 1)
+        self.assertIn("_t0 = ", function_code)
+
+    def test_derivative_rules(self):
+        """
+        Test that the derivative is simplified.
+        """
+        tree = parse_expression("b1*x + b2", ["x", "b1", "b2"])
+
+        self.assertEqual(differentiate(tree, "b1"), ("sym", "x"))
+        self.assertEqual(differentiate(tree, "b2"), ("num", 1))
+        self.assertEqual(differentiate(tree, "b3"), ("num", 0))
+
+    @parameterized.expand(
+        [
+            "b1*np.arctan(x)",
+            "b1*abs(x)",
+            "b1*y",
+            "b1[0]*x",
+            "b1*x if b1 else x",
+            "b1*x)",
+            "b1*np.exp(x, out=x)",
+        ]
+    )
+    def test_unsupported_expression(self, expression):
+        """
+        Test that expressions which can't be differentiated raise an error.
+        """
+        with self.assertRaises(ParsingError):
+            generate_code(expression, ["b1"])
+
+    def test_parameter_called_x(self):
+        """
+        Test that a parameter can't be called x.
+        """
+        with self.assertRaises(ParsingError):
+            generate_code("x*x", ["x"])
+
+
+class ExpressionCodegenCacheTests(TestCase):
+    """
+    Tests for caching the generated code.
+    """
+
+    def setUp(self):
+        self.dir = TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+
+    def cached_files(self):
+        path = Path(self.dir.name) / "codegen"
+        return list(path.iterdir()) if path.exists() else []
+
+    def test_code_is_cached(self):
+        """
+        Test that the code is written to the cache and read back.
+        """
+        generate_derivatives("b1*np.exp(-b2*x)", ["b1", "b2"], self.dir.name)
+        self.assertEqual(len(self.cached_files()), 1)
+
+        with patch.object(
+            expression_codegen, "generate_code", side_effect=AssertionError
+        ):
+            func, _, _ = generate_derivatives(
+                "b1*np.exp(-b2*x)", ["b1", "b2"], self.dir.name
+            )
+
+        self.assertEqual(func(0.0, 2.0, 1.0), 2.0)
+
+    def test_key_depends_on_names(self):
+        """
+        Test that the same expression with other parameter names has its
+        own entry.
+        """
+        generate_derivatives("b1*x", ["b1"], self.dir.name)
+        generate_derivatives("b1*x", ["b1", "b2"], self.dir.name)
+
+        self.assertEqual(len(self.cached_files()), 2)
+
+    def test_broken_entry_is_regenerated(self):
+        """
+        Test that a broken cache entry is ignored.
+        """
+        generate_derivatives("b1*x", ["b1"], self.dir.name)
+        path = self.cached_files()[0]
+        path.write_text("def fitting_function(x, b1:", encoding="utf-8")
+
+        func, _, _ = generate_derivatives("b1*x", ["b1"], self.dir.name)
+
+        self.assertEqual(func(2.0, 3.0), 6.0)
+
+    def test_entry_without_header_is_not_run(self):
+        """
+        Test that cached code is not run unless it was written for the same
+        key and version of the code generator.
+        """
+        generate_derivatives("b1*x", ["b1"], self.dir.name)
+        path = self.cached_files()[0]
+        code = path.read_text(encoding="utf-8")
+        path.write_text(
+            code.split("\n", 1)[1].replace("b1 * x", "b1 * x * 2"),
+            encoding="utf-8",
+        )
+
+        func, _, _ = generate_derivatives("b1*x", ["b1"], self.dir.name)
+
+        self.assertEqual(func(2.0, 3.0), 6.0)
+
+    def test_no_cache_dir(self):
+        """
+        Test that nothing is written when the cache is disabled.
+        """
+        with patch.object(expression_codegen, "write_atomic") as write:
+            generate_derivatives("b1*x", ["b1"], "")
+
+        write.assert_not_called()
+
+
+class NISTParserCodegenTests(TestCase):
+    """
+    Tests for the derivatives of NIST problems.
+    """
+
+    def setUp(self):
+        self.dir = TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+        self.options = Options(additional_options={"cache_dir": self.dir.name})
+        self.filename = os.path.join(
+            os.path.dirname(__file__), "nist", "basic.dat"
+        )
+
+    def parse(self):
+        with NISTParser(self.filename, self.options) as parser:
+            return parser.parse()
+
+    def test_files_are_used(self):
+        """
+        Test that the Jacobian and Hessian come from the files shipped with
+        the problem if there are any.
+        """
+        problem = self.parse()
+        x = np.array([0.5, 1.0])
+        params = [2.0, 0.5]
+        e = np.exp(-0.5 * x)
+
+        np.testing.assert_allclose(
+            problem.jacobian(x, params),
+            np.column_stack([1 - e, 2 * 0.5 * e]),
+        )
+        np.testing.assert_allclose(
+            problem.hessian(x, params),
+            [[np.zeros(2), 0.5 * e], [0.5 * e, e * (2 - 2 * 0.5 * x)]],
+        )
+
+    def test_derivatives_are_generated(self):
+        """
+        Test that the Jacobian and Hessian come from the equation if there
+        are no files shipped with the problem.
+        """
+        with (
+            patch.object(
+                NISTParser, "_parse_jacobian", side_effect=NoJacobianError
+            ),
+            patch.object(
+                NISTParser, "_parse_hessian", side_effect=NoHessianError
+            ),
+        ):
+            problem = self.parse()
+        x = np.array([0.5, 1.0])
+        params = [2.0, 0.5]
+        e = np.exp(-0.5 * x)
+
+        np.testing.assert_allclose(
+            problem.jacobian(x, params), np.column_stack([1 - e, 2 * x * e])
+        )
+        np.testing.assert_allclose(
+            problem.hessian(x, params),
+            [[np.zeros(2), x * e], [x * e, -2 * x**2 * e]],
+        )
+
+    def test_fallback_to_files(self):
+        """
+        Test that the files shipped with the problem are used if the
+        derivatives can't be generated.
+        """
+        with patch.object(
+            NISTParser,
+            "_generate_derivatives",
+            side_effect=ParsingError("unsupported"),
+        ):
+            problem = self.parse()
+        x = np.array([0.5, 1.0])
+        params = [2.0, 0.5]
+        e = np.exp(-0.5 * x)
+
+        np.testing.assert_allclose(
+            problem.jacobian(x, params),
+            np.column_stack([1 - e, 2 * 0.5 * e]),
+        )
+        np.testing.assert_allclose(
+            problem.hessian(x, params),
+            [[np.zeros(2), 0.5 * e], [0.5 * e, e * (2 - 2 * 0.5 * x)]],
+        )
+        np.testing.assert_allclose(
+            problem.eval_model(params, x=x), 2 * (1 - e)
+        )
@@ -4,6 +4,8 @@ This file contains tests for the fitbenchmark parser.
 
 import sys
 from pathlib import Path
+from shutil import copytree
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 from unittest.mock import MagicMock, mock_open, patch
 
@@ -14,9 +16,13 @@ from fitbenchmarking.parsing.fitbenchmark_parser import (
     FitbenchmarkParser,
     _find_first_line,
     _get_column_data,
+    _load_rows,
     _parse_range,
+    load_data_file,
+    save_binary_data,
 )
 from fitbenchmarking.parsing.fitting_problem import FittingProblem
+from fitbenchmarking.parsing.parser_factory import parse_problem_file
 from fitbenchmarking.utils import exceptions
 from fitbenchmarking.utils.options import Options
 
@@ -556,6 +562,25 @@ class TestFitbenchmarkParser(TestCase):
         with self.assertRaises(exceptions.ParsingError):
             _ = _get_column_data(file_lines, first_line, dim)
 
+    @parameterized.expand(
+        [
+            (["1 2 3\n", "4 5  6\n"], [[1, 2, 3], [4, 5, 6]]),
+            (["1 2 3\n", "\n", "4 5 6\n"], [[1, 2, 3], [4, 5, 6]]),
+            (["1 2 3\r\n", " 4e1 -5 .6\r\n"], [[1, 2, 3], [40, -5, 0.6]]),
+            (["1 2 3\n", "4 B C\n"], [[1, 2, 3], [np.nan] * 3]),
+            (["1 2 3\n", "4 5\n"], [[1, 2, 3], [np.nan] * 3]),
+            (["1 2 3\n", "4 5 6 # a\n"], [[1, 2, 3], [np.nan] * 3]),
+            (["1 2 3\n", "1_0 2 3\n"], [[1, 2, 3], [10, 2, 3]]),
+        ]
+    )
+    def test_load_rows(self, data_lines, expected):
+        """
+        Verifies the output of _load_rows() function.
+        """
+        np.testing.assert_array_equal(
+            _load_rows(data_lines, 3), np.array(expected, dtype=float)
+        )
+
     @parameterized.expand(
         [
             (
@@ -828,6 +853,7 @@ class TestFitbenchmarkParser(TestCase):
         mock_create_function.return_value = ["mock_function"]
 
         self.parser.options = Options()
+        self.parser.options.cache_dir = ""
         self.parser._PARAM_IGNORE_LIST = ["name"]
         result = self.parser.parse()
 
@@ -858,3 +884,167 @@ class TestFitbenchmarkParser(TestCase):
         assert not result.sparse_jacobian
         assert result.start_x == [None, None]
         assert result.value_ranges == [(1.0, 10.0), (1.0, 5.0)]
+
+
+class TestBinaryDataFiles(TestCase):
+    """
+    Tests reading and writing binary data files.
+    """
+
+    def setUp(self):
+        """
+        Set up a directory for the data files.
+        """
+        self.dir = TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+        self.path = Path(self.dir.name)
+        self.x = np.linspace(0, 1, 5)
+        self.y = self.x**2
+        self.e = np.full(5, 0.1)
+
+    def test_npy_is_memory_mapped(self):
+        """
+        Verifies .npy files are memory mapped, and their columns are split
+        without copying.
+        """
+        np.save(self.path / "data.npy", np.column_stack([self.x, self.y]))
+
+        result = load_data_file(self.path / "data.npy")
+
+        assert set(result) == {"x", "y"}
+        np.testing.assert_array_equal(result["x"], self.x)
+        np.testing.assert_array_equal(result["y"], self.y)
+        assert isinstance(result["x"].base, np.memmap)
+        assert np.may_share_memory(result["x"], result["y"])
+
+    def test_npy_is_not_changed(self):
+        """
+        Verifies changing the data doesn't change the .npy file.
+        """
+        columns = np.column_stack([self.x, self.y, self.e])
+        np.save(self.path / "data.npy", columns)
+
+        result = load_data_file(self.path / "data.npy")
+        result["e"][:] = 0
+
+        np.testing.assert_array_equal(np.load(self.path / "data.npy"), columns)
+
+    @parameterized.expand(
+        [
+            ({"x": "x", "y": "y", "e": "e"},),
+            ({"x": "x0", "y": "Y", "e": "E0"},),
+        ]
+    )
+    def test_npz(self, names):
+        """
+        Verifies .npz files are read with the array names as headers.
+        """
+        np.savez(
+            self.path / "data.npz",
+            **{names["x"]: self.x, names["y"]: self.y, names["e"]: self.e},
+        )
+
+        result = load_data_file(self.path / "data.npz")
+
+        for key, expected in [("x", self.x), ("y", self.y), ("e", self.e)]:
+            np.testing.assert_array_equal(result[key], expected)
+
+    def test_npz_multiple_columns(self):
+        """
+        Verifies numbered columns in .npz files are stacked.
+        """
+        np.savez(self.path / "data.npz", x0=self.x, x1=self.e, y=self.y)
+
+        result = load_data_file(self.path / "data.npz")
+
+        np.testing.assert_array_equal(
+            result["x"], np.column_stack([self.x, self.e])
+        )
+        np.testing.assert_array_equal(result["y"], self.y)
+
+    def test_nan_rows_are_stripped(self):
+        """
+        Verifies rows containing np.nan are removed.
+        """
+        self.y[1] = np.nan
+        np.save(self.path / "data.npy", np.column_stack([self.x, self.y]))
+
+        result = load_data_file(self.path / "data.npy")
+
+        np.testing.assert_array_equal(result["x"], self.x[[0, 2, 3, 4]])
+        np.testing.assert_array_equal(result["y"], self.y[[0, 2, 3, 4]])
+
+    @parameterized.expand(
+        [
+            ("data.npz", {"x": np.ones(3), "err": np.ones(3)}),
+            ("data.npz", {"x": np.ones(3), "y": np.ones(4)}),
+            ("data.npy", np.ones(3)),
+            ("data.npy", np.ones((3, 4))),
+        ]
+    )
+    def test_invalid_files(self, filename, data):
+        """
+        Verifies a ParsingError is raised for files which don't hold data
+        points.
+        """
+        if isinstance(data, dict):
+            np.savez(self.path / filename, **data)
+        else:
+            np.save(self.path / filename, data)
+
+        with self.assertRaises(exceptions.ParsingError):
+            load_data_file(self.path / filename)
+
+    @parameterized.expand(["data.npy", "data.npz"])
+    def test_save_binary_data(self, filename):
+        """
+        Verifies saved data is read back.
+        """
+        data = {"x": self.x, "y": self.y, "e": None}
+
+        save_binary_data(data, self.path / filename)
+        result = load_data_file(self.path / filename)
+
+        assert set(result) == {"x", "y"}
+        np.testing.assert_array_equal(result["x"], self.x)
+        np.testing.assert_array_equal(result["y"], self.y)
+
+    def test_save_npy_multiple_columns(self):
+        """
+        Verifies a ParsingError is raised when saving multiple x columns as
+        .npy.
+        """
+        data = {"x": np.column_stack([self.x, self.e]), "y": self.y}
+
+        with self.assertRaises(exceptions.ParsingError):
+            save_binary_data(data, self.path / "data.npy")
+
+    def test_parse_problem_with_npz(self):
+        """
+        Verifies a problem reading a .npz file matches the text version.
+        """
+        ivp_dir = Path(__file__).parent / "ivp"
+        problem_dir = self.path / "ivp"
+        copytree(ivp_dir, problem_dir)
+        text_file = problem_dir / "data_files" / "simplified_anac.txt"
+        save_binary_data(
+            load_data_file(text_file), text_file.with_suffix(".npz")
+        )
+        definition = problem_dir / "simplified_anac.txt"
+        definition.write_text(
+            definition.read_text(encoding="utf-8").replace(
+                "input_file = 'simplified_anac.txt'",
+                "input_file = 'simplified_anac.npz'",
+            ),
+            encoding="utf-8",
+        )
+        options = Options(additional_options={"cache_dir": ""})
+
+        expected = parse_problem_file(ivp_dir / "simplified_anac.txt", options)
+        result = parse_problem_file(definition, options)
+
+        for attr in ["data_x", "data_y", "data_e"]:
+            np.testing.assert_array_equal(
+                getattr(result[0], attr), getattr(expected[0], attr)
+            )
+        assert result[0].starting_values == expected[0].starting_values
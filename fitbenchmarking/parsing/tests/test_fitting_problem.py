@@ -2,8 +2,9 @@
 Test file to test the fitting_problem file.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import numpy as np
 from parameterized import parameterized
@@ -151,6 +152,81 @@ class TestFittingProblem(TestCase):
         eval_result = fitting_problem.eval_model(x=[1, 8, 11], params=[5])
         self.assertTrue(all(eval_result == np.array([6, 13, 16])))
 
+    def test_eval_model_cached(self):
+        """
+        Test that eval_model only calls the function once at the same
+        parameters
+        """
+        fitting_problem = FittingProblem(self.options)
+        fitting_problem.function = MagicMock(return_value=np.array([1.0]))
+        fitting_problem.data_x = np.array([1.0])
+
+        fitting_problem.eval_model(params=[5.0])
+        fitting_problem.eval_model(params=np.array([5.0]))
+        fitting_problem.eval_model(params=[6.0])
+
+        self.assertEqual(fitting_problem.function.call_count, 2)
+        self.assertEqual(fitting_problem.model_cache.hits, 1)
+
+    def test_eval_model_cache_disabled(self):
+        """
+        Test that eval_model calls the function every time when the
+        model_cache option is off
+        """
+        self.options.model_cache = False
+        fitting_problem = FittingProblem(self.options)
+        fitting_problem.function = MagicMock(return_value=np.array([1.0]))
+        fitting_problem.data_x = np.array([1.0])
+
+        fitting_problem.eval_model(params=[5])
+        fitting_problem.eval_model(params=[5])
+
+        self.assertEqual(fitting_problem.function.call_count, 2)
+
+    @parameterized.expand([(None,), (2,)])
+    def test_eval_model_batch(self, num_threads):
+        """
+        Test that eval_model_batch evaluates the function for each set of
+        parameters, serially and on threads
+        """
+        fitting_problem = FittingProblem(self.options)
+        fitting_problem.function = lambda x, a, b: a * x + b
+        fitting_problem.data_x = np.array([1.0, 2.0, 3.0])
+        params = np.array([[1.0, 0.0], [2.0, 1.0], [0.5, -1.0]])
+
+        if num_threads is None:
+            result = fitting_problem.eval_model_batch(params)
+        else:
+            with ThreadPoolExecutor(max_workers=num_threads) as executor:
+                result = fitting_problem.eval_model_batch(
+                    params, executor=executor
+                )
+
+        expected = [fitting_problem.eval_model(p) for p in params]
+        np.testing.assert_array_equal(result, expected)
+
+    def test_eval_model_batch_function(self):
+        """
+        Test that eval_model_batch uses the batch function of the problem
+        """
+        fitting_problem = FittingProblem(self.options)
+        fitting_problem.function = MagicMock()
+        fitting_problem.batch_function = lambda x, p: p[:, :1] * x
+        fitting_problem.data_x = np.array([1.0, 2.0])
+
+        result = fitting_problem.eval_model_batch(np.array([[1.0], [3.0]]))
+
+        np.testing.assert_array_equal(result, [[1.0, 2.0], [3.0, 6.0]])
+        fitting_problem.function.assert_not_called()
+
+    def test_eval_model_batch_raise_error(self):
+        """
+        Test that eval_model_batch raises an error if there is no function
+        """
+        fitting_problem = FittingProblem(self.options)
+        with self.assertRaises(exceptions.FittingProblemError):
+            fitting_problem.eval_model_batch(np.array([[1.0]]))
+
     def test_get_function_params(self):
         """
         Tests that the function params is formatted correctly
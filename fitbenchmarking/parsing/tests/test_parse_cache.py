@@ -0,0 +1,244 @@
+"""
+Tests for fitbenchmarking.parsing.parse_cache
+"""
+
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+
+from fitbenchmarking.parsing import parse_cache
+from fitbenchmarking.parsing.fitbenchmark_parser import FitbenchmarkParser
+from fitbenchmarking.parsing.nist_parser import NISTParser
+from fitbenchmarking.parsing.parse_cache import (
+    entry_path,
+    read_entry,
+    write_entry,
+)
+from fitbenchmarking.utils.options import Options
+
+
+class ParseCacheTests(TestCase):
+    """
+    Tests for reading and writing cache entries.
+    """
+
+    def setUp(self):
+        self.dir = TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+        self.data_file = Path(self.dir.name) / "data.txt"
+        self.data_file.write_text("1 2\n", encoding="utf-8")
+        self.path = entry_path(self.data_file, "Parser", self.dir.name)
+        self.arrays = {"x": np.arange(2000.0), "y": np.ones(2000)}
+
+    def test_round_trip(self):
+        """
+        Test that an entry is read back.
+        """
+        write_entry(self.path, {"name": "a"}, self.arrays, [self.data_file])
+
+        meta, arrays = read_entry(self.path)
+
+        self.assertEqual(meta["name"], "a")
+        self.assertEqual(set(arrays), {"x", "y"})
+        np.testing.assert_array_equal(arrays["x"], self.arrays["x"])
+
+    def test_changed_data_file(self):
+        """
+        Test that an entry is not used once its data files change.
+        """
+        write_entry(self.path, {}, self.arrays, [self.data_file])
+        self.data_file.write_text("1 3\n", encoding="utf-8")
+
+        self.assertIsNone(read_entry(self.path))
+
+    def test_missing_data_file(self):
+        """
+        Test that an entry is not used once its data files are removed.
+        """
+        write_entry(self.path, {}, self.arrays, [self.data_file])
+        os.remove(self.data_file)
+
+        self.assertIsNone(read_entry(self.path))
+
+    def test_key_depends_on_contents(self):
+        """
+        Test that the entry changes with the file and the parser.
+        """
+        other = entry_path(self.data_file, "OtherParser", self.dir.name)
+        self.data_file.write_text("1 3\n", encoding="utf-8")
+        changed = entry_path(self.data_file, "Parser", self.dir.name)
+
+        self.assertEqual(len({self.path, other, changed}), 3)
+
+    def test_disabled(self):
+        """
+        Test that nothing is cached without a cache directory.
+        """
+        self.assertIsNone(entry_path(self.data_file, "Parser", ""))
+        self.assertIsNone(read_entry(None))
+        write_entry(None, {}, self.arrays)
+
+    def test_small_entries_not_written(self):
+        """
+        Test that problems with little data are not cached.
+        """
+        write_entry(self.path, {}, {"x": np.ones(3)})
+
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_object_arrays_not_written(self):
+        """
+        Test that arrays which would need pickling are not cached.
+        """
+        arrays = {"x": np.array([None] * 2000, dtype=object)}
+
+        write_entry(self.path, {}, arrays)
+
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_broken_entry(self):
+        """
+        Test that a broken entry is ignored.
+        """
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "wb") as f:
+            f.write(b"not an npz file")
+
+        self.assertIsNone(read_entry(self.path))
+
+
+class FitbenchmarkParserCacheTests(TestCase):
+    """
+    Tests for caching the data points of fitbenchmark problems.
+    """
+
+    def setUp(self):
+        self.dir = TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+        root = Path(self.dir.name)
+        self.problem_file = root / "problem.txt"
+        self.problem_file.write_text(
+            "software = 'test'\ninput_file = 'data.txt'\n", encoding="utf-8"
+        )
+        (root / "data_files").mkdir()
+        self.data_file = root / "data_files" / "data.txt"
+        rng = np.random.default_rng(0)
+        np.savetxt(self.data_file, rng.random((500, 3)), header="X Y E")
+        self.options = Options(
+            additional_options={"cache_dir": str(root / "cache")}
+        )
+
+    def get_data_points(self):
+        with FitbenchmarkParser(self.problem_file, self.options) as parser:
+            parser._entries = parser._get_data_problem_entries()
+            return parser._get_cached_data_points()
+
+    def test_data_points_cached(self):
+        """
+        Test that the data files are only found and read once.
+        """
+        expected = self.get_data_points()
+
+        with (
+            patch.object(FitbenchmarkParser, "_get_data_file") as find,
+            patch.object(FitbenchmarkParser, "_get_data_points") as read,
+        ):
+            actual = self.get_data_points()
+
+        find.assert_not_called()
+        read.assert_not_called()
+        self.assertEqual(len(actual), 1)
+        self.assertEqual(set(actual[0]), {"x", "y", "e"})
+        for key, value in expected[0].items():
+            np.testing.assert_array_equal(actual[0][key], value)
+
+    def test_changed_data_file(self):
+        """
+        Test that the data is read again when the data file changes.
+        """
+        self.get_data_points()
+        np.savetxt(self.data_file, np.zeros((500, 2)))
+
+        actual = self.get_data_points()
+
+        self.assertEqual(set(actual[0]), {"x", "y"})
+        np.testing.assert_array_equal(actual[0]["x"], np.zeros(500))
+
+    def test_binary_data_not_cached(self):
+        """
+        Test that binary data files are not cached.
+        """
+        rng = np.random.default_rng(0)
+        np.save(self.data_file.with_suffix(".npy"), rng.random((500, 3)))
+        self.problem_file.write_text(
+            "software = 'test'\ninput_file = 'data.npy'\n", encoding="utf-8"
+        )
+
+        self.get_data_points()
+
+        self.assertFalse((Path(self.options.cache_dir) / "parse").exists())
+
+    def test_not_cached_by_default(self):
+        """
+        Test that the data is read each time with the default options,
+        which have no cache directory.
+        """
+        self.options = Options()
+        self.get_data_points()
+
+        with patch.object(
+            FitbenchmarkParser, "_get_data_points", return_value={}
+        ) as read:
+            self.get_data_points()
+
+        read.assert_called_once()
+
+
+class NISTParserCacheTests(TestCase):
+    """
+    Tests for caching NIST problems.
+    """
+
+    def setUp(self):
+        self.dir = TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+        self.options = Options(additional_options={"cache_dir": self.dir.name})
+        self.filename = os.path.join(
+            os.path.dirname(__file__), "nist", "basic.dat"
+        )
+        patcher = patch.object(parse_cache, "MIN_CACHED_BYTES", 0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def parse(self):
+        with NISTParser(self.filename, self.options) as parser:
+            return parser.parse()
+
+    def test_problem_cached(self):
+        """
+        Test that a cached problem is not parsed again, and matches the
+        parsed problem.
+        """
+        expected = self.parse()
+
+        with patch.object(NISTParser, "_parse_line_by_line") as parse:
+            actual = self.parse()
+
+        parse.assert_not_called()
+        for attr in ["name", "description", "equation", "starting_values"]:
+            self.assertEqual(getattr(actual, attr), getattr(expected, attr))
+        np.testing.assert_array_equal(actual.data_x, expected.data_x)
+        np.testing.assert_array_equal(actual.data_y, expected.data_y)
+        self.assertIsNone(actual.data_e)
+        params = [1.0, 2.0]
+        np.testing.assert_array_equal(
+            actual.eval_model(params), expected.eval_model(params)
+        )
+        np.testing.assert_array_equal(
+            actual.jacobian(actual.data_x, params),
+            expected.jacobian(expected.data_x, params),
+        )
@@ -340,16 +340,20 @@ class TestParsers:
                     r[1] = np.ones(r[1]["n_params"]) * r[1]["param_value"]
                     r[2] = np.ones(r[2]["n_data_points"]) * r[2]["func_val"]
 
-                if r[0] == "NA":
-                    actual = fitting_problem.eval_model(params=r[1])
-                else:
-                    x = np.array(r[0])
-                    actual = fitting_problem.eval_model(x=x, params=r[1])
+                kwargs = {} if r[0] == "NA" else {"x": np.array(r[0])}
+                actual = fitting_problem.eval_model(params=r[1], **kwargs)
 
                 assert np.isclose(actual, r[2]).all(), (
                     f"Expected: {r[2]}\nReceived: {actual}"
                 )
 
+                batch = fitting_problem.eval_model_batch(
+                    params=np.array([r[1], r[1]], dtype=float), **kwargs
+                )
+                assert np.isclose(batch, np.ravel(r[2])).all(), (
+                    f"Expected: {r[2]}\nReceived: {batch}"
+                )
+
     def test_jacobian_evaluation(self, file_format, evaluations_file):
         """
         Tests that the Jacobian evaluation is consistent with what would be
@@ -57,6 +57,7 @@ class Table:
         "median",
         "harmonic",
         "trim",
+        "cpu",
     ]
     color_to_class = {
         "rgb(0,0,0)": 'class="dark"',
@@ -116,6 +116,7 @@ def create_prob_group(result, support_pages_dir, options):
                 median_runtime=f"{result.median_runtime:.4g}",
                 harmonic_runtime=f"{result.harmonic_runtime:.4g}",
                 trim_runtime=f"{result.trim_runtime:.4g}",
+                cpu_runtime=f"{result.cpu_runtime:.4g}",
                 energy=energy_disp,
                 is_best_fit=result.is_best_fit,
                 min_params=result.fin_function_params,
@@ -0,0 +1,188 @@
+"""
+Overhead table
+"""
+
+import matplotlib.colors as clrs
+import numpy as np
+
+from fitbenchmarking.results_processing.base_table import (
+    CONTRAST_RATIO_AAA,
+    Table,
+    background_to_text,
+)
+
+
+class OverheadTable(Table):
+    """
+
+    The overhead results show the percentage of the runtime of a fit that
+    is spent evaluating the model, Jacobian, Hessian and cost function,
+    together with the number of model evaluations per run of the fit.
+    The output looks like ``{percentage} ({model evaluations})``.
+    A high percentage means the runtime is dominated by an expensive
+    model, and a low percentage that it is dominated by the minimizer.
+    Cells are shaded from no time to all of the time spent in evaluations.
+
+    The tooltip for each result shows the number of each type of
+    evaluation per run of the fit, and the time spent in them.
+    Evaluations are only counted while the fit is being timed, and only
+    when this table is selected, as counting them adds a small cost to
+    each evaluation.
+
+    """
+
+    name = "overhead"
+    cbar_title = "Cell Shading: Share of Runtime Spent in Evaluations"
+
+    def __init__(
+        self,
+        results,
+        best_results,
+        options,
+        group_dir,
+        pp_locations,
+        table_name,
+    ):
+        """
+        Initialise the overhead table which shows how much of the runtime
+        is spent evaluating the problem.
+
+        :param results: Results grouped by row and category (for colouring)
+        :type results:
+            dict[str, dict[str, list[utils.fitbm_result.FittingResult]]]
+        :param best_results: The best results from each row/category
+        :type best_results:
+            dict[str, dict[str, utils.fitbm_result.FittingResult]],
+        :param options: Options used in fitting
+        :type options: utils.options.Options
+        :param group_dir: path to the directory where group results should be
+                          stored
+        :type group_dir: str
+        :param pp_locations: the locations of the performance profiles
+        :type pp_locations: dict[str,str]
+        :param table_name: Name of the table
+        :type table_name: str
+        """
+        super().__init__(
+            results, best_results, options, group_dir, pp_locations, table_name
+        )
+        self.pps = ["runtime"]
+
+        self.cbar_left_label = "0%"
+        self.cbar_right_label = "100%"
+
+    def get_value(self, result):
+        """
+        Gets the main value to be reported in the tables for a given result
+
+        Note that the first value (share of the runtime) will be used in the
+        default colour handling.
+
+        :param result: The result to generate the values for.
+        :type result: FittingResult
+
+        :return: The share of the mean runtime spent in evaluations and the
+                 number of model evaluations per run of the fit
+        :rtype: tuple(float, float)
+        """
+        if np.isinf(result.runtime):
+            return np.inf, np.inf
+        if "total" not in result.eval_times:
+            return None, None
+
+        share = result.eval_times["total"] / result.mean_runtime
+        model_evals = result.eval_counts.get("model", 0)
+        return share, model_evals
+
+    def display_str(self, value):
+        """
+        Combine the share of the runtime spent in evaluations with the
+        number of model evaluations.
+
+        :param value: The share of the runtime and number of model
+                      evaluations
+        :type value: tuple(float, float)
+
+        :return: string representation of the value for display in the table.
+        :rtype: str
+        """
+        share, model_evals = value
+        if share is None:
+            return "N/A"
+        if np.isinf(share):
+            return "inf"
+        template = self.output_string_type["abs"]
+        return f"{share:.1%} ({template.format(model_evals)})"
+
+    def get_hover_table(self):
+        """
+        Create a dict with the tooltip for each cell from self.sorted_results.
+        The tooltips include the number of each type of evaluation and the
+        time spent in them.
+
+        :return: The dictionary of strings for the table
+        :rtype: dict[list[str]]
+        """
+        str_dict = {}
+        for k, results in self.sorted_results.items():
+            str_dict[k] = [
+                result.hover_text(style="css", include_evals=True)
+                for result in results
+            ]
+        return str_dict.values()
+
+    @staticmethod
+    def vals_to_colour(vals, flags, cmap, cmap_range, log_ulim):
+        """
+        Converts an array of values to a list of hexadecimal colour strings
+        using linear sampling from a matplotlib colourmap according to the
+        share of the runtime spent in evaluations.
+
+        :param vals: values in the range [0, 1] to convert to colour strings
+        :type vals: list[float]
+        :param flags: The flags associated with the results
+        :type flags: list[int]
+        :param cmap: matplotlib colourmap
+        :type cmap: matplotlib colourmap object
+        :param cmap_range: values in range [0, 1] for colourmap cropping
+        :type cmap_range: list[float], 2 elements
+        :param log_ulim: **Unused** log10 of worst shading cutoff value
+        :type log_ulim: float
+
+        :return: Colours as hex strings for each input value and
+                 Foreground colours for the text as html rgb strings
+                 e.g. 'rgb(255, 255, 255)'
+        :rtype: tuple[list[str], list[str]]
+        """
+        missing = [v is None or np.isinf(v) for v in vals]
+        # The share can be slightly over 1 as the evaluations are timed
+        # separately to the fit
+        shares = np.array(
+            [0.0 if m else min(v, 1.0) for v, m in zip(vals, missing)]
+        )
+        rgba = cmap(cmap_range[0] + shares * (cmap_range[1] - cmap_range[0]))
+        hex_strs = [
+            clrs.to_hex("whitesmoke") if m else clrs.rgb2hex(colour)
+            for colour, m in zip(rgba, missing)
+        ]
+        text_str = [
+            background_to_text(colour[:3], CONTRAST_RATIO_AAA)
+            for colour in rgba
+        ]
+        return hex_strs, text_str
+
+    def get_description(self):
+        """
+        Generates table description from class docstrings and converts them
+        into html
+
+        :return: Dictionary containing table descriptions
+        :rtype: dict
+        """
+        html = super().get_description()
+        html["overhead_mode"] = (
+            "'N/A' in the table indicates that the evaluations were not "
+            "counted for the result."
+        )
+
+        return html
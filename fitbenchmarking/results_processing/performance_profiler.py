@@ -49,7 +49,8 @@ def prepare_profile_data(results):
     """
     Helper function which generates dictionaries for each metric containing
     names of solvers as the keys and a list of floats (one for each problem)
-    as the values.
+    as the values. The time to target is only included if the convergence
+    of the fits was traced.
 
     :param results: The sorted results grouped by row and category
     :type results: dict[str, dict[str, list[utils.fitbm_result.FittingResult]]]
@@ -57,7 +58,13 @@ def prepare_profile_data(results):
     :return: dictionary containing number of occurrences
     :rtype: dict[str, dict[str, list[float]]]
     """
-    pp_data = {"acc": {}, "runtime": {}, "energy_usage": {}}
+    pp_data = {
+        "acc": {},
+        "runtime": {},
+        "energy_usage": {},
+        "time_to_target": {},
+    }
+    traced = False
     minimizers = []
     to_remove = set()
 
@@ -79,11 +86,18 @@ def prepare_profile_data(results):
                 pp_data["energy_usage"][minimizers[i]].append(
                     result.norm_energy
                 )
+                pp_data["time_to_target"][minimizers[i]].append(
+                    result.norm_time_to_target
+                )
+                traced = traced or result.convergence_trace is not None
 
     for key in to_remove:
         for pp in pp_data.values():
             del pp[key]
 
+    if not traced:
+        del pp_data["time_to_target"]
+
     return pp_data
 
 
@@ -12,11 +12,53 @@ class RuntimeTable(Table):
     `timeit <https://docs.python.org/2/library/timeit.html>`_  module
     in python. num_runs is set in :ref:`options`.
 
+    The tooltip for each result shows the time spent setting up the
+    minimizer, running the fits, cleaning up and evaluating the accuracy.
+
+    If the convergence of the fits was traced, a performance profile of
+    the time taken to reach a cost within 1% of the best accuracy is also
+    shown.
+
     """
 
     name = "runtime"
     cbar_title = "Problem-Specific Cell Shading: Relative Runtime"
 
+    def __init__(
+        self,
+        results,
+        best_results,
+        options,
+        group_dir,
+        pp_locations,
+        table_name,
+    ):
+        """
+        Initialise the runtime table, which also shows the time to target
+        performance profile if it was made.
+
+        :param results: Results grouped by row and category (for colouring)
+        :type results:
+            dict[str, dict[str, list[utils.fitbm_result.FittingResult]]]
+        :param best_results: The best results from each row/category
+        :type best_results:
+            dict[str, dict[str, utils.fitbm_result.FittingResult]]
+        :param options: Options used in fitting
+        :type options: utils.options.Options
+        :param group_dir: path to the directory where group results should be
+                          stored
+        :type group_dir: str
+        :param pp_locations: the locations of the performance profiles
+        :type pp_locations: dict[str,str]
+        :param table_name: Name of the table
+        :type table_name: str
+        """
+        super().__init__(
+            results, best_results, options, group_dir, pp_locations, table_name
+        )
+        if "time_to_target" in pp_locations:
+            self.pps.append("time_to_target")
+
     def get_value(self, result):
         """
         Gets the main value to be reported in the tables for a given result
@@ -35,6 +77,23 @@ class RuntimeTable(Table):
         abs_value = result.runtime
         return rel_value, abs_value
 
+    def get_hover_table(self):
+        """
+        Create a dict with the tooltip for each cell from self.sorted_results.
+        The tooltips include the time spent in each phase of the fit, to show
+        when the setup or cleanup of a minimizer takes longer than the fit.
+
+        :return: The dictionary of strings for the table
+        :rtype: dict[list[str]]
+        """
+        str_dict = {}
+        for k, results in self.sorted_results.items():
+            str_dict[k] = [
+                result.hover_text(style="css", include_phases=True)
+                for result in results
+            ]
+        return str_dict.values()
+
     def get_hyperlink(self, result, val_str, text_col):
         """
         Generates the hyperlink for a given result
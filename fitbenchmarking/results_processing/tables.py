@@ -19,7 +19,14 @@ from fitbenchmarking.utils.misc import ERROR_FLAG_MAPPINGS, get_css, get_js
 
 LOGGER = get_logger()
 
-SORTED_TABLE_NAMES = ["compare", "acc", "runtime", "local_min", "energy_usage"]
+SORTED_TABLE_NAMES = [
+    "compare",
+    "acc",
+    "runtime",
+    "local_min",
+    "energy_usage",
+    "overhead",
+]
 
 
 def create_results_tables(
@@ -85,8 +92,8 @@ def create_results_tables(
 
             description.update(table.get_description())
 
-            if suffix == "local_min":
-                table_format = description["local_min_mode"]
+            if suffix in ["local_min", "overhead"]:
+                table_format = description[f"{suffix}_mode"]
             else:
                 table_format = description[options.comparison_mode]
 
@@ -256,6 +256,23 @@ class PerformanceProfilerTests(unittest.TestCase):
             assert np.allclose(v, bounds["runtime"][k])
         for k, v in self.energy_expected.items():
             assert np.allclose(v, bounds["energy_usage"][k])
+        assert "time_to_target" not in bounds
+
+    def test_prepare_profile_data_time_to_target(self):
+        """
+        Test that prepare profile data includes the time to target when
+        the convergence of the fits was traced.
+        """
+        for row in self.results.values():
+            for cat in row.values():
+                for result in cat:
+                    result.convergence_trace = np.array([[0.5, 5, 0.0]])
+                    result.min_time_to_target = 0.25
+
+        bounds = performance_profiler.prepare_profile_data(self.results)
+
+        for v in bounds["time_to_target"].values():
+            assert np.allclose(v, 2.0)
 
     def test_correct_profile_output_paths(self):
         """
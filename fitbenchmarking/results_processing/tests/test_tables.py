@@ -243,6 +243,7 @@ class CreateResultsTableTests(unittest.TestCase):
         """
         Checks to see whether files with the correct name are produced.
         """
+        self.options.table_type = SORTED_TABLE_NAMES
         create_results_tables(
             options=self.options,
             results=self.results,
@@ -7,9 +7,9 @@ This is also used to read in checkpointed data.
 import json
 import os
 import pickle
+import shutil
 import sys
 from base64 import a85decode, a85encode
-from tempfile import TemporaryDirectory
 
 import numpy as np
 
@@ -46,7 +46,6 @@ class Checkpoint:
         self.options = options
 
         # File paths for temp files
-        self.dir: TemporaryDirectory | None = None
         self.problems_file: str | None = None
         self.results_file: str | None = None
 
@@ -54,6 +53,9 @@ class Checkpoint:
         self.cp_file: str = os.path.join(
             self.options.results_dir, self.options.checkpoint_filename
         )
+        # The temp files are kept next to the checkpoint file, so that an
+        # interrupted run can be resumed from them
+        self.tmp_dir: str = f"{self.cp_file}.partial"
 
         # Saves the config
         self.config = {
@@ -64,6 +66,8 @@ class Checkpoint:
             ),
             "numpy_version": np.__version__,
         }
+        if self.options.shard:
+            self.config["shard"] = self.options.shard
 
     def add_result(self, result: FittingResult):
         """
@@ -84,11 +88,9 @@ class Checkpoint:
                 with open(self.cp_file, "w", encoding="utf-8") as f:
                     f.write("{\n")
 
-            self.dir = TemporaryDirectory()
-            self.problems_file = os.path.join(
-                self.dir.name, "problems_tmp.txt"
-            )
-            self.results_file = os.path.join(self.dir.name, "results_tmp.txt")
+            os.makedirs(self.tmp_dir, exist_ok=True)
+            self.problems_file = os.path.join(self.tmp_dir, "problems_tmp.txt")
+            self.results_file = os.path.join(self.tmp_dir, "results_tmp.txt")
             with open(self.results_file, "w", encoding="utf-8") as f:
                 f.write("[\n")
             with open(self.problems_file, "w", encoding="utf-8") as f:
@@ -103,7 +105,12 @@ class Checkpoint:
             "accuracy": result.accuracy,
             "runtime": result.runtime,
             "runtimes": result.runtimes,
+            "cpu_runtimes": result.cpu_runtimes,
             "runtime_metric": result.runtime_metric,
+            "phase_times": result.phase_times,
+            "eval_counts": result.eval_counts,
+            "eval_times": result.eval_times,
+            "convergence_trace": _compress(result.convergence_trace),
             "energy": result.energy,
             "iteration_count": result.iteration_count,
             "func_evals": result.func_evals,
@@ -224,6 +231,10 @@ class Checkpoint:
             )
             f.write("  }")
 
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+        self.problems_file = None
+        self.results_file = None
+
         self.finalised_labels.append(label)
         self.first_result = True
         self.problem_names = []
@@ -250,6 +261,7 @@ class Checkpoint:
 
     def load(
         self,
+        checkpoint_filename: str | None = None,
     ) -> tuple[
         dict[str, list[FittingResult]], dict, dict[str, list[str]], dict
     ]:
@@ -257,6 +269,10 @@ class Checkpoint:
         Load fitting results from a checkpoint file along with
         failed problems and unselected minimizers.
 
+        :param checkpoint_filename: The checkpoint file to load, defaults
+                                    to the checkpoint file in the options
+        :type checkpoint_filename: str, optional
+
         :return: Instantiated fitting results,
                  unselected minimisers, failed problems
                  config
@@ -267,11 +283,12 @@ class Checkpoint:
         unselected_minimizers: dict[str, list[str]] = {}
         failed_problems: dict[str, list[str]] = {}
 
+        if checkpoint_filename is None:
+            checkpoint_filename = self.options.checkpoint_filename
+
         for f in [
-            self.options.checkpoint_filename,
-            os.path.join(
-                self.options.results_dir, self.options.checkpoint_filename
-            ),
+            checkpoint_filename,
+            os.path.join(self.options.results_dir, checkpoint_filename),
         ]:
             if os.path.isfile(f):
                 filename: str = f
@@ -283,8 +300,6 @@ class Checkpoint:
             tmp = json.load(f)
 
         for label, group in tmp.items():
-            output[label] = []
-
             problems = group["problems"]
             results = group["results"]
             unselected_minimizers[label] = group["unselected_minimizers"]
@@ -313,68 +328,226 @@ class Checkpoint:
                     config["numpy_version"],
                 )
 
-            # Unpickle problems so that we use 1 shared object for all results
-            # per array
-            for p in problems.values():
-                p["ini_y"] = _decompress(p["ini_y"])
-                p["x"] = _decompress(p["x"])
-                p["y"] = _decompress(p["y"])
-                p["e"] = _decompress(p["e"])
-                p["sorted_idx"] = _decompress(p["sorted_idx"])
-                p["ini_params"] = _decompress(p["ini_params"])
-
-            for r in results:
-                new_result = FittingResult.__new__(FittingResult)
-                new_result.init_blank()
-
-                new_result.params = _decompress(r["fin_params"])
-                new_result.fin_function_params = r["fin_params_str"]
-                new_result.accuracy = r["accuracy"]
-                new_result.runtime = r["runtime"]
-                new_result.runtimes = r["runtimes"]
-                new_result.runtime_metric = r["runtime_metric"]
-                new_result.energy = r["energy"]
-                new_result.iteration_count = r["iteration_count"]
-                new_result.func_evals = r["func_evals"]
-                new_result.error_flag = r["flag"]
-                new_result.multistart = r["multistart"]
-                new_result.params_pdfs = r["params_pdfs"]
-                new_result.plot_info = r["plot_info"]
-                new_result.software = r["software"]
-                new_result.minimizer = r["minimizer"]
-                new_result.jac = r["jacobian"]
-                new_result.hess = r["hessian"]
-                new_result.software_tag = r["software_tag"]
-                new_result.minimizer_tag = r["minimizer_tag"]
-                new_result.jacobian_tag = r["jacobian_tag"]
-                new_result.hessian_tag = r["hessian_tag"]
-                new_result.costfun_tag = r["costfun_tag"]
-                new_result.fin_y = _decompress(r["fin_y"])
-                new_result.r_x = _decompress(r["r"])
-                new_result.jac_x = _decompress(r["J"])
-                new_result.algorithm_type = r["tags"]
-                new_result.status = r.get("status", "unknown")
-
-                new_result.name = r["name"]
-                p = problems[new_result.name]
-                new_result.multivariate = p["multivar"]
-                new_result.problem_format = p["format"]
-                new_result.initial_params = p["ini_params"]
-                new_result.ini_function_params = p["ini_params_str"]
-                new_result.data_x = p["x"]
-                new_result.data_y = p["y"]
-                new_result.data_e = p["e"]
-                new_result.sorted_index = p["sorted_idx"]
-                new_result.ini_y = p["ini_y"]
-                new_result.problem_tag = p["problem_tag"]
-                new_result.problem_desc = p["problem_desc"]
-                new_result.equation = p["equation"]
-                new_result.plot_scale = p["plot_scale"]
-
-                output[label].append(new_result)
+            output[label] = _load_results(problems, results)
 
         return output, unselected_minimizers, failed_problems, config
 
+    def load_partial(
+        self,
+    ) -> tuple[dict[str, list[FittingResult]], list[FittingResult]]:
+        """
+        Load the fitting results left by a run which may have been
+        interrupted. This reads the checkpoint file, which may not have
+        been finalised, along with the temp files for the group which was
+        running when the run stopped.
+
+        This must be called before any results are added, as adding a
+        result starts a new checkpoint file.
+
+        :return: Instantiated fitting results for each finalised group,
+                 and the results from the group which was not finalised
+        :rtype: Tuple[dict[str, list[FittingResult]],
+                      list[FittingResult]]
+        """
+        groups: dict[str, list[FittingResult]] = {}
+        partial: list[FittingResult] = []
+
+        if not os.path.isfile(self.cp_file):
+            LOGGER.warning(
+                "Could not find checkpoint file %s to resume from.",
+                self.cp_file,
+            )
+            return groups, partial
+
+        with open(self.cp_file, encoding="utf-8") as f:
+            tmp = _load_partial_json(f.read(), {})
+
+        for label, group in tmp.items():
+            results = _load_results(group["problems"], group["results"])
+            # Written by finalise when the run stopped part way
+            # through a group
+            if label == "incomplete_group":
+                partial.extend(results)
+            else:
+                groups[label] = results
+
+        problems_file = os.path.join(self.tmp_dir, "problems_tmp.txt")
+        results_file = os.path.join(self.tmp_dir, "results_tmp.txt")
+        if os.path.isfile(problems_file) and os.path.isfile(results_file):
+            with open(problems_file, encoding="utf-8") as f:
+                problems = _load_partial_json(f.read(), {})
+            with open(results_file, encoding="utf-8") as f:
+                results = _load_partial_json(f.read(), [])
+            # The problem is written before its first result
+            results = [r for r in results if r["name"] in problems]
+            partial.extend(_load_results(problems, results))
+
+        return groups, partial
+
+
+def _load_results(
+    problems: dict[str, dict], results: list[dict]
+) -> list[FittingResult]:
+    """
+    Create fitting results from the problems and results sections of a
+    checkpoint group.
+
+    :param problems: The problems section, keyed by problem name
+    :type problems: dict[str, dict]
+    :param results: The results section
+    :type results: list[dict]
+
+    :return: Instantiated fitting results
+    :rtype: list[FittingResult]
+    """
+    output: list[FittingResult] = []
+
+    # Unpickle problems so that we use 1 shared object for all results
+    # per array
+    for p in problems.values():
+        p["ini_y"] = _decompress(p["ini_y"])
+        p["x"] = _decompress(p["x"])
+        p["y"] = _decompress(p["y"])
+        p["e"] = _decompress(p["e"])
+        p["sorted_idx"] = _decompress(p["sorted_idx"])
+        p["ini_params"] = _decompress(p["ini_params"])
+
+    for r in results:
+        new_result = FittingResult.__new__(FittingResult)
+        new_result.init_blank()
+
+        new_result.params = _decompress(r["fin_params"])
+        new_result.fin_function_params = r["fin_params_str"]
+        new_result.accuracy = r["accuracy"]
+        new_result.runtime = r["runtime"]
+        new_result.runtimes = r["runtimes"]
+        # Checkpoints from before the CPU time was recorded do not have it
+        new_result.cpu_runtimes = r.get(
+            "cpu_runtimes", [np.nan] * len(r["runtimes"])
+        )
+        new_result.runtime_metric = r["runtime_metric"]
+        new_result.phase_times = r.get("phase_times", {})
+        new_result.eval_counts = r.get("eval_counts", {})
+        new_result.eval_times = r.get("eval_times", {})
+        new_result.convergence_trace = (
+            _decompress(r["convergence_trace"])
+            if "convergence_trace" in r
+            else None
+        )
+        new_result.energy = r["energy"]
+        new_result.iteration_count = r["iteration_count"]
+        new_result.func_evals = r["func_evals"]
+        new_result.error_flag = r["flag"]
+        new_result.multistart = r["multistart"]
+        new_result.params_pdfs = r["params_pdfs"]
+        new_result.plot_info = r["plot_info"]
+        new_result.software = r["software"]
+        new_result.minimizer = r["minimizer"]
+        new_result.jac = r["jacobian"]
+        new_result.hess = r["hessian"]
+        new_result.software_tag = r["software_tag"]
+        new_result.minimizer_tag = r["minimizer_tag"]
+        new_result.jacobian_tag = r["jacobian_tag"]
+        new_result.hessian_tag = r["hessian_tag"]
+        new_result.costfun_tag = r["costfun_tag"]
+        new_result.fin_y = _decompress(r["fin_y"])
+        new_result.r_x = _decompress(r["r"])
+        new_result.jac_x = _decompress(r["J"])
+        new_result.algorithm_type = r["tags"]
+        new_result.status = r.get("status", "unknown")
+
+        new_result.name = r["name"]
+        p = problems[new_result.name]
+        new_result.multivariate = p["multivar"]
+        new_result.problem_format = p["format"]
+        new_result.initial_params = p["ini_params"]
+        new_result.ini_function_params = p["ini_params_str"]
+        new_result.data_x = p["x"]
+        new_result.data_y = p["y"]
+        new_result.data_e = p["e"]
+        new_result.sorted_index = p["sorted_idx"]
+        new_result.ini_y = p["ini_y"]
+        new_result.problem_tag = p["problem_tag"]
+        new_result.problem_desc = p["problem_desc"]
+        new_result.equation = p["equation"]
+        new_result.plot_scale = p["plot_scale"]
+
+        output.append(new_result)
+
+    return output
+
+
+def _load_partial_json(text: str, empty):
+    """
+    Load a json object or list which may have been cut off while it was
+    being written. Anything after the last complete entry is dropped.
+
+    The entries are decoded in one pass from the start, so each one is
+    only parsed once.
+
+    :param text: The text to load
+    :type text: str
+    :param empty: The value to return if there are no complete entries,
+                  this also sets whether an object or list is expected
+    :type empty: dict or list
+
+    :return: The loaded object or list
+    :rtype: dict or list
+    """
+    is_dict = isinstance(empty, dict)
+    opening, closing = "{}" if is_dict else "[]"
+    decoder = json.JSONDecoder()
+    output = {} if is_dict else []
+
+    pos = _skip_whitespace(text, 0)
+    if not text.startswith(opening, pos):
+        return output
+    pos = _skip_whitespace(text, pos + 1)
+    if text.startswith(closing, pos):
+        return output
+
+    while True:
+        try:
+            if is_dict:
+                key, pos = decoder.raw_decode(text, pos)
+                pos = _skip_whitespace(text, pos)
+                if not text.startswith(":", pos):
+                    break
+                pos = _skip_whitespace(text, pos + 1)
+            value, pos = decoder.raw_decode(text, pos)
+        except json.JSONDecodeError:
+            break
+        pos = _skip_whitespace(text, pos)
+        # The entries are written whole, so one which decodes is complete
+        # unless it is followed by something other than the next entry
+        if pos < len(text) and not text.startswith((",", closing), pos):
+            break
+        if is_dict:
+            output[key] = value
+        else:
+            output.append(value)
+        if not text.startswith(",", pos):
+            break
+        pos = _skip_whitespace(text, pos + 1)
+    return output
+
+
+def _skip_whitespace(text: str, pos: int) -> int:
+    """
+    Find the first character of the text from pos which is not whitespace.
+
+    :param text: The text to search
+    :type text: str
+    :param pos: The position to start from
+    :type pos: int
+
+    :return: The position of the character, or the length of the text
+    :rtype: int
+    """
+    while pos < len(text) and text[pos] in " \t\n\r":
+        pos += 1
+    return pos
+
 
 def _compress(value):
     """
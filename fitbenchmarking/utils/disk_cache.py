@@ -0,0 +1,89 @@
+"""
+Helpers for the caches kept on disk between runs, e.g. of generated code
+or converted data files.
+"""
+
+import hashlib
+import os
+import tempfile
+
+from fitbenchmarking.utils.log import get_logger
+
+LOGGER = get_logger()
+
+
+def hash_key(*parts):
+    """
+    Get a key for a cache entry from the inputs it depends on.
+
+    :param parts: The inputs of the entry
+    :type parts: str or bytes
+
+    :return: The hex digest of the inputs
+    :rtype: str
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, str):
+            part = part.encode("utf-8")
+        # Include the length so the parts can't run into each other
+        digest.update(len(part).to_bytes(8, "little"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def cache_path(cache_dir, category, key, extension=""):
+    """
+    Get the path of a cache entry.
+
+    :param cache_dir: The cache directory from the options. If this is
+                      empty, nothing is cached.
+    :type cache_dir: str
+    :param category: The name of the sub directory for this kind of entry
+    :type category: str
+    :param key: The key of the entry
+    :type key: str
+    :param extension: The extension of the file
+    :type extension: str
+
+    :return: The path of the entry, or None if nothing is cached
+    :rtype: str or None
+    """
+    if not cache_dir:
+        return None
+    return os.path.join(
+        os.path.expanduser(cache_dir), category, key + extension
+    )
+
+
+def write_atomic(path, data):
+    """
+    Write a cache entry, so that readers (e.g. other worker processes)
+    never see a partly written file. Failures are logged and ignored, as
+    the entry can be made again.
+
+    :param path: The path of the entry
+    :type path: str
+    :param data: The contents of the entry
+    :type data: bytes or str
+
+    :return: Whether the entry was written
+    :rtype: bool
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+    except OSError as e:
+        LOGGER.debug("Could not write the cache entry %s: %s", path, e)
+        return False
+    return True
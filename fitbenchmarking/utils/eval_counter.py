@@ -0,0 +1,484 @@
+"""
+Implements the EvalCounter class used to count the evaluations of the
+model, Jacobian, Hessian and cost function during a fit, and to measure
+the time spent in them, and the ConvergenceTrace class used to record the
+best cost found during a fit.
+"""
+
+from collections import defaultdict
+from contextlib import contextmanager
+from time import perf_counter_ns
+
+import numpy as np
+
+from fitbenchmarking.cost_func.nlls_base_cost_func import BaseNLLSCostFunc
+
+# The maximum number of points in a convergence trace
+TRACE_POINTS = 256
+
+# The methods of the cost function which are counted. The residual methods
+# are included as least squares controllers call them directly.
+COST_FUNC_METHODS = [
+    "eval_cost",
+    "jac_cost",
+    "hes_cost",
+    "eval_r",
+    "jac_res",
+    "hes_res",
+    "eval_cost_grad",
+    "eval_r_and_jac",
+    "eval_cost_batch",
+]
+
+
+class EvalCounter:
+    """
+    Counts the calls to the evaluation methods used by a fit and measures
+    the time spent in them.
+
+    The methods are replaced with counted versions on the instances used
+    by the controller, so every controller is counted in the same way.
+    The evaluations are counted under the following names:
+
+    - ``model``: ``FittingProblem.eval_model``
+    - ``model_batch``: ``FittingProblem.eval_model_batch``
+    - ``jacobian``: ``Jacobian.eval``
+    - ``hessian``: ``Hessian.eval``
+    - the name of the cost function method for ``eval_cost``,
+      ``jac_cost``, ``hes_cost``, ``eval_r``, ``jac_res``, ``hes_res``,
+      ``eval_cost_grad``, ``eval_r_and_jac`` and ``eval_cost_batch``
+
+    The evaluations call each other (e.g. ``eval_cost`` calls
+    ``eval_model``), so the time of each is inclusive of the evaluations
+    it makes. The time spent in evaluations overall is only counted for
+    the outermost call.
+    """
+
+    def __init__(self):
+        """
+        Initialise the counter.
+        """
+        self.counts = defaultdict(int)
+        # The times are recorded in nanoseconds
+        self.times = defaultdict(int)
+        self.total_time = 0
+        self._depth = 0
+        self._installed = []
+
+    def install(self, controller):
+        """
+        Replace the evaluation methods used by the controller with counted
+        versions.
+
+        :param controller: The software controller for the fitting
+        :type controller: Object derived from BaseSoftwareController
+        """
+        cost_func = controller.cost_func
+        self._wrap(controller.problem, "eval_model", "model")
+        if hasattr(controller.problem, "eval_model_batch"):
+            self._wrap(controller.problem, "eval_model_batch", "model_batch")
+        for method in COST_FUNC_METHODS:
+            if hasattr(cost_func, method):
+                self._wrap(cost_func, method, method)
+        if cost_func.jacobian is not None:
+            self._wrap(cost_func.jacobian, "eval", "jacobian")
+        if cost_func.hessian is not None:
+            self._wrap(cost_func.hessian, "eval", "hessian")
+
+    def uninstall(self):
+        """
+        Restore the evaluation methods replaced by install.
+        """
+        _restore_methods(self._installed)
+
+    def reset(self):
+        """
+        Reset the counts and times, e.g. to ignore the evaluations made
+        while setting up a fit.
+        """
+        self.counts.clear()
+        self.times.clear()
+        self.total_time = 0
+
+    def per_run(self, num_runs):
+        """
+        Get the average number of evaluations and time spent in them for
+        each run of the fit.
+
+        :param num_runs: The number of times the fit was run
+        :type num_runs: int
+
+        :return: The number of evaluations and the time in seconds spent in
+                 them, by name. The times include a ``total`` of the time
+                 spent in evaluations overall.
+        :rtype: tuple(dict[str, float], dict[str, float])
+        """
+        counts = {
+            name: count / num_runs for name, count in self.counts.items()
+        }
+        times = {
+            name: time / num_runs / 1e9 for name, time in self.times.items()
+        }
+        times["total"] = self.total_time / num_runs / 1e9
+        return counts, times
+
+    def call(self, method, name, *args, **kwargs):
+        """
+        Call a method, counting the call and the time spent in it.
+
+        :param method: The method to call
+        :type method: Callable
+        :param name: The name to count the call under
+        :type name: str
+
+        :return: The output of the method
+        :rtype: Any
+        """
+        self.counts[name] += 1
+        self._depth += 1
+        start = perf_counter_ns()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            elapsed = perf_counter_ns() - start
+            self._depth -= 1
+            self.times[name] += elapsed
+            if self._depth == 0:
+                self.total_time += elapsed
+
+    def _wrap(self, obj, method, name):
+        """
+        Replace a method of an instance with a counted version.
+
+        :param obj: The instance to replace the method on
+        :type obj: object
+        :param method: The name of the method
+        :type method: str
+        :param name: The name to count the evaluations under
+        :type name: str
+        """
+        _replace_method(
+            obj,
+            method,
+            _CountedMethod(self, getattr(obj, method), name),
+            self._installed,
+        )
+
+
+class _CountedMethod:
+    """
+    A method which records its calls in an EvalCounter. This is a class
+    rather than a closure so that the controller can still be pickled.
+    """
+
+    def __init__(self, counter, method, name):
+        """
+        :param counter: The counter to record the calls in
+        :type counter: EvalCounter
+        :param method: The bound method to count
+        :type method: Callable
+        :param name: The name to count the calls under
+        :type name: str
+        """
+        self.counter = counter
+        self.method = method
+        self.name = name
+
+    def __call__(self, *args, **kwargs):
+        return self.counter.call(self.method, self.name, *args, **kwargs)
+
+
+@contextmanager
+def counting_evals(controller, enabled=True):
+    """
+    Count the evaluations made by the controller inside the context.
+
+    :param controller: The software controller for the fitting
+    :type controller: Object derived from BaseSoftwareController
+    :param enabled: Whether to count the evaluations. If False, the
+                    counter records nothing.
+    :type enabled: bool
+
+    :return: The counter
+    :rtype: EvalCounter
+    """
+    counter = EvalCounter()
+    if enabled:
+        counter.install(controller)
+    try:
+        yield counter
+    finally:
+        counter.uninstall()
+
+
+class ConvergenceTrace:
+    """
+    Records the best cost found against the time and number of cost
+    function evaluations during a run of a fit.
+
+    A point is only recorded when the best cost improves. To keep the
+    memory bounded, every other point is dropped whenever the trace is
+    full, so the resolution of the trace halves each time it fills up.
+    The trace is restarted at the start of each run of the fit, so it
+    holds the last run.
+    """
+
+    def __init__(self, max_points=TRACE_POINTS):
+        """
+        Initialise the trace.
+
+        :param max_points: The maximum number of points in the trace
+        :type max_points: int
+        """
+        self.max_points = max_points
+        self._points = []
+        self._evals = 0
+        self._best = np.inf
+        self._start = perf_counter_ns()
+        self._depth = 0
+        self._installed = []
+
+    def install(self, controller):
+        """
+        Replace the cost function methods used by the controller with
+        versions which record the cost, and restart the trace at the start
+        of each run of the fit.
+
+        :param controller: The software controller for the fitting
+        :type controller: Object derived from BaseSoftwareController
+        """
+        cost_func = controller.cost_func
+        _replace_method(
+            controller,
+            "execute",
+            _TracedRun(self, controller.execute),
+            self._installed,
+        )
+        _replace_method(
+            cost_func,
+            "eval_cost",
+            _TracedMethod(self, cost_func.eval_cost, residuals=False),
+            self._installed,
+        )
+        if hasattr(cost_func, "eval_cost_batch"):
+            _replace_method(
+                cost_func,
+                "eval_cost_batch",
+                _TracedBatch(self, cost_func.eval_cost_batch),
+                self._installed,
+            )
+        # The cost of a least squares cost function is the sum of the
+        # squares of its residuals
+        if isinstance(cost_func, BaseNLLSCostFunc):
+            _replace_method(
+                cost_func,
+                "eval_r",
+                _TracedMethod(self, cost_func.eval_r, residuals=True),
+                self._installed,
+            )
+
+    def uninstall(self):
+        """
+        Restore the methods replaced by install.
+        """
+        _restore_methods(self._installed)
+
+    def start(self):
+        """
+        Restart the trace.
+        """
+        self._points = []
+        self._evals = 0
+        self._best = np.inf
+        self._start = perf_counter_ns()
+
+    def record(self, cost):
+        """
+        Record an evaluation of the cost function.
+
+        :param cost: The value of the cost function
+        :type cost: float
+        """
+        elapsed = (perf_counter_ns() - self._start) / 1e9
+        self._evals += 1
+        if cost < self._best:
+            self._best = cost
+            if len(self._points) == self.max_points:
+                del self._points[1::2]
+            self._points.append((elapsed, self._evals, cost))
+
+    def call(self, method, residuals, *args, **kwargs):
+        """
+        Call a cost function method and record the cost. Only the
+        outermost call is recorded, as eval_cost calls eval_r for least
+        squares cost functions.
+
+        :param method: The method to call
+        :type method: Callable
+        :param residuals: Whether the method returns the residuals rather
+                          than the cost
+        :type residuals: bool
+
+        :return: The output of the method
+        :rtype: Any
+        """
+        self._depth += 1
+        try:
+            out = method(*args, **kwargs)
+        finally:
+            self._depth -= 1
+        if self._depth == 0:
+            self.record(float(np.dot(out, out)) if residuals else out)
+        return out
+
+    def call_batch(self, method, *args, **kwargs):
+        """
+        Call a method evaluating the cost function for a batch of
+        parameters and record each cost, in the order of the batch.
+
+        :param method: The method to call
+        :type method: Callable
+
+        :return: The output of the method
+        :rtype: numpy.ndarray
+        """
+        self._depth += 1
+        try:
+            out = method(*args, **kwargs)
+        finally:
+            self._depth -= 1
+        if self._depth == 0:
+            for cost in out:
+                self.record(float(cost))
+        return out
+
+    def as_array(self):
+        """
+        Get the trace as an array.
+
+        :return: The elapsed time in seconds, number of evaluations and best
+                 cost at each point of the trace, with shape (n, 3)
+        :rtype: numpy.ndarray
+        """
+        return np.array(self._points, dtype=float).reshape(-1, 3)
+
+
+class _TracedMethod:
+    """
+    A cost function method which records the cost in a ConvergenceTrace.
+    """
+
+    def __init__(self, trace, method, residuals):
+        """
+        :param trace: The trace to record the cost in
+        :type trace: ConvergenceTrace
+        :param method: The bound method to trace
+        :type method: Callable
+        :param residuals: Whether the method returns the residuals
+        :type residuals: bool
+        """
+        self.trace = trace
+        self.method = method
+        self.residuals = residuals
+
+    def __call__(self, *args, **kwargs):
+        return self.trace.call(self.method, self.residuals, *args, **kwargs)
+
+
+class _TracedBatch:
+    """
+    A cost function method evaluating a batch of parameters, which records
+    the costs in a ConvergenceTrace.
+    """
+
+    def __init__(self, trace, method):
+        """
+        :param trace: The trace to record the costs in
+        :type trace: ConvergenceTrace
+        :param method: The bound method to trace
+        :type method: Callable
+        """
+        self.trace = trace
+        self.method = method
+
+    def __call__(self, *args, **kwargs):
+        return self.trace.call_batch(self.method, *args, **kwargs)
+
+
+class _TracedRun:
+    """
+    A controller execute method which restarts a ConvergenceTrace.
+    """
+
+    def __init__(self, trace, method):
+        """
+        :param trace: The trace to restart
+        :type trace: ConvergenceTrace
+        :param method: The bound execute method of the controller
+        :type method: Callable
+        """
+        self.trace = trace
+        self.method = method
+
+    def __call__(self):
+        self.trace.start()
+        return self.method()
+
+
+@contextmanager
+def tracing_convergence(controller, enabled=True):
+    """
+    Record the convergence of the fits run by the controller inside the
+    context.
+
+    :param controller: The software controller for the fitting
+    :type controller: Object derived from BaseSoftwareController
+    :param enabled: Whether to record the convergence. If False, the
+                    trace records nothing.
+    :type enabled: bool
+
+    :return: The trace
+    :rtype: ConvergenceTrace
+    """
+    trace = ConvergenceTrace()
+    if enabled:
+        trace.install(controller)
+    try:
+        yield trace
+    finally:
+        trace.uninstall()
+
+
+def _replace_method(obj, method, new, installed):
+    """
+    Replace a method of an instance, keeping what it replaced so that it
+    can be restored. Replacing a method which has already been replaced on
+    the instance (e.g. by both an EvalCounter and a ConvergenceTrace) is
+    supported, as long as they are restored in the reverse order.
+
+    :param obj: The instance to replace the method on
+    :type obj: object
+    :param method: The name of the method
+    :type method: str
+    :param new: The replacement
+    :type new: Callable
+    :param installed: The list to record the replacement in
+    :type installed: list
+    """
+    installed.append((obj, method, vars(obj).get(method)))
+    setattr(obj, method, new)
+
+
+def _restore_methods(installed):
+    """
+    Restore the methods replaced by _replace_method, emptying installed.
+
+    :param installed: The replacements to restore
+    :type installed: list
+    """
+    while installed:
+        obj, method, previous = installed.pop()
+        if previous is None:
+            delattr(obj, method)
+        else:
+            setattr(obj, method, previous)
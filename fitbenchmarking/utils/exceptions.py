@@ -354,3 +354,22 @@ class IncompatibleMultifitError(ValidationException):
         "problems."
     )
     error_code = 32
+
+
+class MaxMemoryError(FitBenchmarkException):
+    """
+    Indicates a minimizer has used too much memory
+    """
+
+    class_message = "Minimizer memory usage exceeded maximum memory"
+    error_code = 33
+
+
+class FitProcessError(FitBenchmarkException):
+    """
+    Indicates that the process running a fit exited without returning
+    a result
+    """
+
+    class_message = "The fit process exited unexpectedly."
+    error_code = 34
@@ -21,6 +21,12 @@ if TYPE_CHECKING:
 
 LOGGER = get_logger()
 
+# The time to target is the time taken to reach a cost within this factor
+# of the best accuracy for the problem. The absolute tolerance is added so
+# that a target can be reached when the best accuracy is zero.
+TARGET_FACTOR = 1.01
+TARGET_ATOL = 1e-12
+
 
 class FittingResult:
     """
@@ -37,8 +43,17 @@ class FittingResult:
         runtimes: float | list[float] = np.inf,
         energy: float = np.inf,
         runtime_metric: Literal[
-            "mean", "minimum", "maximum", "first", "median", "harmonic", "trim"
+            "mean",
+            "minimum",
+            "maximum",
+            "first",
+            "median",
+            "harmonic",
+            "trim",
+            "cpu",
         ] = "mean",
+        cpu_runtimes: float | list[float] = np.inf,
+        phase_times: dict[str, float] | None = None,
         dataset: int | None = None,
     ) -> None:
         """
@@ -52,6 +67,14 @@ class FittingResult:
         :type runtimes: Union[float, list[float]], optional
         :param energy: The average energy usage for the fit, defaults to np.inf
         :type energy: float, optional
+        :param runtime_metric: The runtime metric, defaults to "mean"
+        :type runtime_metric: str, optional
+        :param cpu_runtimes: The CPU time of each run of the fit, defaults to
+                             np.inf
+        :type cpu_runtimes: Union[float, list[float]], optional
+        :param phase_times: The time spent in each phase of the fit (setup,
+                            fit, cleanup and accuracy), defaults to None
+        :type phase_times: dict[str, float], optional
         :param dataset: The index of the dataset (Only used for MultiFit),
                         defaults to None
         :type dataset: int, optional
@@ -118,10 +141,17 @@ class FittingResult:
                     )
 
         self.runtimes = runtimes if isinstance(runtimes, list) else [runtimes]
+        self.cpu_runtimes = (
+            cpu_runtimes if isinstance(cpu_runtimes, list) else [cpu_runtimes]
+        )
         self.runtime_metric = runtime_metric
+        self.phase_times = phase_times if phase_times is not None else {}
         self.energy = energy
         self.iteration_count = controller.iteration_count
         self.func_evals = controller.func_evals
+        self.eval_counts = controller.eval_counts
+        self.eval_times = controller.eval_times
+        self.convergence_trace = controller.convergence_trace
 
         # Posterior pdfs for Bayesian fitting
         self.params_pdfs = controller.params_pdfs
@@ -285,6 +315,8 @@ class FittingResult:
         self.min_median_runtime = np.inf
         self.min_harmonic_runtime = np.inf
         self.min_trim_runtime = np.inf
+        self.min_cpu_runtime = np.inf
+        self.min_time_to_target = np.inf
 
         # Paths to various output files
         self.problem_summary_page_link = ""
@@ -474,6 +506,40 @@ class FittingResult:
         """
         return stats.trim_mean(self.runtimes, 0.2)
 
+    @property
+    def cpu_runtime(self):
+        """
+        Getting function for cpu_runtime attribute
+
+        :return: mean of the CPU times of the runs
+        :rtype: float
+        """
+        return fmean(self.cpu_runtimes)
+
+    @property
+    def time_to_target(self):
+        """
+        Getting function for time_to_target attribute
+
+        :return: the time taken by the last run of the fit to reach a cost
+                 within TARGET_FACTOR of the best accuracy for the problem,
+                 inf if it was not reached or nan if the convergence of the
+                 fit was not traced
+        :rtype: float
+        """
+        if self.convergence_trace is None:
+            return np.nan
+        costs = self.convergence_trace[:, 2]
+        target = (
+            self.min_accuracy
+            + (TARGET_FACTOR - 1) * abs(self.min_accuracy)
+            + TARGET_ATOL
+        )
+        reached = costs <= target
+        if not reached.any():
+            return np.inf
+        return float(self.convergence_trace[reached.argmax(), 0])
+
     @property
     def norm_acc(self):
         """
@@ -521,6 +587,21 @@ class FittingResult:
             norm_runtime = getattr(self, f"{metric}_runtime") / min_rumtime
         return norm_runtime
 
+    @property
+    def norm_time_to_target(self):
+        """
+        Getting function for norm_time_to_target attribute
+
+        :return: normalised time to target value
+        :rtype: float
+        """
+        time_to_target = self.time_to_target
+        if not np.isfinite(time_to_target):
+            return time_to_target
+        if self.min_time_to_target in [np.nan, np.inf]:
+            return np.inf
+        return time_to_target / self.min_time_to_target
+
     @property
     def norm_energy(self):
         """
@@ -560,7 +641,13 @@ class FittingResult:
     def sanitised_name(self, value):
         raise RuntimeError("sanitised_name can not be edited")
 
-    def hover_text(self, include_title=False, style="html") -> str:
+    def hover_text(
+        self,
+        include_title=False,
+        style="html",
+        include_phases=False,
+        include_evals=False,
+    ) -> str:
         """
         Generate the tooltip text for a given fitting result.
         :param result: The result to generate the text for
@@ -568,6 +655,12 @@ class FittingResult:
         :param include_title: Whether to include the result title in the
             tooltip
         :type include_title: bool
+        :param include_phases: Whether to include the time spent in each
+            phase of the fit in the tooltip
+        :type include_phases: bool
+        :param include_evals: Whether to include the number of evaluations
+            per run of the fit, and the time spent in them, in the tooltip
+        :type include_evals: bool
         :param newline: The newline character to use, defaults to CSS style
             newline used in tables
         :type newline: str
@@ -597,6 +690,19 @@ class FittingResult:
             f"Function Evaluations: {self.func_evals}"
         )
 
+        if include_phases:
+            for phase, phase_time in self.phase_times.items():
+                hover_text += (
+                    f"{line_break}{phase.capitalize()} time: {phase_time:.4g}"
+                )
+
+        if include_evals:
+            for name, count in self.eval_counts.items():
+                hover_text += (
+                    f"{line_break}{name} evaluations: {count:.4g}"
+                    f" ({self.eval_times[name]:.4g}s)"
+                )
+
         if include_title:
             hover_text = (
                 f"{bold_start}"
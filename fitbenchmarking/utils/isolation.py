@@ -0,0 +1,173 @@
+"""
+Implements run_isolated, used to run a fit in a child process that can be
+killed if it exceeds the 'max_runtime' or 'max_memory' options.
+"""
+
+import multiprocessing
+import time
+from contextlib import suppress
+
+import psutil
+
+from fitbenchmarking.utils.exceptions import (
+    FitBenchmarkException,
+    FitProcessError,
+    MaxMemoryError,
+    MaxRuntimeError,
+)
+
+# The interval in seconds at which the child process is checked
+POLL_INTERVAL = 0.05
+
+
+def fork_available():
+    """
+    Check whether child processes can be forked on this platform.
+    Forking is needed as parsed problems cannot always be pickled.
+
+    :return: Whether the 'fork' start method is available
+    :rtype: bool
+    """
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def run_isolated(func, max_runtime, max_memory=0):
+    """
+    Run a function in a forked child process and return its result.
+
+    The child is killed if it is still running after max_runtime seconds,
+    or if the resident memory of the child (and any processes it starts)
+    exceeds max_memory MiB. Any exception raised by the function is
+    re-raised in the calling process.
+
+    :param func: The function to run. This takes no arguments and must
+                 return a picklable value.
+    :type func: callable
+    :param max_runtime: The maximum wall clock time in seconds
+    :type max_runtime: float
+    :param max_memory: The maximum resident memory in MiB.
+                       0 means no limit.
+    :type max_memory: float
+
+    :return: The value returned by func
+    :rtype: any
+    """
+    ctx = multiprocessing.get_context("fork")
+    recv_conn, send_conn = ctx.Pipe(duplex=False)
+    proc = ctx.Process(target=_run_child, args=(func, send_conn))
+    start_time = time.monotonic()
+    proc.start()
+    send_conn.close()
+
+    try:
+        status, value = _wait_for_child(
+            proc, recv_conn, start_time, max_runtime, max_memory
+        )
+    finally:
+        if proc.is_alive():
+            proc.kill()
+        proc.join()
+        recv_conn.close()
+
+    if status == "error":
+        raise value
+    return value
+
+
+def _wait_for_child(proc, conn, start_time, max_runtime, max_memory):
+    """
+    Wait for the child process to send back its result, enforcing the
+    runtime and memory limits.
+
+    :param proc: The child process
+    :type proc: multiprocessing.Process
+    :param conn: The connection the result will be sent on
+    :type conn: multiprocessing.connection.Connection
+    :param start_time: The time the child process was started
+    :type start_time: float
+    :param max_runtime: The maximum wall clock time in seconds
+    :type max_runtime: float
+    :param max_memory: The maximum resident memory in MiB.
+                       0 means no limit.
+    :type max_memory: float
+
+    :return: The status ("ok" or "error") and the value sent by the child
+    :rtype: tuple(str, any)
+    """
+    max_bytes = max_memory * 1024**2
+    while True:
+        if conn.poll(POLL_INTERVAL):
+            try:
+                return conn.recv()
+            except EOFError as ex:
+                raise FitProcessError(
+                    f"The exit code was {proc.exitcode}."
+                ) from ex
+
+        if not proc.is_alive():
+            if conn.poll():
+                return conn.recv()
+            raise FitProcessError(f"The exit code was {proc.exitcode}.")
+
+        elapsed = time.monotonic() - start_time
+        if elapsed > max_runtime:
+            raise MaxRuntimeError(
+                f"The fit process was killed after {elapsed:.2f} seconds."
+            )
+
+        if max_bytes > 0:
+            rss = _get_rss(proc.pid)
+            if rss > max_bytes:
+                raise MaxMemoryError(
+                    "The fit process was killed after using "
+                    f"{rss / 1024**2:.1f} MiB."
+                )
+
+
+def _get_rss(pid):
+    """
+    Get the resident memory of a process and all of its children.
+
+    :param pid: The id of the process
+    :type pid: int
+
+    :return: The resident memory in bytes
+    :rtype: int
+    """
+    try:
+        parent = psutil.Process(pid)
+        procs = [parent, *parent.children(recursive=True)]
+    except psutil.NoSuchProcess:
+        return 0
+
+    rss = 0
+    for p in procs:
+        with suppress(psutil.NoSuchProcess):
+            rss += p.memory_info().rss
+    return rss
+
+
+def _run_child(func, conn):
+    """
+    The target of the child process. Runs the function and sends the
+    result, or the exception raised, back to the parent.
+
+    :param func: The function to run
+    :type func: callable
+    :param conn: The connection to send the result on
+    :type conn: multiprocessing.connection.Connection
+    """
+    try:
+        message = ("ok", func())
+    except Exception as ex:
+        message = ("error", ex)
+
+    try:
+        conn.send(message)
+    except Exception as ex:
+        # Not all exceptions can be pickled. The message is kept, as it
+        # is used to work out the error flag.
+        error = message[1] if message[0] == "error" else ex
+        conn.send(("error", FitBenchmarkException(str(error))))
+    finally:
+        conn.close()
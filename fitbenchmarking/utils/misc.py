@@ -21,6 +21,7 @@ ERROR_FLAG_MAPPINGS = {
     6: "Solver has exceeded maximum allowed runtime",
     7: "Validation of the provided options failed",
     8: "Confidence in fit could not be calculated",
+    9: "Solver has exceeded maximum allowed memory",
 }
 
 
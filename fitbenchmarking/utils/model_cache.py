@@ -0,0 +1,125 @@
+"""
+Implements the ModelCache class used to avoid evaluating the model of a
+fitting problem more than once at the same parameters.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+# The number of model evaluations kept in the cache
+MODEL_CACHE_SIZE = 8
+
+
+class ModelCache:
+    """
+    A small least recently used cache of model evaluations.
+
+    The cost functions evaluate the model at the same parameters more than
+    once in an iteration, e.g. ``jac_cost`` evaluates the residuals and the
+    Jacobian of the residuals, which both evaluate the model. The cache
+    returns the stored evaluation for these repeated calls.
+
+    Evaluations are keyed by the parameters and the identity
+    of the x values and the function, so changing the function or passing
+    new x values gives a miss. Modifying the x values in place is not
+    detected. The stored evaluations are read-only, and are returned
+    without copying, so a caller which needs to modify one must copy it.
+    Parameters which can't be read as a flat array of numbers, and
+    evaluations which are not arrays, are not cached.
+    """
+
+    def __init__(self, max_size=MODEL_CACHE_SIZE):
+        """
+        Initialise the cache.
+
+        :param max_size: The maximum number of evaluations to keep
+        :type max_size: int
+        """
+        self.max_size = max_size
+        #: Whether to use the cache. If False, every call is evaluated.
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, params, x, function, evaluate):
+        """
+        Get the evaluation of the model, evaluating it if it is not cached.
+
+        :param params: The parameters the model is evaluated at
+        :type params: list or numpy.ndarray
+        :param x: The x values the model is evaluated at
+        :type x: numpy.ndarray or list of numpy.ndarray
+        :param function: The function of the problem
+        :type function: Callable
+        :param evaluate: A callable which evaluates the model
+        :type evaluate: Callable
+
+        :return: The evaluation of the model
+        :rtype: numpy.ndarray
+        """
+        params_bytes = _to_bytes(params) if self.enabled else None
+        if params_bytes is None:
+            return evaluate()
+
+        key = (params_bytes, id(x))
+        entry = self._entries.get(key)
+        # The x values and function are kept in the entry, so their ids
+        # can't be reused while it is cached
+        if entry is not None and entry[0] is x and entry[1] is function:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[2]
+
+        self.misses += 1
+        value = evaluate()
+        # The type of other outputs (e.g. numpy or python floats) can
+        # depend on the type of the parameters, so only arrays are cached
+        if isinstance(value, np.ndarray):
+            # The function may keep a reference to its output, so the
+            # stored evaluation is a copy
+            value = value.copy()
+            value.flags.writeable = False
+            self._entries[key] = (x, function, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        """
+        Remove the cached evaluations, e.g. at the start of each run of a
+        fit so that the runs are timed in the same way.
+        """
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def _to_bytes(params):
+    """
+    Get the type and bytes of the parameters, to use in the key of the
+    cache. The type is included so that e.g. the complex parameters used
+    by complex step derivatives are not mistaken for real ones.
+
+    :param params: The parameters
+    :type params: Iterable of numbers
+
+    :return: The type and bytes of the parameters, or None if they are not
+             a flat array of numbers
+    :rtype: bytes or None
+    """
+    try:
+        # Iterators can't be read twice, so they are not cached
+        if iter(params) is params:
+            return None
+        params = np.asarray(
+            params if isinstance(params, np.ndarray) else list(params)
+        )
+    except (TypeError, ValueError):
+        return None
+    if params.ndim != 1 or params.dtype.kind not in "iufc":
+        return None
+    return params.dtype.str.encode() + params.tobytes()
@@ -10,6 +10,7 @@ import uuid
 import matplotlib.pyplot as plt
 
 from fitbenchmarking.utils.exceptions import OptionsError
+from fitbenchmarking.utils.isolation import fork_available
 
 
 class Options:
@@ -183,7 +184,12 @@ class Options:
         ],
         "scipy_ls": ["lm-scipy", "trf", "dogbox"],
         "scipy_leastsq": ["lm-leastsq"],
-        "scipy_go": ["differential_evolution", "shgo", "dual_annealing"],
+        "scipy_go": [
+            "differential_evolution",
+            "differential_evolution_batch",
+            "shgo",
+            "dual_annealing",
+        ],
         "theseus": ["Levenberg_Marquardt", "Gauss-Newton"],
     }
     VALID_FITTING = {
@@ -234,6 +240,9 @@ class Options:
             "analytic",
             "default",
             "numdifftools",
+            "parallel",
+            "complex_step",
+            "forward_ad",
         ],
         "hes_method": [
             "best_available",
@@ -251,7 +260,16 @@ class Options:
         ],
     }
     VALID_JACOBIAN = {
-        "scipy": ["2-point", "3-point", "cs", "2-point_sparse"],
+        "scipy": [
+            "2-point",
+            "3-point",
+            "cs",
+            "2-point_sparse",
+            "2-point_autosparse",
+        ],
+        "parallel": ["2-point", "3-point"],
+        "complex_step": ["default"],
+        "forward_ad": ["default"],
         "best_available": ["default"],
         "analytic": ["default", "sparse"],
         "default": ["default"],
@@ -276,6 +294,8 @@ class Options:
             "backward",
         ],
     }
+    # The options of the JACOBIAN section which are not Jacobian methods
+    VALID_JACOBIAN_SETTINGS = {"parallel_backend": ["thread", "process"]}
     VALID_OUTPUT = {
         "level": ["NOTSET", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
         "append": [True, False],
@@ -289,6 +309,7 @@ class Options:
             "compare",
             "local_min",
             "energy_usage",
+            "overhead",
         ],
         "results_browser": [True, False],
         "run_dash": [True, False],
@@ -300,21 +321,25 @@ class Options:
         "append": [True, False],
         "external_output": ["debug", "display", "log_only"],
     }
-    VALID_RUNTIME = [
-        "mean",
-        "minimum",
-        "maximum",
-        "first",
-        "median",
-        "harmonic",
-        "trim",
-    ]
+    VALID_RUNTIME = {
+        "runtime_metric": [
+            "mean",
+            "minimum",
+            "maximum",
+            "first",
+            "median",
+            "harmonic",
+            "trim",
+            "cpu",
+        ],
+        "cpu_clock": ["process", "thread"],
+    }
     VALID_DASH = {}
 
     VALID = {
         "MINIMIZERS": VALID_MINIMIZERS,
         "FITTING": VALID_FITTING,
-        "JACOBIAN": VALID_JACOBIAN,
+        "JACOBIAN": {**VALID_JACOBIAN, **VALID_JACOBIAN_SETTINGS},
         "HESSIAN": VALID_HESSIAN,
         "OUTPUT": VALID_OUTPUT,
         "LOGGING": VALID_LOGGING,
@@ -439,12 +464,24 @@ class Options:
     }
     DEFAULT_FITTING = {
         "num_runs": 5,
+        "adaptive_runs": False,
+        "max_runs": 100,
+        "runtime_rtol": 0.05,
+        "max_timing_time": 60,
         "algorithm_type": ["all"],
         "software": ["scipy", "scipy_ls"],
         "jac_method": ["best_available"],
         "hes_method": ["best_available"],
         "cost_func_type": ["weighted_nlls"],
         "max_runtime": 600,
+        "num_workers": 1,
+        "isolate_fits": False,
+        "max_memory": 0,
+        "shard": "",
+        "runtime_history": "",
+        "convergence_trace": False,
+        "model_cache": True,
+        "cache_dir": "",
     }
     DEFAULT_JACOBIAN = {
         "analytic": ["default"],
@@ -452,6 +489,9 @@ class Options:
         "scipy": ["2-point"],
         "default": ["default"],
         "numdifftools": ["central"],
+        "parallel": ["2-point"],
+        "complex_step": ["default"],
+        "forward_ad": ["default"],
     }
     DEFAULT_HESSIAN = {
         "analytic": ["default"],
@@ -460,6 +500,11 @@ class Options:
         "default": ["default"],
         "numdifftools": ["central"],
     }
+    DEFAULT_JACOBIAN_SETTINGS = {
+        "parallel_workers": 0,
+        "parallel_backend": "thread",
+    }
+    DEFAULT_HESSIAN_SETTINGS = {"chunk_size": 0}
     DEFAULT_OUTPUT = {
         "results_dir": "fitbenchmarking_results",
         "make_plots": True,
@@ -488,13 +533,13 @@ class Options:
         "level": "INFO",
         "external_output": "log_only",
     }
-    DEFAULT_RUNTIME = {"runtime_metric": "mean"}
+    DEFAULT_RUNTIME = {"runtime_metric": "mean", "cpu_clock": "process"}
     DEFAULT_DASH = {"port": 4000, "ip_address": "127.0.0.1"}
     DEFAULTS = {
         "MINIMIZERS": DEFAULT_MINIMZERS,
         "FITTING": DEFAULT_FITTING,
-        "JACOBIAN": DEFAULT_JACOBIAN,
-        "HESSIAN": DEFAULT_HESSIAN,
+        "JACOBIAN": {**DEFAULT_JACOBIAN, **DEFAULT_JACOBIAN_SETTINGS},
+        "HESSIAN": {**DEFAULT_HESSIAN, **DEFAULT_HESSIAN_SETTINGS},
         "OUTPUT": DEFAULT_OUTPUT,
         "LOGGING": DEFAULT_LOGGING,
         "RUNTIME": DEFAULT_RUNTIME,
@@ -570,6 +615,40 @@ class Options:
             fitting.getint, "num_runs", additional_options
         )
 
+        if "adaptive_runs" in additional_options:
+            self.adaptive_runs = additional_options["adaptive_runs"]
+        else:
+            self.adaptive_runs = self.read_value(
+                fitting.getboolean, "adaptive_runs", additional_options
+            )
+
+        self.max_runs = self.read_value(
+            fitting.getint, "max_runs", additional_options
+        )
+        if self.max_runs is not None and self.max_runs < 1:
+            self.error_message.append(
+                f"The option 'max_runs: {self.max_runs}' in the ini "
+                "file is invalid. max_runs must be a positive integer."
+            )
+
+        self.runtime_rtol = self.read_value(
+            fitting.getfloat, "runtime_rtol", additional_options
+        )
+        if self.runtime_rtol is not None and self.runtime_rtol <= 0:
+            self.error_message.append(
+                f"The option 'runtime_rtol: {self.runtime_rtol}' in the ini "
+                "file is invalid. runtime_rtol must be positive."
+            )
+
+        self.max_timing_time = self.read_value(
+            fitting.getfloat, "max_timing_time", additional_options
+        )
+        if self.max_timing_time is not None and self.max_timing_time <= 0:
+            self.error_message.append(
+                f"The option 'max_timing_time: {self.max_timing_time}' in "
+                "the ini file is invalid. max_timing_time must be positive."
+            )
+
         self.algorithm_type = self.read_value(
             fitting.getlist, "algorithm_type", additional_options
         )
@@ -594,6 +673,69 @@ class Options:
             fitting.getfloat, "max_runtime", additional_options
         )
 
+        self.num_workers = self.read_value(
+            fitting.getint, "num_workers", additional_options
+        )
+        if self.num_workers is not None and self.num_workers < 1:
+            self.error_message.append(
+                f"The option 'num_workers: {self.num_workers}' in the ini "
+                "file is invalid. num_workers must be a positive integer."
+            )
+
+        if "isolate_fits" in additional_options:
+            self.isolate_fits = additional_options["isolate_fits"]
+        else:
+            self.isolate_fits = self.read_value(
+                fitting.getboolean, "isolate_fits", additional_options
+            )
+        if self.isolate_fits and not fork_available():
+            self.error_message.append(
+                "The option 'isolate_fits: True' in the ini file is "
+                "invalid. Isolated fits need the 'fork' start method, "
+                "which is not available on this platform."
+            )
+
+        self.max_memory = self.read_value(
+            fitting.getfloat, "max_memory", additional_options
+        )
+        if self.max_memory is not None and self.max_memory < 0:
+            self.error_message.append(
+                f"The option 'max_memory: {self.max_memory}' in the ini "
+                "file is invalid. max_memory must not be negative."
+            )
+
+        self.shard = self.read_value(fitting.get, "shard", additional_options)
+        if self.shard:
+            try:
+                parse_shard(self.shard)
+            except ValueError as e:
+                self.error_message.append(
+                    f"The option 'shard: {self.shard}' in the ini file is "
+                    f"invalid. {e}"
+                )
+
+        self.runtime_history = self.read_value(
+            fitting.get, "runtime_history", additional_options
+        )
+
+        if "convergence_trace" in additional_options:
+            self.convergence_trace = additional_options["convergence_trace"]
+        else:
+            self.convergence_trace = self.read_value(
+                fitting.getboolean, "convergence_trace", additional_options
+            )
+
+        if "model_cache" in additional_options:
+            self.model_cache = additional_options["model_cache"]
+        else:
+            self.model_cache = self.read_value(
+                fitting.getboolean, "model_cache", additional_options
+            )
+
+        self.cache_dir = self.read_value(
+            fitting.get, "cache_dir", additional_options
+        )
+
         jacobian = config["JACOBIAN"]
         self.jac_num_method = {}
         for key in self.VALID_FITTING["jac_method"]:
@@ -601,6 +743,23 @@ class Options:
                 jacobian.getlist, key, additional_options
             )
 
+        self.jac_parallel_workers = self.read_value(
+            jacobian.getint, "parallel_workers", additional_options
+        )
+        if (
+            self.jac_parallel_workers is not None
+            and self.jac_parallel_workers < 0
+        ):
+            self.error_message.append(
+                "The option 'parallel_workers: "
+                f"{self.jac_parallel_workers}' in the ini file is invalid. "
+                "parallel_workers must not be negative."
+            )
+
+        self.jac_parallel_backend = self.read_value(
+            jacobian.getstr, "parallel_backend", additional_options
+        )
+
         hessian = config["HESSIAN"]
         self.hes_num_method = {}
         for key in self.VALID_FITTING["hes_method"]:
@@ -608,6 +767,15 @@ class Options:
                 hessian.getlist, key, additional_options
             )
 
+        self.hes_chunk_size = self.read_value(
+            hessian.getint, "chunk_size", additional_options
+        )
+        if self.hes_chunk_size is not None and self.hes_chunk_size < 0:
+            self.error_message.append(
+                f"The option 'chunk_size: {self.hes_chunk_size}' in the "
+                "ini file is invalid. chunk_size must not be negative."
+            )
+
         output = config["OUTPUT"]
 
         if "make_plots" in additional_options:
@@ -681,6 +849,9 @@ class Options:
         self.runtime_metric = self.read_value(
             runtime.getstr, "runtime_metric", additional_options
         )
+        self.cpu_clock = self.read_value(
+            runtime.getstr, "cpu_clock", additional_options
+        )
 
         dash_settings = config["DASH"]
         self.port = self.read_value(
@@ -799,18 +970,33 @@ class Options:
         }
         config["FITTING"] = {
             "num_runs": self.num_runs,
+            "adaptive_runs": self.adaptive_runs,
+            "max_runs": self.max_runs,
+            "runtime_rtol": self.runtime_rtol,
+            "max_timing_time": self.max_timing_time,
             "algorithm_type": list_to_string(self.algorithm_type),
             "software": list_to_string(self.software),
             "jac_method": list_to_string(self.jac_method),
             "hes_method": list_to_string(self.hes_method),
             "max_runtime": self.max_runtime,
+            "num_workers": self.num_workers,
+            "isolate_fits": self.isolate_fits,
+            "max_memory": self.max_memory,
+            "shard": self.shard,
+            "runtime_history": self.runtime_history,
+            "convergence_trace": self.convergence_trace,
+            "model_cache": self.model_cache,
+            "cache_dir": self.cache_dir,
             "cost_func_type": list_to_string(self.cost_func_type),
         }
         config["JACOBIAN"] = {
-            k: list_to_string(m) for k, m in self.jac_num_method.items()
+            **{k: list_to_string(m) for k, m in self.jac_num_method.items()},
+            "parallel_workers": self.jac_parallel_workers,
+            "parallel_backend": self.jac_parallel_backend,
         }
         config["HESSIAN"] = {
-            k: list_to_string(m) for k, m in self.hes_num_method.items()
+            **{k: list_to_string(m) for k, m in self.hes_num_method.items()},
+            "chunk_size": self.hes_chunk_size,
         }
 
         config["OUTPUT"] = {
@@ -836,7 +1022,10 @@ class Options:
             "external_output": self.external_output,
         }
 
-        config["RUNTIME"] = {"runtime_metric": self.runtime_metric}
+        config["RUNTIME"] = {
+            "runtime_metric": self.runtime_metric,
+            "cpu_clock": self.cpu_clock,
+        }
 
         config["DASH"] = {"port": self.port, "ip_address": self.ip_address}
 
@@ -907,6 +1096,28 @@ def read_range(s):
     return rng
 
 
+def parse_shard(s):
+    """
+    Utility function to read the shard of a benchmark to run
+
+    :param s: string of the form i/N
+    :type s: string
+
+    :return: the index of the shard (from 1) and the number of shards
+    :rtype: tuple(int, int)
+    """
+    try:
+        index, num_shards = (int(v) for v in str(s).split("/"))
+    except ValueError as e:
+        raise ValueError("shard must be given as i/N, e.g. 1/4.") from e
+    if num_shards < 1 or not 1 <= index <= num_shards:
+        raise ValueError(
+            "The shard index must satisfy 1 <= i <= N, where N is the "
+            "number of shards."
+        )
+    return index, num_shards
+
+
 def find_options_file(options_file: str, additional_options: dict) -> Options:
     """
     Attempts to find the options file and creates an Options object for it.
@@ -3,6 +3,7 @@ Tests for checkpoint.py
 """
 
 import inspect
+import json
 import pathlib
 import pprint
 from tempfile import TemporaryDirectory
@@ -10,6 +11,7 @@ from unittest import TestCase
 from unittest.mock import patch
 
 import numpy as np
+from parameterized import parameterized
 
 from fitbenchmarking import test_files
 from fitbenchmarking.controllers.scipy_controller import ScipyController
@@ -21,7 +23,12 @@ from fitbenchmarking.jacobian.default_jacobian import (
 )
 from fitbenchmarking.jacobian.scipy_jacobian import Scipy as ScipyJacobian
 from fitbenchmarking.parsing.fitting_problem import FittingProblem
-from fitbenchmarking.utils.checkpoint import Checkpoint, _compress, _decompress
+from fitbenchmarking.utils.checkpoint import (
+    Checkpoint,
+    _compress,
+    _decompress,
+    _load_partial_json,
+)
 from fitbenchmarking.utils.exceptions import CheckpointError
 from fitbenchmarking.utils.fitbm_result import FittingResult
 from fitbenchmarking.utils.log import get_logger
@@ -302,6 +309,93 @@ class CheckpointTests(TestCase):
             },
         )
 
+    def test_missing_cpu_runtimes_are_nan(self):
+        """
+        Test that results from a checkpoint file without CPU times are
+        loaded with a NaN CPU time for each run.
+        """
+        cp_file = (
+            pathlib.Path(inspect.getfile(test_files)).parent
+            / "regression_checkpoint.json"
+        )
+        options = Options(
+            additional_options={"checkpoint_filename": str(cp_file)}
+        )
+        cp = Checkpoint(options)
+        res, _, _, _ = cp.load()
+        for result in res["NIST_average_difficulty"]:
+            self.assertEqual(len(result.cpu_runtimes), len(result.runtimes))
+            self.assertTrue(np.isnan(result.cpu_runtimes).all())
+
+    def test_load_partial_interrupted(self):
+        """
+        Test the results are loaded from a checkpoint which was not
+        finalised, including a result which was cut off part way through
+        being written.
+        """
+        with TemporaryDirectory() as temp_dir:
+            cp_file = pathlib.Path(temp_dir, "cp.json")
+            options = Options(
+                additional_options={"checkpoint_filename": cp_file}
+            )
+            cp = Checkpoint(options)
+            expected_res = generate_results()
+            for res in expected_res["set1"]:
+                cp.add_result(res)
+            cp.finalise_group("set1")
+            for res in expected_res["set2"]:
+                cp.add_result(res)
+
+            # Cut off the last result part way through
+            results_file = pathlib.Path(cp.results_file)
+            text = results_file.read_text(encoding="utf-8")
+            results_file.write_text(text[:-100], encoding="utf-8")
+
+            groups, partial = Checkpoint(options).load_partial()
+
+        self.assertEqual(list(groups), ["set1"])
+        for a, e in zip(groups["set1"], expected_res["set1"]):
+            self.assertEqual(a, e)
+        self.assertEqual(len(partial), len(expected_res["set2"]) - 1)
+        for a, e in zip(partial, expected_res["set2"]):
+            self.assertEqual(a, e)
+
+    def test_load_partial_incomplete_group(self):
+        """
+        Test the results in the incomplete group are returned as partial
+        results.
+        """
+        with TemporaryDirectory() as temp_dir:
+            cp_file = pathlib.Path(temp_dir, "cp.json")
+            options = Options(
+                additional_options={"checkpoint_filename": cp_file}
+            )
+            cp = Checkpoint(options)
+            expected_res = generate_results()
+            for res in expected_res["set1"]:
+                cp.add_result(res)
+            cp.finalise()
+
+            groups, partial = Checkpoint(options).load_partial()
+            self.assertFalse(pathlib.Path(cp.tmp_dir).exists())
+
+        self.assertDictEqual(groups, {})
+        self.assertEqual(len(partial), len(expected_res["set1"]))
+
+    def test_load_partial_no_file(self):
+        """
+        Test nothing is loaded if there is no checkpoint to resume from.
+        """
+        options = Options(
+            additional_options={"checkpoint_filename": "not_a_file"}
+        )
+        cp = Checkpoint(options=options)
+
+        with self.assertLogs(LOGGER, level="WARNING"):
+            groups, partial = cp.load_partial()
+        self.assertDictEqual(groups, {})
+        self.assertEqual(partial, [])
+
 
 class CompressTests(TestCase):
     """
@@ -325,3 +419,52 @@ class CompressTests(TestCase):
                     (exp == _decompress(_compress(exp))).all(),
                     f"Failed to compress/decompress {exp}",
                 )
+
+
+class LoadPartialJsonTests(TestCase):
+    """
+    Tests for the _load_partial_json function.
+    """
+
+    @parameterized.expand(
+        [
+            ("complete_dict", '{\n  "a": {"x": 1},\n  "b": {"y": 2}\n}', {}),
+            ("unclosed_dict", '{\n  "a": {"x": 1},\n  "b": {"y": 2}\n  ', {}),
+            ("cut_dict", '{\n  "a": {"x": 1},\n  "b": {"y": 2}, "c": {', {}),
+            ("cut_key", '{\n  "a": {"x": 1},\n  "b": {"y": 2},\n  "c', {}),
+            ("complete_list", '[\n  {"x": 1},\n  {"y": 2}\n]', []),
+            ("cut_list", '[\n  {"x": 1},\n  {"y": 2},\n  {"z": ', []),
+        ]
+    )
+    def test_load_partial_json(self, _, text, empty):
+        """
+        Test that the complete entries are loaded.
+        """
+        expected = (
+            {"a": {"x": 1}, "b": {"y": 2}}
+            if isinstance(empty, dict)
+            else [{"x": 1}, {"y": 2}]
+        )
+        self.assertEqual(_load_partial_json(text, empty), expected)
+
+    @parameterized.expand(
+        [("empty", "", {}), ("opened", "{\n  ", {}), ("closed", "[\n]", [])]
+    )
+    def test_load_partial_json_no_entries(self, _, text, empty):
+        """
+        Test that empty is returned if there are no complete entries.
+        """
+        self.assertEqual(_load_partial_json(text, empty), empty)
+
+    def test_load_partial_json_decodes_once(self):
+        """
+        Test that each entry is only decoded once.
+        """
+        text = "[" + ", ".join(['{"x": 1}'] * 100) + ", {"
+        with patch.object(
+            json.JSONDecoder, "raw_decode", wraps=json.JSONDecoder().raw_decode
+        ) as raw_decode:
+            output = _load_partial_json(text, [])
+
+        self.assertEqual(len(output), 100)
+        self.assertEqual(raw_decode.call_count, 101)
@@ -0,0 +1,65 @@
+"""
+Tests for fitbenchmarking.utils.disk_cache
+"""
+
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from fitbenchmarking.utils.disk_cache import cache_path, hash_key, write_atomic
+
+
+class DiskCacheTests(TestCase):
+    """
+    Tests for the disk cache helpers.
+    """
+
+    def setUp(self):
+        self.dir = TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+
+    def test_hash_key(self):
+        """
+        Test that the key depends on how the inputs are split.
+        """
+        self.assertEqual(hash_key("ab", "c"), hash_key("ab", b"c"))
+        self.assertNotEqual(hash_key("ab", "c"), hash_key("a", "bc"))
+
+    def test_cache_path(self):
+        """
+        Test the path of an entry.
+        """
+        path = cache_path(self.dir.name, "category", "key", ".py")
+
+        self.assertEqual(
+            path, os.path.join(self.dir.name, "category", "key.py")
+        )
+
+    def test_cache_path_disabled(self):
+        """
+        Test that there is no path when the cache is disabled.
+        """
+        self.assertIsNone(cache_path("", "category", "key"))
+
+    def test_write_atomic(self):
+        """
+        Test that an entry is written, creating its directory.
+        """
+        path = os.path.join(self.dir.name, "category", "key")
+
+        self.assertTrue(write_atomic(path, "data"))
+        with open(path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "data")
+        self.assertEqual(os.listdir(os.path.dirname(path)), ["key"])
+
+    def test_write_atomic_failure(self):
+        """
+        Test that a failure to write is ignored, leaving no files behind.
+        """
+        path = os.path.join(self.dir.name, "key")
+
+        with patch("os.replace", side_effect=OSError):
+            self.assertFalse(write_atomic(path, b"data"))
+
+        self.assertEqual(os.listdir(self.dir.name), [])
@@ -0,0 +1,317 @@
+"""
+Tests for fitbenchmarking.utils.eval_counter
+"""
+
+import pickle
+from unittest import TestCase
+
+import numpy as np
+
+from fitbenchmarking.utils.eval_counter import (
+    ConvergenceTrace,
+    EvalCounter,
+    counting_evals,
+    tracing_convergence,
+)
+
+
+class FakeProblem:
+    """
+    A problem with a model to evaluate.
+    """
+
+    def eval_model(self, params):
+        return [2 * p for p in params]
+
+
+class FakeJacobian:
+    """
+    A Jacobian which evaluates the model.
+    """
+
+    def __init__(self, problem):
+        self.problem = problem
+
+    def eval(self, params):
+        return self.problem.eval_model(params)
+
+
+class FakeCostFunc:
+    """
+    A cost function with residuals but no Hessian.
+    """
+
+    def __init__(self, problem):
+        self.problem = problem
+        self.jacobian = FakeJacobian(problem)
+        self.hessian = None
+
+    def eval_r(self, params):
+        return self.problem.eval_model(params)
+
+    def eval_cost(self, params):
+        return sum(r**2 for r in self.eval_r(params))
+
+
+class FakeController:
+    """
+    A controller holding the problem and cost function.
+    """
+
+    def __init__(self):
+        self.problem = FakeProblem()
+        self.cost_func = FakeCostFunc(self.problem)
+        self.params = [3.0]
+
+    def execute(self):
+        self.params = [p / 2 for p in self.params]
+        return self.cost_func.eval_cost(self.params)
+
+
+class EvalCounterTests(TestCase):
+    """
+    Tests for the EvalCounter class.
+    """
+
+    def setUp(self):
+        self.controller = FakeController()
+        self.counter = EvalCounter()
+        self.counter.install(self.controller)
+
+    def tearDown(self):
+        self.counter.uninstall()
+
+    def test_counts(self):
+        """
+        Test that nested evaluations are each counted.
+        """
+        self.controller.cost_func.eval_cost([1.0, 2.0])
+        self.controller.cost_func.jacobian.eval([1.0])
+
+        self.assertEqual(
+            dict(self.counter.counts),
+            {"eval_cost": 1, "eval_r": 1, "model": 2, "jacobian": 1},
+        )
+
+    def test_total_time_counts_outermost_calls(self):
+        """
+        Test that the total time is not increased by nested evaluations.
+        """
+        self.controller.cost_func.eval_cost([1.0, 2.0])
+
+        self.assertEqual(
+            self.counter.total_time, self.counter.times["eval_cost"]
+        )
+        self.assertLessEqual(
+            self.counter.times["model"], self.counter.times["eval_r"]
+        )
+
+    def test_total_time_sums_separate_calls(self):
+        """
+        Test that the total time is the sum of the outermost calls.
+        """
+        self.controller.problem.eval_model([1.0])
+        model_time = self.counter.times["model"]
+        self.controller.cost_func.jacobian.eval([1.0])
+
+        self.assertEqual(
+            self.counter.total_time,
+            model_time + self.counter.times["jacobian"],
+        )
+
+    def test_reset(self):
+        """
+        Test that reset clears the counts and times.
+        """
+        self.controller.problem.eval_model([1.0])
+        self.counter.reset()
+
+        self.assertEqual(dict(self.counter.counts), {})
+        self.assertEqual(dict(self.counter.times), {})
+        self.assertEqual(self.counter.total_time, 0)
+
+    def test_per_run(self):
+        """
+        Test that the counts and times are averaged over the runs.
+        """
+        for _ in range(4):
+            self.controller.problem.eval_model([1.0])
+
+        counts, times = self.counter.per_run(2)
+
+        self.assertEqual(counts, {"model": 2.0})
+        self.assertEqual(set(times), {"model", "total"})
+        self.assertAlmostEqual(
+            times["model"], self.counter.times["model"] / 2e9
+        )
+
+    def test_uninstall(self):
+        """
+        Test that uninstall restores the original methods.
+        """
+        self.counter.uninstall()
+        self.controller.problem.eval_model([1.0])
+
+        self.assertNotIn("eval_model", vars(self.controller.problem))
+        self.assertNotIn("eval_r", vars(self.controller.cost_func))
+        self.assertEqual(dict(self.counter.counts), {})
+
+    def test_pickle(self):
+        """
+        Test that the counted methods can still be pickled.
+        """
+        cost_func = pickle.loads(pickle.dumps(self.controller.cost_func))
+
+        self.assertEqual(cost_func.eval_cost([1.0]), 4.0)
+
+
+class CountingEvalsTests(TestCase):
+    """
+    Tests for the counting_evals context manager.
+    """
+
+    def test_counting_evals(self):
+        """
+        Test that the evaluations are counted inside the context only.
+        """
+        controller = FakeController()
+        with counting_evals(controller) as counter:
+            controller.problem.eval_model([1.0])
+        controller.problem.eval_model([1.0])
+
+        self.assertEqual(dict(counter.counts), {"model": 1})
+
+    def test_counting_evals_disabled(self):
+        """
+        Test that nothing is counted when disabled.
+        """
+        controller = FakeController()
+        with counting_evals(controller, enabled=False) as counter:
+            controller.problem.eval_model([1.0])
+
+        self.assertEqual(dict(counter.counts), {})
+
+    def test_counting_evals_exception(self):
+        """
+        Test that the methods are restored if the context raises.
+        """
+        controller = FakeController()
+        with self.assertRaises(ValueError), counting_evals(controller):
+            raise ValueError
+
+        self.assertNotIn("eval_model", vars(controller.problem))
+
+
+class ConvergenceTraceTests(TestCase):
+    """
+    Tests for the ConvergenceTrace class.
+    """
+
+    def test_records_improvements(self):
+        """
+        Test that points are only recorded when the best cost improves.
+        """
+        trace = ConvergenceTrace()
+        for cost in [5.0, 6.0, 3.0, 3.0, 1.0]:
+            trace.record(cost)
+
+        points = trace.as_array()
+        np.testing.assert_array_equal(points[:, 1], [1, 3, 5])
+        np.testing.assert_array_equal(points[:, 2], [5.0, 3.0, 1.0])
+        self.assertTrue(np.all(np.diff(points[:, 0]) >= 0))
+
+    def test_bounded(self):
+        """
+        Test that the trace is bounded, keeping the first and best points.
+        """
+        trace = ConvergenceTrace(max_points=8)
+        for cost in range(100, 0, -1):
+            trace.record(float(cost))
+
+        points = trace.as_array()
+        self.assertLessEqual(len(points), 8)
+        self.assertEqual(points[0, 2], 100.0)
+        self.assertEqual(points[-1, 2], 1.0)
+        self.assertTrue(np.all(np.diff(points[:, 2]) < 0))
+
+    def test_start(self):
+        """
+        Test that start restarts the trace.
+        """
+        trace = ConvergenceTrace()
+        trace.record(1.0)
+        trace.start()
+        trace.record(2.0)
+
+        np.testing.assert_array_equal(trace.as_array()[:, 1:], [[1, 2.0]])
+
+    def test_empty(self):
+        """
+        Test that an empty trace has the right shape.
+        """
+        self.assertEqual(ConvergenceTrace().as_array().shape, (0, 3))
+
+    def test_call_records_outermost(self):
+        """
+        Test that nested calls are recorded once, with the outer cost.
+        """
+        trace = ConvergenceTrace()
+
+        def residuals():
+            return np.array([1.0, 2.0])
+
+        def cost():
+            return 3.0 * float(np.sum(trace.call(residuals, True) ** 2))
+
+        trace.call(cost, False)
+        trace.call(residuals, True)
+
+        np.testing.assert_array_equal(
+            trace.as_array()[:, 1:], [[1, 15.0], [2, 5.0]]
+        )
+
+    def test_call_batch_records_each_cost(self):
+        """
+        Test that each cost in a batch is recorded, in order.
+        """
+        trace = ConvergenceTrace()
+
+        def costs():
+            return np.array([4.0, 2.0, 3.0, 1.0])
+
+        trace.call_batch(costs)
+
+        np.testing.assert_array_equal(
+            trace.as_array()[:, 1:], [[1, 4.0], [2, 2.0], [4, 1.0]]
+        )
+
+    def test_tracing_convergence(self):
+        """
+        Test that each run restarts the trace and the methods are restored.
+        """
+        controller = FakeController()
+        with tracing_convergence(controller) as trace:
+            controller.execute()
+            controller.execute()
+
+        # The second run halves the parameter from 1.5 to 0.75, so the
+        # model is 1.5 and the cost is 2.25
+        np.testing.assert_array_equal(trace.as_array()[:, 1:], [[1, 2.25]])
+        self.assertNotIn("execute", vars(controller))
+        self.assertNotIn("eval_cost", vars(controller.cost_func))
+
+    def test_tracing_with_counting(self):
+        """
+        Test that tracing and counting the same methods restore them.
+        """
+        controller = FakeController()
+        with (
+            counting_evals(controller) as counter,
+            tracing_convergence(controller) as trace,
+        ):
+            controller.execute()
+
+        self.assertEqual(counter.counts["eval_cost"], 1)
+        self.assertEqual(len(trace.as_array()), 1)
+        self.assertNotIn("eval_cost", vars(controller.cost_func))
+        self.assertNotIn("eval_model", vars(controller.problem))
@@ -209,6 +209,19 @@ class FitbmResultTests(unittest.TestCase):
         )
         self.assertAlmostEqual(expected, result.runtime, places=5)
 
+    def test_cpu_runtime_metric(self):
+        """
+        Tests the cpu runtime metric uses the CPU times of the runs
+        """
+        result = FittingResult(
+            controller=self.controller,
+            runtimes=[2.0, 4.0],
+            cpu_runtimes=[1.0, 2.0],
+            runtime_metric="cpu",
+        )
+        self.assertAlmostEqual(1.5, result.runtime)
+        self.assertAlmostEqual(3.0, result.mean_runtime)
+
     @patch(
         "fitbenchmarking.utils.fitbm_result.harmonic_mean",
         side_effect=StatisticsError,
@@ -285,6 +298,72 @@ class FitbmResultTests(unittest.TestCase):
         self.result.min_runtime = np.inf
         self.assertEqual(self.result.norm_runtime(), np.inf)
 
+    @parameterized.expand(
+        [
+            ("not_traced", None, np.nan),
+            ("reached", [[0.1, 1, 5.0], [0.2, 4, 2.02], [0.3, 9, 2.0]], 0.2),
+            ("not_reached", [[0.1, 1, 5.0], [0.2, 4, 3.0]], np.inf),
+        ]
+    )
+    def test_time_to_target(self, _, trace, expected):
+        """
+        Test that time_to_target is the time the trace first reaches a
+        cost within 1% of the best accuracy.
+        """
+        self.result.min_accuracy = 2.0
+        self.result.convergence_trace = (
+            None if trace is None else np.array(trace)
+        )
+        np.testing.assert_equal(self.result.time_to_target, expected)
+
+    @parameterized.expand(
+        [
+            ("zero", 0.0, [[0.1, 1, 1e-3], [0.2, 4, 0.0]], 0.2),
+            ("zero_rounding", 0.0, [[0.1, 1, 1e-3], [0.2, 4, 1e-15]], 0.2),
+            ("negative", -2.0, [[0.1, 1, -1.9], [0.2, 4, -1.99]], 0.2),
+        ]
+    )
+    def test_time_to_target_non_positive(self, _, min_acc, trace, expected):
+        """
+        Test that time_to_target can be reached when the best accuracy is
+        zero or negative.
+        """
+        self.result.min_accuracy = min_acc
+        self.result.convergence_trace = np.array(trace)
+        np.testing.assert_equal(self.result.time_to_target, expected)
+
+    def test_norm_time_to_target(self):
+        """
+        Test that norm_time_to_target is relative to the fastest result.
+        """
+        self.result.min_accuracy = 2.0
+        self.result.convergence_trace = np.array([[0.3, 9, 2.0]])
+        self.result.min_time_to_target = 0.1
+        self.assertAlmostEqual(self.result.norm_time_to_target, 3.0)
+
+    def test_hover_text_phase_times(self):
+        """
+        Test that the phase times are only in the tooltip when requested.
+        """
+        self.result.min_accuracy = 1
+        self.result.phase_times = {"setup": 0.5, "fit": 0.03}
+
+        hover_text = self.result.hover_text(include_phases=True)
+        self.assertIn("<br>Setup time: 0.5<br>Fit time: 0.03", hover_text)
+        self.assertNotIn("Setup time", self.result.hover_text())
+
+    def test_hover_text_eval_counts(self):
+        """
+        Test that the evaluations are only in the tooltip when requested.
+        """
+        self.result.min_accuracy = 1
+        self.result.eval_counts = {"model": 20.0}
+        self.result.eval_times = {"model": 0.5, "total": 0.5}
+
+        hover_text = self.result.hover_text(include_evals=True)
+        self.assertIn("<br>model evaluations: 20 (0.5s)", hover_text)
+        self.assertNotIn("evaluations:", self.result.hover_text())
+
     def test_sanitised_name(self):
         """
         Test that sanitised names are correct.
@@ -0,0 +1,91 @@
+"""
+Tests for fitbenchmarking.utils.isolation
+"""
+
+import os
+import time
+from unittest import TestCase
+
+import numpy as np
+import psutil
+
+from fitbenchmarking.utils.exceptions import (
+    FitBenchmarkException,
+    FitProcessError,
+    MaxMemoryError,
+    MaxRuntimeError,
+    ValidationException,
+)
+from fitbenchmarking.utils.isolation import run_isolated
+
+
+class RunIsolatedTests(TestCase):
+    """
+    Tests for run_isolated.
+    """
+
+    def test_returns_result(self):
+        """
+        Test the value returned in the child process is returned.
+        """
+        result = run_isolated(lambda: (os.getpid(), [1, 2]), max_runtime=60)
+        self.assertNotEqual(result[0], os.getpid())
+        self.assertEqual(result[1], [1, 2])
+
+    def test_exception_is_reraised(self):
+        """
+        Test an exception raised in the child process is raised again.
+        """
+
+        def func():
+            raise ValidationException("bad options")
+
+        with self.assertRaises(ValidationException) as context:
+            run_isolated(func, max_runtime=60)
+        self.assertIn("bad options", str(context.exception))
+
+    def test_unpicklable_exception_keeps_message(self):
+        """
+        Test an exception which cannot be pickled is replaced with one
+        holding the same message.
+        """
+
+        class LocalError(Exception):
+            pass
+
+        def func():
+            raise LocalError(MaxRuntimeError.class_message)
+
+        with self.assertRaises(FitBenchmarkException) as context:
+            run_isolated(func, max_runtime=60)
+        self.assertIn(MaxRuntimeError.class_message, str(context.exception))
+
+    def test_killed_after_max_runtime(self):
+        """
+        Test the child is killed once the max runtime is exceeded.
+        """
+        start = time.monotonic()
+        with self.assertRaises(MaxRuntimeError):
+            run_isolated(lambda: time.sleep(30), max_runtime=0.5)
+        self.assertLess(time.monotonic() - start, 10)
+
+    def test_killed_after_max_memory(self):
+        """
+        Test the child is killed once the max memory is exceeded.
+        """
+        max_memory = psutil.Process().memory_info().rss / 1024**2 + 50
+
+        def func():
+            data = np.ones(int(500 * 1024**2 / 8))
+            time.sleep(30)
+            return data.sum()
+
+        with self.assertRaises(MaxMemoryError):
+            run_isolated(func, max_runtime=60, max_memory=max_memory)
+
+    def test_unexpected_exit(self):
+        """
+        Test an error is raised if the child exits without a result.
+        """
+        with self.assertRaises(FitProcessError):
+            run_isolated(lambda: os._exit(3), max_runtime=60)
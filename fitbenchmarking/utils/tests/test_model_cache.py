@@ -0,0 +1,197 @@
+"""
+Tests for fitbenchmarking.utils.model_cache
+"""
+
+import pickle
+from unittest import TestCase
+
+import numpy as np
+
+from fitbenchmarking.utils.model_cache import ModelCache
+
+
+def function(x, a):
+    """
+    A model to cache.
+    """
+    return a * x
+
+
+class ModelCacheTests(TestCase):
+    """
+    Tests for the ModelCache class.
+    """
+
+    def setUp(self):
+        self.cache = ModelCache(max_size=2)
+        self.x = np.array([1.0, 2.0])
+        self.calls = 0
+
+    def get(self, params, x=None, func=function):
+        """
+        Get an evaluation of the model from the cache, counting the calls
+        to the model.
+        """
+        x = self.x if x is None else x
+
+        def evaluate():
+            self.calls += 1
+            return func(x, *params)
+
+        return self.cache.get(params, x, func, evaluate)
+
+    def test_hit(self):
+        """
+        Test that the model is evaluated once at the same parameters.
+        """
+        first = self.get([2.0])
+        second = self.get(np.array([2.0]))
+
+        np.testing.assert_array_equal(second, [2.0, 4.0])
+        np.testing.assert_array_equal(first, second)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_miss_on_new_params(self):
+        """
+        Test that the model is evaluated at new parameters.
+        """
+        self.get([2.0])
+        result = self.get([3.0])
+
+        np.testing.assert_array_equal(result, [3.0, 6.0])
+        self.assertEqual(self.calls, 2)
+
+    def test_miss_on_new_x(self):
+        """
+        Test that the model is evaluated for new x values, even if they
+        are equal to the cached ones.
+        """
+        self.get([2.0])
+        self.get([2.0], x=self.x.copy())
+
+        self.assertEqual(self.calls, 2)
+
+    def test_miss_on_new_function(self):
+        """
+        Test that the model is evaluated if the function changes.
+        """
+        self.get([2.0])
+        result = self.get([2.0], func=lambda x, a: a + x)
+
+        np.testing.assert_array_equal(result, [3.0, 4.0])
+        self.assertEqual(self.calls, 2)
+
+    def test_returns_read_only(self):
+        """
+        Test that the cached evaluations are read-only and returned
+        without copying.
+        """
+        first = self.get([2.0])
+        second = self.get([2.0])
+
+        self.assertIs(first, second)
+        with self.assertRaises(ValueError):
+            first[:] = 0
+        self.assertEqual(self.calls, 1)
+
+    def test_stores_copy(self):
+        """
+        Test that the function modifying its output after it is returned
+        does not change the cache.
+        """
+        out = np.array([2.0, 4.0])
+
+        def func(x, a):
+            return out
+
+        self.get([2.0], func=func)
+        out[:] = 0
+
+        np.testing.assert_array_equal(self.get([2.0], func=func), [2.0, 4.0])
+        self.assertEqual(self.calls, 1)
+
+    def test_lru_eviction(self):
+        """
+        Test that the least recently used evaluation is evicted.
+        """
+        self.get([1.0])
+        self.get([2.0])
+        self.get([1.0])
+        self.get([3.0])
+
+        self.assertEqual(len(self.cache), 2)
+        self.get([1.0])
+        self.assertEqual(self.calls, 3)
+        self.get([2.0])
+        self.assertEqual(self.calls, 4)
+
+    def test_disabled(self):
+        """
+        Test that nothing is cached when the cache is disabled.
+        """
+        self.cache.enabled = False
+        self.get([2.0])
+        self.get([2.0])
+
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 0))
+
+    def test_complex_params(self):
+        """
+        Test that complex parameters are not mistaken for real ones.
+        """
+        self.get([2.0])
+        result = self.get(np.array([2.0 + 1e-20j]))
+
+        np.testing.assert_array_equal(result.imag, [1e-20, 2e-20])
+        self.assertEqual(self.calls, 2)
+
+    def test_not_numbers(self):
+        """
+        Test that parameters which are not numbers are not cached.
+        """
+        self.get([np.array([1.0, 2.0])])
+        self.get([np.array([1.0, 2.0])])
+
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_iterator(self):
+        """
+        Test that iterators of parameters are evaluated and not cached.
+        """
+        result = self.get(iter([2.0]))
+
+        np.testing.assert_array_equal(result, [2.0, 4.0])
+        self.assertEqual(len(self.cache), 0)
+
+    def test_scalar_not_cached(self):
+        """
+        Test that evaluations which are not arrays are not cached.
+        """
+        self.get([2.0], x=3.0)
+        self.get([2.0], x=3.0)
+
+        self.assertEqual(self.calls, 2)
+
+    def test_clear(self):
+        """
+        Test that clear removes the cached evaluations.
+        """
+        self.get([2.0])
+        self.cache.clear()
+        self.get([2.0])
+
+        self.assertEqual(self.calls, 2)
+
+    def test_pickle(self):
+        """
+        Test that the cache can be pickled.
+        """
+        self.get([2.0])
+        cache = pickle.loads(pickle.dumps(self.cache))
+
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.misses, 1)
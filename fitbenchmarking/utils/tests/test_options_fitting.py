@@ -7,6 +7,8 @@ import shutil
 import unittest
 from pathlib import Path
 
+from parameterized import parameterized
+
 from fitbenchmarking.utils import exceptions
 from fitbenchmarking.utils.options import Options
 
@@ -78,6 +80,102 @@ class FittingOptionTests(unittest.TestCase):
         actual = self.options.max_runtime
         self.assertEqual(expected, actual)
 
+    def test_num_workers_default(self):
+        """
+        Checks num_workers default
+        """
+        expected = 1
+        actual = self.options.num_workers
+        self.assertEqual(expected, actual)
+
+    def test_adaptive_runs_default(self):
+        """
+        Checks adaptive_runs default
+        """
+        expected = False
+        actual = self.options.adaptive_runs
+        self.assertEqual(expected, actual)
+
+    def test_max_runs_default(self):
+        """
+        Checks max_runs default
+        """
+        expected = 100
+        actual = self.options.max_runs
+        self.assertEqual(expected, actual)
+
+    def test_runtime_rtol_default(self):
+        """
+        Checks runtime_rtol default
+        """
+        expected = 0.05
+        actual = self.options.runtime_rtol
+        self.assertEqual(expected, actual)
+
+    def test_max_timing_time_default(self):
+        """
+        Checks max_timing_time default
+        """
+        expected = 60
+        actual = self.options.max_timing_time
+        self.assertEqual(expected, actual)
+
+    def test_isolate_fits_default(self):
+        """
+        Checks isolate_fits default
+        """
+        expected = False
+        actual = self.options.isolate_fits
+        self.assertEqual(expected, actual)
+
+    def test_max_memory_default(self):
+        """
+        Checks max_memory default
+        """
+        expected = 0
+        actual = self.options.max_memory
+        self.assertEqual(expected, actual)
+
+    def test_shard_default(self):
+        """
+        Checks shard default
+        """
+        expected = ""
+        actual = self.options.shard
+        self.assertEqual(expected, actual)
+
+    def test_runtime_history_default(self):
+        """
+        Checks runtime_history default
+        """
+        expected = ""
+        actual = self.options.runtime_history
+        self.assertEqual(expected, actual)
+
+    def test_convergence_trace_default(self):
+        """
+        Checks convergence_trace default
+        """
+        expected = False
+        actual = self.options.convergence_trace
+        self.assertEqual(expected, actual)
+
+    def test_cache_dir_default(self):
+        """
+        Checks cache_dir default
+        """
+        expected = ""
+        actual = self.options.cache_dir
+        self.assertEqual(expected, actual)
+
+    def test_model_cache_default(self):
+        """
+        Checks model_cache default
+        """
+        expected = True
+        actual = self.options.model_cache
+        self.assertEqual(expected, actual)
+
 
 class BaseFittingOptionTests(unittest.TestCase):
     """
@@ -245,3 +343,182 @@ class UserFittingOptionTests(BaseFittingOptionTests):
         """
         config_str = "[FITTING]\nmax_runtime: 10 seconds"
         self.shared_invalid("max_runtime", config_str)
+
+    def test_num_workers_valid(self):
+        """
+        Checks user set num_workers is valid
+        """
+        set_option = 4
+        config_str = "[FITTING]\nnum_workers: 4"
+        self.shared_valid("num_workers", set_option, config_str)
+
+    @parameterized.expand(["four", "0"])
+    def test_num_workers_invalid(self, value):
+        """
+        Checks user set num_workers is invalid
+        """
+        config_str = f"[FITTING]\nnum_workers: {value}"
+        self.shared_invalid("num_workers", config_str)
+
+    def test_adaptive_runs_valid(self):
+        """
+        Checks user set adaptive_runs is valid
+        """
+        set_option = True
+        config_str = "[FITTING]\nadaptive_runs: yes"
+        self.shared_valid("adaptive_runs", set_option, config_str)
+
+    def test_adaptive_runs_invalid(self):
+        """
+        Checks user set adaptive_runs is invalid
+        """
+        config_str = "[FITTING]\nadaptive_runs: sometimes"
+        self.shared_invalid("adaptive_runs", config_str)
+
+    def test_max_runs_valid(self):
+        """
+        Checks user set max_runs is valid
+        """
+        set_option = 20
+        config_str = "[FITTING]\nmax_runs: 20"
+        self.shared_valid("max_runs", set_option, config_str)
+
+    @parameterized.expand(["many", "0"])
+    def test_max_runs_invalid(self, value):
+        """
+        Checks user set max_runs is invalid
+        """
+        config_str = f"[FITTING]\nmax_runs: {value}"
+        self.shared_invalid("max_runs", config_str)
+
+    def test_runtime_rtol_valid(self):
+        """
+        Checks user set runtime_rtol is valid
+        """
+        set_option = 0.1
+        config_str = "[FITTING]\nruntime_rtol: 0.1"
+        self.shared_valid("runtime_rtol", set_option, config_str)
+
+    @parameterized.expand(["small", "0", "-0.1"])
+    def test_runtime_rtol_invalid(self, value):
+        """
+        Checks user set runtime_rtol is invalid
+        """
+        config_str = f"[FITTING]\nruntime_rtol: {value}"
+        self.shared_invalid("runtime_rtol", config_str)
+
+    def test_max_timing_time_valid(self):
+        """
+        Checks user set max_timing_time is valid
+        """
+        set_option = 30
+        config_str = "[FITTING]\nmax_timing_time: 30"
+        self.shared_valid("max_timing_time", set_option, config_str)
+
+    @parameterized.expand(["long", "0"])
+    def test_max_timing_time_invalid(self, value):
+        """
+        Checks user set max_timing_time is invalid
+        """
+        config_str = f"[FITTING]\nmax_timing_time: {value}"
+        self.shared_invalid("max_timing_time", config_str)
+
+    def test_isolate_fits_valid(self):
+        """
+        Checks user set isolate_fits is valid
+        """
+        set_option = True
+        config_str = "[FITTING]\nisolate_fits: yes"
+        self.shared_valid("isolate_fits", set_option, config_str)
+
+    def test_isolate_fits_invalid(self):
+        """
+        Checks user set isolate_fits is invalid
+        """
+        config_str = "[FITTING]\nisolate_fits: sometimes"
+        self.shared_invalid("isolate_fits", config_str)
+
+    def test_max_memory_valid(self):
+        """
+        Checks user set max_memory is valid
+        """
+        set_option = 512
+        config_str = "[FITTING]\nmax_memory: 512"
+        self.shared_valid("max_memory", set_option, config_str)
+
+    @parameterized.expand(["512MiB", "-1"])
+    def test_max_memory_invalid(self, value):
+        """
+        Checks user set max_memory is invalid
+        """
+        config_str = f"[FITTING]\nmax_memory: {value}"
+        self.shared_invalid("max_memory", config_str)
+
+    def test_shard_valid(self):
+        """
+        Checks user set shard is valid
+        """
+        set_option = "2/4"
+        config_str = "[FITTING]\nshard: 2/4"
+        self.shared_valid("shard", set_option, config_str)
+
+    @parameterized.expand(["2", "0/4", "5/4", "a/b", "1/2/3"])
+    def test_shard_invalid(self, value):
+        """
+        Checks user set shard is invalid
+        """
+        config_str = f"[FITTING]\nshard: {value}"
+        self.shared_invalid("shard", config_str)
+
+    def test_runtime_history_valid(self):
+        """
+        Checks user set runtime_history is valid
+        """
+        set_option = "old_results/checkpoint.json"
+        config_str = "[FITTING]\nruntime_history: old_results/checkpoint.json"
+        self.shared_valid("runtime_history", set_option, config_str)
+
+    def test_convergence_trace_valid(self):
+        """
+        Checks user set convergence_trace is valid
+        """
+        set_option = True
+        config_str = "[FITTING]\nconvergence_trace: yes"
+        self.shared_valid("convergence_trace", set_option, config_str)
+
+    def test_convergence_trace_invalid(self):
+        """
+        Checks user set convergence_trace is invalid
+        """
+        config_str = "[FITTING]\nconvergence_trace: sometimes"
+        self.shared_invalid("convergence_trace", config_str)
+
+    def test_model_cache_valid(self):
+        """
+        Checks user set model_cache is valid
+        """
+        set_option = False
+        config_str = "[FITTING]\nmodel_cache: no"
+        self.shared_valid("model_cache", set_option, config_str)
+
+    def test_cache_dir_valid(self):
+        """
+        Checks user set cache_dir is valid
+        """
+        set_option = "/tmp/fitbenchmarking_cache"
+        config_str = "[FITTING]\ncache_dir: /tmp/fitbenchmarking_cache"
+        self.shared_valid("cache_dir", set_option, config_str)
+
+    def test_cache_dir_empty(self):
+        """
+        Checks user set cache_dir can be empty
+        """
+        config_str = "[FITTING]\ncache_dir:"
+        self.shared_valid("cache_dir", "", config_str)
+
+    def test_model_cache_invalid(self):
+        """
+        Checks user set model_cache is invalid
+        """
+        config_str = "[FITTING]\nmodel_cache: sometimes"
+        self.shared_invalid("model_cache", config_str)
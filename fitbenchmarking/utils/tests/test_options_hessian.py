@@ -4,6 +4,8 @@ Test the HESSIAN section for the options file
 
 import unittest
 
+from parameterized import parameterized
+
 from fitbenchmarking.utils.options import Options
 from fitbenchmarking.utils.tests.test_options_fitting import (
     BaseFittingOptionTests,
@@ -35,6 +37,12 @@ class HessianOptionTesHessians(unittest.TestCase):
         actual = self.options.hes_num_method
         self.assertEqual(expected, actual)
 
+    def test_chunk_size_default(self):
+        """
+        Checks chunk_size default
+        """
+        self.assertEqual(self.options.hes_chunk_size, 0)
+
 
 class UserHessianOptionTests(BaseFittingOptionTests):
     """
@@ -68,3 +76,25 @@ class UserHessianOptionTests(BaseFittingOptionTests):
         """
         config_str = "[HESSIAN]\nnum_method: FD_3point"
         self.shared_invalid("hes_num_method", config_str)
+
+    def test_chunk_size_valid(self):
+        """
+        Checks user set chunk_size is valid
+        """
+        config_str = "[HESSIAN]\nchunk_size: 1000"
+        self.shared_valid("hes_chunk_size", 1000, config_str)
+
+    @parameterized.expand(["-1", "some"])
+    def test_chunk_size_invalid(self, value):
+        """
+        Checks user set chunk_size is invalid
+        """
+        config_str = f"[HESSIAN]\nchunk_size: {value}"
+        self.shared_invalid("hes_chunk_size", config_str)
+
+    def test_chunk_size_not_in_fitting(self):
+        """
+        Checks chunk_size can't be set in the FITTING section
+        """
+        config_str = "[FITTING]\nhes_chunk_size: 1000"
+        self.shared_invalid("hes_chunk_size", config_str)
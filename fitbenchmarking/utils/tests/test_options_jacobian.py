@@ -28,13 +28,37 @@ class JacobianOptionTesJacobians(unittest.TestCase):
         expected = {
             "analytic": ["default"],
             "best_available": ["default"],
+            "complex_step": ["default"],
             "default": ["default"],
+            "forward_ad": ["default"],
             "numdifftools": ["central"],
+            "parallel": ["2-point"],
             "scipy": ["2-point"],
         }
         actual = self.options.jac_num_method
         self.assertEqual(expected, actual)
 
+    def test_method_dicts_only_hold_methods(self):
+        """
+        Checks the Jacobian method dicts only have keys for the Jacobian
+        methods, so they can be used to list the methods
+        """
+        methods = set(self.options.VALID_FITTING["jac_method"])
+        self.assertEqual(set(self.options.VALID_JACOBIAN), methods)
+        self.assertEqual(set(self.options.DEFAULT_JACOBIAN), methods)
+
+    def test_parallel_workers_default(self):
+        """
+        Checks parallel_workers default
+        """
+        self.assertEqual(self.options.jac_parallel_workers, 0)
+
+    def test_parallel_backend_default(self):
+        """
+        Checks parallel_backend default
+        """
+        self.assertEqual(self.options.jac_parallel_backend, "thread")
+
 
 class UserJacobianOptionTests(BaseFittingOptionTests):
     """
@@ -55,8 +79,11 @@ class UserJacobianOptionTests(BaseFittingOptionTests):
         set_option = {
             "analytic": ["default"],
             "best_available": ["default"],
+            "complex_step": ["default"],
             "default": ["default"],
+            "forward_ad": ["default"],
             "numdifftools": ["central"],
+            "parallel": ["2-point"],
             "scipy": ["cs"],
         }
         config_str = "[JACOBIAN]\nscipy: cs"
@@ -68,3 +95,31 @@ class UserJacobianOptionTests(BaseFittingOptionTests):
         """
         config_str = "[JACOBIAN]\nnum_method: FD_3point"
         self.shared_invalid("jac_num_method", config_str)
+
+    def test_parallel_workers_valid(self):
+        """
+        Checks user set parallel_workers is valid
+        """
+        config_str = "[JACOBIAN]\nparallel_workers: 4"
+        self.shared_valid("jac_parallel_workers", 4, config_str)
+
+    def test_parallel_workers_invalid(self):
+        """
+        Checks user set parallel_workers is invalid
+        """
+        config_str = "[JACOBIAN]\nparallel_workers: -1"
+        self.shared_invalid("jac_parallel_workers", config_str)
+
+    def test_parallel_backend_valid(self):
+        """
+        Checks user set parallel_backend is valid
+        """
+        config_str = "[JACOBIAN]\nparallel_backend: process"
+        self.shared_valid("jac_parallel_backend", "process", config_str)
+
+    def test_parallel_backend_invalid(self):
+        """
+        Checks user set parallel_backend is invalid
+        """
+        config_str = "[JACOBIAN]\nparallel_backend: gpu"
+        self.shared_invalid("jac_parallel_backend", config_str)
@@ -0,0 +1,80 @@
+"""
+Test the RUNTIME section for the options file
+"""
+
+import unittest
+
+from parameterized import parameterized
+
+from fitbenchmarking.utils.options import Options
+from fitbenchmarking.utils.tests.test_options_fitting import (
+    BaseFittingOptionTests,
+)
+
+
+class RuntimeOptionsTests(unittest.TestCase):
+    """
+    Checks the default runtime options are set correctly
+    """
+
+    def setUp(self):
+        """
+        Create the default options
+        """
+        self.options = Options()
+
+    def test_runtime_metric_default(self):
+        """
+        Checks runtime_metric default
+        """
+        expected = "mean"
+        actual = self.options.runtime_metric
+        self.assertEqual(expected, actual)
+
+    def test_cpu_clock_default(self):
+        """
+        Checks cpu_clock default
+        """
+        expected = "process"
+        actual = self.options.cpu_clock
+        self.assertEqual(expected, actual)
+
+
+class UserRuntimeOptionTests(BaseFittingOptionTests):
+    """
+    Checks the runtime options in the options file are set correctly or
+    raise errors
+    """
+
+    @parameterized.expand(["median", "cpu"])
+    def test_runtime_metric_valid(self, value):
+        """
+        Checks user set runtime_metric is valid
+        """
+        config_str = f"[RUNTIME]\nruntime_metric: {value}"
+        self.shared_valid("runtime_metric", value, config_str)
+
+    def test_runtime_metric_invalid(self):
+        """
+        Checks user set runtime_metric is invalid
+        """
+        config_str = "[RUNTIME]\nruntime_metric: fastest"
+        self.shared_invalid("runtime_metric", config_str)
+
+    def test_cpu_clock_valid(self):
+        """
+        Checks user set cpu_clock is valid
+        """
+        config_str = "[RUNTIME]\ncpu_clock: thread"
+        self.shared_valid("cpu_clock", "thread", config_str)
+
+    def test_cpu_clock_invalid(self):
+        """
+        Checks user set cpu_clock is invalid
+        """
+        config_str = "[RUNTIME]\ncpu_clock: wall"
+        self.shared_invalid("cpu_clock", config_str)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,23 @@
 """
-Tests for fitbenchmarking.utils.timer.TimerWithMaxTime
+Tests for fitbenchmarking.utils.timer
 """
 
 from time import sleep
 from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+from parameterized import parameterized
 
 from fitbenchmarking.utils.exceptions import MaxRuntimeError
-from fitbenchmarking.utils.timer import TimerWithMaxTime
+from fitbenchmarking.utils.timer import (
+    TimerWithMaxTime,
+    relative_ci_width,
+    repeat,
+    repeat_until_stable,
+    time_phase,
+    time_run,
+)
 
 
 class TimerWithMaxTimeTests(TestCase):
@@ -82,3 +93,164 @@ class TimerWithMaxTimeTests(TestCase):
 
         self.assertGreater(self.timer.total_elapsed_time, 0.0)
         self.assertEqual(self.timer.start_time, None)
+
+
+class RelativeCIWidthTests(TestCase):
+    """
+    Tests for relative_ci_width.
+    """
+
+    @parameterized.expand(
+        ["mean", "minimum", "maximum", "median", "harmonic", "trim"]
+    )
+    def test_width_decreases_with_spread(self, metric):
+        """
+        Test that runtimes with less spread have a narrower interval.
+        """
+        rng = np.random.default_rng(1)
+        noise = rng.normal(size=20)
+        wide = relative_ci_width(1 + 0.1 * noise, metric)
+        narrow = relative_ci_width(1 + 0.01 * noise, metric)
+        self.assertLess(narrow, wide)
+        self.assertGreaterEqual(narrow, 0)
+
+    def test_constant_runtimes(self):
+        """
+        Test that identical runtimes have a zero width interval.
+        """
+        self.assertEqual(relative_ci_width([2.0] * 5, "mean"), 0.0)
+
+    def test_first_is_always_stable(self):
+        """
+        Test that the first runtime metric does not need more runs.
+        """
+        self.assertEqual(relative_ci_width([1.0], "first"), 0.0)
+
+    def test_single_runtime(self):
+        """
+        Test that a single runtime has an infinite interval.
+        """
+        self.assertEqual(relative_ci_width([1.0], "mean"), np.inf)
+
+
+class RepeatUntilStableTests(TestCase):
+    """
+    Tests for repeat_until_stable.
+    """
+
+    def setUp(self):
+        self.calls = []
+
+    def func(self):
+        """
+        The function to time, which records each call.
+        """
+        self.calls.append(None)
+
+    @patch("fitbenchmarking.utils.timer.relative_ci_width", return_value=0.0)
+    def test_stops_when_stable(self, _):
+        """
+        Test that the function is run min_runs times if it is stable.
+        """
+        runtimes, cpu_runtimes = repeat_until_stable(
+            self.func, "mean", 3, 10, 0.1, 60
+        )
+        self.assertEqual(len(runtimes), 3)
+        self.assertEqual(len(cpu_runtimes), 3)
+        self.assertEqual(len(self.calls), 3)
+
+    @patch("fitbenchmarking.utils.timer.relative_ci_width", return_value=1.0)
+    def test_stops_at_max_runs(self, _):
+        """
+        Test that the function is run max_runs times if it is not stable.
+        """
+        runtimes, _ = repeat_until_stable(self.func, "mean", 3, 10, 0.1, 60)
+        self.assertEqual(len(runtimes), 10)
+
+    @patch("fitbenchmarking.utils.timer.relative_ci_width", return_value=1.0)
+    def test_stops_at_max_time(self, _):
+        """
+        Test that the function stops when the total runtime is exceeded.
+        """
+        runtimes, _ = repeat_until_stable(
+            lambda: sleep(0.01), "mean", 2, 100, 0.1, 0.05
+        )
+        self.assertGreaterEqual(len(runtimes), 2)
+        self.assertLess(len(runtimes), 100)
+        self.assertLess(sum(runtimes[:-1]), 0.05)
+
+    @patch(
+        "fitbenchmarking.utils.timer.relative_ci_width",
+        side_effect=[1.0, 0.0],
+    )
+    def test_cpu_metric_uses_cpu_runtimes(self, mock):
+        """
+        Test that the cpu metric checks the interval of the CPU times.
+        """
+        _, cpu_runtimes = repeat_until_stable(self.func, "cpu", 2, 10, 0.1, 60)
+        self.assertEqual(len(cpu_runtimes), 3)
+        self.assertEqual(mock.call_args[0], (cpu_runtimes, "mean"))
+
+
+class TimeRunTests(TestCase):
+    """
+    Tests for time_run and repeat.
+    """
+
+    def test_sleep_uses_wall_time_only(self):
+        """
+        Test that sleeping counts towards the wall time but not the CPU
+        time.
+        """
+        runtime, cpu_runtime = time_run(lambda: sleep(0.05))
+        self.assertGreaterEqual(runtime, 0.05)
+        self.assertLess(cpu_runtime, 0.05)
+
+    @parameterized.expand(["process", "thread"])
+    def test_busy_loop_uses_cpu_time(self, cpu_clock):
+        """
+        Test that a busy loop counts towards the CPU time.
+        """
+        runtime, cpu_runtime = time_run(lambda: sum(range(10**6)), cpu_clock)
+        self.assertGreater(cpu_runtime, 0.0)
+        self.assertGreater(runtime, 0.0)
+
+    def test_repeat(self):
+        """
+        Test that repeat runs the function num_runs times.
+        """
+        calls = []
+        runtimes, cpu_runtimes = repeat(lambda: calls.append(None), 4)
+        self.assertEqual(len(calls), 4)
+        self.assertEqual(len(runtimes), 4)
+        self.assertEqual(len(cpu_runtimes), 4)
+
+
+class TimePhaseTests(TestCase):
+    """
+    Tests for time_phase.
+    """
+
+    def test_time_is_added_to_phase(self):
+        """
+        Test that the time in each block is added to its phase.
+        """
+        phase_times = {}
+        with time_phase(phase_times, "setup"):
+            sleep(0.01)
+        with time_phase(phase_times, "setup"):
+            sleep(0.01)
+        with time_phase(phase_times, "fit"):
+            pass
+        self.assertEqual(list(phase_times), ["setup", "fit"])
+        self.assertGreaterEqual(phase_times["setup"], 0.02)
+        self.assertLess(phase_times["fit"], phase_times["setup"])
+
+    def test_time_is_recorded_on_exception(self):
+        """
+        Test that the time is recorded if the block raises.
+        """
+        phase_times = {}
+        with self.assertRaises(ValueError), time_phase(phase_times, "fit"):
+            raise ValueError
+        self.assertIn("fit", phase_times)
@@ -1,12 +1,35 @@
 """
 Implements the TimerWithMaxTime class used for checking the
-'max_runtime' is not exceeded.
+'max_runtime' is not exceeded, and the functions used to time the runs
+of a fit.
 """
 
-from time import time
+import gc
+from contextlib import contextmanager
+from time import perf_counter_ns, process_time_ns, thread_time_ns
+
+import numpy as np
+from scipy import stats
 
 from fitbenchmarking.utils.exceptions import MaxRuntimeError
 
+# The confidence level of the interval used by repeat_until_stable
+CONFIDENCE = 0.95
+# The number of resamples used to bootstrap the confidence interval
+NUM_RESAMPLES = 200
+
+# Functions for the runtime metrics, applied along the last axis
+_METRICS = {
+    "minimum": lambda r: np.min(r, axis=-1),
+    "maximum": lambda r: np.max(r, axis=-1),
+    "median": lambda r: np.median(r, axis=-1),
+    "harmonic": lambda r: stats.hmean(r, axis=-1),
+    "trim": lambda r: stats.trim_mean(r, 0.2, axis=-1),
+}
+
+# The clocks which can be used to measure the CPU time of a run
+CPU_CLOCKS = {"process": process_time_ns, "thread": thread_time_ns}
+
 
 class TimerWithMaxTime:
     """
@@ -24,13 +47,14 @@ class TimerWithMaxTime:
         """
         self.max_runtime: float = max_runtime
         self.total_elapsed_time: float = 0.0
-        self.start_time: float = None
+        self.start_time: int = None
 
     def start(self) -> None:
         """
-        Starts the timer by recording the current time.
+        Starts the timer by recording the current time of the performance
+        counter in nanoseconds.
         """
-        self.start_time = time()
+        self.start_time = perf_counter_ns()
 
     def stop(self) -> None:
         """
@@ -38,7 +62,9 @@ class TimerWithMaxTime:
         since starting the timer is added onto the total elapsed time.
         """
         if self.start_time is not None:
-            self.total_elapsed_time += time() - self.start_time
+            self.total_elapsed_time += (
+                perf_counter_ns() - self.start_time
+            ) / 1e9
             self.start_time = None
 
     def reset(self) -> None:
@@ -56,8 +82,180 @@ class TimerWithMaxTime:
         it carries on.
         """
         is_timing = self.start_time is not None
-        active_elapsed_time = time() - self.start_time if is_timing else 0.0
+        active_elapsed_time = (
+            (perf_counter_ns() - self.start_time) / 1e9 if is_timing else 0.0
+        )
 
         if self.total_elapsed_time + active_elapsed_time > self.max_runtime:
             self.stop()
             raise MaxRuntimeError
+
+
+def relative_ci_width(runtimes, runtime_metric):
+    """
+    Get the half width of the confidence interval of a runtime metric,
+    relative to the value of the metric.
+
+    The interval for the mean uses the t distribution, the intervals for
+    the other metrics are bootstrapped.
+
+    :param runtimes: The runtimes of the fit
+    :type runtimes: list[float]
+    :param runtime_metric: The runtime metric, as in the options
+    :type runtime_metric: str
+
+    :return: The relative half width of the confidence interval
+    :rtype: float
+    """
+    if runtime_metric == "first":
+        # Repeating the fit can not change the first runtime
+        return 0.0
+    if len(runtimes) < 2:
+        return np.inf
+
+    runtimes = np.asarray(runtimes, dtype=float)
+    if runtime_metric == "mean":
+        value = np.mean(runtimes)
+        half_width = stats.t.ppf(
+            (1 + CONFIDENCE) / 2, len(runtimes) - 1
+        ) * stats.sem(runtimes)
+    else:
+        metric = _METRICS[runtime_metric]
+        value = metric(runtimes)
+        rng = np.random.default_rng(0)
+        samples = rng.choice(runtimes, (NUM_RESAMPLES, len(runtimes)))
+        lower, upper = np.quantile(
+            metric(samples), [(1 - CONFIDENCE) / 2, (1 + CONFIDENCE) / 2]
+        )
+        half_width = (upper - lower) / 2
+
+    if value <= 0:
+        return np.inf
+    return float(half_width / value)
+
+
+def time_run(func, cpu_clock="process"):
+    """
+    Time one run of a function with the garbage collector disabled, as
+    timeit does.
+
+    :param func: The function to time
+    :type func: Callable
+    :param cpu_clock: The clock used for the CPU time, either "process"
+                      (all threads of the process) or "thread" (the
+                      calling thread only)
+    :type cpu_clock: str
+
+    :return: The wall clock time and the CPU time of the run in seconds
+    :rtype: tuple[float, float]
+    """
+    cpu_time_ns = CPU_CLOCKS[cpu_clock]
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        wall_start = perf_counter_ns()
+        cpu_start = cpu_time_ns()
+        func()
+        cpu_end = cpu_time_ns()
+        wall_end = perf_counter_ns()
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return (wall_end - wall_start) / 1e9, (cpu_end - cpu_start) / 1e9
+
+
+def repeat(func, num_runs, cpu_clock="process"):
+    """
+    Time a function a fixed number of times.
+
+    :param func: The function to time
+    :type func: Callable
+    :param num_runs: The number of runs
+    :type num_runs: int
+    :param cpu_clock: The clock used for the CPU time, see time_run
+    :type cpu_clock: str
+
+    :return: The wall clock times and the CPU times of the runs
+    :rtype: tuple[list[float], list[float]]
+    """
+    runtimes = []
+    cpu_runtimes = []
+    for _ in range(num_runs):
+        runtime, cpu_runtime = time_run(func, cpu_clock)
+        runtimes.append(runtime)
+        cpu_runtimes.append(cpu_runtime)
+    return runtimes, cpu_runtimes
+
+
+def repeat_until_stable(
+    func,
+    runtime_metric,
+    min_runs,
+    max_runs,
+    rtol,
+    max_time,
+    cpu_clock="process",
+):
+    """
+    Time a function until the confidence interval of the runtime metric is
+    within a relative tolerance.
+
+    The function is always run at least min_runs times. After that it
+    stops when the interval is narrow enough, when it has been run
+    max_runs times, or when the total runtime exceeds max_time.
+
+    :param func: The function to time
+    :type func: Callable
+    :param runtime_metric: The runtime metric, as in the options. The
+                           "cpu" metric uses the mean of the CPU times.
+    :type runtime_metric: str
+    :param min_runs: The minimum number of runs
+    :type min_runs: int
+    :param max_runs: The maximum number of runs
+    :type max_runs: int
+    :param rtol: The relative half width of the confidence interval to
+                 stop at
+    :type rtol: float
+    :param max_time: The total runtime in seconds to stop at
+    :type max_time: float
+    :param cpu_clock: The clock used for the CPU time, see time_run
+    :type cpu_clock: str
+
+    :return: The wall clock times and the CPU times of the runs
+    :rtype: tuple[list[float], list[float]]
+    """
+    runtimes = []
+    cpu_runtimes = []
+    while len(runtimes) < max_runs:
+        runtime, cpu_runtime = time_run(func, cpu_clock)
+        runtimes.append(runtime)
+        cpu_runtimes.append(cpu_runtime)
+        if len(runtimes) < min_runs:
+            continue
+        if sum(runtimes) >= max_time:
+            break
+        if runtime_metric == "cpu":
+            width = relative_ci_width(cpu_runtimes, "mean")
+        else:
+            width = relative_ci_width(runtimes, runtime_metric)
+        if width <= rtol:
+            break
+    return runtimes, cpu_runtimes
+
+
+@contextmanager
+def time_phase(phase_times, phase):
+    """
+    Add the wall clock time spent in a with block to a phase of a fit.
+
+    :param phase_times: The time spent in each phase so far, in seconds
+    :type phase_times: dict[str, float]
+    :param phase: The name of the phase, e.g. "setup"
+    :type phase: str
+    """
+    start = perf_counter_ns()
+    try:
+        yield
+    finally:
+        elapsed = (perf_counter_ns() - start) / 1e9
+        phase_times[phase] = phase_times.get(phase, 0.0) + elapsed